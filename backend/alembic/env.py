@@ -5,6 +5,7 @@ from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 from alembic import context
 import os
+import re
 import sys
 from dotenv import load_dotenv
 
@@ -42,6 +43,17 @@ except ImportError as e:
 # ... etc.
 
 
+# Tables managed outside the models: the tasks partitions and the partitioning swap's
+# shadow tables (see jobs/partition_tasks.py). Autogenerate must not drop them.
+UNMANAGED_TABLES = re.compile(r"^tasks_(p\d+|partitioned|unpartitioned)$")
+
+
+def include_name(name, type_, parent_names) -> bool:
+    if type_ == "table":
+        return UNMANAGED_TABLES.match(name) is None
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -58,6 +70,9 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
+        # SQLite can't ALTER most columns or constraints; batch mode rebuilds the table instead
+        render_as_batch=url.startswith("sqlite"),
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -67,7 +82,12 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_name=include_name,
+        render_as_batch=connection.dialect.name == "sqlite"
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,108 @@
+"""prepare hash partitioned tasks
+
+Creates `tasks_partitioned`, hash-partitioned by tenant_id, and a trigger
+that mirrors every write on `tasks` into it. `python -m jobs.partition_tasks`
+then backfills existing rows online and swaps the two tables.
+
+The partition count defaults to 16; override it with
+`alembic -x tasks_partitions=64 upgrade head` or TASKS_PARTITIONS.
+
+Revision ID: b7fa75794aba
+Revises: 2520125c7db5
+Create Date: 2026-10-18 23:14:05.118407
+
+"""
+import os
+from typing import Sequence, Union
+
+from alembic import context, op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7fa75794aba'
+down_revision: Union[str, None] = '2520125c7db5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = [
+    'id', 'title', 'description', 'status', 'priority', 'project_id', 'tenant_id',
+    'created_by', 'assigned_to', 'due_date', 'created_at', 'updated_at',
+]
+FOREIGN_KEYS = {
+    'assigned_to': 'users', 'created_by': 'users', 'project_id': 'projects', 'tenant_id': 'tenants',
+}
+
+
+def partition_count() -> int:
+    value = context.get_x_argument(as_dictionary=True).get('tasks_partitions') or os.getenv('TASKS_PARTITIONS', '16')
+    return int(value)
+
+
+def is_partitioned() -> bool:
+    return op.get_bind().exec_driver_sql(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'tasks'::regclass)"
+    ).scalar()
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    partitions = partition_count()
+    # The key has to contain the partition column; id comes first so lookups by id alone stay index scans
+    op.execute("CREATE TABLE tasks_partitioned (LIKE tasks INCLUDING DEFAULTS) PARTITION BY HASH (tenant_id)")
+    op.execute("ALTER TABLE tasks_partitioned ADD CONSTRAINT tasks_partitioned_pkey PRIMARY KEY (id, tenant_id)")
+    for column, referenced in FOREIGN_KEYS.items():
+        op.execute(
+            f"ALTER TABLE tasks_partitioned ADD CONSTRAINT tasks_partitioned_{column}_fkey "
+            f"FOREIGN KEY ({column}) REFERENCES {referenced}(id)"
+        )
+    # Indexes on the parent are created on, and kept local to, every partition
+    op.execute("CREATE INDEX ix_tasks_partitioned_tenant_updated_at ON tasks_partitioned (tenant_id, updated_at)")
+    for remainder in range(partitions):
+        op.execute(
+            f"CREATE TABLE tasks_p{remainder:03d} PARTITION OF tasks_partitioned "
+            f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+        )
+
+    assignments = ', '.join(f"{column} = EXCLUDED.{column}" for column in COLUMNS if column not in ('id', 'tenant_id'))
+    op.execute(f"""
+        CREATE FUNCTION tasks_partition_sync() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                DELETE FROM tasks_partitioned WHERE id = OLD.id AND tenant_id = OLD.tenant_id;
+                RETURN OLD;
+            END IF;
+            INSERT INTO tasks_partitioned SELECT NEW.*
+            ON CONFLICT (id, tenant_id) DO UPDATE SET {assignments};
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(
+        "CREATE TRIGGER tasks_partition_sync AFTER INSERT OR UPDATE OR DELETE ON tasks "
+        "FOR EACH ROW EXECUTE FUNCTION tasks_partition_sync()"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    if is_partitioned():
+        # Already swapped: rebuild a plain table from the live, partitioned one (blocks writes meanwhile)
+        op.execute("LOCK TABLE tasks IN ACCESS EXCLUSIVE MODE")
+        op.execute("DROP TABLE IF EXISTS tasks_unpartitioned")
+        op.execute("CREATE TABLE tasks_plain (LIKE tasks INCLUDING DEFAULTS)")
+        op.execute("INSERT INTO tasks_plain SELECT * FROM tasks")
+        op.execute("DROP TABLE tasks")
+        op.execute("ALTER TABLE tasks_plain RENAME TO tasks")
+        op.execute("ALTER TABLE tasks ADD CONSTRAINT tasks_pkey PRIMARY KEY (id)")
+        for column, referenced in FOREIGN_KEYS.items():
+            op.execute(
+                f"ALTER TABLE tasks ADD CONSTRAINT tasks_{column}_fkey "
+                f"FOREIGN KEY ({column}) REFERENCES {referenced}(id)"
+            )
+        op.execute("CREATE INDEX ix_tasks_tenant_updated_at ON tasks (tenant_id, updated_at)")
+    else:
+        op.execute("DROP TRIGGER IF EXISTS tasks_partition_sync ON tasks")
+        op.execute("DROP TABLE tasks_partitioned")
+    op.execute("DROP FUNCTION IF EXISTS tasks_partition_sync()")
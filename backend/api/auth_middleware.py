@@ -1,40 +1,62 @@
 # backend/api/auth_middleware.py
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.ext.asyncio import AsyncSession
+import hmac
+import os
+from typing import Optional
 import uuid
 
-from infrastructure.database.connection import get_db_session
-from infrastructure.database.repositories.user_repository_impl import UserRepositoryImpl
 from infrastructure.auth.jwt_handler import JWTHandler
 from domain.entities.auth import TokenData
+from domain.repositories import UserRepository
+from infrastructure.database.instrumentation import record_tenant
+from infrastructure.metrics import auth_failures
+from .repositories import get_read_user_repository
 
-security = HTTPBearer()
+# Missing credentials are rejected below, so they are counted with the other failures
+security = HTTPBearer(auto_error=False)
 
 async def get_current_user_data(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    session: AsyncSession = Depends(get_db_session)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    user_repo: UserRepository = Depends(get_read_user_repository)
 ) -> TokenData:
     """
     Dependency to get current user data from JWT token
     """
+    if credentials is None:
+        auth_failures.labels("missing_token").inc()
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
     try:
         jwt_handler = JWTHandler()
         token_data = jwt_handler.get_current_user_from_token(credentials.credentials)
-        
+    except Exception:
+        auth_failures.labels("invalid_token").inc()
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+    try:
         # Verify user exists in database
-        user_repo = UserRepositoryImpl(session)
         user = await user_repo.get_by_id(token_data.user_id)
         if not user or not user.is_active:
+            auth_failures.labels("unknown_or_inactive_user").inc()
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not found or inactive"
             )
         
+        record_tenant(token_data.tenant_id)
         return token_data
     except HTTPException:
         raise
     except Exception as e:
+        auth_failures.labels("user_lookup_failed").inc()
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials"
@@ -50,4 +72,16 @@ async def get_current_user_id(
     token_data: TokenData = Depends(get_current_user_data)
 ) -> uuid.UUID:
     """Get current user ID from authenticated user"""
-    return token_data.user_id
\ No newline at end of file
+    return token_data.user_id
+
+def admin_key_matches(admin_key: Optional[str]) -> bool:
+    expected = os.getenv("ADMIN_API_KEY")
+    return bool(expected) and admin_key is not None and hmac.compare_digest(admin_key.encode(), expected.encode())
+
+async def require_admin_key(admin_key: Optional[str] = Header(None, alias="X-Admin-Key")) -> None:
+    """Guard for operator endpoints; they don't exist unless ADMIN_API_KEY is set"""
+    if not os.getenv("ADMIN_API_KEY"):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not admin_key_matches(admin_key):
+        auth_failures.labels("invalid_admin_key").inc()
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid admin key")
@@ -0,0 +1,51 @@
+# backend/api/consistency_middleware.py
+import logging
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.database.replicas import (
+    CONSISTENCY_HEADER, ReplicaRouter, format_lsn, parse_lsn, required_lsn
+)
+
+logger = logging.getLogger(__name__)
+
+READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+class ConsistencyTokenMiddleware:
+    """
+    Read-your-writes across replicas: successful writes return the primary's
+    WAL position in X-Consistency-Token, and requests sending it back only
+    read from replicas that have replayed that far.
+    """
+    def __init__(self, app: ASGIApp, router: ReplicaRouter):
+        self.app = app
+        self.router = router
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.router.tracks_replay:
+            await self.app(scope, receive, send)
+            return
+
+        lsn = None
+        token = Headers(scope=scope).get(CONSISTENCY_HEADER)
+        if token:
+            try:
+                lsn = parse_lsn(token)
+            except ValueError:
+                pass
+        is_write = scope["method"] not in READ_METHODS
+
+        async def send_with_token(message: Message) -> None:
+            if is_write and message["type"] == "http.response.start" and message["status"] < 400:
+                try:
+                    position = await self.router.primary_lsn()
+                    MutableHeaders(scope=message).append(CONSISTENCY_HEADER, format_lsn(max(position, lsn or 0)))
+                except Exception:
+                    logger.warning("Could not read the primary WAL position", exc_info=True)
+            await send(message)
+
+        reset_token = required_lsn.set(lsn)
+        try:
+            await self.app(scope, receive, send_with_token)
+        finally:
+            required_lsn.reset(reset_token)
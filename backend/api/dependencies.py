@@ -1,34 +1,122 @@
 # backend/api/dependencies.py
+from typing import Callable, Dict
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 
-from infrastructure.database.connection import get_db_session
-from infrastructure.database.repositories.project_repository_impl import ProjectRepositoryImpl
-from infrastructure.database.repositories.task_repository_impl import TaskRepositoryImpl
+from infrastructure.database.connection import get_db_session, get_read_db_session
+from domain.repositories import ProjectRepository, TaskRepository
+from infrastructure.database.repositories.tombstone_repository_impl import TombstoneRepositoryImpl
+from infrastructure.database.repositories.activity_repository_impl import ActivityRepositoryImpl
+from infrastructure.database.repositories.flow_repository_impl import FlowRepositoryImpl
+from infrastructure.database.repositories.task_report_repository_impl import TaskReportRepositoryImpl
+from infrastructure.activity.writer import activity_log_writer
+from infrastructure.cache import report_cache
+from infrastructure.memory import (
+    InMemoryProjectRepository, InMemoryStore, InMemoryTaskRepository, InMemoryTenantRepository, InMemoryUserRepository
+)
 from application.use_cases.project_use_cases import ProjectUseCases
 from application.use_cases.task_use_cases import TaskUseCases
+from application.use_cases.sync_use_cases import SyncUseCases
+from application.use_cases.activity_use_cases import ActivityUseCases
+from application.use_cases.flow_use_cases import FlowUseCases
+from application.use_cases.report_use_cases import ReportUseCases
 from .auth_middleware import get_current_tenant_id, get_current_user_id
+from .repositories import (
+    get_directory_tenant_repository, get_directory_user_repository, get_read_tenant_repository,
+    get_read_user_repository, repository_backend
+)
 
-# Repository Dependencies
+# Repository Dependencies; projects and tasks come from the configured REPOSITORY_BACKEND
 async def get_project_repository(session: AsyncSession = Depends(get_db_session)):
-    return ProjectRepositoryImpl(session)
+    return repository_backend.projects(session)
 
 async def get_task_repository(session: AsyncSession = Depends(get_db_session)):
-    return TaskRepositoryImpl(session)
+    return repository_backend.tasks(session)
+
+async def get_tombstone_repository(session: AsyncSession = Depends(get_db_session)):
+    return TombstoneRepositoryImpl(session)
+
+async def get_activity_repository(session: AsyncSession = Depends(get_db_session)):
+    return ActivityRepositoryImpl(session)
+
+async def get_flow_repository(session: AsyncSession = Depends(get_db_session)):
+    return FlowRepositoryImpl(session)
+
+async def get_task_report_repository(session: AsyncSession = Depends(get_read_db_session)):
+    return TaskReportRepositoryImpl(session)
+
+# Read-only repositories, served by a replica when one is configured and current
+async def get_read_project_repository(session: AsyncSession = Depends(get_read_db_session)):
+    return repository_backend.projects(session)
+
+async def get_read_task_repository(session: AsyncSession = Depends(get_read_db_session)):
+    return repository_backend.tasks(session)
+
+def in_memory_overrides(store: InMemoryStore) -> Dict[Callable, Callable]:
+    """Overrides for app.dependency_overrides that serve projects, tasks, users and tenants from store"""
+    def provide(repository_class):
+        async def dependency():
+            return repository_class(store)
+        return dependency
+    return {
+        get_project_repository: provide(InMemoryProjectRepository),
+        get_read_project_repository: provide(InMemoryProjectRepository),
+        get_task_repository: provide(InMemoryTaskRepository),
+        get_read_task_repository: provide(InMemoryTaskRepository),
+        get_directory_user_repository: provide(InMemoryUserRepository),
+        get_read_user_repository: provide(InMemoryUserRepository),
+        get_directory_tenant_repository: provide(InMemoryTenantRepository),
+        get_read_tenant_repository: provide(InMemoryTenantRepository),
+    }
 
 # Use Case Dependencies
 async def get_project_use_cases(
-    project_repo: ProjectRepositoryImpl = Depends(get_project_repository)
+    project_repo: ProjectRepository = Depends(get_project_repository)
 ):
-    return ProjectUseCases(project_repo)
+    return ProjectUseCases(project_repo, activity_log_writer)
 
 async def get_task_use_cases(
-    task_repo: TaskRepositoryImpl = Depends(get_task_repository),
-    project_repo: ProjectRepositoryImpl = Depends(get_project_repository)
+    task_repo: TaskRepository = Depends(get_task_repository),
+    project_repo: ProjectRepository = Depends(get_project_repository)
+):
+    return TaskUseCases(task_repo, project_repo, activity_log_writer)
+
+async def get_read_project_use_cases(
+    project_repo: ProjectRepository = Depends(get_read_project_repository)
+):
+    return ProjectUseCases(project_repo)
+
+async def get_read_task_use_cases(
+    task_repo: TaskRepository = Depends(get_read_task_repository),
+    project_repo: ProjectRepository = Depends(get_read_project_repository)
 ):
     return TaskUseCases(task_repo, project_repo)
 
+async def get_sync_use_cases(
+    project_repo: ProjectRepository = Depends(get_project_repository),
+    task_repo: TaskRepository = Depends(get_task_repository),
+    tombstone_repo: TombstoneRepositoryImpl = Depends(get_tombstone_repository)
+):
+    return SyncUseCases(project_repo, task_repo, tombstone_repo)
+
+async def get_activity_use_cases(
+    activity_repo: ActivityRepositoryImpl = Depends(get_activity_repository),
+    project_repo: ProjectRepository = Depends(get_project_repository)
+):
+    return ActivityUseCases(activity_repo, project_repo)
+
+async def get_flow_use_cases(
+    flow_repo: FlowRepositoryImpl = Depends(get_flow_repository),
+    project_repo: ProjectRepository = Depends(get_project_repository)
+):
+    return FlowUseCases(flow_repo, project_repo)
+
+async def get_report_use_cases(
+    report_repo: TaskReportRepositoryImpl = Depends(get_task_report_repository)
+):
+    return ReportUseCases(report_repo, report_cache)
+
 # Authentication Dependencies - Replace the mock ones
 async def get_current_tenant(tenant_id: uuid.UUID = Depends(get_current_tenant_id)) -> uuid.UUID:
     """Get current tenant ID from JWT token"""
@@ -0,0 +1,65 @@
+# backend/api/metrics_middleware.py
+import asyncio
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.allocation_tracer import allocation_tracer
+from infrastructure.database.instrumentation import QueryStats, current_query_stats
+from infrastructure.loop_monitor import requests_in_flight
+from infrastructure.metrics import (
+    db_pool_wait_per_request, db_statements_per_request, db_time_per_request,
+    http_request_duration, http_requests_in_flight, query_budget_exceeded
+)
+from .query_budget import budget_of
+
+class RequestMetricsMiddleware:
+    """
+    Latency, SQL statements, DB time and pool wait of every request, labelled
+    with the route template (not the raw path) so ids don't explode the series.
+    Add it last so it wraps the other middleware and their queries.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = QueryStats(scope)
+        # Exposed as request.state.query_stats, and to whoever called the app with this scope
+        scope.setdefault("state", {})["query_stats"] = stats
+        reset_token = current_query_stats.set(stats)
+        # Lets the loop monitor name the request that blocked the loop
+        task = asyncio.current_task()
+        requests_in_flight[task] = scope
+        http_requests_in_flight.inc()
+        # None unless an admin is tracing allocations and this route's peaks are wanted
+        allocations = allocation_tracer.begin_request(scope)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            if allocations is not None:
+                allocation_tracer.end_request(allocations)
+            http_requests_in_flight.dec()
+            requests_in_flight.pop(task, None)
+            current_query_stats.reset(reset_token)
+            # Unmatched paths share one label
+            labels = (scope["method"], stats.route or "unmatched", str(status_code))
+            http_request_duration.labels(*labels).observe(elapsed)
+            db_statements_per_request.labels(*labels).observe(stats.statements)
+            db_time_per_request.labels(*labels).observe(stats.db_seconds)
+            db_pool_wait_per_request.labels(*labels).observe(stats.pool_wait_seconds)
+            budget = budget_of(scope.get("route"))
+            if budget is not None and stats.statements > budget:
+                query_budget_exceeded.labels(scope["method"], stats.route).inc()
@@ -0,0 +1,79 @@
+# backend/api/profiling_middleware.py
+from datetime import datetime
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from domain.identifiers import uuid7
+from infrastructure.metrics import request_profiles
+from infrastructure.profiling import RequestProfiler, request_profiler
+from .auth_middleware import admin_key_matches
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_ID_HEADER = b"x-profile-id"
+
+class ProfilingMiddleware:
+    """
+    Profiles a request when an admin sends X-Profile: 1 with X-Admin-Key, or
+    when PROFILING_SAMPLE_RATE picks it. The response then carries
+    X-Profile-Id, to fetch from /api/v1/admin/profiles/{id}. Any other
+    request costs one pass over its headers.
+    """
+    def __init__(self, app: ASGIApp, profiler: RequestProfiler = request_profiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        trigger = self.trigger(scope)
+        if trigger is None:
+            await self.app(scope, receive, send)
+            return
+        await self.profile(scope, receive, send, trigger)
+
+    def trigger(self, scope: Scope):
+        requested, admin_key = None, None
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                requested = value
+            elif name == b"x-admin-key":
+                admin_key = value
+        if requested == b"1" and admin_key is not None and admin_key_matches(admin_key.decode("latin-1")):
+            return "header"
+        return "sampled" if self.profiler.sampled() else None
+
+    async def profile(self, scope: Scope, receive: Receive, send: Send, trigger: str) -> None:
+        # Stacks start at this frame, leaving out the server and the middleware around it
+        sampler = self.profiler.start(ProfilingMiddleware.profile.__code__)
+        if sampler is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid7()
+        status_code = 500
+
+        async def send_with_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [*message.get("headers", []), (PROFILE_ID_HEADER, str(profile_id).encode())]
+            await send(message)
+
+        started_at = datetime.utcnow()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            route = scope.get("route")
+            await self.profiler.finish(sampler, {
+                "id": str(profile_id),
+                "started_at": started_at.isoformat(),
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": route.path if route is not None else None,
+                "status": status_code,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+                "trigger": trigger
+            })
+            request_profiles.labels(trigger).inc()
@@ -0,0 +1,22 @@
+# backend/api/query_budget.py
+"""
+Query budgets: the most SQL statements one request to an endpoint may run.
+
+Routes declare theirs with @query_budget(n) under the router decorator,
+as part of the endpoint's contract. tests/test_query_budgets.py drives
+every route against a real database and fails when a request goes over,
+which catches N+1 queries and extra round trips. In production,
+RequestMetricsMiddleware counts requests over budget in
+askbob_query_budget_exceeded_total.
+"""
+from typing import Callable, Optional
+from starlette.routing import BaseRoute
+
+def query_budget(statements: int) -> Callable:
+    def declare(endpoint: Callable) -> Callable:
+        endpoint.query_budget = statements
+        return endpoint
+    return declare
+
+def budget_of(route: Optional[BaseRoute]) -> Optional[int]:
+    return getattr(getattr(route, "endpoint", None), "query_budget", None)
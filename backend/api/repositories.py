@@ -0,0 +1,66 @@
+# backend/api/repositories.py
+"""
+Repository implementations the API builds per request, chosen with
+REPOSITORY_BACKEND: "sqlalchemy" (the default) maps through the ORM,
+"asyncpg" runs the same queries on the driver directly. Tests and
+profiling runs can swap in other implementations with FastAPI's
+dependency_overrides (see in_memory_overrides in api/dependencies.py).
+"""
+import os
+from typing import Dict, Type
+from fastapi import Depends
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.repositories import ProjectRepository, TaskRepository, TenantRepository, UserRepository
+from infrastructure.database.connection import DATABASE_URL, get_directory_db_session, get_read_db_session
+from infrastructure.database.repositories.project_repository_impl import ProjectRepositoryImpl
+from infrastructure.database.repositories.task_repository_impl import TaskRepositoryImpl
+from infrastructure.database.repositories.tenant_repository_impl import TenantRepositoryImpl
+from infrastructure.database.repositories.user_repository_impl import UserRepositoryImpl
+from infrastructure.database.repositories.raw import (
+    AsyncpgProjectRepository, AsyncpgTaskRepository, AsyncpgTenantRepository, AsyncpgUserRepository
+)
+
+class RepositoryBackend:
+    """Repository classes that are each constructed from a request's AsyncSession"""
+    def __init__(
+        self,
+        projects: Type[ProjectRepository],
+        tasks: Type[TaskRepository],
+        users: Type[UserRepository],
+        tenants: Type[TenantRepository]
+    ):
+        self.projects = projects
+        self.tasks = tasks
+        self.users = users
+        self.tenants = tenants
+
+REPOSITORY_BACKENDS: Dict[str, RepositoryBackend] = {
+    "sqlalchemy": RepositoryBackend(ProjectRepositoryImpl, TaskRepositoryImpl, UserRepositoryImpl, TenantRepositoryImpl),
+    "asyncpg": RepositoryBackend(
+        AsyncpgProjectRepository, AsyncpgTaskRepository, AsyncpgUserRepository, AsyncpgTenantRepository
+    ),
+}
+
+def select_backend(name: str, database_url: str) -> RepositoryBackend:
+    if name not in REPOSITORY_BACKENDS:
+        raise ValueError(f"Unknown REPOSITORY_BACKEND {name!r}; expected one of {sorted(REPOSITORY_BACKENDS)}")
+    if name == "asyncpg" and make_url(database_url).get_driver_name() != "asyncpg":
+        raise ValueError("REPOSITORY_BACKEND=asyncpg needs a postgresql+asyncpg DATABASE_URL")
+    return REPOSITORY_BACKENDS[name]
+
+repository_backend = select_backend(os.getenv("REPOSITORY_BACKEND", "sqlalchemy"), DATABASE_URL)
+
+# User and tenant repositories for authentication, which looks users up in the directory
+async def get_directory_user_repository(session: AsyncSession = Depends(get_directory_db_session)) -> UserRepository:
+    return repository_backend.users(session)
+
+async def get_directory_tenant_repository(session: AsyncSession = Depends(get_directory_db_session)) -> TenantRepository:
+    return repository_backend.tenants(session)
+
+async def get_read_user_repository(session: AsyncSession = Depends(get_read_db_session)) -> UserRepository:
+    return repository_backend.users(session)
+
+async def get_read_tenant_repository(session: AsyncSession = Depends(get_read_db_session)) -> TenantRepository:
+    return repository_backend.tenants(session)
@@ -1,5 +1,5 @@
 """API routes module initialization."""
 
-from . import projects, tasks, auth
+from . import projects, tasks, auth, sync, events, activity
 
-__all__ = ["projects", "tasks", "auth"]
\ No newline at end of file
+__all__ = ["projects", "tasks", "auth", "sync", "events", "activity"]
\ No newline at end of file
@@ -0,0 +1,38 @@
+# backend/api/routes/activity.py
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
+import uuid
+
+from application.use_cases.activity_use_cases import ActivityUseCases, decode_cursor
+from application.dto.activity_dto import ActivityResponse, ActivityPageResponse
+from api.dependencies import get_activity_use_cases, get_current_tenant
+from api.query_budget import query_budget
+
+router = APIRouter()
+
+@router.get("/projects/{project_id}/activity", response_model=ActivityPageResponse)
+@query_budget(6)
+async def list_project_activity(
+    project_id: uuid.UUID,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    activity_use_cases: ActivityUseCases = Depends(get_activity_use_cases),
+    tenant_id: uuid.UUID = Depends(get_current_tenant)
+):
+    """Get the change history of a project and its tasks, newest first"""
+    try:
+        before = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid activity cursor")
+
+    try:
+        entries, next_cursor = await activity_use_cases.get_project_activity(
+            project_id, tenant_id, limit=limit, before=before
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    return ActivityPageResponse(
+        items=[ActivityResponse.model_validate(entry) for entry in entries],
+        next_cursor=next_cursor
+    )
@@ -0,0 +1,88 @@
+# backend/api/routes/admin.py
+import asyncio
+import uuid
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from api.auth_middleware import require_admin_key
+from infrastructure.allocation_tracer import allocation_tracer
+from infrastructure.database.slow_queries import slow_query_log
+from infrastructure.profiling import collapsed, request_profiler, speedscope
+from api.query_budget import query_budget
+
+router = APIRouter(dependencies=[Depends(require_admin_key)])
+
+@router.get("/admin/slow-queries")
+@query_budget(0)
+async def get_slow_queries(limit: int = Query(50, ge=1, le=1000)):
+    """Recent statements over SLOW_QUERY_THRESHOLD_MS, newest first, with their plans"""
+    return {**slow_query_log.stats(), "queries": slow_query_log.recent(limit)}
+
+@router.get("/admin/profiles")
+@query_budget(0)
+async def list_profiles(limit: int = Query(50, ge=1, le=1000)):
+    """Stored request profiles, newest first, without their stacks"""
+    return {"profiles": await asyncio.to_thread(request_profiler.store.recent, limit)}
+
+@router.get("/admin/profiles/{profile_id}")
+@query_budget(0)
+async def get_profile(
+    profile_id: uuid.UUID,
+    format: str = Query("collapsed", pattern="^(collapsed|speedscope|json)$")
+):
+    """One profile as collapsed stacks (flamegraph.pl, speedscope), speedscope JSON, or as stored"""
+    profile = await asyncio.to_thread(request_profiler.store.get, profile_id)
+    if profile is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    if format == "collapsed":
+        return PlainTextResponse(collapsed(profile))
+    return speedscope(profile) if format == "speedscope" else profile
+
+@router.get("/admin/memory")
+@query_budget(0)
+async def get_memory_status():
+    """Whether allocations are traced, the kept snapshots, and peak allocation per traced route"""
+    return allocation_tracer.status()
+
+@router.post("/admin/memory/start")
+@query_budget(0)
+async def start_memory_tracing(frames: int = Query(1, ge=1)):
+    """Start tracemalloc, keeping up to `frames` frames (capped by TRACEMALLOC_MAX_FRAMES) per allocation"""
+    try:
+        await allocation_tracer.start(frames)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return allocation_tracer.status()
+
+@router.post("/admin/memory/stop")
+@query_budget(0)
+async def stop_memory_tracing():
+    """Stop tracemalloc; snapshots taken so far can still be diffed"""
+    try:
+        await allocation_tracer.stop()
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return allocation_tracer.status()
+
+@router.post("/admin/memory/snapshots")
+@query_budget(0)
+async def take_memory_snapshot(limit: int = Query(25, ge=1, le=1000)):
+    """Snapshot traced allocations; returns its id and the lines holding the most memory"""
+    try:
+        return await asyncio.to_thread(allocation_tracer.take_snapshot, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+@router.get("/admin/memory/diff")
+@query_budget(0)
+async def diff_memory_snapshots(
+    first: int,
+    second: int,
+    group_by: str = Query("lineno", pattern="^(lineno|filename|traceback)$"),
+    limit: int = Query(25, ge=1, le=1000)
+):
+    """Allocation growth from snapshot `first` to `second`, biggest first"""
+    try:
+        return await asyncio.to_thread(allocation_tracer.diff, first, second, group_by, limit)
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -1,25 +1,36 @@
 # backend/api/routes/auth.py
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from application.use_cases.auth_use_cases import AuthUseCases
 from application.dto.auth_dto import LoginRequest, RegisterRequest, TokenResponse
-from infrastructure.database.connection import get_db_session
-from infrastructure.database.repositories.user_repository_impl import UserRepositoryImpl
-from infrastructure.database.repositories.tenant_repository_impl import TenantRepositoryImpl
+from domain.repositories import TenantRepository, UserRepository
 from infrastructure.auth.jwt_handler import JWTHandler
+from infrastructure.database.sharding import tenant_placement
+from api.query_budget import query_budget
+from ..repositories import (
+    get_directory_tenant_repository, get_directory_user_repository, get_read_tenant_repository, get_read_user_repository
+)
 
 router = APIRouter()
 security = HTTPBearer()
 
-async def get_auth_dependencies(session: AsyncSession = Depends(get_db_session)):
-    user_repo = UserRepositoryImpl(session)
-    tenant_repo = TenantRepositoryImpl(session)
+async def get_auth_dependencies(
+    # Registration and login look users up by email, so they always use the directory
+    user_repo: UserRepository = Depends(get_directory_user_repository),
+    tenant_repo: TenantRepository = Depends(get_directory_tenant_repository)
+):
     jwt_handler = JWTHandler()
-    return AuthUseCases(user_repo, tenant_repo, jwt_handler)
+    return AuthUseCases(user_repo, tenant_repo, jwt_handler, tenant_placement)
+
+async def get_read_auth_dependencies(
+    user_repo: UserRepository = Depends(get_read_user_repository),
+    tenant_repo: TenantRepository = Depends(get_read_tenant_repository)
+):
+    return AuthUseCases(user_repo, tenant_repo, JWTHandler())
 
 @router.post("/auth/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
+@query_budget(9)
 async def register_user(
     request: RegisterRequest,
     auth_use_cases: AuthUseCases = Depends(get_auth_dependencies)
@@ -34,6 +45,7 @@ async def register_user(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Registration failed")
 
 @router.post("/auth/login", response_model=TokenResponse)
+@query_budget(2)
 async def login_user(
     request: LoginRequest,
     auth_use_cases: AuthUseCases = Depends(get_auth_dependencies)
@@ -48,9 +60,10 @@ async def login_user(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Login failed")
 
 @router.get("/auth/me")
+@query_budget(2)
 async def get_current_user_info(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    auth_use_cases: AuthUseCases = Depends(get_auth_dependencies)
+    auth_use_cases: AuthUseCases = Depends(get_read_auth_dependencies)
 ):
     """Get current user information from JWT token"""
     try:
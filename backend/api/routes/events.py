@@ -0,0 +1,59 @@
+# backend/api/routes/events.py
+import asyncio
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+import uuid
+
+from infrastructure.database.connection import get_read_db_session
+from infrastructure.realtime.broker import Subscription, change_broker, encode_event
+from api.dependencies import get_current_tenant
+from api.query_budget import query_budget
+
+router = APIRouter()
+
+# Tell EventSource clients how long to wait before reconnecting
+RECONNECT_DELAY_MS = 3000
+
+async def _event_stream(request: Request, subscription: Subscription):
+    try:
+        yield f"retry: {RECONNECT_DELAY_MS}\n\n"
+        while True:
+            if subscription.needs_resync:
+                # The client fell behind; it must catch up through /sync
+                yield "event: resync\ndata: {}\n\n"
+                return
+            try:
+                change = await asyncio.wait_for(
+                    subscription.queue.get(), timeout=change_broker.heartbeat_seconds
+                )
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    return
+                yield ": heartbeat\n\n"
+                continue
+            if subscription.needs_resync:
+                # Woken by request_resync(), or this event came after the gap
+                continue
+            yield f"event: change\ndata: {encode_event(change)}\n\n"
+    finally:
+        change_broker.unsubscribe(subscription)
+
+@router.get("/events")
+@query_budget(2)
+async def stream_changes(
+    request: Request,
+    tenant_id: uuid.UUID = Depends(get_current_tenant),
+    session: AsyncSession = Depends(get_read_db_session)
+):
+    """Stream project and task changes for the current tenant as Server-Sent Events"""
+    # Authentication is done; give the connection back to the pool instead
+    # of holding it for the lifetime of the stream
+    await session.close()
+
+    subscription = change_broker.subscribe(tenant_id)
+    return StreamingResponse(
+        _event_stream(request, subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,39 @@
+# backend/api/routes/flow.py
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+import uuid
+
+from application.use_cases.flow_use_cases import FlowUseCases
+from application.dto.flow_dto import FlowDayResponse, FlowResponse
+from api.dependencies import get_flow_use_cases, get_current_tenant
+from api.query_budget import query_budget
+
+router = APIRouter()
+
+@router.get("/projects/{project_id}/flow", response_model=FlowResponse)
+@query_budget(6)
+async def get_project_flow(
+    project_id: uuid.UUID,
+    start: date = Query(..., alias="from"),
+    end: date = Query(..., alias="to"),
+    flow_use_cases: FlowUseCases = Depends(get_flow_use_cases),
+    tenant_id: uuid.UUID = Depends(get_current_tenant)
+):
+    """Get end-of-day task counts per status, read from the daily rollups"""
+    if end < start:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="'from' must not be after 'to'")
+    if (end - start).days >= flow_use_cases.max_days:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Date range cannot exceed {flow_use_cases.max_days} days"
+        )
+
+    try:
+        days = await flow_use_cases.get_project_flow(project_id, tenant_id, start, end)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    return FlowResponse(
+        project_id=project_id,
+        days=[FlowDayResponse.model_validate(day) for day in days]
+    )
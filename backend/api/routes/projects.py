@@ -5,11 +5,13 @@ import uuid
 
 from application.use_cases.project_use_cases import ProjectUseCases
 from application.dto.project_dto import CreateProjectRequest, UpdateProjectRequest, ProjectResponse
-from api.dependencies import get_project_use_cases, get_current_tenant, get_current_user
+from api.dependencies import get_project_use_cases, get_read_project_use_cases, get_current_tenant, get_current_user
+from api.query_budget import query_budget
 
 router = APIRouter()
 
 @router.post("/projects", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
+@query_budget(7)
 async def create_project(
     request: CreateProjectRequest,
     project_use_cases: ProjectUseCases = Depends(get_project_use_cases),
@@ -39,8 +41,9 @@ async def create_project(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.get("/projects", response_model=List[ProjectResponse])
+@query_budget(5)
 async def list_projects(
-    project_use_cases: ProjectUseCases = Depends(get_project_use_cases),
+    project_use_cases: ProjectUseCases = Depends(get_read_project_use_cases),
     tenant_id: uuid.UUID = Depends(get_current_tenant)
 ):
     """Get all projects for the current tenant"""
@@ -61,9 +64,10 @@ async def list_projects(
     ]
 
 @router.get("/projects/{project_id}", response_model=ProjectResponse)
+@query_budget(3)
 async def get_project(
     project_id: uuid.UUID,
-    project_use_cases: ProjectUseCases = Depends(get_project_use_cases),
+    project_use_cases: ProjectUseCases = Depends(get_read_project_use_cases),
     tenant_id: uuid.UUID = Depends(get_current_tenant)
 ):
     """Get a specific project"""
@@ -84,11 +88,13 @@ async def get_project(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 @router.put("/projects/{project_id}", response_model=ProjectResponse)
+@query_budget(8)
 async def update_project(
     project_id: uuid.UUID,
     request: UpdateProjectRequest,
     project_use_cases: ProjectUseCases = Depends(get_project_use_cases),
-    tenant_id: uuid.UUID = Depends(get_current_tenant)
+    tenant_id: uuid.UUID = Depends(get_current_tenant),
+    user_id: uuid.UUID = Depends(get_current_user)
 ):
     """Update a project"""
     try:
@@ -97,7 +103,8 @@ async def update_project(
             tenant_id=tenant_id,
             name=request.name,
             description=request.description,
-            status=request.status
+            status=request.status,
+            actor_id=user_id
         )
         
         return ProjectResponse(
@@ -114,14 +121,16 @@ async def update_project(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 @router.delete("/projects/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
+@query_budget(9)
 async def delete_project(
     project_id: uuid.UUID,
     project_use_cases: ProjectUseCases = Depends(get_project_use_cases),
-    tenant_id: uuid.UUID = Depends(get_current_tenant)
+    tenant_id: uuid.UUID = Depends(get_current_tenant),
+    user_id: uuid.UUID = Depends(get_current_user)
 ):
     """Delete a project"""
     try:
-        success = await project_use_cases.delete_project(project_id, tenant_id)
+        success = await project_use_cases.delete_project(project_id, tenant_id, actor_id=user_id)
         if not success:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
     except ValueError as e:
@@ -0,0 +1,37 @@
+# backend/api/routes/reports.py
+from datetime import date, datetime, time, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
+import uuid
+
+from application.use_cases.report_use_cases import ReportUseCases
+from application.dto.report_dto import AssigneeWorkloadResponse, WorkloadReportResponse
+from api.dependencies import get_report_use_cases, get_current_tenant
+from api.query_budget import query_budget
+
+router = APIRouter()
+
+@router.get("/reports/workload", response_model=WorkloadReportResponse)
+@query_budget(3)
+async def get_workload_report(
+    start: Optional[date] = Query(None, alias="from", description="First day, defaults to 30 days before 'to'"),
+    end: Optional[date] = Query(None, alias="to", description="Last day (inclusive), defaults to today"),
+    report_use_cases: ReportUseCases = Depends(get_report_use_cases),
+    tenant_id: uuid.UUID = Depends(get_current_tenant)
+):
+    """Get open tasks by priority, throughput, cycle time and overdue ratio per assignee"""
+    end = end or datetime.utcnow().date()
+    start = start or end - timedelta(days=30)
+    if end < start:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="'from' must not be after 'to'")
+
+    # Whole UTC days keep the cache key stable for the day
+    window_start = datetime.combine(start, time.min)
+    window_end = datetime.combine(end + timedelta(days=1), time.min)
+    assignees = await report_use_cases.get_workload(tenant_id, window_start, window_end)
+
+    return WorkloadReportResponse(
+        start=window_start,
+        end=window_end,
+        assignees=[AssigneeWorkloadResponse.model_validate(assignee) for assignee in assignees]
+    )
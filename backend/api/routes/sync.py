@@ -0,0 +1,40 @@
+# backend/api/routes/sync.py
+from datetime import datetime, timezone
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
+import uuid
+
+from application.use_cases.sync_use_cases import SyncUseCases
+from application.dto.project_dto import ProjectResponse
+from application.dto.task_dto import TaskResponse
+from application.dto.sync_dto import SyncResponse, TombstoneResponse
+from api.dependencies import get_sync_use_cases, get_current_tenant
+from api.query_budget import query_budget
+
+router = APIRouter()
+
+@router.get("/sync", response_model=SyncResponse)
+@query_budget(5)
+async def sync_changes(
+    since: Optional[str] = Query(None, description="Cursor returned by the previous sync"),
+    sync_use_cases: SyncUseCases = Depends(get_sync_use_cases),
+    tenant_id: uuid.UUID = Depends(get_current_tenant)
+):
+    """Get projects, tasks and deletions changed since the given cursor"""
+    try:
+        since_at = datetime.fromisoformat(since) if since else None
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid sync cursor")
+    # Timestamps are stored as naive UTC, and aware ones can't be compared with them
+    if since_at is not None and since_at.tzinfo is not None:
+        since_at = since_at.astimezone(timezone.utc).replace(tzinfo=None)
+
+    changes = await sync_use_cases.get_changes(tenant_id, since_at)
+
+    return SyncResponse(
+        cursor=changes.cursor.isoformat(),
+        reset=changes.reset,
+        projects=[ProjectResponse.model_validate(project) for project in changes.projects],
+        tasks=[TaskResponse.model_validate(task) for task in changes.tasks],
+        deleted=[TombstoneResponse.model_validate(tombstone) for tombstone in changes.tombstones]
+    )
@@ -5,11 +5,13 @@ import uuid
 
 from application.use_cases.task_use_cases import TaskUseCases
 from application.dto.task_dto import CreateTaskRequest, UpdateTaskRequest, TaskResponse
-from api.dependencies import get_task_use_cases, get_current_tenant, get_current_user
+from api.dependencies import get_task_use_cases, get_read_task_use_cases, get_current_tenant, get_current_user
+from api.query_budget import query_budget
 
 router = APIRouter()
 
 @router.post("/projects/{project_id}/tasks", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
+@query_budget(9)
 async def create_task(
     project_id: uuid.UUID,
     request: CreateTaskRequest,
@@ -48,14 +50,16 @@ async def create_task(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.get("/projects/{project_id}/tasks", response_model=List[TaskResponse])
+@query_budget(6)
 async def list_tasks_by_project(
     project_id: uuid.UUID,
-    task_use_cases: TaskUseCases = Depends(get_task_use_cases),
+    include_archived: bool = False,
+    task_use_cases: TaskUseCases = Depends(get_read_task_use_cases),
     tenant_id: uuid.UUID = Depends(get_current_tenant)
 ):
-    """Get all tasks for a project"""
+    """Get all tasks for a project; archived completed tasks only with include_archived=true"""
     try:
-        tasks = await task_use_cases.get_tasks_by_project(project_id, tenant_id)
+        tasks = await task_use_cases.get_tasks_by_project(project_id, tenant_id, include_archived)
         
         return [
             TaskResponse(
@@ -70,7 +74,8 @@ async def list_tasks_by_project(
                 assigned_to=task.assigned_to,
                 due_date=task.due_date,
                 created_at=task.created_at,
-                updated_at=task.updated_at
+                updated_at=task.updated_at,
+                archived_at=task.archived_at
             )
             for task in tasks
         ]
@@ -78,11 +83,13 @@ async def list_tasks_by_project(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 @router.put("/tasks/{task_id}", response_model=TaskResponse)
+@query_budget(9)
 async def update_task(
     task_id: uuid.UUID,
     request: UpdateTaskRequest,
     task_use_cases: TaskUseCases = Depends(get_task_use_cases),
-    tenant_id: uuid.UUID = Depends(get_current_tenant)
+    tenant_id: uuid.UUID = Depends(get_current_tenant),
+    user_id: uuid.UUID = Depends(get_current_user)
 ):
     """Update a task"""
     try:
@@ -94,7 +101,8 @@ async def update_task(
             status=request.status,
             priority=request.priority,
             assigned_to=request.assigned_to,
-            due_date=request.due_date
+            due_date=request.due_date,
+            actor_id=user_id
         )
         
         return TaskResponse(
@@ -115,14 +123,16 @@ async def update_task(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 @router.delete("/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
+@query_budget(10)
 async def delete_task(
     task_id: uuid.UUID,
     task_use_cases: TaskUseCases = Depends(get_task_use_cases),
-    tenant_id: uuid.UUID = Depends(get_current_tenant)
+    tenant_id: uuid.UUID = Depends(get_current_tenant),
+    user_id: uuid.UUID = Depends(get_current_user)
 ):
     """Delete a task"""
     try:
-        success = await task_use_cases.delete_task(task_id, tenant_id)
+        success = await task_use_cases.delete_task(task_id, tenant_id, actor_id=user_id)
         if not success:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
     except ValueError as e:
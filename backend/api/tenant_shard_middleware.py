@@ -0,0 +1,50 @@
+# backend/api/tenant_shard_middleware.py
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from infrastructure.auth.jwt_handler import JWTHandler
+from infrastructure.database.connection import current_shard
+from infrastructure.database.sharding import SHARD_MOVING, ShardDirectory
+from .consistency_middleware import READ_METHODS
+
+# How long clients should wait before retrying a write during a tenant move
+MOVE_RETRY_AFTER_SECONDS = "5"
+
+class TenantShardMiddleware:
+    """
+    Bind the request to the shard of the tenant in its JWT, so database
+    sessions handed out by get_db_session use that tenant's cluster.
+    """
+    def __init__(self, app: ASGIApp, directory: ShardDirectory):
+        self.app = app
+        self.directory = directory
+        self.jwt_handler = JWTHandler()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.directory.sharded:
+            await self.app(scope, receive, send)
+            return
+
+        scheme, _, credentials = Headers(scope=scope).get("authorization", "").partition(" ")
+        token_data = self.jwt_handler.verify_token(credentials) if scheme.lower() == "bearer" else None
+        if token_data is None:
+            # Unauthenticated requests use the default shard; protected routes reject them anyway
+            await self.app(scope, receive, send)
+            return
+
+        assignment = await self.directory.assignment(token_data.tenant_id)
+        if assignment.state == SHARD_MOVING and scope["method"] not in READ_METHODS:
+            response = JSONResponse(
+                {"detail": "Tenant is being moved, please retry shortly"},
+                status_code=503,
+                headers={"Retry-After": MOVE_RETRY_AFTER_SECONDS}
+            )
+            await response(scope, receive, send)
+            return
+
+        reset_token = current_shard.set(assignment.shard)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_shard.reset(reset_token)
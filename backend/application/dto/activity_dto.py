@@ -0,0 +1,22 @@
+# backend/application/dto/activity_dto.py
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel
+import uuid
+from domain.entities.change import ChangeType, EntityType
+
+class ActivityResponse(BaseModel):
+    id: uuid.UUID
+    entity_type: EntityType
+    entity_id: uuid.UUID
+    action: ChangeType
+    actor_id: Optional[uuid.UUID]
+    changes: Dict[str, Any]
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class ActivityPageResponse(BaseModel):
+    items: List[ActivityResponse]
+    next_cursor: Optional[str]
@@ -0,0 +1,17 @@
+# backend/application/dto/flow_dto.py
+from datetime import date
+from typing import Dict, List
+from pydantic import BaseModel
+import uuid
+from domain.entities.task import TaskStatus
+
+class FlowDayResponse(BaseModel):
+    day: date
+    counts: Dict[TaskStatus, int]
+
+    class Config:
+        from_attributes = True
+
+class FlowResponse(BaseModel):
+    project_id: uuid.UUID
+    days: List[FlowDayResponse]
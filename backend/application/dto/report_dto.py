@@ -0,0 +1,22 @@
+# backend/application/dto/report_dto.py
+from datetime import datetime
+from typing import Dict, List, Optional
+from pydantic import BaseModel
+import uuid
+from domain.entities.task import TaskPriority
+
+class AssigneeWorkloadResponse(BaseModel):
+    assignee_id: Optional[uuid.UUID]
+    open_total: int
+    open_by_priority: Dict[TaskPriority, int]
+    completed: int
+    avg_cycle_time_hours: Optional[float]
+    overdue_ratio: Optional[float]
+
+    class Config:
+        from_attributes = True
+
+class WorkloadReportResponse(BaseModel):
+    start: datetime
+    end: datetime
+    assignees: List[AssigneeWorkloadResponse]
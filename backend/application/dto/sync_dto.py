@@ -0,0 +1,23 @@
+# backend/application/dto/sync_dto.py
+from datetime import datetime
+from typing import List
+from pydantic import BaseModel
+import uuid
+from domain.entities.change import EntityType
+from .project_dto import ProjectResponse
+from .task_dto import TaskResponse
+
+class TombstoneResponse(BaseModel):
+    entity_type: EntityType
+    entity_id: uuid.UUID
+    deleted_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class SyncResponse(BaseModel):
+    cursor: str
+    reset: bool
+    projects: List[ProjectResponse]
+    tasks: List[TaskResponse]
+    deleted: List[TombstoneResponse]
@@ -33,6 +33,7 @@ class TaskResponse(BaseModel):
     due_date: Optional[datetime]
     created_at: datetime
     updated_at: datetime
+    archived_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
\ No newline at end of file
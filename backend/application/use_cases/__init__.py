@@ -1,4 +1,7 @@
 from .project_use_cases import ProjectUseCases
 from .task_use_cases import TaskUseCases
+from .sync_use_cases import SyncUseCases
+from .flow_use_cases import FlowUseCases
+from .report_use_cases import ReportUseCases
 
-__all__ = ["ProjectUseCases", "TaskUseCases"]
\ No newline at end of file
+__all__ = ["ProjectUseCases", "TaskUseCases", "SyncUseCases", "FlowUseCases", "ReportUseCases"]
\ No newline at end of file
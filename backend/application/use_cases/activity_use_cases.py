@@ -0,0 +1,60 @@
+# backend/application/use_cases/activity_use_cases.py
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import uuid
+from domain.entities.activity import ActivityEntry
+from domain.repositories.activity_repository import ActivityRepository
+from domain.repositories.project_repository import ProjectRepository
+
+def snapshot(entity: Any, fields: Iterable[str]) -> Dict[str, Any]:
+    """JSON-safe copy of the given entity attributes, for change diffs"""
+    values = {}
+    for field in fields:
+        value = getattr(entity, field)
+        if isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, (uuid.UUID, datetime)):
+            value = str(value)
+        values[field] = value
+    return values
+
+def changed_fields(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """Map each changed field to [old, new]"""
+    return {
+        field: [before[field], after[field]]
+        for field in before
+        if before[field] != after[field]
+    }
+
+def encode_cursor(entry: ActivityEntry) -> str:
+    return f"{entry.created_at.isoformat()},{entry.id}"
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    created_at, entry_id = cursor.split(",", 1)
+    return datetime.fromisoformat(created_at), uuid.UUID(entry_id)
+
+class ActivityUseCases:
+    def __init__(
+        self,
+        activity_repository: ActivityRepository,
+        project_repository: ProjectRepository
+    ):
+        self.activity_repository = activity_repository
+        self.project_repository = project_repository
+
+    async def get_project_activity(
+        self,
+        project_id: uuid.UUID,
+        tenant_id: uuid.UUID,
+        limit: int = 50,
+        before: Optional[Tuple[datetime, uuid.UUID]] = None
+    ) -> Tuple[List[ActivityEntry], Optional[str]]:
+        """Get a page of a project's history, newest first, with the next page's cursor"""
+        project = await self.project_repository.get_by_tenant_and_id(tenant_id, project_id)
+        if not project:
+            raise ValueError("Project not found or access denied")
+
+        entries = await self.activity_repository.get_by_project(tenant_id, project_id, limit, before)
+        next_cursor = encode_cursor(entries[-1]) if len(entries) == limit else None
+        return entries, next_cursor
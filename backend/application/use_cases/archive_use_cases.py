@@ -0,0 +1,32 @@
+# backend/application/use_cases/archive_use_cases.py
+import os
+from datetime import datetime, timedelta
+from typing import Optional
+from domain.repositories.task_archive_repository import TaskArchiveRepository
+
+class ArchiveUseCases:
+    def __init__(self, archive_repository: TaskArchiveRepository):
+        self.archive_repository = archive_repository
+        self.default_days = int(os.getenv("TASK_ARCHIVE_AFTER_DAYS", "365"))
+        self.batch_size = int(os.getenv("TASK_ARCHIVE_BATCH_SIZE", "1000"))
+
+    def cutoff(self, tenant_days: Optional[int], now: datetime) -> Optional[datetime]:
+        """When a tenant's done tasks become archivable; None (from 0 days) disables archiving"""
+        days = self.default_days if tenant_days is None else tenant_days
+        return now - timedelta(days=days) if days > 0 else None
+
+    async def archive_completed_tasks(self, now: Optional[datetime] = None) -> int:
+        """Move every tenant's old done tasks into the archive, one small batch at a time"""
+        now = now or datetime.utcnow()
+        archived = 0
+        thresholds = await self.archive_repository.get_tenant_thresholds()
+        for tenant_id, tenant_days in thresholds.items():
+            completed_before = self.cutoff(tenant_days, now)
+            if completed_before is None:
+                continue
+            while True:
+                moved = await self.archive_repository.archive_completed(tenant_id, completed_before, self.batch_size)
+                archived += moved
+                if moved < self.batch_size:
+                    break
+        return archived
@@ -5,6 +5,7 @@ from domain.entities.user import User
 from domain.entities.tenant import Tenant
 from domain.repositories.user_repository import UserRepository
 from domain.repositories.tenant_repository import TenantRepository
+from domain.repositories.tenant_placement import TenantPlacement
 from infrastructure.auth.jwt_handler import JWTHandler
 from application.dto.auth_dto import LoginRequest, RegisterRequest, TokenResponse
 
@@ -13,11 +14,13 @@ class AuthUseCases:
         self, 
         user_repository: UserRepository,
         tenant_repository: TenantRepository,
-        jwt_handler: JWTHandler
+        jwt_handler: JWTHandler,
+        tenant_placement: Optional[TenantPlacement] = None
     ):
         self.user_repository = user_repository
         self.tenant_repository = tenant_repository
         self.jwt_handler = jwt_handler
+        self.tenant_placement = tenant_placement
     
     async def register_user(self, user_data: RegisterRequest) -> TokenResponse:
         """Register a new user and create their tenant"""
@@ -61,6 +64,10 @@ class AuthUseCases:
             created_user = await self.user_repository.create(user)
             print(f"✅ DEBUG: User created with ID: {created_user.id}")
             
+            # Put the new tenant on its shard before handing out a token for it
+            if self.tenant_placement is not None:
+                await self.tenant_placement.place(created_tenant, created_user)
+            
             # Generate JWT token
             print(f"🔄 DEBUG: Generating JWT token...")
             access_token = self.jwt_handler.create_access_token(
@@ -0,0 +1,97 @@
+# backend/application/use_cases/flow_use_cases.py
+from datetime import date, datetime, time, timedelta
+from itertools import groupby
+import os
+from typing import Iterable, List, Optional
+import uuid
+from domain.entities.flow import DailyStatusCounts, StatusTransition
+from domain.repositories.flow_repository import FlowRepository
+from domain.repositories.project_repository import ProjectRepository
+
+FLOW_ROLLUP_CHECKPOINT = "project_flow_daily"
+
+def replay_transitions(
+    baseline: Optional[DailyStatusCounts],
+    transitions: Iterable[StatusTransition]
+) -> List[DailyStatusCounts]:
+    """End-of-day counts for each day with transitions, starting from the baseline's counts"""
+    counts = dict(baseline.counts) if baseline else {}
+    rollups = []
+    for day, day_transitions in groupby(transitions, key=lambda transition: transition.changed_at.date()):
+        for transition in day_transitions:
+            if transition.from_status is not None:
+                counts[transition.from_status] = counts.get(transition.from_status, 0) - 1
+            if transition.to_status is not None:
+                counts[transition.to_status] = counts.get(transition.to_status, 0) + 1
+        rollups.append(DailyStatusCounts(day=day, counts=counts))
+    return rollups
+
+def forward_fill(rollups: List[DailyStatusCounts], start: date, end: date) -> List[DailyStatusCounts]:
+    """One entry per day in [start, end], carrying counts over days without changes"""
+    days = []
+    counts = {}
+    index = 0
+    day = start
+    while day <= end:
+        while index < len(rollups) and rollups[index].day <= day:
+            counts = rollups[index].counts
+            index += 1
+        days.append(DailyStatusCounts(day=day, counts=counts))
+        day += timedelta(days=1)
+    return days
+
+class FlowUseCases:
+    def __init__(
+        self,
+        flow_repository: FlowRepository,
+        project_repository: Optional[ProjectRepository] = None
+    ):
+        self.flow_repository = flow_repository
+        self.project_repository = project_repository
+        self.max_days = int(os.getenv("FLOW_MAX_DAYS", "366"))
+        # Transitions newer than this may still belong to open transactions
+        self.settle_seconds = int(os.getenv("FLOW_ROLLUP_SETTLE_SECONDS", "60"))
+
+    async def get_project_flow(
+        self,
+        project_id: uuid.UUID,
+        tenant_id: uuid.UUID,
+        start: date,
+        end: date
+    ) -> List[DailyStatusCounts]:
+        """Get daily task counts per status for a cumulative-flow or burndown chart"""
+        project = await self.project_repository.get_by_tenant_and_id(tenant_id, project_id)
+        if not project:
+            raise ValueError("Project not found or access denied")
+
+        rollups = await self.flow_repository.get_rollups(tenant_id, project_id, start, end)
+        return forward_fill(rollups, start, end)
+
+    async def refresh_rollups(self, now: Optional[datetime] = None) -> int:
+        """Recompute rollups of projects with new transitions, from their earliest changed day"""
+        until = (now or datetime.utcnow()) - timedelta(seconds=self.settle_seconds)
+        processed_until = await self.flow_repository.get_checkpoint(FLOW_ROLLUP_CHECKPOINT)
+        if processed_until is not None and until <= processed_until:
+            return 0
+        changed = await self.flow_repository.get_changed_projects(processed_until, until)
+
+        for project_id, (tenant_id, first_change) in changed.items():
+            await self.rebuild_project(tenant_id, project_id, first_change.date(), until)
+
+        await self.flow_repository.set_checkpoint(FLOW_ROLLUP_CHECKPOINT, until)
+        return len(changed)
+
+    async def rebuild_project(
+        self,
+        tenant_id: uuid.UUID,
+        project_id: uuid.UUID,
+        from_day: date,
+        until: datetime
+    ) -> None:
+        """Recompute a project's rollups from from_day with the transitions recorded up to until"""
+        baseline = await self.flow_repository.get_rollup_before(project_id, from_day)
+        transitions = await self.flow_repository.get_transitions(
+            project_id, datetime.combine(from_day, time.min), until
+        )
+        rollups = replay_transitions(baseline, transitions)
+        await self.flow_repository.replace_rollups(tenant_id, project_id, from_day, rollups)
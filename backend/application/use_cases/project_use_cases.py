@@ -1,12 +1,42 @@
 # backend/application/use_cases/project_use_cases.py
-from typing import List
+from typing import Any, Dict, List, Optional
 import uuid
 from domain.entities.project import Project
+from domain.entities.activity import ActivityEntry
+from domain.entities.change import ChangeType, EntityType
 from domain.repositories.project_repository import ProjectRepository
+from domain.repositories.activity_repository import ActivitySink
+from .activity_use_cases import snapshot, changed_fields
+
+TRACKED_FIELDS = ("name", "description", "status")
 
 class ProjectUseCases:
-    def __init__(self, project_repository: ProjectRepository):
+    def __init__(
+        self,
+        project_repository: ProjectRepository,
+        activity_log: Optional[ActivitySink] = None
+    ):
         self.project_repository = project_repository
+        self.activity_log = activity_log
+
+    def _record(
+        self,
+        project: Project,
+        action: ChangeType,
+        actor_id: Optional[uuid.UUID],
+        changes: Optional[Dict[str, Any]] = None
+    ) -> None:
+        if self.activity_log is None:
+            return
+        self.activity_log.record(ActivityEntry(
+            tenant_id=project.tenant_id,
+            project_id=project.id,
+            entity_type=EntityType.PROJECT,
+            entity_id=project.id,
+            action=action,
+            actor_id=actor_id,
+            changes=changes
+        ))
 
     async def create_project(
         self, 
@@ -23,7 +53,12 @@ class ProjectUseCases:
             description=description
         )
         
-        return await self.project_repository.create(project)
+        created = await self.project_repository.create(project)
+        self._record(
+            created, ChangeType.CREATED, created_by,
+            changed_fields(dict.fromkeys(TRACKED_FIELDS), snapshot(created, TRACKED_FIELDS))
+        )
+        return created
 
     async def get_projects_by_tenant(self, tenant_id: uuid.UUID) -> List[Project]:
         """Get all projects for a specific tenant"""
@@ -42,10 +77,12 @@ class ProjectUseCases:
         tenant_id: uuid.UUID,
         name: str = None,
         description: str = None,
-        status = None
+        status = None,
+        actor_id: uuid.UUID = None
     ) -> Project:
         """Update a project ensuring tenant isolation"""
         project = await self.get_project(project_id, tenant_id)
+        before = snapshot(project, TRACKED_FIELDS)
         
         if name is not None:
             project.name = name
@@ -54,9 +91,24 @@ class ProjectUseCases:
         if status is not None:
             project.update_status(status)
             
-        return await self.project_repository.update(project)
+        updated = await self.project_repository.update(project)
+        changes = changed_fields(before, snapshot(updated, TRACKED_FIELDS))
+        if changes:
+            self._record(updated, ChangeType.UPDATED, actor_id, changes)
+        return updated
 
-    async def delete_project(self, project_id: uuid.UUID, tenant_id: uuid.UUID) -> bool:
+    async def delete_project(
+        self,
+        project_id: uuid.UUID,
+        tenant_id: uuid.UUID,
+        actor_id: uuid.UUID = None
+    ) -> bool:
         """Delete a project ensuring tenant isolation"""
         project = await self.get_project(project_id, tenant_id)
-        return await self.project_repository.delete(project.id)
\ No newline at end of file
+        deleted = await self.project_repository.delete(project.id)
+        if deleted:
+            self._record(
+                project, ChangeType.DELETED, actor_id,
+                changed_fields(snapshot(project, TRACKED_FIELDS), dict.fromkeys(TRACKED_FIELDS))
+            )
+        return deleted
\ No newline at end of file
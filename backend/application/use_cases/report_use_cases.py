@@ -0,0 +1,105 @@
+# backend/application/use_cases/report_use_cases.py
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import uuid
+import numpy as np
+from domain.entities.report import AssigneeWorkload, TaskColumns
+from domain.entities.task import TaskPriority, TaskStatus
+from domain.repositories.task_report_repository import TaskReportRepository
+
+PRIORITIES = list(TaskPriority)
+PRIORITY_CODES = {priority: code for code, priority in enumerate(PRIORITIES)}
+DONE = TaskStatus.DONE
+EPOCH = datetime(1970, 1, 1)
+
+def _codes(values, mapping: Dict[Any, int], dtype=np.int64) -> np.ndarray:
+    return np.fromiter((mapping[value] for value in values), dtype=dtype, count=len(values))
+
+def _timestamps(values) -> np.ndarray:
+    # None becomes NaN, and every comparison with NaN is False
+    return np.array(values, dtype=np.float64)
+
+def epoch_seconds(value: datetime) -> float:
+    return (value - EPOCH).total_seconds()
+
+def aggregate_workload(
+    columns: TaskColumns,
+    start: datetime,
+    end: datetime,
+    now: datetime
+) -> List[AssigneeWorkload]:
+    """Per-assignee open tasks by priority, and throughput, cycle time and overdue ratio in [start, end)"""
+    count = len(columns)
+    if count == 0:
+        return []
+
+    assignees: Dict[Optional[uuid.UUID], int] = {}
+    assignee = np.fromiter(
+        (assignees.setdefault(value, len(assignees)) for value in columns.assigned_to),
+        dtype=np.int64,
+        count=count
+    )
+    done = np.fromiter((status is DONE for status in columns.status), dtype=bool, count=count)
+    priority = _codes(columns.priority, PRIORITY_CODES)
+    created_at = _timestamps(columns.created_at)
+    due_date = _timestamps(columns.due_date)
+    started_at = _timestamps(columns.started_at)
+    completed_at = _timestamps(columns.completed_at)
+    window_start, window_end, now = (epoch_seconds(value) for value in (start, end, now))
+    size = len(assignees)
+
+    open_by_priority = np.bincount(
+        assignee[~done] * len(PRIORITIES) + priority[~done],
+        minlength=size * len(PRIORITIES)
+    ).reshape(size, len(PRIORITIES))
+
+    completed = done & (completed_at >= window_start) & (completed_at < window_end)
+    throughput = np.bincount(assignee[completed], minlength=size)
+    # Tasks that never went through IN_PROGRESS count from creation
+    began_at = np.where(np.isnan(started_at), created_at, started_at)
+    cycle_hours = (completed_at[completed] - began_at[completed]) / 3600
+    cycle_hours_sum = np.bincount(assignee[completed], weights=cycle_hours, minlength=size)
+
+    due = (due_date >= window_start) & (due_date < window_end) & (due_date <= now)
+    late = due & (~done | (completed_at > due_date))
+    due_count = np.bincount(assignee[due], minlength=size)
+    late_count = np.bincount(assignee[late], minlength=size)
+
+    report = []
+    for assignee_id, index in assignees.items():
+        report.append(AssigneeWorkload(
+            assignee_id=assignee_id,
+            open_by_priority={
+                priority: int(open_by_priority[index, code]) for code, priority in enumerate(PRIORITIES)
+            },
+            completed=int(throughput[index]),
+            avg_cycle_time_hours=float(cycle_hours_sum[index] / throughput[index]) if throughput[index] else None,
+            overdue_ratio=float(late_count[index] / due_count[index]) if due_count[index] else None
+        ))
+    report.sort(key=lambda row: row.open_total, reverse=True)
+    return report
+
+class ReportUseCases:
+    def __init__(self, report_repository: TaskReportRepository, cache: Optional[Any] = None):
+        self.report_repository = report_repository
+        # Anything with get(key) and set(key, value), e.g. infrastructure.cache.TTLCache
+        self.cache = cache
+
+    async def get_workload(
+        self,
+        tenant_id: uuid.UUID,
+        start: datetime,
+        end: datetime
+    ) -> List[AssigneeWorkload]:
+        """Get the workload report for a window, reusing a recent result for the same window"""
+        key = ("workload", tenant_id, start, end)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        columns = await self.report_repository.get_task_columns(tenant_id)
+        report = aggregate_workload(columns, start, end, datetime.utcnow())
+        if self.cache is not None:
+            self.cache.set(key, report)
+        return report
@@ -0,0 +1,50 @@
+# backend/application/use_cases/sync_use_cases.py
+import os
+from datetime import datetime, timedelta
+from typing import Optional
+import uuid
+from domain.entities.change import ChangeSet
+from domain.repositories.project_repository import ProjectRepository
+from domain.repositories.task_repository import TaskRepository
+from domain.repositories.tombstone_repository import TombstoneRepository
+
+class SyncUseCases:
+    def __init__(
+        self,
+        project_repository: ProjectRepository,
+        task_repository: TaskRepository,
+        tombstone_repository: TombstoneRepository
+    ):
+        self.project_repository = project_repository
+        self.task_repository = task_repository
+        self.tombstone_repository = tombstone_repository
+        self.retention = timedelta(days=int(os.getenv("SYNC_TOMBSTONE_RETENTION_DAYS", "30")))
+        # Overlap absorbs writes whose updated_at was stamped before a
+        # concurrent sync ran but which committed after it
+        self.cursor_overlap = timedelta(seconds=int(os.getenv("SYNC_CURSOR_OVERLAP_SECONDS", "5")))
+
+    async def get_changes(self, tenant_id: uuid.UUID, since: Optional[datetime] = None) -> ChangeSet:
+        """Get projects, tasks and deletions changed since the cursor"""
+        now = datetime.utcnow()
+
+        # Tombstones older than the retention window are gone, so a client
+        # this far behind must drop its cache and take a full snapshot
+        reset = since is None or since < now - self.retention
+        if reset:
+            since = None
+
+        projects = await self.project_repository.get_updated_since(tenant_id, since)
+        tasks = await self.task_repository.get_updated_since(tenant_id, since)
+        tombstones = [] if reset else await self.tombstone_repository.get_since(tenant_id, since)
+
+        return ChangeSet(
+            cursor=now - self.cursor_overlap,
+            projects=projects,
+            tasks=tasks,
+            tombstones=tombstones,
+            reset=reset
+        )
+
+    async def purge_expired_tombstones(self) -> int:
+        """Delete tombstones that fell out of the retention window"""
+        return await self.tombstone_repository.purge_before(datetime.utcnow() - self.retention)
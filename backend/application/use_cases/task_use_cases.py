@@ -1,18 +1,45 @@
 # backend/application/use_cases/task_use_cases.py
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 import uuid
 from domain.entities.task import Task, TaskStatus
+from domain.entities.activity import ActivityEntry
+from domain.entities.change import ChangeType, EntityType
 from domain.repositories.task_repository import TaskRepository
 from domain.repositories.project_repository import ProjectRepository
+from domain.repositories.activity_repository import ActivitySink
+from .activity_use_cases import snapshot, changed_fields
+
+TRACKED_FIELDS = ("title", "description", "status", "priority", "assigned_to", "due_date")
 
 class TaskUseCases:
     def __init__(
         self, 
         task_repository: TaskRepository,
-        project_repository: ProjectRepository
+        project_repository: ProjectRepository,
+        activity_log: Optional[ActivitySink] = None
     ):
         self.task_repository = task_repository
         self.project_repository = project_repository
+        self.activity_log = activity_log
+
+    def _record(
+        self,
+        task: Task,
+        action: ChangeType,
+        actor_id: Optional[uuid.UUID],
+        changes: Optional[Dict[str, Any]] = None
+    ) -> None:
+        if self.activity_log is None:
+            return
+        self.activity_log.record(ActivityEntry(
+            tenant_id=task.tenant_id,
+            project_id=task.project_id,
+            entity_type=EntityType.TASK,
+            entity_id=task.id,
+            action=action,
+            actor_id=actor_id,
+            changes=changes
+        ))
 
     async def create_task(
         self,
@@ -42,12 +69,18 @@ class TaskUseCases:
             due_date=due_date
         )
         
-        return await self.task_repository.create(task)
+        created = await self.task_repository.create(task)
+        self._record(
+            created, ChangeType.CREATED, created_by,
+            changed_fields(dict.fromkeys(TRACKED_FIELDS), snapshot(created, TRACKED_FIELDS))
+        )
+        return created
 
     async def get_tasks_by_project(
         self, 
         project_id: uuid.UUID, 
-        tenant_id: uuid.UUID
+        tenant_id: uuid.UUID,
+        include_archived: bool = False
     ) -> List[Task]:
         """Get all tasks for a project ensuring tenant isolation"""
         # Verify project belongs to tenant
@@ -55,7 +88,7 @@ class TaskUseCases:
         if not project:
             raise ValueError("Project not found or access denied")
         
-        return await self.task_repository.get_by_project(project_id, tenant_id)
+        return await self.task_repository.get_by_project(project_id, tenant_id, include_archived)
 
     async def get_task(
         self, 
@@ -74,12 +107,14 @@ class TaskUseCases:
         status: TaskStatus = None,
         priority = None,
         assigned_to: uuid.UUID = None,
-        due_date = None
+        due_date = None,
+        actor_id: uuid.UUID = None
     ) -> Task:
         """Update a task ensuring tenant isolation"""
         task = await self.get_task(task_id, tenant_id)
         if not task:
             raise ValueError("Task not found or access denied")
+        before = snapshot(task, TRACKED_FIELDS)
 
         if title is not None:
             task.title = title
@@ -94,12 +129,27 @@ class TaskUseCases:
         if due_date is not None:
             task.due_date = due_date
 
-        return await self.task_repository.update(task)
+        updated = await self.task_repository.update(task)
+        changes = changed_fields(before, snapshot(updated, TRACKED_FIELDS))
+        if changes:
+            self._record(updated, ChangeType.UPDATED, actor_id, changes)
+        return updated
 
-    async def delete_task(self, task_id: uuid.UUID, tenant_id: uuid.UUID) -> bool:
+    async def delete_task(
+        self,
+        task_id: uuid.UUID,
+        tenant_id: uuid.UUID,
+        actor_id: uuid.UUID = None
+    ) -> bool:
         """Delete a task ensuring tenant isolation"""
         task = await self.get_task(task_id, tenant_id)
         if not task:
             raise ValueError("Task not found or access denied")
         
-        return await self.task_repository.delete(task.id)
\ No newline at end of file
+        deleted = await self.task_repository.delete(task.id)
+        if deleted:
+            self._record(
+                task, ChangeType.DELETED, actor_id,
+                changed_fields(snapshot(task, TRACKED_FIELDS), dict.fromkeys(TRACKED_FIELDS))
+            )
+        return deleted
\ No newline at end of file
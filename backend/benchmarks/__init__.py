@@ -0,0 +1 @@
+"""Benchmarks, run from the backend directory with ``python -m benchmarks.<name>``."""
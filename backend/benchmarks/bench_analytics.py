@@ -0,0 +1,118 @@
+# backend/benchmarks/bench_analytics.py - Compare the vectorized workload report with per-object loops
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+import uuid
+
+from application.use_cases.report_use_cases import aggregate_workload, epoch_seconds
+from domain.entities.report import AssigneeWorkload, TaskColumns
+from domain.entities.task import Task, TaskPriority, TaskStatus
+
+NOW = datetime(2024, 6, 30)
+START = NOW - timedelta(days=30)
+
+def seed(count: int, assignee_count: int) -> Tuple[List[Task], Dict[uuid.UUID, tuple], TaskColumns]:
+    """Synthetic tasks as ORM-style objects plus the same data as columns"""
+    rng = random.Random(42)
+    tenant_id, project_id, creator_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    assignees = [uuid.uuid4() for _ in range(assignee_count)] + [None]
+    statuses, priorities = list(TaskStatus), list(TaskPriority)
+    tasks, milestones = [], {}
+    for _ in range(count):
+        created_at = NOW - timedelta(seconds=rng.randrange(180 * 86400))
+        status = rng.choice(statuses)
+        started_at = created_at + timedelta(hours=rng.randrange(1, 72)) if status is not TaskStatus.TODO else None
+        completed_at = started_at + timedelta(hours=rng.randrange(1, 240)) if status is TaskStatus.DONE else None
+        due_date = created_at + timedelta(days=rng.randrange(1, 60)) if rng.random() < 0.7 else None
+        task = Task(
+            title="Task",
+            project_id=project_id,
+            tenant_id=tenant_id,
+            created_by=creator_id,
+            status=status,
+            priority=rng.choice(priorities),
+            assigned_to=rng.choice(assignees),
+            due_date=due_date
+        )
+        task.created_at = created_at
+        tasks.append(task)
+        milestones[task.id] = (started_at, completed_at)
+    # What TaskReportRepositoryImpl returns: column tuples with epoch-second timestamps
+    epoch = lambda value: epoch_seconds(value) if value is not None else None
+    columns = TaskColumns(
+        assigned_to=tuple(task.assigned_to for task in tasks),
+        status=tuple(task.status for task in tasks),
+        priority=tuple(task.priority for task in tasks),
+        created_at=tuple(epoch(task.created_at) for task in tasks),
+        due_date=tuple(epoch(task.due_date) for task in tasks),
+        started_at=tuple(epoch(milestones[task.id][0]) for task in tasks),
+        completed_at=tuple(epoch(milestones[task.id][1]) for task in tasks)
+    )
+    return tasks, milestones, columns
+
+def aggregate_naive(tasks: List[Task], milestones: Dict[uuid.UUID, tuple]) -> List[AssigneeWorkload]:
+    """The straightforward version: one pass over Task objects with per-assignee dicts"""
+    stats: Dict[Optional[uuid.UUID], dict] = {}
+    for task in tasks:
+        row = stats.setdefault(task.assigned_to, {
+            "open": {priority: 0 for priority in TaskPriority},
+            "completed": 0, "cycle_hours": 0.0, "due": 0, "late": 0
+        })
+        started_at, completed_at = milestones[task.id]
+        done = task.status == TaskStatus.DONE
+        if not done:
+            row["open"][task.priority] += 1
+        elif completed_at is not None and START <= completed_at < NOW:
+            row["completed"] += 1
+            row["cycle_hours"] += (completed_at - (started_at or task.created_at)).total_seconds() / 3600
+        if task.due_date is not None and START <= task.due_date < NOW:
+            row["due"] += 1
+            if not done or (completed_at is not None and completed_at > task.due_date):
+                row["late"] += 1
+    return [
+        AssigneeWorkload(
+            assignee_id=assignee_id,
+            open_by_priority=row["open"],
+            completed=row["completed"],
+            avg_cycle_time_hours=row["cycle_hours"] / row["completed"] if row["completed"] else None,
+            overdue_ratio=row["late"] / row["due"] if row["due"] else None
+        )
+        for assignee_id, row in stats.items()
+    ]
+
+def best_of(repeat: int, function, *args) -> Tuple[float, object]:
+    timings, result = [], None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--assignees", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    tasks, milestones, columns = seed(args.tasks, args.assignees)
+    print(f"Seeded {args.tasks:,} tasks in {time.perf_counter() - started:.1f}s")
+
+    naive_seconds, naive = best_of(args.repeat, aggregate_naive, tasks, milestones)
+    vector_seconds, vectorized = best_of(args.repeat, aggregate_workload, columns, START, NOW, NOW)
+
+    summary = lambda rows: {
+        row.assignee_id: (row.open_total, row.completed, round(row.avg_cycle_time_hours or 0, 6), row.overdue_ratio)
+        for row in rows
+    }
+    expected, actual = summary(naive), summary(vectorized)
+    assert expected == actual, "vectorized report differs from the naive one"
+
+    print(f"naive per-object loop: {naive_seconds * 1000:8.1f} ms")
+    print(f"vectorized (numpy):    {vector_seconds * 1000:8.1f} ms  ({naive_seconds / vector_seconds:.1f}x)")
+
+if __name__ == "__main__":
+    main()
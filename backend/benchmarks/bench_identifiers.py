@@ -0,0 +1,84 @@
+# backend/benchmarks/bench_identifiers.py - Compare uuid4 and UUIDv7 primary keys on insert throughput and index size
+"""
+Inserts the same number of rows into two tables of a scratch schema in
+DATABASE_URL, one keyed by uuid4 and one by UUIDv7, in batches like the
+API writes them, then reports rows per second, the primary-key index
+size and how many index pages had to be read from outside shared buffers.
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from sqlalchemy import text
+
+from domain.identifiers import uuid7
+from infrastructure.database.connection import engine
+
+SCHEMA = "bench_identifiers"
+GENERATORS = {"uuid4": uuid.uuid4, "uuid7": uuid7}
+
+async def run(args) -> None:
+    async with engine.begin() as connection:
+        await connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        for name in GENERATORS:
+            await connection.execute(text(
+                f"CREATE TABLE {SCHEMA}.{name} (id uuid PRIMARY KEY, title varchar(200) NOT NULL, "
+                f"created_at timestamp NOT NULL DEFAULT now())"
+            ))
+
+    try:
+        print(f"{'key':<6} {'rows/s':>10} {'index MiB':>10} {'index reads':>12} {'leaf fill':>10}")
+        async with engine.connect() as connection:
+            raw = (await connection.get_raw_connection()).driver_connection
+            for name, generate in GENERATORS.items():
+                table = f"{SCHEMA}.{name}"
+                statement = await raw.prepare(
+                    f"INSERT INTO {table} (id, title) SELECT * FROM unnest($1::uuid[], $2::text[])"
+                )
+                titles = ["Task"] * args.batch_size
+                reads_before = await raw.fetchval(
+                    "SELECT coalesce(sum(idx_blks_read), 0) FROM pg_statio_all_indexes WHERE schemaname = $1",
+                    SCHEMA
+                )
+                started = time.perf_counter()
+                for _ in range(args.rows // args.batch_size):
+                    await statement.fetch([generate() for _ in range(args.batch_size)], titles)
+                elapsed = time.perf_counter() - started
+                # Statistics are flushed asynchronously; give the collector a moment
+                await asyncio.sleep(1)
+                await raw.execute("SELECT pg_stat_force_next_flush()")
+                reads = await raw.fetchval(
+                    "SELECT coalesce(sum(idx_blks_read), 0) FROM pg_statio_all_indexes WHERE schemaname = $1",
+                    SCHEMA
+                ) - reads_before
+                index_bytes = await raw.fetchval(f"SELECT pg_relation_size('{table}_pkey')")
+                # 16-byte keys plus 8 bytes of tuple header and 4 of line pointer per entry
+                fill = args.rows * 28 / index_bytes
+                print(
+                    f"{name:<6} {args.rows / elapsed:>10,.0f} {index_bytes / 2**20:>10.1f} "
+                    f"{reads:>12,} {fill:>9.0%}"
+                )
+
+            ordered = await raw.fetchval(
+                f"SELECT bool_and(previous < id) FROM "
+                f"(SELECT id, lag(id) OVER (ORDER BY created_at, ctid) AS previous FROM {SCHEMA}.uuid7) AS ids "
+                f"WHERE previous IS NOT NULL"
+            )
+            print(f"uuid7 ids follow insertion order: {ordered}")
+    finally:
+        if not args.keep:
+            async with engine.begin() as connection:
+                await connection.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema for manual inspection")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
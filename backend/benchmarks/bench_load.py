@@ -0,0 +1,335 @@
+# backend/benchmarks/bench_load.py - Concurrent HTTP load scenarios with per-endpoint latency percentiles
+"""
+Drives the real app with concurrent clients and reports throughput and
+p50/p95/p99 latency per endpoint. By default the app from main.py is
+served in-process through httpx's ASGI transport, with its lifespan,
+against DATABASE_URL. With --url, the same load goes to a running server
+instead, e.g. `uvicorn main:app --workers 4`.
+
+Scenarios:
+  login      every client logs in over and over (password hashing under contention)
+  projects   project listings and single projects
+  task-crud  40% task listings, 20% creates, 30% status updates, 10% deletes
+  fairness   several tenants with the same number of clients, one holding
+             --heavy-factor times more tasks than the rest; reports each
+             tenant's throughput and percentiles and Jain's fairness index
+
+Every client is a closed loop: it sends its next request when the last
+one finished, after a --warmup that is not recorded. Operations are
+drawn from a random.Random seeded with --seed, so runs send the same mix.
+Tenants are registered and seeded through the API first.
+
+--output writes the results as JSON. --compare BASELINE.json prints the
+change in throughput and p95 per endpoint against an earlier run and
+exits with status 1 when any endpoint got more than --tolerance worse,
+so CI can keep a baseline and fail on regressions.
+"""
+import argparse
+import asyncio
+from datetime import datetime
+import json
+import random
+import subprocess
+import sys
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+import uuid
+import httpx
+
+PASSWORD = "Bench-passw0rd"
+# Done tasks may not go straight back to todo, so updates never pick it
+STATUSES = ["in_progress", "in_review", "done"]
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+def summarize(latencies: List[float], errors: int, seconds: float) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "count": len(ordered),
+        "errors": errors,
+        "throughput": len(ordered) / seconds,
+        "p50_ms": percentile(ordered, 0.50) * 1000,
+        "p95_ms": percentile(ordered, 0.95) * 1000,
+        "p99_ms": percentile(ordered, 0.99) * 1000,
+        "max_ms": ordered[-1] * 1000 if ordered else 0.0
+    }
+
+def jain_index(rates: List[float]) -> float:
+    """1.0 when every tenant gets the same throughput, 1/n when one gets it all"""
+    total = sum(rates)
+    return total * total / (len(rates) * sum(rate * rate for rate in rates)) if total else 0.0
+
+class Recorder:
+    """Latencies per endpoint, and per tenant for the fairness scenario"""
+    def __init__(self):
+        self.recording = False
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.tenant_latencies: Dict[str, List[float]] = {}
+
+    async def send(
+        self, endpoint: str, request: Awaitable[httpx.Response], tenant: Optional[str] = None
+    ) -> Optional[httpx.Response]:
+        started = time.perf_counter()
+        try:
+            response = await request
+            failed = response.status_code >= 400
+        except httpx.HTTPError:
+            response, failed = None, True
+        elapsed = time.perf_counter() - started
+        if self.recording:
+            self.latencies.setdefault(endpoint, [])
+            if failed:
+                self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+            else:
+                self.latencies[endpoint].append(elapsed)
+                if tenant is not None:
+                    self.tenant_latencies.setdefault(tenant, []).append(elapsed)
+        return None if failed else response
+
+class Tenant:
+    def __init__(self, name: str, email: str, token: str):
+        self.name = name
+        self.email = email
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.project_ids: List[str] = []
+        self.task_ids: List[str] = []
+
+async def register(client: httpx.AsyncClient, name: str, projects: int, tasks_per_project: int) -> Tenant:
+    """A new tenant filled through the API"""
+    domain = f"load-{uuid.uuid4().hex[:8]}"
+    email = f"owner@{domain}.example.com"
+    response = await client.post("/api/v1/auth/register", json={
+        "email": email, "password": PASSWORD, "first_name": "Load", "last_name": name,
+        "tenant_name": name, "tenant_domain": domain
+    })
+    tenant = Tenant(name, email, response.raise_for_status().json()["access_token"])
+    for number in range(projects):
+        response = await client.post("/api/v1/projects", json={"name": f"Project {number}"}, headers=tenant.headers)
+        tenant.project_ids.append(response.raise_for_status().json()["id"])
+        for task_number in range(tasks_per_project):
+            response = await client.post(
+                f"/api/v1/projects/{tenant.project_ids[-1]}/tasks", json={"title": f"Task {task_number}"},
+                headers=tenant.headers
+            )
+            tenant.task_ids.append(response.raise_for_status().json()["id"])
+    return tenant
+
+Operation = Callable[[random.Random], Awaitable[None]]
+
+async def run_clients(recorder: Recorder, clients: List[Operation], args) -> float:
+    """Run every client's loop through the warmup and the measured window; returns the window's length"""
+    phase_ends = [0.0]
+
+    async def loop(operation: Operation, seed: int) -> None:
+        rng = random.Random(seed)
+        while time.perf_counter() < phase_ends[0]:
+            await operation(rng)
+
+    phase_ends[0] = time.perf_counter() + args.warmup
+    await asyncio.gather(*[loop(operation, args.seed + number) for number, operation in enumerate(clients)])
+    recorder.recording = True
+    started = time.perf_counter()
+    phase_ends[0] = started + args.seconds
+    await asyncio.gather(*[
+        loop(operation, args.seed + len(clients) + number) for number, operation in enumerate(clients)
+    ])
+    recorder.recording = False
+    return time.perf_counter() - started
+
+async def login_scenario(client: httpx.AsyncClient, recorder: Recorder, args) -> dict:
+    tenants = [await register(client, f"Tenant {number}", 0, 0) for number in range(args.tenants)]
+
+    def login_client(tenant: Tenant) -> Operation:
+        async def operation(rng: random.Random) -> None:
+            await recorder.send("POST /api/v1/auth/login", client.post(
+                "/api/v1/auth/login", json={"email": tenant.email, "password": PASSWORD}
+            ))
+        return operation
+
+    seconds = await run_clients(recorder, [login_client(tenants[n % len(tenants)]) for n in range(args.concurrency)], args)
+    return {"seconds": seconds}
+
+async def projects_scenario(client: httpx.AsyncClient, recorder: Recorder, args) -> dict:
+    tenant = await register(client, "Tenant", args.projects, args.tasks)
+
+    async def operation(rng: random.Random) -> None:
+        if rng.random() < 0.5:
+            await recorder.send("GET /api/v1/projects", client.get("/api/v1/projects", headers=tenant.headers))
+        else:
+            project = rng.choice(tenant.project_ids)
+            await recorder.send(
+                "GET /api/v1/projects/{project_id}", client.get(f"/api/v1/projects/{project}", headers=tenant.headers)
+            )
+
+    return {"seconds": await run_clients(recorder, [operation] * args.concurrency, args)}
+
+def task_crud_client(client: httpx.AsyncClient, recorder: Recorder, tenant: Tenant, label: Optional[str] = None) -> Operation:
+    """40% listings, 20% creates, 30% status updates, 10% deletes of tasks this client created"""
+    created: List[str] = []
+
+    async def operation(rng: random.Random) -> None:
+        project = rng.choice(tenant.project_ids)
+        roll = rng.random()
+        if roll < 0.4:
+            await recorder.send(
+                "GET /api/v1/projects/{project_id}/tasks",
+                client.get(f"/api/v1/projects/{project}/tasks", headers=tenant.headers), label
+            )
+        elif roll < 0.6 or (roll >= 0.9 and not created):
+            response = await recorder.send(
+                "POST /api/v1/projects/{project_id}/tasks",
+                client.post(f"/api/v1/projects/{project}/tasks", json={"title": "Load"}, headers=tenant.headers), label
+            )
+            if response is not None:
+                created.append(response.json()["id"])
+        elif roll < 0.9:
+            task = rng.choice(tenant.task_ids + created)
+            await recorder.send(
+                "PUT /api/v1/tasks/{task_id}",
+                client.put(f"/api/v1/tasks/{task}", json={"status": rng.choice(STATUSES)}, headers=tenant.headers), label
+            )
+        else:
+            task = created.pop(rng.randrange(len(created)))
+            await recorder.send(
+                "DELETE /api/v1/tasks/{task_id}", client.delete(f"/api/v1/tasks/{task}", headers=tenant.headers), label
+            )
+    return operation
+
+async def task_crud_scenario(client: httpx.AsyncClient, recorder: Recorder, args) -> dict:
+    tenant = await register(client, "Tenant", args.projects, args.tasks)
+    clients = [task_crud_client(client, recorder, tenant) for _ in range(args.concurrency)]
+    return {"seconds": await run_clients(recorder, clients, args)}
+
+async def fairness_scenario(client: httpx.AsyncClient, recorder: Recorder, args) -> dict:
+    tenants = [await register(client, "heavy", args.projects, args.tasks * args.heavy_factor)]
+    tenants += [await register(client, f"light-{number}", args.projects, args.tasks) for number in range(1, args.tenants)]
+    clients = [
+        task_crud_client(client, recorder, tenant, tenant.name)
+        for tenant in tenants for _ in range(max(1, args.concurrency // len(tenants)))
+    ]
+    seconds = await run_clients(recorder, clients, args)
+    per_tenant = {
+        tenant.name: summarize(recorder.tenant_latencies.get(tenant.name, []), 0, seconds) for tenant in tenants
+    }
+    return {
+        "seconds": seconds,
+        "tenants": per_tenant,
+        "jain_index": jain_index([result["throughput"] for result in per_tenant.values()])
+    }
+
+SCENARIOS = {
+    "login": login_scenario,
+    "projects": projects_scenario,
+    "task-crud": task_crud_scenario,
+    "fairness": fairness_scenario,
+}
+
+async def run_scenario(name: str, client: httpx.AsyncClient, args) -> dict:
+    recorder = Recorder()
+    result = await SCENARIOS[name](client, recorder, args)
+    seconds = result["seconds"]
+    result["endpoints"] = {
+        endpoint: summarize(latencies, recorder.errors.get(endpoint, 0), seconds)
+        for endpoint, latencies in sorted(recorder.latencies.items())
+    }
+    result["throughput"] = sum(endpoint["count"] for endpoint in result["endpoints"].values()) / seconds
+    result["errors"] = sum(recorder.errors.values())
+    return result
+
+async def run(args) -> dict:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    if args.url:
+        async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=30) as client:
+            return {name: await run_scenario(name, client, args) for name in args.scenarios}
+    from main import app
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=30) as client:
+            return {name: await run_scenario(name, client, args) for name in args.scenarios}
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_results(scenarios: dict) -> None:
+    for name, result in scenarios.items():
+        print(f"\n{name}: {result['throughput']:,.0f} req/s over {result['seconds']:.1f}s, {result['errors']} errors")
+        print(f"  {'endpoint':<42} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+        rows = list(result["endpoints"].items()) + [(f"tenant {tenant}", stats) for tenant, stats in result.get("tenants", {}).items()]
+        for label, stats in rows:
+            print(
+                f"  {label:<42} {stats['throughput']:>8,.0f} {stats['p50_ms']:>8.1f} {stats['p95_ms']:>8.1f} "
+                f"{stats['p99_ms']:>8.1f} {stats['errors']:>7}"
+            )
+        if "jain_index" in result:
+            print(f"  Jain's fairness index across tenants: {result['jain_index']:.3f}")
+
+def compare(baseline: dict, current: dict, tolerance: float) -> bool:
+    """Print throughput and p95 changes per endpoint; False when one regressed beyond tolerance"""
+    within = True
+    print(f"\n{'scenario / endpoint':<54} {'req/s':>8} {'change':>8} {'p95 ms':>8} {'change':>8}")
+    for name, result in current["scenarios"].items():
+        for endpoint, stats in result["endpoints"].items():
+            before = baseline["scenarios"].get(name, {}).get("endpoints", {}).get(endpoint)
+            if before is None:
+                continue
+            throughput_change = stats["throughput"] / before["throughput"] - 1 if before["throughput"] else 0.0
+            p95_change = stats["p95_ms"] / before["p95_ms"] - 1 if before["p95_ms"] else 0.0
+            regressed = throughput_change < -tolerance or p95_change > tolerance
+            within = within and not regressed
+            print(
+                f"{name + ' ' + endpoint:<54} {stats['throughput']:>8,.0f} {throughput_change:>+8.1%} "
+                f"{stats['p95_ms']:>8.1f} {p95_change:>+8.1%}{'  REGRESSED' if regressed else ''}"
+            )
+    return within
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenarios", nargs="*", help=f"Any of {', '.join(SCENARIOS)}; all by default")
+    parser.add_argument("--url", help="A running server to load instead of the in-process app")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Measured window per scenario")
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients")
+    parser.add_argument("--tenants", type=int, default=4)
+    parser.add_argument("--projects", type=int, default=5, help="Projects per tenant")
+    parser.add_argument("--tasks", type=int, default=20, help="Tasks per project")
+    parser.add_argument("--heavy-factor", type=int, default=10, help="How many more tasks the heavy tenant has")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="A JSON file from an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative regression with --compare")
+    args = parser.parse_args()
+    args.scenarios = args.scenarios or list(SCENARIOS)
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+
+    results = {
+        "started_at": datetime.utcnow().isoformat(),
+        "revision": git_revision(),
+        "target": args.url or "in-process",
+        "settings": {
+            key: value for key, value in vars(args).items() if key not in ("output", "compare", "tolerance")
+        },
+        "scenarios": asyncio.run(run(args))
+    }
+    print_results(results["scenarios"])
+    if args.output:
+        with open(args.output, "w") as sink:
+            json.dump(results, sink, indent=2)
+    if args.compare:
+        with open(args.compare) as source:
+            if not compare(json.load(source), results, args.tolerance):
+                sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+# backend/benchmarks/bench_micro.py - Micro-benchmarks of the per-request hot paths, with a baseline to compare against
+"""
+Times the inner loops every request goes through: constructing Task and
+Project entities, TaskMapper in both directions, JWT creation and
+verification, building TaskResponse and encoding it to JSON the way
+FastAPI does, and enum conversions. Inputs come from a random.Random
+with a fixed --seed, so every run times the same data.
+
+Each benchmark runs a batch of BATCH operations per call. timeit picks
+the number of calls per round, and the report gives the median and the
+minimum time per operation over --rounds rounds, with the garbage
+collector off while timing. Rounds are interleaved, one round of every
+benchmark at a time, so a machine that speeds up or slows down part way
+through moves all of them alike rather than whichever ran then.
+
+--save-baseline writes the results to --baseline (benchmarks/baselines/
+micro.json by default). --compare times again and flags every benchmark
+whose median got more than --threshold slower, exiting with status 1 if
+any did. Baselines only compare on the machine and Python that made them,
+so regenerate the file when either changes; on a noisy
+machine, raise --rounds. -k runs the benchmarks whose
+names contain one of the given strings.
+"""
+import argparse
+from datetime import datetime, timedelta
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import timeit
+from typing import Callable, Dict, List, Tuple
+import uuid
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from application.dto.task_dto import TaskResponse
+from domain.entities.project import Project, ProjectStatus
+from domain.entities.task import Task, TaskPriority, TaskStatus
+from infrastructure.auth.jwt_handler import JWTHandler
+from infrastructure.database.mappers import TaskMapper
+
+BATCH = 100
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines", "micro.json")
+
+# name -> builds the timed callable from a seeded random.Random; the callable does BATCH operations
+BENCHMARKS: Dict[str, Callable[[random.Random], Callable[[], object]]] = {}
+
+def benchmark(name: str):
+    def register(build: Callable[[random.Random], Callable[[], object]]):
+        BENCHMARKS[name] = build
+        return build
+    return register
+
+def random_uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+def random_moment(rng: random.Random) -> datetime:
+    return datetime(2026, 1, 1) + timedelta(seconds=rng.randrange(365 * 24 * 3600))
+
+def task_fields(rng: random.Random) -> dict:
+    created_at = random_moment(rng)
+    return {
+        "id": random_uuid(rng),
+        "title": f"Task {rng.randrange(10_000)}",
+        "description": rng.choice([None, "Ship the release notes"]),
+        "status": rng.choice(list(TaskStatus)),
+        "priority": rng.choice(list(TaskPriority)),
+        "project_id": random_uuid(rng),
+        "tenant_id": random_uuid(rng),
+        "created_by": random_uuid(rng),
+        "assigned_to": rng.choice([None, random_uuid(rng)]),
+        "due_date": rng.choice([None, created_at + timedelta(days=7)]),
+        "created_at": created_at,
+        "updated_at": created_at + timedelta(hours=rng.randrange(48))
+    }
+
+def tasks(rng: random.Random) -> List[Task]:
+    return [Task(**task_fields(rng)) for _ in range(BATCH)]
+
+def response_for(task: Task) -> TaskResponse:
+    """As the task routes build their responses"""
+    return TaskResponse(
+        id=task.id, title=task.title, description=task.description, status=task.status, priority=task.priority,
+        project_id=task.project_id, tenant_id=task.tenant_id, created_by=task.created_by,
+        assigned_to=task.assigned_to, due_date=task.due_date, created_at=task.created_at,
+        updated_at=task.updated_at, archived_at=task.archived_at
+    )
+
+@benchmark("domain.task_construct")
+def task_construct(rng):
+    fields = [task_fields(rng) for _ in range(BATCH)]
+    return lambda: [Task(**each) for each in fields]
+
+@benchmark("domain.project_construct")
+def project_construct(rng):
+    fields = [
+        {"name": f"Project {number}", "tenant_id": random_uuid(rng), "created_by": random_uuid(rng),
+         "status": rng.choice(list(ProjectStatus)), "id": random_uuid(rng), "created_at": random_moment(rng)}
+        for number in range(BATCH)
+    ]
+    return lambda: [Project(**each) for each in fields]
+
+@benchmark("mapper.task_to_model")
+def task_to_model(rng):
+    entities = tasks(rng)
+    return lambda: [TaskMapper.to_model(task) for task in entities]
+
+@benchmark("mapper.task_to_domain")
+def task_to_domain(rng):
+    models = [TaskMapper.to_model(task) for task in tasks(rng)]
+    return lambda: [TaskMapper.to_domain(model) for model in models]
+
+@benchmark("auth.create_access_token")
+def create_access_token(rng):
+    handler = JWTHandler()
+    users = [(random_uuid(rng), random_uuid(rng), f"user{number}@bench.test") for number in range(BATCH)]
+    return lambda: [handler.create_access_token(*user) for user in users]
+
+@benchmark("auth.verify_token")
+def verify_token(rng):
+    handler = JWTHandler()
+    tokens = [
+        handler.create_access_token(random_uuid(rng), random_uuid(rng), f"user{number}@bench.test")
+        for number in range(BATCH)
+    ]
+    return lambda: [handler.verify_token(token) for token in tokens]
+
+@benchmark("dto.task_response_construct")
+def task_response_construct(rng):
+    entities = tasks(rng)
+    return lambda: [response_for(task) for task in entities]
+
+@benchmark("dto.task_response_from_attributes")
+def task_response_from_attributes(rng):
+    entities = tasks(rng)
+    return lambda: [TaskResponse.model_validate(task) for task in entities]
+
+@benchmark("json.task_list_fastapi")
+def task_list_fastapi(rng):
+    """jsonable_encoder and json.dumps, which is what a response_model route does with the list"""
+    responses = [response_for(task) for task in tasks(rng)]
+    return lambda: json.dumps(jsonable_encoder(responses)).encode()
+
+@benchmark("json.task_list_pydantic")
+def task_list_pydantic(rng):
+    adapter = TypeAdapter(List[TaskResponse])
+    responses = [response_for(task) for task in tasks(rng)]
+    return lambda: adapter.dump_json(responses)
+
+@benchmark("enum.status_from_value")
+def status_from_value(rng):
+    values = [rng.choice(list(TaskStatus)).value for _ in range(BATCH)]
+    return lambda: [TaskStatus(value) for value in values]
+
+@benchmark("enum.status_from_name")
+def status_from_name(rng):
+    """How the asyncpg repositories read the enum columns"""
+    names = [rng.choice(list(TaskStatus)).name for _ in range(BATCH)]
+    return lambda: [TaskStatus[name] for name in names]
+
+def run(names: List[str], args) -> Dict[str, dict]:
+    """Median and minimum microseconds per operation of each benchmark"""
+    timers = {name: timeit.Timer(BENCHMARKS[name](random.Random(args.seed))) for name in names}
+    numbers = {name: timer.autorange()[0] for name, timer in timers.items()}
+    rounds: Dict[str, List[float]] = {name: [] for name in names}
+    for _ in range(args.rounds):
+        for name, timer in timers.items():
+            rounds[name].append(timer.timeit(numbers[name]) / numbers[name] / BATCH * 1e6)
+
+    results = {}
+    print(f"{'benchmark':<36} {'median us/op':>13} {'min us/op':>10}")
+    for name, per_operation in rounds.items():
+        results[name] = {
+            "median_us": statistics.median(per_operation), "min_us": min(per_operation),
+            "calls_per_round": numbers[name]
+        }
+        print(f"{name:<36} {results[name]['median_us']:>13.3f} {results[name]['min_us']:>10.3f}")
+    return results
+
+def compare(baseline: dict, results: Dict[str, dict], threshold: float) -> List[Tuple[str, float]]:
+    """The benchmarks whose median is more than threshold slower than the baseline's"""
+    if baseline["machine"] != machine():
+        print(f"warning: the baseline was made on {baseline['machine']}, not {machine()}")
+    print(f"\n{'benchmark':<36} {'baseline us':>12} {'now us':>10} {'change':>8}")
+    regressions = []
+    for name, result in results.items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<36} {'-':>12} {result['median_us']:>10.3f}")
+            continue
+        change = result["median_us"] / before["median_us"] - 1
+        flag = "  REGRESSED" if change > threshold else ""
+        print(f"{name:<36} {before['median_us']:>12.3f} {result['median_us']:>10.3f} {change:>+8.1%}{flag}")
+        if flag:
+            regressions.append((name, change))
+    return regressions
+
+def machine() -> str:
+    return f"{platform.machine()} {platform.processor() or platform.system()}, Python {platform.python_version()}"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", nargs="*", default=[], help="Only benchmarks whose names contain one of these")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--rounds", type=int, default=15)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results to --baseline")
+    parser.add_argument("--compare", action="store_true", help="Compare against --baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative slowdown with --compare")
+    args = parser.parse_args()
+
+    names = [name for name in BENCHMARKS if not args.k or any(part in name for part in args.k)]
+    results = run(names, args)
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as sink:
+            json.dump({"machine": machine(), "seed": args.seed, "batch": BATCH, "results": results}, sink, indent=2)
+            sink.write("\n")
+    if args.compare:
+        with open(args.baseline) as source:
+            regressions = compare(json.load(source), results, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) more than {args.threshold:.0%} slower than the baseline")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# backend/benchmarks/bench_partitioning.py - Compare tenant queries on a plain and a hash-partitioned tasks table
+"""
+Seeds the same synthetic tasks into a plain table and into one
+hash-partitioned by tenant_id (as the "prepare hash partitioned tasks"
+migration builds it), in a scratch schema of DATABASE_URL, then runs the
+task repository's tenant queries with EXPLAIN ANALYZE on both.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+from typing import List, Tuple
+from sqlalchemy import text
+
+from infrastructure.database.connection import engine
+
+SCHEMA = "bench_partitioning"
+
+# The shapes of TaskRepositoryImpl's queries; get_by_id is the one without a tenant to prune on
+QUERIES = {
+    "by id only": "SELECT * FROM {table} WHERE id = $2",
+    "tenant + id": "SELECT * FROM {table} WHERE tenant_id = $1 AND id = $2",
+    "by status": "SELECT * FROM {table} WHERE tenant_id = $1 AND status = 'IN_PROGRESS'",
+    "updated since": "SELECT * FROM {table} WHERE tenant_id = $1 AND updated_at > now() - interval '7 days'",
+}
+
+def seed_statements(table: str, tasks: int, tenants: int) -> List[str]:
+    return [
+        f"""
+        INSERT INTO {SCHEMA}.{table}
+        SELECT
+            md5(n::text || 'task')::uuid,
+            'Task ' || n,
+            NULL,
+            (ARRAY['TODO', 'IN_PROGRESS', 'IN_REVIEW', 'DONE'])[1 + n % 4]::taskstatus,
+            (ARRAY['LOW', 'MEDIUM', 'HIGH', 'URGENT'])[1 + n % 4]::taskpriority,
+            md5((n % ({tenants} * 10))::text || 'project')::uuid,
+            md5((n % {tenants})::text || 'tenant')::uuid,
+            md5((n % {tenants})::text || 'user')::uuid,
+            NULL,
+            NULL,
+            now() - (n % 365) * interval '1 day',
+            now() - (n % 90) * interval '1 day'
+        FROM generate_series(1, {tasks}) AS n
+        """,
+        f"ANALYZE {SCHEMA}.{table}",
+    ]
+
+def plan_summary(plan: dict) -> Tuple[int, int, int]:
+    """(relations scanned, partitions pruned at run time, shared buffers touched) for one EXPLAIN plan"""
+    scanned, pruned = 0, 0
+    nodes = [plan["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        pruned += node.get("Subplans Removed", 0)
+        if "Relation Name" in node:
+            scanned += 1
+        nodes.extend(node.get("Plans", []))
+    buffers = plan["Plan"].get("Shared Hit Blocks", 0) + plan["Plan"].get("Shared Read Blocks", 0)
+    return scanned, pruned, buffers
+
+async def run(args) -> None:
+    async with engine.begin() as connection:
+        await connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        await connection.execute(text(f"CREATE TABLE {SCHEMA}.plain (LIKE public.tasks INCLUDING DEFAULTS)"))
+        await connection.execute(text(f"ALTER TABLE {SCHEMA}.plain ADD PRIMARY KEY (id)"))
+        await connection.execute(text(f"CREATE INDEX ON {SCHEMA}.plain (tenant_id, updated_at)"))
+        await connection.execute(text(
+            f"CREATE TABLE {SCHEMA}.partitioned (LIKE public.tasks INCLUDING DEFAULTS) PARTITION BY HASH (tenant_id)"
+        ))
+        await connection.execute(text(f"ALTER TABLE {SCHEMA}.partitioned ADD PRIMARY KEY (id, tenant_id)"))
+        await connection.execute(text(f"CREATE INDEX ON {SCHEMA}.partitioned (tenant_id, updated_at)"))
+        for remainder in range(args.partitions):
+            await connection.execute(text(
+                f"CREATE TABLE {SCHEMA}.partitioned_{remainder} PARTITION OF {SCHEMA}.partitioned "
+                f"FOR VALUES WITH (MODULUS {args.partitions}, REMAINDER {remainder})"
+            ))
+        for table in ("plain", "partitioned"):
+            for statement in seed_statements(table, args.tasks, args.tenants):
+                await connection.execute(text(statement))
+    print(f"Seeded {args.tasks:,} tasks for {args.tenants:,} tenants, {args.partitions} partitions")
+
+    try:
+        async with engine.connect() as connection:
+            raw = (await connection.get_raw_connection()).driver_connection
+            # Long-lived prepared statements switch to generic plans after a few executions
+            await raw.execute("SET plan_cache_mode = force_generic_plan")
+            result = await raw.fetch(
+                f"SELECT tenant_id, id FROM {SCHEMA}.plain TABLESAMPLE SYSTEM (5) LIMIT {args.samples}"
+            )
+            samples = [(row["tenant_id"], row["id"]) for row in result]
+            print(f"{'query':<14} {'table':<12} {'median ms':>10} {'scanned':>8} {'pruned':>7} {'buffers':>8}")
+            for number, (name, query) in enumerate(QUERIES.items()):
+                for table in ("plain", "partitioned"):
+                    # Server-side prepared like the app's statements, so generic plans prune when they execute
+                    statement_name = f"bench_{number}_{table}"
+                    await raw.execute(
+                        f"PREPARE {statement_name} (uuid, uuid) AS " + query.format(table=f"{SCHEMA}.{table}")
+                    )
+                    timings, summary = [], (0, 0, 0)
+                    for tenant_id, task_id in samples:
+                        explained = await raw.fetchval(
+                            f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) EXECUTE {statement_name}('{tenant_id}', '{task_id}')"
+                        )
+                        # SQLAlchemy registers a json codec on its asyncpg connections
+                        plan = (json.loads(explained) if isinstance(explained, str) else explained)[0]
+                        timings.append(plan["Execution Time"])
+                        summary = plan_summary(plan)
+                    scanned, pruned, buffers = summary
+                    print(
+                        f"{name:<14} {table:<12} {statistics.median(timings):>10.3f} "
+                        f"{scanned:>8} {pruned:>7} {buffers:>8}"
+                    )
+            sizes = await raw.fetchrow(f"""
+                SELECT
+                    pg_relation_size('{SCHEMA}.plain_tenant_id_updated_at_idx'),
+                    max(pg_relation_size(indexrelid))
+                FROM pg_index JOIN pg_inherits ON inhrelid = indrelid
+                WHERE inhparent = '{SCHEMA}.partitioned'::regclass AND NOT indisprimary
+            """)
+            print(
+                f"(tenant_id, updated_at) index: {sizes[0] / 2**20:.1f} MiB on the plain table, "
+                f"at most {sizes[1] / 2**20:.1f} MiB per partition"
+            )
+    finally:
+        if not args.keep:
+            async with engine.begin() as connection:
+                await connection.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=2_000_000)
+    parser.add_argument("--tenants", type=int, default=2_000)
+    parser.add_argument("--partitions", type=int, default=16)
+    parser.add_argument("--samples", type=int, default=50)
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema for manual EXPLAINs")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
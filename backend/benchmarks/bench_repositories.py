@@ -0,0 +1,77 @@
+# backend/benchmarks/bench_repositories.py - Throughput of the SQLAlchemy and asyncpg repository backends side by side
+"""
+Runs the lookups behind the busiest endpoints (the authenticated user,
+a project, a task, a project's task list) through each repository backend
+against existing rows in DATABASE_URL. Every call gets its own session,
+like a request, and several workers run concurrently on the engine's pool.
+"""
+import argparse
+import asyncio
+import time
+from sqlalchemy import select
+
+from api.repositories import REPOSITORY_BACKENDS
+from infrastructure.database.connection import AsyncSessionLocal, engine
+from infrastructure.database.models import TaskModel
+
+LOOKUPS = {
+    "user by id": lambda backend, session, task: backend.users(session).get_by_id(task.created_by),
+    "project by tenant + id": lambda backend, session, task: backend.projects(session).get_by_tenant_and_id(
+        task.tenant_id, task.project_id
+    ),
+    "task by tenant + id": lambda backend, session, task: backend.tasks(session).get_by_tenant_and_id(
+        task.tenant_id, task.id
+    ),
+    "tasks by project": lambda backend, session, task: backend.tasks(session).get_by_project(
+        task.project_id, task.tenant_id
+    ),
+}
+
+async def throughput(backend, lookup, samples, seconds: float, concurrency: int) -> float:
+    """Lookups per second over `seconds` with `concurrency` workers"""
+    deadline = time.perf_counter() + seconds
+    counts = [0] * concurrency
+
+    async def worker(number: int) -> None:
+        while time.perf_counter() < deadline:
+            task = samples[(counts[number] * concurrency + number) % len(samples)]
+            async with AsyncSessionLocal() as session:
+                await lookup(backend, session, task)
+            counts[number] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker(number) for number in range(concurrency)])
+    return sum(counts) / (time.perf_counter() - started)
+
+async def run(args) -> None:
+    try:
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(select(TaskModel).limit(args.samples))
+            samples = result.scalars().all()
+        if not samples:
+            raise SystemExit("DATABASE_URL has no tasks to look up; create sample data first")
+
+        backends = sorted(REPOSITORY_BACKENDS)
+        print(f"{'lookup':<24} " + " ".join(f"{name + ' ops/s':>18}" for name in backends) + f" {'speedup':>8}")
+        for name, lookup in LOOKUPS.items():
+            rates = {}
+            for backend_name in backends:
+                backend = REPOSITORY_BACKENDS[backend_name]
+                # Warm the pool, SQLAlchemy's compiled cache and the prepared statements
+                await throughput(backend, lookup, samples, 0.5, args.concurrency)
+                rates[backend_name] = await throughput(backend, lookup, samples, args.seconds, args.concurrency)
+            speedup = rates["asyncpg"] / rates["sqlalchemy"]
+            print(f"{name:<24} " + " ".join(f"{rates[b]:>18,.0f}" for b in backends) + f" {speedup:>7.2f}x")
+    finally:
+        await engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--samples", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# backend/benchmarks/bench_sqlite.py - The standard endpoints on the SQLite profile against local Postgres
+"""
+Runs the busiest endpoints (the authenticated user, project and task
+listings, a project, sync, task creation and status updates) through the
+app in-process with httpx's ASGI transport, once against a fresh SQLite
+file migrated with alembic and once against DATABASE_URL (local Postgres).
+Each database is measured in its own subprocess, because the engines are
+built from DATABASE_URL at import time. A new tenant is registered and
+seeded through the API for every run.
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+async def requests_per_second(send, seconds: float, concurrency: int) -> float:
+    deadline = time.perf_counter() + seconds
+    counts = [0] * concurrency
+
+    async def worker(number: int) -> None:
+        while time.perf_counter() < deadline:
+            response = await send(counts[number] * concurrency + number)
+            response.raise_for_status()
+            counts[number] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker(number) for number in range(concurrency)])
+    return sum(counts) / (time.perf_counter() - started)
+
+async def seed(client: httpx.AsyncClient, projects: int, tasks_per_project: int):
+    """Register a tenant and fill it through the API; returns the project and task ids"""
+    domain = f"bench-{uuid.uuid4().hex[:8]}"
+    response = await client.post("/api/v1/auth/register", json={
+        "email": f"owner@{domain}.example.com", "password": "Bench-passw0rd", "first_name": "Bench",
+        "last_name": "Owner", "tenant_name": "Bench", "tenant_domain": domain
+    })
+    response.raise_for_status()
+    client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+    project_ids, task_ids = [], []
+    for number in range(projects):
+        response = await client.post("/api/v1/projects", json={"name": f"Project {number}"})
+        project_ids.append(response.raise_for_status().json()["id"])
+        for task_number in range(tasks_per_project):
+            response = await client.post(f"/api/v1/projects/{project_ids[-1]}/tasks", json={"title": f"Task {task_number}"})
+            task_ids.append(response.raise_for_status().json()["id"])
+    return project_ids, task_ids
+
+async def measure(args) -> None:
+    """Worker side: benchmark the app against this process's DATABASE_URL, print JSON rates"""
+    from main import app
+
+    statuses = ["todo", "in_progress", "in_review", "done"]
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            project_ids, task_ids = await seed(client, args.projects, args.tasks)
+            project = project_ids[0]
+            endpoints = {
+                "GET auth/me": lambda n: client.get("/api/v1/auth/me"),
+                "GET projects": lambda n: client.get("/api/v1/projects"),
+                "GET project": lambda n: client.get(f"/api/v1/projects/{project_ids[n % len(project_ids)]}"),
+                f"GET {args.tasks} tasks": lambda n: client.get(f"/api/v1/projects/{project}/tasks"),
+                "GET sync": lambda n: client.get("/api/v1/sync"),
+                "POST task": lambda n: client.post(f"/api/v1/projects/{project}/tasks", json={"title": f"New {n}"}),
+                "PUT task status": lambda n: client.put(
+                    f"/api/v1/tasks/{task_ids[n % len(task_ids)]}", json={"status": statuses[n // len(task_ids) % 4]}
+                ),
+            }
+            rates = {}
+            for name, send in endpoints.items():
+                await requests_per_second(send, 0.5, args.concurrency)
+                rates[name] = await requests_per_second(send, args.seconds, args.concurrency)
+    print(json.dumps(rates))
+
+def run_worker(database_url: str, args) -> dict:
+    command = [
+        sys.executable, "-m", "benchmarks.bench_sqlite", "--worker",
+        "--seconds", str(args.seconds), "--concurrency", str(args.concurrency),
+        "--projects", str(args.projects), "--tasks", str(args.tasks)
+    ]
+    env = {**os.environ, "DATABASE_URL": database_url, "DATABASE_SHARD_URLS": "", "DATABASE_REPLICA_URLS": ""}
+    output = subprocess.run(command, cwd=BACKEND_DIR, env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def compare(args) -> None:
+    postgres_url = os.getenv("DATABASE_URL")
+    if not postgres_url or not postgres_url.startswith("postgresql"):
+        raise SystemExit("Set DATABASE_URL to the local Postgres database to compare against")
+    with tempfile.TemporaryDirectory() as directory:
+        sqlite_url = f"sqlite+aiosqlite:///{os.path.join(directory, 'askbob.db')}"
+        subprocess.run(
+            ["alembic", "upgrade", "head"], cwd=BACKEND_DIR, check=True, capture_output=True,
+            env={**os.environ, "DATABASE_URL": sqlite_url}
+        )
+        results = {"sqlite": run_worker(sqlite_url, args), "postgres": run_worker(postgres_url, args)}
+
+    print(f"{'endpoint':<18} {'sqlite req/s':>13} {'postgres req/s':>15} {'ratio':>7}")
+    for name in results["sqlite"]:
+        sqlite_rate, postgres_rate = results["sqlite"][name], results["postgres"][name]
+        print(f"{name:<18} {sqlite_rate:>13,.0f} {postgres_rate:>15,.0f} {sqlite_rate / postgres_rate:>6.2f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--projects", type=int, default=10)
+    parser.add_argument("--tasks", type=int, default=50, help="Tasks per project")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        asyncio.run(measure(args))
+    else:
+        compare(args)
+
+if __name__ == "__main__":
+    main()
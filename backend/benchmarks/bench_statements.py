@@ -0,0 +1,95 @@
+# backend/benchmarks/bench_statements.py - Per-call overhead of rebuilt select() statements against cached lambda statements
+"""
+Runs the task repository's lookup by tenant and id, and the user lookup by
+email, against existing rows in DATABASE_URL three ways: a select() rebuilt
+on every call without SQLAlchemy's compiled cache or asyncpg's prepared
+statement cache, a select() rebuilt on every call with both caches (the
+repositories before), and the lambda statements they use now. Also times
+the Python-side work alone: building a statement and its cache key.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Callable, List
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.database.connection import build_engine
+from infrastructure.database.models import TaskModel, UserModel
+from infrastructure.database.settings import DatabaseSettings
+
+def task_select(tenant_id, task_id):
+    return select(TaskModel).where(TaskModel.tenant_id == tenant_id, TaskModel.id == task_id)
+
+def task_lambda(tenant_id, task_id):
+    return lambda_stmt(lambda: select(TaskModel).where(TaskModel.tenant_id == tenant_id, TaskModel.id == task_id))
+
+def user_select(email):
+    return select(UserModel).where(UserModel.email == email)
+
+def user_lambda(email):
+    return lambda_stmt(lambda: select(UserModel).where(UserModel.email == email))
+
+def build_cost(build: Callable, samples: List[tuple], calls: int) -> float:
+    """Microseconds to build a statement and compute the cache key SQLAlchemy looks it up by"""
+    started = time.perf_counter()
+    for number in range(calls):
+        build(*samples[number % len(samples)])._generate_cache_key()
+    return (time.perf_counter() - started) / calls * 1e6
+
+async def round_trips(session: AsyncSession, build: Callable, samples: List[tuple], calls: int, options: dict) -> float:
+    """Median microseconds per executed lookup"""
+    timings = []
+    for number in range(calls):
+        started = time.perf_counter()
+        result = await session.execute(build(*samples[number % len(samples)]), execution_options=options)
+        result.scalars().all()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1e6
+
+async def run(args) -> None:
+    cached = build_engine(DatabaseSettings())
+    uncached_settings = DatabaseSettings()
+    uncached_settings.statement_cache_size = 0
+    uncached_settings.prepared_statement_cache_size = 0
+    uncached = build_engine(uncached_settings)
+    try:
+        async with AsyncSession(cached) as session:
+            task_samples = (await session.execute(
+                select(TaskModel.tenant_id, TaskModel.id).limit(args.samples)
+            )).all()
+            user_samples = (await session.execute(select(UserModel.email).limit(args.samples))).all()
+        if not task_samples or not user_samples:
+            raise SystemExit("DATABASE_URL has no tasks or users to look up; create sample data first")
+
+        lookups = [
+            ("task by tenant + id", task_select, task_lambda, [tuple(row) for row in task_samples]),
+            ("user by email", user_select, user_lambda, [tuple(row) for row in user_samples]),
+        ]
+        print(f"{'lookup':<20} {'statement':<18} {'build + key us':>15} {'round trip us':>14}")
+        for name, plain, cached_lambda, samples in lookups:
+            variants = [
+                ("select, uncached", plain, uncached, {"compiled_cache": None}),
+                ("select", plain, cached, {}),
+                ("lambda_stmt", cached_lambda, cached, {}),
+            ]
+            for label, build, engine, options in variants:
+                async with AsyncSession(engine) as session:
+                    # Warm the pool connection, the compiled cache and the prepared statements
+                    await round_trips(session, build, samples, 20, options)
+                    per_call = await round_trips(session, build, samples, args.calls, options)
+                print(f"{name:<20} {label:<18} {build_cost(build, samples, args.calls):>15.1f} {per_call:>14.1f}")
+    finally:
+        await cached.dispose()
+        await uncached.dispose()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=5_000)
+    parser.add_argument("--samples", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,10 @@ from .tenant import Tenant
 from .user import User
 from .project import Project, ProjectStatus
 from .task import Task, TaskStatus, TaskPriority
+from .change import EntityType, ChangeType, ChangeEvent, Tombstone, ChangeSet
+from .activity import ActivityEntry
+from .flow import StatusTransition, DailyStatusCounts
+from .report import TaskColumns, AssigneeWorkload
 
 __all__ = [
     "Tenant",
@@ -10,5 +14,15 @@ __all__ = [
     "ProjectStatus",
     "Task",
     "TaskStatus",
-    "TaskPriority"
+    "TaskPriority",
+    "EntityType",
+    "ChangeType",
+    "ChangeEvent",
+    "Tombstone",
+    "ChangeSet",
+    "ActivityEntry",
+    "StatusTransition",
+    "DailyStatusCounts",
+    "TaskColumns",
+    "AssigneeWorkload"
 ]
@@ -0,0 +1,30 @@
+# backend/domain/entities/activity.py
+from datetime import datetime
+from typing import Any, Dict, Optional
+import uuid
+from .change import ChangeType, EntityType
+from ..identifiers import uuid7
+
+class ActivityEntry:
+    """Who changed what on a project or one of its tasks"""
+    def __init__(
+        self,
+        tenant_id: uuid.UUID,
+        project_id: uuid.UUID,
+        entity_type: EntityType,
+        entity_id: uuid.UUID,
+        action: ChangeType,
+        actor_id: Optional[uuid.UUID] = None,
+        changes: Optional[Dict[str, Any]] = None,
+        id: Optional[uuid.UUID] = None,
+        created_at: Optional[datetime] = None
+    ):
+        self.id = id or uuid7()
+        self.tenant_id = tenant_id
+        self.project_id = project_id
+        self.entity_type = entity_type
+        self.entity_id = entity_id
+        self.action = action
+        self.actor_id = actor_id
+        self.changes = changes or {}
+        self.created_at = created_at or datetime.utcnow()
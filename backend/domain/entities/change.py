@@ -0,0 +1,68 @@
+# backend/domain/entities/change.py
+from datetime import datetime
+from typing import List, Optional
+import uuid
+from enum import Enum
+
+from .project import Project
+from .task import Task
+from ..identifiers import uuid7
+
+class EntityType(Enum):
+    PROJECT = "project"
+    TASK = "task"
+
+class ChangeType(Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
+class ChangeEvent:
+    """A create, update or delete of a project or task, pushed to live clients"""
+    def __init__(
+        self,
+        tenant_id: uuid.UUID,
+        entity_type: EntityType,
+        entity_id: uuid.UUID,
+        change_type: ChangeType,
+        project_id: Optional[uuid.UUID] = None,
+        occurred_at: Optional[datetime] = None
+    ):
+        self.tenant_id = tenant_id
+        self.entity_type = entity_type
+        self.entity_id = entity_id
+        self.change_type = change_type
+        self.project_id = project_id
+        self.occurred_at = occurred_at or datetime.utcnow()
+
+class Tombstone:
+    """Compact record left behind when a project or task is deleted"""
+    def __init__(
+        self,
+        entity_type: EntityType,
+        entity_id: uuid.UUID,
+        tenant_id: uuid.UUID,
+        id: Optional[uuid.UUID] = None,
+        deleted_at: Optional[datetime] = None
+    ):
+        self.id = id or uuid7()
+        self.entity_type = entity_type
+        self.entity_id = entity_id
+        self.tenant_id = tenant_id
+        self.deleted_at = deleted_at or datetime.utcnow()
+
+class ChangeSet:
+    """Projects, tasks and deletions that changed since a sync cursor"""
+    def __init__(
+        self,
+        cursor: datetime,
+        projects: List[Project],
+        tasks: List[Task],
+        tombstones: List[Tombstone],
+        reset: bool = False
+    ):
+        self.cursor = cursor
+        self.projects = projects
+        self.tasks = tasks
+        self.tombstones = tombstones
+        self.reset = reset
@@ -0,0 +1,31 @@
+# backend/domain/entities/flow.py
+from datetime import date, datetime
+from typing import Dict, Optional
+import uuid
+from .task import TaskStatus
+
+class StatusTransition:
+    """A task moving between statuses; None marks creation or deletion"""
+    def __init__(
+        self,
+        task_id: uuid.UUID,
+        project_id: uuid.UUID,
+        tenant_id: uuid.UUID,
+        from_status: Optional[TaskStatus],
+        to_status: Optional[TaskStatus],
+        changed_at: Optional[datetime] = None,
+        id: Optional[int] = None
+    ):
+        self.id = id
+        self.task_id = task_id
+        self.project_id = project_id
+        self.tenant_id = tenant_id
+        self.from_status = from_status
+        self.to_status = to_status
+        self.changed_at = changed_at or datetime.utcnow()
+
+class DailyStatusCounts:
+    """Number of a project's tasks in each status at the end of a day"""
+    def __init__(self, day: date, counts: Dict[TaskStatus, int]):
+        self.day = day
+        self.counts = {status: counts.get(status, 0) for status in TaskStatus}
@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Optional
 import uuid
 from enum import Enum
+from ..identifiers import uuid7
 
 class ProjectStatus(Enum):
     PLANNING = "planning"
@@ -23,7 +24,7 @@ class Project:
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None
     ):
-        self.id = id or uuid.uuid4()
+        self.id = id or uuid7()
         self.name = name
         self.tenant_id = tenant_id
         self.created_by = created_by
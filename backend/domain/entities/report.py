@@ -0,0 +1,47 @@
+# backend/domain/entities/report.py
+from typing import Dict, Optional, Sequence
+import uuid
+from .task import TaskPriority, TaskStatus
+
+class TaskColumns:
+    """
+    Task attributes needed for reports, one sequence per column instead of
+    one object per task. Timestamps are UTC seconds since the epoch.
+    """
+    def __init__(
+        self,
+        assigned_to: Sequence[Optional[uuid.UUID]],
+        status: Sequence[TaskStatus],
+        priority: Sequence[TaskPriority],
+        created_at: Sequence[float],
+        due_date: Sequence[Optional[float]],
+        started_at: Sequence[Optional[float]],
+        completed_at: Sequence[Optional[float]]
+    ):
+        self.assigned_to = assigned_to
+        self.status = status
+        self.priority = priority
+        self.created_at = created_at
+        self.due_date = due_date
+        self.started_at = started_at
+        self.completed_at = completed_at
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+class AssigneeWorkload:
+    """Workload and throughput of one assignee; None stands for unassigned tasks"""
+    def __init__(
+        self,
+        assignee_id: Optional[uuid.UUID],
+        open_by_priority: Dict[TaskPriority, int],
+        completed: int,
+        avg_cycle_time_hours: Optional[float],
+        overdue_ratio: Optional[float]
+    ):
+        self.assignee_id = assignee_id
+        self.open_by_priority = open_by_priority
+        self.open_total = sum(open_by_priority.values())
+        self.completed = completed
+        self.avg_cycle_time_hours = avg_cycle_time_hours
+        self.overdue_ratio = overdue_ratio
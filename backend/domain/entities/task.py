@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Optional
 import uuid
 from enum import Enum
+from ..identifiers import uuid7
 
 class TaskStatus(Enum):
     TODO = "todo"
@@ -30,9 +31,10 @@ class Task:
         due_date: Optional[datetime] = None,
         id: Optional[uuid.UUID] = None,
         created_at: Optional[datetime] = None,
-        updated_at: Optional[datetime] = None
+        updated_at: Optional[datetime] = None,
+        archived_at: Optional[datetime] = None
     ):
-        self.id = id or uuid.uuid4()
+        self.id = id or uuid7()
         self.title = title
         self.project_id = project_id
         self.tenant_id = tenant_id
@@ -44,6 +46,7 @@ class Task:
         self.due_date = due_date
         self.created_at = created_at or datetime.utcnow()
         self.updated_at = updated_at or datetime.utcnow()
+        self.archived_at = archived_at
         
         # Business rules
         if not title or len(title.strip()) == 0:
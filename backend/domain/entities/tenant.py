@@ -2,6 +2,7 @@
 from datetime import datetime
 from typing import Optional
 import uuid
+from ..identifiers import uuid7
 
 class Tenant:
     def __init__(
@@ -9,12 +10,15 @@ class Tenant:
         name: str,
         domain: str,
         id: Optional[uuid.UUID] = None,
-        created_at: Optional[datetime] = None
+        created_at: Optional[datetime] = None,
+        task_archive_days: Optional[int] = None
     ):
-        self.id = id or uuid.uuid4()
+        self.id = id or uuid7()
         self.name = name
         self.domain = domain
         self.created_at = created_at or datetime.utcnow()
+        # Days after completion before tasks move to the archive; None uses the deployment default
+        self.task_archive_days = task_archive_days
         
         # Business rules
         if not name or len(name.strip()) == 0:
@@ -2,6 +2,7 @@
 from datetime import datetime
 from typing import Optional
 import uuid
+from ..identifiers import uuid7
 
 class User:
     def __init__(
@@ -15,7 +16,7 @@ class User:
         created_at: Optional[datetime] = None,
         is_active: bool = True
     ):
-        self.id = id or uuid.uuid4()
+        self.id = id or uuid7()
         self.email = email
         self.tenant_id = tenant_id
         self.hashed_password = hashed_password
@@ -2,10 +2,23 @@ from .tenant_repository import TenantRepository
 from .user_repository import UserRepository
 from .project_repository import ProjectRepository
 from .task_repository import TaskRepository
+from .tombstone_repository import TombstoneRepository
+from .activity_repository import ActivityRepository, ActivitySink
+from .flow_repository import FlowRepository
+from .task_report_repository import TaskReportRepository
+from .task_archive_repository import TaskArchiveRepository
+from .tenant_placement import TenantPlacement
 
 __all__ = [
     "TenantRepository",
     "UserRepository", 
     "ProjectRepository",
-    "TaskRepository"
+    "TaskRepository",
+    "TombstoneRepository",
+    "ActivityRepository",
+    "ActivitySink",
+    "FlowRepository",
+    "TaskReportRepository",
+    "TaskArchiveRepository",
+    "TenantPlacement"
 ]
\ No newline at end of file
@@ -0,0 +1,28 @@
+# backend/domain/repositories/activity_repository.py
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional, Tuple
+import uuid
+from ..entities.activity import ActivityEntry
+
+class ActivitySink(ABC):
+    """Write side of the activity log; must not block the calling request"""
+    @abstractmethod
+    def record(self, entry: ActivityEntry) -> None:
+        pass
+
+class ActivityRepository(ABC):
+    @abstractmethod
+    async def add_many(self, entries: List[ActivityEntry]) -> None:
+        pass
+
+    @abstractmethod
+    async def get_by_project(
+        self,
+        tenant_id: uuid.UUID,
+        project_id: uuid.UUID,
+        limit: int,
+        before: Optional[Tuple[datetime, uuid.UUID]] = None
+    ) -> List[ActivityEntry]:
+        """Newest first; `before` is the (created_at, id) of the previous page's last entry"""
+        pass
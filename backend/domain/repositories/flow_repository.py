@@ -0,0 +1,60 @@
+# backend/domain/repositories/flow_repository.py
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+import uuid
+from ..entities.flow import DailyStatusCounts, StatusTransition
+
+class FlowRepository(ABC):
+    @abstractmethod
+    async def get_rollups(
+        self,
+        tenant_id: uuid.UUID,
+        project_id: uuid.UUID,
+        start: date,
+        end: date
+    ) -> List[DailyStatusCounts]:
+        """Stored rollups in [start, end], plus the latest one before start"""
+        pass
+
+    @abstractmethod
+    async def get_checkpoint(self, name: str) -> Optional[datetime]:
+        pass
+
+    @abstractmethod
+    async def get_changed_projects(
+        self,
+        after: Optional[datetime],
+        until: datetime
+    ) -> Dict[uuid.UUID, Tuple[uuid.UUID, datetime]]:
+        """Map each project with transitions in (after, until] to its tenant and earliest change"""
+        pass
+
+    @abstractmethod
+    async def get_rollup_before(self, project_id: uuid.UUID, day: date) -> Optional[DailyStatusCounts]:
+        pass
+
+    @abstractmethod
+    async def get_transitions(
+        self,
+        project_id: uuid.UUID,
+        since: datetime,
+        until: datetime
+    ) -> List[StatusTransition]:
+        """Transitions in [since, until], oldest first"""
+        pass
+
+    @abstractmethod
+    async def replace_rollups(
+        self,
+        tenant_id: uuid.UUID,
+        project_id: uuid.UUID,
+        from_day: date,
+        rollups: List[DailyStatusCounts]
+    ) -> None:
+        """Swap the project's rollups from from_day onwards for the given ones"""
+        pass
+
+    @abstractmethod
+    async def set_checkpoint(self, name: str, processed_until: datetime) -> None:
+        pass
@@ -1,5 +1,6 @@
 # backend/domain/repositories/project_repository.py
 from abc import abstractmethod
+from datetime import datetime
 from typing import List, Optional
 import uuid
 from .base import BaseRepository
@@ -16,4 +17,8 @@ class ProjectRepository(BaseRepository[Project]):
     
     @abstractmethod
     async def get_by_status(self, tenant_id: uuid.UUID, status: ProjectStatus) -> List[Project]:
+        pass
+    
+    @abstractmethod
+    async def get_updated_since(self, tenant_id: uuid.UUID, since: Optional[datetime]) -> List[Project]:
         pass
\ No newline at end of file
@@ -0,0 +1,16 @@
+# backend/domain/repositories/task_archive_repository.py
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, Optional
+import uuid
+
+class TaskArchiveRepository(ABC):
+    @abstractmethod
+    async def get_tenant_thresholds(self) -> Dict[uuid.UUID, Optional[int]]:
+        """Each tenant's task_archive_days, None where the tenant uses the default"""
+        pass
+
+    @abstractmethod
+    async def archive_completed(self, tenant_id: uuid.UUID, completed_before: datetime, limit: int) -> int:
+        """Move up to limit done tasks last updated before the cutoff into the archive"""
+        pass
@@ -0,0 +1,10 @@
+# backend/domain/repositories/task_report_repository.py
+from abc import ABC, abstractmethod
+import uuid
+from ..entities.report import TaskColumns
+
+class TaskReportRepository(ABC):
+    @abstractmethod
+    async def get_task_columns(self, tenant_id: uuid.UUID) -> TaskColumns:
+        """All of a tenant's tasks with their first start and last completion times"""
+        pass
@@ -1,17 +1,19 @@
 # backend/domain/repositories/task_repository.py
 from abc import abstractmethod
+from datetime import datetime
 from typing import List, Optional
 import uuid
 from .base import BaseRepository
 from ..entities.task import Task, TaskStatus
 
 class TaskRepository(BaseRepository[Task]):
+    # Listings read only active tasks unless include_archived also asks for the archive
     @abstractmethod
-    async def get_by_project(self, project_id: uuid.UUID, tenant_id: uuid.UUID) -> List[Task]:
+    async def get_by_project(self, project_id: uuid.UUID, tenant_id: uuid.UUID, include_archived: bool = False) -> List[Task]:
         pass
     
     @abstractmethod
-    async def get_by_assignee(self, user_id: uuid.UUID, tenant_id: uuid.UUID) -> List[Task]:
+    async def get_by_assignee(self, user_id: uuid.UUID, tenant_id: uuid.UUID, include_archived: bool = False) -> List[Task]:
         pass
     
     @abstractmethod
@@ -19,5 +21,9 @@ class TaskRepository(BaseRepository[Task]):
         pass
     
     @abstractmethod
-    async def get_by_status(self, tenant_id: uuid.UUID, status: TaskStatus) -> List[Task]:
+    async def get_by_status(self, tenant_id: uuid.UUID, status: TaskStatus, include_archived: bool = False) -> List[Task]:
+        pass
+    
+    @abstractmethod
+    async def get_updated_since(self, tenant_id: uuid.UUID, since: Optional[datetime]) -> List[Task]:
         pass
\ No newline at end of file
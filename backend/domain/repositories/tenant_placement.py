@@ -0,0 +1,10 @@
+# backend/domain/repositories/tenant_placement.py
+from abc import ABC, abstractmethod
+from ..entities.tenant import Tenant
+from ..entities.user import User
+
+class TenantPlacement(ABC):
+    @abstractmethod
+    async def place(self, tenant: Tenant, owner: User) -> str:
+        """Pick the shard for a newly registered tenant, prepare it, and return its name"""
+        pass
@@ -0,0 +1,15 @@
+# backend/domain/repositories/tombstone_repository.py
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List
+import uuid
+from ..entities.change import Tombstone
+
+class TombstoneRepository(ABC):
+    @abstractmethod
+    async def get_since(self, tenant_id: uuid.UUID, since: datetime) -> List[Tombstone]:
+        pass
+
+    @abstractmethod
+    async def purge_before(self, cutoff: datetime) -> int:
+        pass
@@ -0,0 +1,3 @@
+from .writer import ActivityLogWriter, activity_log_writer
+
+__all__ = ["ActivityLogWriter", "activity_log_writer"]
@@ -0,0 +1,136 @@
+# backend/infrastructure/activity/writer.py
+"""
+Asynchronous, batched writer for the activity log.
+
+Use cases hand entries to `record`, which only appends to a bounded
+in-process queue. A background task drains the queue and writes one
+multi-row INSERT every ACTIVITY_FLUSH_INTERVAL_MS or ACTIVITY_BATCH_SIZE
+entries, whichever comes first. When the queue is full new entries are
+dropped and counted rather than slowing down the request path.
+With several shards, each batch is split by the shard of its tenants.
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Optional
+import uuid
+
+from domain.entities.activity import ActivityEntry
+from domain.repositories.activity_repository import ActivitySink
+from infrastructure.database.sharding import shard_directory
+from infrastructure.database.repositories.activity_repository_impl import ActivityRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+class ActivityLogWriter(ActivitySink):
+    def __init__(
+        self,
+        session_factory: Callable,
+        shard_for: Optional[Callable[[uuid.UUID], Awaitable[str]]] = None
+    ):
+        # Without shard_for every batch goes to session_factory(); with it, to session_factory(shard)
+        self.session_factory = session_factory
+        self.shard_for = shard_for
+        self.max_queue_size = int(os.getenv("ACTIVITY_QUEUE_SIZE", "10000"))
+        self.batch_size = int(os.getenv("ACTIVITY_BATCH_SIZE", "500"))
+        self.flush_interval = int(os.getenv("ACTIVITY_FLUSH_INTERVAL_MS", "200")) / 1000
+        self.drain_timeout = float(os.getenv("ACTIVITY_DRAIN_TIMEOUT_SECONDS", "10"))
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        # Counters exported as metrics
+        self.enqueued = 0
+        self.dropped = 0
+        self.written = 0
+        self.batches = 0
+        self.failed_batches = 0
+        self.last_flush_seconds = 0.0
+
+    def record(self, entry: ActivityEntry) -> None:
+        """Queue an entry for the next batch; never blocks"""
+        try:
+            self._queue.put_nowait(entry)
+            self.enqueued += 1
+        except asyncio.QueueFull:
+            if self.dropped == 0 or self.dropped % 1000 == 0:
+                logger.warning("Activity log queue full, dropped %d entries so far", self.dropped + 1)
+            self.dropped += 1
+
+    def stats(self) -> dict:
+        return {
+            "queue_depth": self._queue.qsize(),
+            "queue_capacity": self.max_queue_size,
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "written": self.written,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "last_flush_seconds": self.last_flush_seconds
+        }
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Finish the flush loop after draining what is still queued"""
+        if self._task is None:
+            return
+        self._stopping = True
+        try:
+            await asyncio.wait_for(self._task, timeout=self.drain_timeout)
+        except asyncio.TimeoutError:
+            logger.error("Activity log drain timed out with %d entries left", self._queue.qsize())
+        self._task = None
+
+    async def _run(self) -> None:
+        while not (self._stopping and self._queue.empty()):
+            batch = await self._collect_batch()
+            if batch:
+                await self._flush(batch)
+
+    async def _collect_batch(self) -> List[ActivityEntry]:
+        batch: List[ActivityEntry] = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            timeout = deadline - time.monotonic()
+            if timeout <= 0 or self._stopping:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _by_shard(self, batch: List[ActivityEntry]) -> Dict[Optional[str], List[ActivityEntry]]:
+        if self.shard_for is None:
+            return {None: batch}
+        groups: Dict[Optional[str], List[ActivityEntry]] = defaultdict(list)
+        for entry in batch:
+            groups[await self.shard_for(entry.tenant_id)].append(entry)
+        return groups
+
+    async def _flush(self, batch: List[ActivityEntry]) -> None:
+        started = time.perf_counter()
+        try:
+            for shard, entries in (await self._by_shard(batch)).items():
+                factory_args = () if shard is None else (shard,)
+                async with self.session_factory(*factory_args) as session:
+                    await ActivityRepositoryImpl(session).add_many(entries)
+                self.written += len(entries)
+            self.batches += 1
+        except Exception:
+            # Losing a batch of history is preferable to stalling the writer
+            self.failed_batches += 1
+            logger.exception("Failed to write %d activity log entries", len(batch))
+        self.last_flush_seconds = time.perf_counter() - started
+
+activity_log_writer = ActivityLogWriter(shard_directory.session, shard_directory.shard_for)
@@ -0,0 +1,221 @@
+# backend/infrastructure/allocation_tracer.py
+"""
+On-demand tracemalloc for finding what a worker allocates.
+
+An admin starts tracing (api/routes/admin.py), takes snapshots and diffs
+two of them, grouped by file and line, by file, or by traceback. While
+tracing, requests to TRACEMALLOC_ROUTES ("METHOD /template" pairs,
+comma-separated; the project and task listings by default) also record
+their peak allocation. tracemalloc's peak is process-wide, so only one
+request is measured at a time, and others that run meanwhile count
+towards it.
+
+Tracing slows every allocation, so it is bounded. Each trace keeps at
+most TRACEMALLOC_MAX_FRAMES frames. Tracing stops by itself after
+TRACEMALLOC_MAX_SECONDS, or once tracemalloc's own memory passes
+TRACEMALLOC_MAX_OVERHEAD_MB. Only the newest TRACEMALLOC_MAX_SNAPSHOTS
+snapshots are kept. Snapshots survive stopping, so they can still be
+diffed afterwards.
+"""
+import asyncio
+from collections import OrderedDict
+from contextlib import suppress
+from datetime import datetime
+import logging
+import os
+import re
+import time
+import tracemalloc
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROUTES = "GET /api/v1/projects,GET /api/v1/projects/{project_id}/tasks"
+GROUPINGS = ("lineno", "filename", "traceback")
+# Allocations made by tracemalloc and the import machinery are noise
+SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>")
+]
+
+def route_pattern(template: str) -> "re.Pattern":
+    return re.compile("^" + re.sub(r"\\\{[^}]+\\\}", "[^/]+", re.escape(template)) + "$")
+
+def statistic_entry(statistic: Any, group_by: str) -> Dict[str, Any]:
+    """A Statistic or StatisticDiff as JSON, located by its traceback"""
+    entry: Dict[str, Any] = {}
+    if group_by == "traceback":
+        # Oldest frame first, as in a printed traceback
+        entry["traceback"] = [f"{frame.filename}:{frame.lineno}" for frame in statistic.traceback]
+    else:
+        frame = statistic.traceback[0]
+        entry["file"] = frame.filename
+        if group_by == "lineno":
+            entry["line"] = frame.lineno
+    entry.update(size=statistic.size, count=statistic.count)
+    if isinstance(statistic, tracemalloc.StatisticDiff):
+        entry.update(size_diff=statistic.size_diff, count_diff=statistic.count_diff)
+    return entry
+
+class RoutePeaks:
+    def __init__(self):
+        self.requests = 0
+        self.total_bytes = 0
+        self.max_bytes = 0
+        self.last_bytes = 0
+
+    def add(self, peak_bytes: int) -> None:
+        self.requests += 1
+        self.total_bytes += peak_bytes
+        self.max_bytes = max(self.max_bytes, peak_bytes)
+        self.last_bytes = peak_bytes
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests, "mean_bytes": self.total_bytes // self.requests,
+            "max_bytes": self.max_bytes, "last_bytes": self.last_bytes
+        }
+
+class AllocationTracer:
+    def __init__(self):
+        self.max_frames = int(os.getenv("TRACEMALLOC_MAX_FRAMES", "10"))
+        self.max_seconds = float(os.getenv("TRACEMALLOC_MAX_SECONDS", "600"))
+        self.max_overhead_bytes = int(float(os.getenv("TRACEMALLOC_MAX_OVERHEAD_MB", "256")) * 2**20)
+        self.max_snapshots = int(os.getenv("TRACEMALLOC_MAX_SNAPSHOTS", "4"))
+        self.routes = [
+            (method, route_pattern(template), template)
+            for method, template in (
+                entry.strip().split(" ", 1) for entry in os.getenv("TRACEMALLOC_ROUTES", DEFAULT_ROUTES).split(",")
+                if entry.strip()
+            )
+        ]
+        self.active = False
+        self.frames = 0
+        self.started_at: Optional[datetime] = None
+        self.stop_reason: Optional[str] = None
+        self.snapshots: "OrderedDict[int, Tuple[datetime, tracemalloc.Snapshot]]" = OrderedDict()
+        self.route_peaks: Dict[str, RoutePeaks] = {}
+        self._next_snapshot_id = 1
+        self._measuring = False
+        self._limits: Optional[asyncio.Task] = None
+
+    def status(self) -> Dict[str, Any]:
+        traced, peak = tracemalloc.get_traced_memory()
+        return {
+            "tracing": self.active,
+            "frames": self.frames,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "stop_reason": self.stop_reason,
+            "traced_bytes": traced,
+            "peak_bytes": peak,
+            "overhead_bytes": tracemalloc.get_tracemalloc_memory(),
+            "limits": {
+                "max_frames": self.max_frames, "max_seconds": self.max_seconds,
+                "max_overhead_bytes": self.max_overhead_bytes, "max_snapshots": self.max_snapshots
+            },
+            "snapshots": [
+                {"id": snapshot_id, "taken_at": taken_at.isoformat(), "traces": len(snapshot.traces)}
+                for snapshot_id, (taken_at, snapshot) in self.snapshots.items()
+            ],
+            "routes": {route: peaks.to_dict() for route, peaks in self.route_peaks.items()}
+        }
+
+    async def start(self, frames: int) -> None:
+        """Start tracing with up to max_frames frames per allocation; a new session clears the route peaks"""
+        if self.active:
+            raise ValueError("Allocation tracing is already running")
+        if tracemalloc.is_tracing():
+            raise ValueError("tracemalloc was started outside the admin API")
+        self.frames = max(1, min(frames, self.max_frames))
+        tracemalloc.start(self.frames)
+        self.active = True
+        self.started_at = datetime.utcnow()
+        self.stop_reason = None
+        self.route_peaks = {}
+        self._limits = asyncio.create_task(self._enforce_limits(time.monotonic()))
+
+    async def stop(self, reason: str = "stopped by an admin") -> None:
+        if not self.active:
+            raise ValueError("Allocation tracing is not running")
+        self._stop(reason)
+        if self._limits is not None and self._limits is not asyncio.current_task():
+            self._limits.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._limits
+        self._limits = None
+
+    def _stop(self, reason: str) -> None:
+        tracemalloc.stop()
+        self.active = False
+        self._measuring = False
+        self.stop_reason = reason
+
+    async def _enforce_limits(self, started: float) -> None:
+        while self.active:
+            await asyncio.sleep(1)
+            overhead = tracemalloc.get_tracemalloc_memory()
+            if time.monotonic() - started > self.max_seconds:
+                reason = f"ran for TRACEMALLOC_MAX_SECONDS ({self.max_seconds:.0f}s)"
+            elif overhead > self.max_overhead_bytes:
+                reason = f"tracemalloc used {overhead / 2**20:.0f} MiB, over TRACEMALLOC_MAX_OVERHEAD_MB"
+            else:
+                continue
+            logger.warning("Stopped allocation tracing: %s", reason)
+            self._stop(reason)
+
+    def take_snapshot(self, limit: int) -> Dict[str, Any]:
+        """Snapshot the traced allocations and return the biggest lines"""
+        if not self.active:
+            raise ValueError("Allocation tracing is not running")
+        snapshot = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+        snapshot_id, taken_at = self._next_snapshot_id, datetime.utcnow()
+        self._next_snapshot_id += 1
+        self.snapshots[snapshot_id] = (taken_at, snapshot)
+        while len(self.snapshots) > self.max_snapshots:
+            self.snapshots.popitem(last=False)
+        statistics = snapshot.statistics("lineno")
+        return {
+            "id": snapshot_id,
+            "taken_at": taken_at.isoformat(),
+            "total_bytes": sum(statistic.size for statistic in statistics),
+            "top": [statistic_entry(statistic, "lineno") for statistic in statistics[:limit]]
+        }
+
+    def diff(self, first: int, second: int, group_by: str, limit: int) -> Dict[str, Any]:
+        """What changed from the first snapshot to the second, biggest growth first"""
+        if group_by not in GROUPINGS:
+            raise ValueError(f"group_by must be one of {', '.join(GROUPINGS)}")
+        missing = [snapshot_id for snapshot_id in (first, second) if snapshot_id not in self.snapshots]
+        if missing:
+            raise LookupError(f"No snapshot {missing[0]}; only the newest {self.max_snapshots} are kept")
+        differences = self.snapshots[second][1].compare_to(self.snapshots[first][1], group_by)
+        return {
+            "first": first,
+            "second": second,
+            "group_by": group_by,
+            "size_diff": sum(difference.size_diff for difference in differences),
+            "entries": [statistic_entry(difference, group_by) for difference in differences[:limit]]
+        }
+
+    def begin_request(self, scope: Dict[str, Any]) -> Optional[Tuple[str, int]]:
+        """(route, traced bytes) if this request's peak should be measured"""
+        if not self.active or self._measuring:
+            return None
+        for method, pattern, template in self.routes:
+            if scope["method"] == method and pattern.match(scope["path"]):
+                self._measuring = True
+                tracemalloc.reset_peak()
+                return f"{method} {template}", tracemalloc.get_traced_memory()[0]
+        return None
+
+    def end_request(self, measurement: Tuple[str, int]) -> None:
+        if not self._measuring:
+            # Tracing stopped during the request
+            return
+        self._measuring = False
+        route, traced_before = measurement
+        self.route_peaks.setdefault(route, RoutePeaks()).add(tracemalloc.get_traced_memory()[1] - traced_before)
+
+allocation_tracer = AllocationTracer()
@@ -0,0 +1,48 @@
+# backend/infrastructure/cache.py
+"""
+Small in-process cache with per-entry expiry.
+
+Each worker keeps its own copy, so entries can be up to `ttl_seconds`
+stale and are not shared between processes. Only use it for data where
+that is acceptable, such as reports.
+"""
+from collections import OrderedDict
+import os
+import time
+from typing import Any, Hashable, Optional
+
+class TTLCache:
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        # Least recently used entries go first once the cache is full
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+report_cache = TTLCache(
+    ttl_seconds=float(os.getenv("REPORT_CACHE_TTL_SECONDS", "60")),
+    max_entries=int(os.getenv("REPORT_CACHE_MAX_ENTRIES", "1024"))
+)
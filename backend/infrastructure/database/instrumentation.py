@@ -0,0 +1,91 @@
+# backend/infrastructure/database/instrumentation.py
+"""
+Per-request SQL accounting.
+
+RequestMetricsMiddleware puts a QueryStats in `current_query_stats` for
+each request. Engine events add every statement and its time to it, and
+InstrumentedQueuePool adds the time spent waiting for a connection.
+Statements run outside a request, such as the activity writer's batches,
+are not counted.
+
+Statements over SLOW_QUERY_THRESHOLD_MS also go to the slow-query log,
+tagged with the request's route and tenant.
+"""
+from contextvars import ContextVar
+import time
+from typing import Any, Optional
+import uuid
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .slow_queries import explaining, slow_query_log
+
+# asyncpg logs its transaction control too; the ORM path doesn't count it, so neither do we
+TRANSACTION_CONTROL = ("BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE")
+
+class QueryStats:
+    def __init__(self, scope: Optional[dict] = None):
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.pool_wait_seconds = 0.0
+        # The router adds the matched route to the ASGI scope; the auth dependency sets the tenant
+        self.scope = scope
+        self.tenant_id: Optional[uuid.UUID] = None
+
+    @property
+    def route(self) -> Optional[str]:
+        route = self.scope.get("route") if self.scope is not None else None
+        return route.path if route is not None else None
+
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("current_query_stats", default=None)
+
+def record_statement(engine: AsyncEngine, statement: str, parameters: Any, seconds: float) -> None:
+    if explaining.get():
+        return
+    stats = current_query_stats.get()
+    if stats is None:
+        slow_query_log.observe(engine, statement, parameters, seconds)
+        return
+    stats.statements += 1
+    stats.db_seconds += seconds
+    slow_query_log.observe(engine, statement, parameters, seconds, stats.route, stats.tenant_id)
+
+def record_tenant(tenant_id: uuid.UUID) -> None:
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.tenant_id = tenant_id
+
+def record_pool_wait(seconds: float) -> None:
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.pool_wait_seconds += seconds
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Count the statements an engine runs into the current request's QueryStats"""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(connection, cursor, statement, parameters, context, executemany) -> None:
+        connection.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(connection, cursor, statement, parameters, context, executemany) -> None:
+        record_statement(engine, statement, parameters, time.perf_counter() - connection.info["query_started"].pop())
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(context) -> None:
+        started = context.connection.info.get("query_started") if context.connection is not None else None
+        if started:
+            seconds = time.perf_counter() - started.pop()
+            record_statement(engine, context.statement or "", context.parameters, seconds)
+
+    if sync_engine.dialect.driver == "asyncpg":
+        def _log_asyncpg_query(record) -> None:
+            if not record.query.lstrip().upper().startswith(TRANSACTION_CONTROL):
+                record_statement(engine, record.query, record.args, record.elapsed)
+
+        @event.listens_for(sync_engine, "connect")
+        def _connect(dbapi_connection, connection_record) -> None:
+            # The asyncpg repositories query the driver connection directly, past the cursor
+            # events. The ORM's prepared statements don't reach asyncpg's query loggers.
+            dbapi_connection.driver_connection.add_query_logger(_log_asyncpg_query)
@@ -7,7 +7,10 @@ from domain.entities.tenant import Tenant
 from domain.entities.user import User
 from domain.entities.project import Project
 from domain.entities.task import Task
-from .models import TenantModel, UserModel, ProjectModel, TaskModel
+from domain.entities.change import Tombstone
+from domain.entities.activity import ActivityEntry
+from domain.entities.flow import StatusTransition
+from .models import TenantModel, UserModel, ProjectModel, TaskModel, TombstoneModel, ActivityModel, TaskStatusTransitionModel
 
 class TenantMapper:
     @staticmethod
@@ -16,7 +19,8 @@ class TenantMapper:
             id=model.id,
             name=model.name,
             domain=model.domain,
-            created_at=model.created_at
+            created_at=model.created_at,
+            task_archive_days=model.task_archive_days
         )
     
     @staticmethod
@@ -25,7 +29,8 @@ class TenantMapper:
             id=entity.id,
             name=entity.name,
             domain=entity.domain,
-            created_at=entity.created_at
+            created_at=entity.created_at,
+            task_archive_days=entity.task_archive_days
         )
 
 class UserMapper:
@@ -85,6 +90,7 @@ class ProjectMapper:
 class TaskMapper:
     @staticmethod
     def to_domain(model: TaskModel) -> Task:
+        # Also maps tasks_archive rows and rows of the hot/archive union
         return Task(
             id=model.id,
             title=model.title,
@@ -97,7 +103,8 @@ class TaskMapper:
             assigned_to=model.assigned_to,
             due_date=model.due_date,
             created_at=model.created_at,
-            updated_at=model.updated_at
+            updated_at=model.updated_at,
+            archived_at=getattr(model, "archived_at", None)
         )
     
     @staticmethod
@@ -115,4 +122,80 @@ class TaskMapper:
             due_date=entity.due_date,
             created_at=entity.created_at,
             updated_at=entity.updated_at
+        )
+
+class TombstoneMapper:
+    @staticmethod
+    def to_domain(model: TombstoneModel) -> Tombstone:
+        return Tombstone(
+            id=model.id,
+            entity_type=model.entity_type,
+            entity_id=model.entity_id,
+            tenant_id=model.tenant_id,
+            deleted_at=model.deleted_at
+        )
+    
+    @staticmethod
+    def to_model(entity: Tombstone) -> TombstoneModel:
+        return TombstoneModel(
+            id=entity.id,
+            entity_type=entity.entity_type,
+            entity_id=entity.entity_id,
+            tenant_id=entity.tenant_id,
+            deleted_at=entity.deleted_at
+        )
+
+class ActivityMapper:
+    @staticmethod
+    def to_domain(model: ActivityModel) -> ActivityEntry:
+        return ActivityEntry(
+            id=model.id,
+            tenant_id=model.tenant_id,
+            project_id=model.project_id,
+            entity_type=model.entity_type,
+            entity_id=model.entity_id,
+            action=model.action,
+            actor_id=model.actor_id,
+            changes=model.changes,
+            created_at=model.created_at
+        )
+    
+    @staticmethod
+    def to_row(entity: ActivityEntry) -> dict:
+        """Column values for a bulk INSERT, skipping ORM object construction"""
+        return {
+            "id": entity.id,
+            "tenant_id": entity.tenant_id,
+            "project_id": entity.project_id,
+            "entity_type": entity.entity_type,
+            "entity_id": entity.entity_id,
+            "action": entity.action,
+            "actor_id": entity.actor_id,
+            "changes": entity.changes,
+            "created_at": entity.created_at
+        }
+
+class StatusTransitionMapper:
+    @staticmethod
+    def to_domain(model: TaskStatusTransitionModel) -> StatusTransition:
+        return StatusTransition(
+            id=model.id,
+            task_id=model.task_id,
+            project_id=model.project_id,
+            tenant_id=model.tenant_id,
+            from_status=model.from_status,
+            to_status=model.to_status,
+            changed_at=model.changed_at
+        )
+    
+    @staticmethod
+    def to_model(entity: StatusTransition) -> TaskStatusTransitionModel:
+        return TaskStatusTransitionModel(
+            id=entity.id,
+            task_id=entity.task_id,
+            project_id=entity.project_id,
+            tenant_id=entity.tenant_id,
+            from_status=entity.from_status,
+            to_status=entity.to_status,
+            changed_at=entity.changed_at
         )
\ No newline at end of file
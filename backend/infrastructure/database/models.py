@@ -1,34 +1,35 @@
 # backend/infrastructure/database/models.py
 from datetime import datetime
-from typing import Optional
-import uuid
-from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, Date, Boolean, Text, Integer, BigInteger, ForeignKey, Index, JSON, Uuid, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 
+from domain.identifiers import uuid7
 from domain.entities.project import ProjectStatus
 from domain.entities.task import TaskStatus, TaskPriority
+from domain.entities.change import EntityType, ChangeType
 from .connection import Base
 
 class TenantModel(Base):
     __tablename__ = "tenants"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid, primary_key=True, default=uuid7)
     name = Column(String(200), nullable=False)
     domain = Column(String(100), nullable=False, unique=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    task_archive_days = Column(Integer, nullable=True)
     
-    # Relationships
-    users = relationship("UserModel", back_populates="tenant")
-    projects = relationship("ProjectModel", back_populates="tenant")
-    tasks = relationship("TaskModel", back_populates="tenant")
+    # Relationships. Collections are passive on delete: the foreign keys decide, as in the
+    # asyncpg repositories, instead of loading every child just to null its column.
+    users = relationship("UserModel", back_populates="tenant", passive_deletes=True)
+    projects = relationship("ProjectModel", back_populates="tenant", passive_deletes=True)
+    tasks = relationship("TaskModel", back_populates="tenant", passive_deletes=True)
 
 class UserModel(Base):
     __tablename__ = "users"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid, primary_key=True, default=uuid7)
     email = Column(String(255), nullable=False)
-    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id"), nullable=False)
+    tenant_id = Column(Uuid, ForeignKey("tenants.id"), nullable=False)
     hashed_password = Column(String(255), nullable=False)
     first_name = Column(String(100), nullable=False)
     last_name = Column(String(100), nullable=False)
@@ -37,39 +38,47 @@ class UserModel(Base):
     
     # Relationships
     tenant = relationship("TenantModel", back_populates="users")
-    created_projects = relationship("ProjectModel", back_populates="creator")
-    created_tasks = relationship("TaskModel", foreign_keys="TaskModel.created_by", back_populates="creator")
-    assigned_tasks = relationship("TaskModel", foreign_keys="TaskModel.assigned_to", back_populates="assignee")
+    created_projects = relationship("ProjectModel", back_populates="creator", passive_deletes=True)
+    created_tasks = relationship(
+        "TaskModel", foreign_keys="TaskModel.created_by", back_populates="creator", passive_deletes=True
+    )
+    assigned_tasks = relationship(
+        "TaskModel", foreign_keys="TaskModel.assigned_to", back_populates="assignee", passive_deletes=True
+    )
 
 class ProjectModel(Base):
     __tablename__ = "projects"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid, primary_key=True, default=uuid7)
     name = Column(String(200), nullable=False)
     description = Column(Text)
     status = Column(SQLEnum(ProjectStatus), nullable=False, default=ProjectStatus.PLANNING)
-    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id"), nullable=False)
-    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    tenant_id = Column(Uuid, ForeignKey("tenants.id"), nullable=False)
+    created_by = Column(Uuid, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
     tenant = relationship("TenantModel", back_populates="projects")
     creator = relationship("UserModel", back_populates="created_projects")
-    tasks = relationship("TaskModel", back_populates="project")
+    tasks = relationship("TaskModel", back_populates="project", passive_deletes=True)
+    
+    __table_args__ = (
+        Index("ix_projects_tenant_updated_at", "tenant_id", "updated_at"),
+    )
 
 class TaskModel(Base):
     __tablename__ = "tasks"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid, primary_key=True, default=uuid7)
     title = Column(String(200), nullable=False)
     description = Column(Text)
     status = Column(SQLEnum(TaskStatus), nullable=False, default=TaskStatus.TODO)
     priority = Column(SQLEnum(TaskPriority), nullable=False, default=TaskPriority.MEDIUM)
-    project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id"), nullable=False)
-    tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id"), nullable=False)
-    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    assigned_to = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    project_id = Column(Uuid, ForeignKey("projects.id"), nullable=False)
+    tenant_id = Column(Uuid, ForeignKey("tenants.id"), nullable=False)
+    created_by = Column(Uuid, ForeignKey("users.id"), nullable=False)
+    assigned_to = Column(Uuid, ForeignKey("users.id"), nullable=True)
     due_date = Column(DateTime, nullable=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -78,4 +87,109 @@ class TaskModel(Base):
     project = relationship("ProjectModel", back_populates="tasks")
     tenant = relationship("TenantModel", back_populates="tasks")
     creator = relationship("UserModel", foreign_keys=[created_by], back_populates="created_tasks")
-    assignee = relationship("UserModel", foreign_keys=[assigned_to], back_populates="assigned_tasks")
\ No newline at end of file
+    assignee = relationship("UserModel", foreign_keys=[assigned_to], back_populates="assigned_tasks")
+    
+    __table_args__ = (
+        Index("ix_tasks_tenant_updated_at", "tenant_id", "updated_at"),
+    )
+
+class TaskArchiveModel(Base):
+    """Completed tasks moved out of `tasks` by the archival job; read-only"""
+    __tablename__ = "tasks_archive"
+    
+    id = Column(Uuid, primary_key=True)
+    title = Column(String(200), nullable=False)
+    description = Column(Text)
+    status = Column(SQLEnum(TaskStatus), nullable=False)
+    priority = Column(SQLEnum(TaskPriority), nullable=False)
+    # No foreign key to projects, so deleting a project only has to clear its archive rows
+    project_id = Column(Uuid, nullable=False)
+    tenant_id = Column(Uuid, ForeignKey("tenants.id"), nullable=False)
+    created_by = Column(Uuid, nullable=False)
+    assigned_to = Column(Uuid, nullable=True)
+    due_date = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+    archived_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    
+    __table_args__ = (
+        # Serve the include_archived listings; archived rows are all done, so status needs no index
+        Index("ix_tasks_archive_tenant_project", "tenant_id", "project_id"),
+        Index("ix_tasks_archive_tenant_assignee", "tenant_id", "assigned_to"),
+        Index("ix_tasks_archive_tenant_archived_at", "tenant_id", "archived_at"),
+    )
+
+class TombstoneModel(Base):
+    __tablename__ = "tombstones"
+    
+    id = Column(Uuid, primary_key=True, default=uuid7)
+    entity_type = Column(SQLEnum(EntityType), nullable=False)
+    entity_id = Column(Uuid, nullable=False)
+    tenant_id = Column(Uuid, ForeignKey("tenants.id"), nullable=False)
+    deleted_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    
+    __table_args__ = (
+        Index("ix_tombstones_tenant_deleted_at", "tenant_id", "deleted_at"),
+    )
+
+class ActivityModel(Base):
+    __tablename__ = "activity_log"
+    
+    id = Column(Uuid, primary_key=True, default=uuid7)
+    tenant_id = Column(Uuid, ForeignKey("tenants.id"), nullable=False)
+    # No foreign keys to projects or users: history outlives deleted rows
+    project_id = Column(Uuid, nullable=False)
+    entity_type = Column(SQLEnum(EntityType), nullable=False)
+    entity_id = Column(Uuid, nullable=False)
+    action = Column(SQLEnum(ChangeType), nullable=False)
+    actor_id = Column(Uuid, nullable=True)
+    changes = Column(JSON, nullable=False, default=dict)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    
+    __table_args__ = (
+        Index("ix_activity_log_tenant_project_created_at", "tenant_id", "project_id", "created_at", "id"),
+    )
+
+class TaskStatusTransitionModel(Base):
+    __tablename__ = "task_status_transitions"
+    
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    # No foreign keys: transitions of deleted tasks still count towards past days
+    task_id = Column(Uuid, nullable=False)
+    project_id = Column(Uuid, nullable=False)
+    tenant_id = Column(Uuid, nullable=False)
+    from_status = Column(SQLEnum(TaskStatus), nullable=True)
+    to_status = Column(SQLEnum(TaskStatus), nullable=True)
+    changed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    
+    __table_args__ = (
+        Index("ix_task_status_transitions_changed_at", "changed_at"),
+        Index("ix_task_status_transitions_project_changed_at", "project_id", "changed_at"),
+        Index("ix_task_status_transitions_tenant_task", "tenant_id", "task_id"),
+    )
+
+class ProjectFlowDailyModel(Base):
+    """End-of-day task counts per status, stored only for days with transitions"""
+    __tablename__ = "project_flow_daily"
+    
+    project_id = Column(Uuid, primary_key=True)
+    day = Column(Date, primary_key=True)
+    status = Column(SQLEnum(TaskStatus), primary_key=True)
+    tenant_id = Column(Uuid, nullable=False)
+    task_count = Column(Integer, nullable=False)
+
+class RollupCheckpointModel(Base):
+    __tablename__ = "rollup_checkpoints"
+    
+    name = Column(String(100), primary_key=True)
+    processed_until = Column(DateTime, nullable=False)
+
+class TenantShardModel(Base):
+    """Tenants placed away from the default shard; kept on the default shard only"""
+    __tablename__ = "tenant_shards"
+    
+    tenant_id = Column(Uuid, ForeignKey("tenants.id"), primary_key=True)
+    shard = Column(String(50), nullable=False)
+    # "moving" blocks writes while jobs.move_tenant switches shards
+    state = Column(String(20), nullable=False, default="active")
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
\ No newline at end of file
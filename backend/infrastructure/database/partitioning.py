@@ -0,0 +1,125 @@
+# backend/infrastructure/database/partitioning.py
+"""
+Online switch of `tasks` to the hash-partitioned table prepared by the
+"prepare hash partitioned tasks" migration.
+
+While the migration's trigger mirrors new writes, `backfill` copies the
+existing rows in small keyset batches. `swap` then renames the tables in
+one short transaction, so TaskModel and its queries keep using `tasks`.
+The old heap stays as `tasks_unpartitioned` until `drop_unpartitioned`,
+as a frozen copy without foreign keys: it stops being written at the swap,
+and its references would otherwise keep projects, users and tenants whose
+live tasks are gone from being deleted.
+"""
+import logging
+import os
+from typing import Callable, List
+import uuid
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+STATE_UNPREPARED = "unprepared"
+STATE_PREPARED = "prepared"
+STATE_PARTITIONED = "partitioned"
+
+# Constraint and index names of `tasks`, with the table name as {table}
+TASK_CONSTRAINTS = [
+    "{table}_pkey",
+    "{table}_assigned_to_fkey",
+    "{table}_created_by_fkey",
+    "{table}_project_id_fkey",
+    "{table}_tenant_id_fkey",
+]
+TASK_INDEXES = ["ix_{table}_tenant_updated_at"]
+
+BACKFILL_BATCH = text("""
+    WITH batch AS (
+        SELECT * FROM tasks WHERE id > :after ORDER BY id LIMIT :limit FOR SHARE
+    ), copied AS (
+        INSERT INTO tasks_partitioned SELECT * FROM batch ON CONFLICT (id, tenant_id) DO NOTHING
+    )
+    SELECT id FROM batch ORDER BY id DESC LIMIT 1
+""")
+
+def rename_statements(old: str, new: str) -> List[str]:
+    """Rename a tasks-shaped table together with its constraints and indexes"""
+    statements = [f"ALTER TABLE {old} RENAME TO {new}"]
+    statements += [
+        f"ALTER TABLE {new} RENAME CONSTRAINT {name.format(table=old)} TO {name.format(table=new)}"
+        for name in TASK_CONSTRAINTS
+    ]
+    statements += [
+        f"ALTER INDEX {name.format(table=old)} RENAME TO {name.format(table=new)}"
+        for name in TASK_INDEXES
+    ]
+    return statements
+
+def retire_statements(table: str) -> List[str]:
+    """Drop the foreign keys of the swapped-out heap, keeping its primary key"""
+    return [
+        f"ALTER TABLE {table} DROP CONSTRAINT {name.format(table=table)}"
+        for name in TASK_CONSTRAINTS if name.endswith("_fkey")
+    ]
+
+class TaskPartitionMigrator:
+    def __init__(self, session_factory: Callable[[], AsyncSession]):
+        self.session_factory = session_factory
+        self.batch_size = int(os.getenv("TASKS_PARTITION_BATCH_SIZE", "5000"))
+
+    async def state(self) -> str:
+        async with self.session_factory() as session:
+            result = await session.execute(text(
+                "SELECT to_regclass('tasks_partitioned') IS NOT NULL, "
+                "EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'tasks'::regclass)"
+            ))
+            prepared, partitioned = result.one()
+        if partitioned:
+            return STATE_PARTITIONED
+        return STATE_PREPARED if prepared else STATE_UNPREPARED
+
+    async def backfill(self) -> int:
+        """Copy rows the sync trigger has not seen yet; returns the number of batches"""
+        # FOR SHARE makes concurrent updates and deletes of a batch wait until it is copied,
+        # so the trigger always applies them after the copy rather than before
+        after = uuid.UUID(int=0)
+        batches = 0
+        async with self.session_factory() as session:
+            while True:
+                result = await session.execute(BACKFILL_BATCH, {"after": after, "limit": self.batch_size})
+                last_id = result.scalar_one_or_none()
+                await session.commit()
+                if last_id is None:
+                    return batches
+                after = last_id
+                batches += 1
+                if batches % 100 == 0:
+                    logger.info("Backfilled %d batches, up to task %s", batches, after)
+
+    async def swap(self) -> None:
+        """Make the partitioned table `tasks`; writes block only while this runs"""
+        async with self.session_factory() as session:
+            await session.execute(text("SET LOCAL lock_timeout = '5s'"))
+            await session.execute(text("LOCK TABLE tasks, tasks_partitioned IN ACCESS EXCLUSIVE MODE"))
+            result = await session.execute(text(
+                "SELECT (SELECT count(*) FROM tasks), (SELECT count(*) FROM tasks_partitioned)"
+            ))
+            heap_rows, partitioned_rows = result.one()
+            if heap_rows != partitioned_rows:
+                await session.rollback()
+                raise RuntimeError(
+                    f"tasks has {heap_rows} rows but tasks_partitioned {partitioned_rows}; run the backfill again"
+                )
+            await session.execute(text("DROP TRIGGER tasks_partition_sync ON tasks"))
+            for statement in rename_statements("tasks", "tasks_unpartitioned") + retire_statements("tasks_unpartitioned"):
+                await session.execute(text(statement))
+            for statement in rename_statements("tasks_partitioned", "tasks"):
+                await session.execute(text(statement))
+            await session.execute(text("DROP FUNCTION tasks_partition_sync()"))
+            await session.commit()
+
+    async def drop_unpartitioned(self) -> None:
+        async with self.session_factory() as session:
+            await session.execute(text("DROP TABLE IF EXISTS tasks_unpartitioned"))
+            await session.commit()
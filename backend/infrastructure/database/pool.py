@@ -0,0 +1,69 @@
+# backend/infrastructure/database/pool.py
+import time
+from typing import Any, Dict
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from .instrumentation import record_pool_wait
+
+class PoolMetrics:
+    """Counters for how long requests wait to check out a connection"""
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.last_wait_seconds = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+        self.last_wait_seconds = seconds
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """The default asyncio queue pool, timing every checkout"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self.metrics.observe(waited)
+            record_pool_wait(waited)
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        # engine.dispose() swaps in a new pool; keep counting into the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+def pool_stats(engine: AsyncEngine) -> Dict[str, Any]:
+    """Current gauges and checkout counters of an engine's pool"""
+    pool = engine.sync_engine.pool
+    stats: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            # Negative while the pool is still filling up to pool_size
+            "overflow": max(pool.overflow(), 0)
+        })
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        stats.update({
+            "checkouts": metrics.checkouts,
+            "checkout_timeouts": metrics.timeouts,
+            "checkout_wait_seconds_total": metrics.wait_seconds_total,
+            "checkout_wait_seconds_max": metrics.wait_seconds_max
+        })
+    return stats
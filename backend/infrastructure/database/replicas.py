@@ -0,0 +1,124 @@
+# backend/infrastructure/database/replicas.py
+"""
+Routing of read-only sessions to streaming replicas.
+
+Writes always go to the primary. After a write the API hands the client
+the primary's WAL position (LSN) as a consistency token; reads carrying a
+token only use a replica that has replayed at least that far and fall back
+to the primary otherwise, so clients always read their own writes.
+"""
+from contextvars import ContextVar
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from .pool import pool_stats
+
+logger = logging.getLogger(__name__)
+
+CONSISTENCY_HEADER = "X-Consistency-Token"
+
+# Lowest LSN the current request's reads must observe, from the client's token
+required_lsn: ContextVar[Optional[int]] = ContextVar("required_lsn", default=None)
+
+def parse_lsn(token: str) -> int:
+    """Turn a PostgreSQL LSN such as '0/16B3748' into a comparable integer"""
+    high, low = token.strip().split("/")
+    return (int(high, 16) << 32) + int(low, 16)
+
+def format_lsn(lsn: int) -> str:
+    return f"{lsn >> 32:X}/{lsn & 0xFFFFFFFF:X}"
+
+class ReplicaRouter:
+    def __init__(
+        self,
+        primary_engine: AsyncEngine,
+        primary_sessions: Callable[[], AsyncSession],
+        replica_engines: List[AsyncEngine],
+        shared_storage: bool = False
+    ):
+        self.primary_engine = primary_engine
+        # Readers on the primary's own storage (SQLite WAL) see every commit; nothing to track
+        self.shared_storage = shared_storage
+        self.primary_sessions = primary_sessions
+        self.replica_sessions = [
+            async_sessionmaker(bind=replica, class_=AsyncSession, expire_on_commit=False)
+            for replica in replica_engines
+        ]
+        # Highest replay position seen per replica; it only moves forward
+        self.replayed_lsn = [0] * len(replica_engines)
+        # A replica that failed to connect is skipped until then, instead of costing every read a connect attempt
+        self.retry_seconds = float(os.getenv("REPLICA_RETRY_SECONDS", "5"))
+        self.down_until = [0.0] * len(replica_engines)
+        self._next = 0
+        self.replica_reads = 0
+        self.primary_reads = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.replica_sessions)
+
+    @property
+    def tracks_replay(self) -> bool:
+        """Whether reads need the consistency token to find a replica that is current enough"""
+        return self.enabled and not self.shared_storage
+
+    async def primary_lsn(self) -> int:
+        async with self.primary_engine.connect() as connection:
+            result = await connection.execute(text("SELECT pg_current_wal_lsn()::text"))
+            return parse_lsn(result.scalar_one())
+
+    async def _reachable(self, index: int, session: AsyncSession) -> bool:
+        """Check out the session's connection now, so a down replica fails here rather than in the query"""
+        try:
+            await session.connection()
+        except Exception:
+            logger.warning("Replica %d is unavailable, reading from the primary", index, exc_info=True)
+            self.down_until[index] = time.monotonic() + self.retry_seconds
+            return False
+        return True
+
+    async def _caught_up(self, index: int, session: AsyncSession, lsn: int) -> bool:
+        if self.shared_storage or self.replayed_lsn[index] >= lsn:
+            return True
+        try:
+            result = await session.execute(text("SELECT pg_last_wal_replay_lsn()::text"))
+            replayed = result.scalar_one_or_none()
+        except Exception:
+            logger.warning("Replica %d is unavailable, reading from the primary", index, exc_info=True)
+            return False
+        if replayed is None:
+            # Not in recovery, so not a replica we can vouch for
+            return False
+        self.replayed_lsn[index] = max(self.replayed_lsn[index], parse_lsn(replayed))
+        return self.replayed_lsn[index] >= lsn
+
+    async def read_session(self, lsn: Optional[int] = None) -> AsyncSession:
+        """A session for read-only work: a replica in round-robin order, or the primary"""
+        count = len(self.replica_sessions)
+        for offset in range(count):
+            index = (self._next + offset) % count
+            if self.down_until[index] > time.monotonic():
+                continue
+            session = self.replica_sessions[index]()
+            if await self._reachable(index, session) and (lsn is None or await self._caught_up(index, session, lsn)):
+                self._next = (index + 1) % count
+                self.replica_reads += 1
+                return session
+            await session.close()
+        self.primary_reads += 1
+        return self.primary_sessions()
+
+    def stats(self) -> dict:
+        return {
+            "replicas": len(self.replica_sessions),
+            "replica_reads": self.replica_reads,
+            "primary_reads": self.primary_reads
+        }
+
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """pool_stats() of each replica engine, by replica index"""
+        return {str(index): pool_stats(sessions.kw["bind"]) for index, sessions in enumerate(self.replica_sessions)}
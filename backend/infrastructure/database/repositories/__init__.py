@@ -0,0 +1,6 @@
+# backend/infrastructure/database/repositories/__init__.py
+"""SQLAlchemy implementations of the domain repositories.
+
+Hot lookups are lambda statements: SQLAlchemy builds and compiles each one once
+per call site and afterwards only extracts the closure values as bind parameters.
+"""
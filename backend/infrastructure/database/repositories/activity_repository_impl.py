@@ -0,0 +1,48 @@
+# backend/infrastructure/database/repositories/activity_repository_impl.py
+from datetime import datetime
+from typing import List, Optional, Tuple
+import uuid
+from sqlalchemy import select, insert, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities.activity import ActivityEntry
+from domain.repositories.activity_repository import ActivityRepository
+from ..models import ActivityModel
+from ..mappers import ActivityMapper
+
+class ActivityRepositoryImpl(ActivityRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add_many(self, entries: List[ActivityEntry]) -> None:
+        if not entries:
+            return
+        # One multi-row INSERT ... VALUES statement per batch
+        await self.session.execute(
+            insert(ActivityModel).values([ActivityMapper.to_row(entry) for entry in entries])
+        )
+        await self.session.commit()
+
+    async def get_by_project(
+        self,
+        tenant_id: uuid.UUID,
+        project_id: uuid.UUID,
+        limit: int,
+        before: Optional[Tuple[datetime, uuid.UUID]] = None
+    ) -> List[ActivityEntry]:
+        query = select(ActivityModel).where(
+            ActivityModel.tenant_id == tenant_id,
+            ActivityModel.project_id == project_id
+        )
+        if before is not None:
+            # Keyset pagination on (created_at, id), matching the index order
+            before_created_at, before_id = before
+            query = query.where(or_(
+                ActivityModel.created_at < before_created_at,
+                and_(ActivityModel.created_at == before_created_at, ActivityModel.id < before_id)
+            ))
+        result = await self.session.execute(
+            query.order_by(ActivityModel.created_at.desc(), ActivityModel.id.desc()).limit(limit)
+        )
+        models = result.scalars().all()
+        return [ActivityMapper.to_domain(model) for model in models]
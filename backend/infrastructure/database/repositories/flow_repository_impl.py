@@ -0,0 +1,132 @@
+# backend/infrastructure/database/repositories/flow_repository_impl.py
+from datetime import date, datetime
+from itertools import groupby
+from typing import Dict, List, Optional, Tuple
+import uuid
+from sqlalchemy import select, delete, insert, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities.flow import DailyStatusCounts, StatusTransition
+from domain.repositories.flow_repository import FlowRepository
+from ..models import TaskStatusTransitionModel, ProjectFlowDailyModel, RollupCheckpointModel
+from ..mappers import StatusTransitionMapper
+
+def _group_by_day(rows) -> List[DailyStatusCounts]:
+    return [
+        DailyStatusCounts(day=day, counts={row.status: row.task_count for row in day_rows})
+        for day, day_rows in groupby(rows, key=lambda row: row.day)
+    ]
+
+class FlowRepositoryImpl(FlowRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_rollups(
+        self,
+        tenant_id: uuid.UUID,
+        project_id: uuid.UUID,
+        start: date,
+        end: date
+    ) -> List[DailyStatusCounts]:
+        # Rollups are sparse, so the chart's first day comes from the latest earlier snapshot
+        result = await self.session.execute(
+            select(func.max(ProjectFlowDailyModel.day)).where(
+                ProjectFlowDailyModel.project_id == project_id,
+                ProjectFlowDailyModel.tenant_id == tenant_id,
+                ProjectFlowDailyModel.day < start
+            )
+        )
+        first_day = result.scalar_one_or_none() or start
+        result = await self.session.execute(
+            select(ProjectFlowDailyModel).where(
+                ProjectFlowDailyModel.project_id == project_id,
+                ProjectFlowDailyModel.tenant_id == tenant_id,
+                ProjectFlowDailyModel.day >= first_day,
+                ProjectFlowDailyModel.day <= end
+            ).order_by(ProjectFlowDailyModel.day)
+        )
+        return _group_by_day(result.scalars().all())
+
+    async def get_checkpoint(self, name: str) -> Optional[datetime]:
+        model = await self.session.get(RollupCheckpointModel, name)
+        return model.processed_until if model else None
+
+    async def get_changed_projects(
+        self,
+        after: Optional[datetime],
+        until: datetime
+    ) -> Dict[uuid.UUID, Tuple[uuid.UUID, datetime]]:
+        query = select(
+            TaskStatusTransitionModel.project_id,
+            TaskStatusTransitionModel.tenant_id,
+            func.min(TaskStatusTransitionModel.changed_at)
+        ).where(TaskStatusTransitionModel.changed_at <= until)
+        if after is not None:
+            query = query.where(TaskStatusTransitionModel.changed_at > after)
+        result = await self.session.execute(
+            query.group_by(TaskStatusTransitionModel.project_id, TaskStatusTransitionModel.tenant_id)
+        )
+        return {project_id: (tenant_id, changed_at) for project_id, tenant_id, changed_at in result.all()}
+
+    async def get_rollup_before(self, project_id: uuid.UUID, day: date) -> Optional[DailyStatusCounts]:
+        latest_day = (
+            select(func.max(ProjectFlowDailyModel.day))
+            .where(ProjectFlowDailyModel.project_id == project_id, ProjectFlowDailyModel.day < day)
+            .scalar_subquery()
+        )
+        result = await self.session.execute(
+            select(ProjectFlowDailyModel).where(
+                ProjectFlowDailyModel.project_id == project_id,
+                ProjectFlowDailyModel.day == latest_day
+            )
+        )
+        rollups = _group_by_day(result.scalars().all())
+        return rollups[0] if rollups else None
+
+    async def get_transitions(
+        self,
+        project_id: uuid.UUID,
+        since: datetime,
+        until: datetime
+    ) -> List[StatusTransition]:
+        result = await self.session.execute(
+            select(TaskStatusTransitionModel).where(
+                TaskStatusTransitionModel.project_id == project_id,
+                TaskStatusTransitionModel.changed_at >= since,
+                TaskStatusTransitionModel.changed_at <= until
+            ).order_by(TaskStatusTransitionModel.changed_at, TaskStatusTransitionModel.id)
+        )
+        models = result.scalars().all()
+        return [StatusTransitionMapper.to_domain(model) for model in models]
+
+    async def replace_rollups(
+        self,
+        tenant_id: uuid.UUID,
+        project_id: uuid.UUID,
+        from_day: date,
+        rollups: List[DailyStatusCounts]
+    ) -> None:
+        await self.session.execute(
+            delete(ProjectFlowDailyModel).where(
+                ProjectFlowDailyModel.project_id == project_id,
+                ProjectFlowDailyModel.day >= from_day
+            )
+        )
+        rows = [
+            {
+                "project_id": project_id,
+                "day": rollup.day,
+                "status": status,
+                "tenant_id": tenant_id,
+                "task_count": count
+            }
+            for rollup in rollups
+            for status, count in rollup.counts.items()
+        ]
+        if rows:
+            await self.session.execute(insert(ProjectFlowDailyModel).values(rows))
+        await self.session.commit()
+
+    async def set_checkpoint(self, name: str, processed_until: datetime) -> None:
+        await self.session.merge(RollupCheckpointModel(name=name, processed_until=processed_until))
+        await self.session.commit()
@@ -0,0 +1,13 @@
+# backend/infrastructure/database/repositories/raw/__init__.py
+"""Repositories that run SQL on asyncpg directly instead of through the ORM"""
+from .project_repository import AsyncpgProjectRepository
+from .task_repository import AsyncpgTaskRepository
+from .tenant_repository import AsyncpgTenantRepository
+from .user_repository import AsyncpgUserRepository
+
+__all__ = [
+    "AsyncpgProjectRepository",
+    "AsyncpgTaskRepository",
+    "AsyncpgTenantRepository",
+    "AsyncpgUserRepository"
+]
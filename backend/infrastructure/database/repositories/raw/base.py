@@ -0,0 +1,43 @@
+# backend/infrastructure/database/repositories/raw/base.py
+"""
+Shared plumbing for the asyncpg repositories.
+
+They borrow the asyncpg connection behind the request's AsyncSession, so
+shard routing, read replicas and pool settings apply unchanged, but skip
+statement compilation, the unit of work and model instances. asyncpg
+prepares each distinct SQL string once per connection and reuses it from
+its statement cache (DB_STATEMENT_CACHE_SIZE).
+
+Optional filters get their own SQL string instead of an `$n IS NULL OR ...`
+clause, so the prepared plan for `since` can range-scan (tenant_id, updated_at).
+"""
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from asyncpg import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities.change import ChangeEvent
+from infrastructure.realtime.broker import CHANGE_CHANNEL, encode_event
+
+class AsyncpgRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def _connection(self) -> Connection:
+        connection = await self.session.connection()
+        raw = await connection.get_raw_connection()
+        return raw.driver_connection
+
+    @asynccontextmanager
+    async def _transaction(self) -> AsyncIterator[Connection]:
+        """A transaction that commits on exit, like the ORM repositories' session.commit()"""
+        connection = await self._connection()
+        async with connection.transaction():
+            yield connection
+        # If an ORM query earlier in the request opened the session's transaction,
+        # the block above was only a savepoint inside it
+        await self.session.commit()
+
+    async def _publish(self, connection: Connection, change: ChangeEvent) -> None:
+        """Notify listeners from inside the writing transaction, like publish_change"""
+        await connection.execute("SELECT pg_notify($1, $2)", CHANGE_CHANNEL, encode_event(change))
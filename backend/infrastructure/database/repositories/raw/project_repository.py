@@ -0,0 +1,108 @@
+# backend/infrastructure/database/repositories/raw/project_repository.py
+from datetime import datetime
+from typing import List, Optional
+import uuid
+from asyncpg import Connection, Record
+
+from domain.entities.change import ChangeEvent, ChangeType, EntityType
+from domain.entities.project import Project, ProjectStatus
+from domain.identifiers import uuid7
+from domain.repositories.project_repository import ProjectRepository
+from .base import AsyncpgRepository
+
+COLUMNS = "id, name, description, status, tenant_id, created_by, created_at, updated_at"
+
+def to_project(record: Record) -> Project:
+    return Project(
+        id=record["id"],
+        name=record["name"],
+        description=record["description"],
+        status=ProjectStatus[record["status"]],
+        tenant_id=record["tenant_id"],
+        created_by=record["created_by"],
+        created_at=record["created_at"],
+        updated_at=record["updated_at"]
+    )
+
+class AsyncpgProjectRepository(AsyncpgRepository, ProjectRepository):
+    async def _publish_project(self, connection: Connection, record: Record, change_type: ChangeType) -> None:
+        await self._publish(connection, ChangeEvent(
+            tenant_id=record["tenant_id"],
+            entity_type=EntityType.PROJECT,
+            entity_id=record["id"],
+            change_type=change_type
+        ))
+
+    async def create(self, entity: Project) -> Project:
+        async with self._transaction() as connection:
+            record = await connection.fetchrow(
+                f"INSERT INTO projects ({COLUMNS}) VALUES ($1, $2, $3, $4, $5, $6, $7, $8) RETURNING {COLUMNS}",
+                entity.id, entity.name, entity.description, entity.status.name,
+                entity.tenant_id, entity.created_by, entity.created_at, entity.updated_at
+            )
+            await self._publish_project(connection, record, ChangeType.CREATED)
+        return to_project(record)
+
+    async def get_by_id(self, id: uuid.UUID) -> Optional[Project]:
+        connection = await self._connection()
+        record = await connection.fetchrow(f"SELECT {COLUMNS} FROM projects WHERE id = $1", id)
+        return to_project(record) if record else None
+
+    async def get_by_tenant_and_id(self, tenant_id: uuid.UUID, project_id: uuid.UUID) -> Optional[Project]:
+        connection = await self._connection()
+        record = await connection.fetchrow(
+            f"SELECT {COLUMNS} FROM projects WHERE tenant_id = $1 AND id = $2", tenant_id, project_id
+        )
+        return to_project(record) if record else None
+
+    async def get_by_tenant(self, tenant_id: uuid.UUID) -> List[Project]:
+        connection = await self._connection()
+        records = await connection.fetch(f"SELECT {COLUMNS} FROM projects WHERE tenant_id = $1", tenant_id)
+        return [to_project(record) for record in records]
+
+    async def get_by_status(self, tenant_id: uuid.UUID, status: ProjectStatus) -> List[Project]:
+        connection = await self._connection()
+        records = await connection.fetch(
+            f"SELECT {COLUMNS} FROM projects WHERE tenant_id = $1 AND status = $2", tenant_id, status.name
+        )
+        return [to_project(record) for record in records]
+
+    async def get_updated_since(self, tenant_id: uuid.UUID, since: Optional[datetime]) -> List[Project]:
+        connection = await self._connection()
+        if since is None:
+            records = await connection.fetch(
+                f"SELECT {COLUMNS} FROM projects WHERE tenant_id = $1 ORDER BY updated_at, id", tenant_id
+            )
+        else:
+            records = await connection.fetch(
+                f"SELECT {COLUMNS} FROM projects WHERE tenant_id = $1 AND updated_at > $2 ORDER BY updated_at, id",
+                tenant_id, since
+            )
+        return [to_project(record) for record in records]
+
+    async def update(self, entity: Project) -> Project:
+        async with self._transaction() as connection:
+            record = await connection.fetchrow(
+                f"UPDATE projects SET name = $2, description = $3, status = $4, updated_at = $5 "
+                f"WHERE id = $1 RETURNING {COLUMNS}",
+                entity.id, entity.name, entity.description, entity.status.name, entity.updated_at
+            )
+            if not record:
+                raise ValueError("Project not found")
+            await self._publish_project(connection, record, ChangeType.UPDATED)
+        return to_project(record)
+
+    async def delete(self, id: uuid.UUID) -> bool:
+        async with self._transaction() as connection:
+            await connection.execute("DELETE FROM tasks_archive WHERE project_id = $1", id)
+            record = await connection.fetchrow("DELETE FROM projects WHERE id = $1 RETURNING id, tenant_id", id)
+            if not record:
+                return False
+            # Leave a tombstone so delta-syncing clients learn about the delete
+            await connection.execute(
+                "INSERT INTO tombstones (id, entity_type, entity_id, tenant_id, deleted_at) "
+                "VALUES ($1, 'PROJECT', $2, $3, $4)",
+                uuid7(), record["id"], record["tenant_id"], datetime.utcnow()
+            )
+            await self._publish_project(connection, record, ChangeType.DELETED)
+        return True
@@ -0,0 +1,154 @@
+# backend/infrastructure/database/repositories/raw/task_repository.py
+from datetime import datetime
+from typing import List, Optional
+import uuid
+from asyncpg import Connection, Record
+
+from domain.entities.change import ChangeEvent, ChangeType, EntityType
+from domain.entities.task import Task, TaskPriority, TaskStatus
+from domain.identifiers import uuid7
+from domain.repositories.task_repository import TaskRepository
+from .base import AsyncpgRepository
+
+COLUMNS = (
+    "id, title, description, status, priority, project_id, tenant_id, "
+    "created_by, assigned_to, due_date, created_at, updated_at"
+)
+# Listings of active tasks, optionally with the archive appended as one UNION ALL round trip
+ACTIVE = f"SELECT {COLUMNS}, NULL::timestamp AS archived_at FROM tasks WHERE {{criteria}}"
+WITH_ARCHIVED = ACTIVE + f" UNION ALL SELECT {COLUMNS}, archived_at FROM tasks_archive WHERE {{criteria}}"
+
+def to_task(record: Record) -> Task:
+    return Task(
+        id=record["id"],
+        title=record["title"],
+        description=record["description"],
+        status=TaskStatus[record["status"]],
+        priority=TaskPriority[record["priority"]],
+        project_id=record["project_id"],
+        tenant_id=record["tenant_id"],
+        created_by=record["created_by"],
+        assigned_to=record["assigned_to"],
+        due_date=record["due_date"],
+        created_at=record["created_at"],
+        updated_at=record["updated_at"],
+        archived_at=record.get("archived_at")
+    )
+
+def status_name(status: Optional[TaskStatus]) -> Optional[str]:
+    return status.name if status else None
+
+class AsyncpgTaskRepository(AsyncpgRepository, TaskRepository):
+    async def _publish_task(self, connection: Connection, record: Record, change_type: ChangeType) -> None:
+        await self._publish(connection, ChangeEvent(
+            tenant_id=record["tenant_id"],
+            entity_type=EntityType.TASK,
+            entity_id=record["id"],
+            change_type=change_type,
+            project_id=record["project_id"]
+        ))
+
+    async def _record_transition(
+        self,
+        connection: Connection,
+        record: Record,
+        from_status: Optional[TaskStatus],
+        to_status: Optional[TaskStatus],
+        changed_at: datetime
+    ) -> None:
+        # Written in the same transaction as the task so flow rollups never miss a change
+        await connection.execute(
+            "INSERT INTO task_status_transitions (task_id, project_id, tenant_id, from_status, to_status, changed_at) "
+            "VALUES ($1, $2, $3, $4, $5, $6)",
+            record["id"], record["project_id"], record["tenant_id"],
+            status_name(from_status), status_name(to_status), changed_at
+        )
+
+    async def _list(self, criteria: str, include_archived: bool, *args) -> List[Task]:
+        connection = await self._connection()
+        query = (WITH_ARCHIVED if include_archived else ACTIVE).format(criteria=criteria)
+        return [to_task(record) for record in await connection.fetch(query, *args)]
+
+    async def create(self, entity: Task) -> Task:
+        async with self._transaction() as connection:
+            record = await connection.fetchrow(
+                f"INSERT INTO tasks ({COLUMNS}) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12) "
+                f"RETURNING {COLUMNS}",
+                entity.id, entity.title, entity.description, entity.status.name, entity.priority.name,
+                entity.project_id, entity.tenant_id, entity.created_by, entity.assigned_to,
+                entity.due_date, entity.created_at, entity.updated_at
+            )
+            await self._record_transition(connection, record, None, entity.status, entity.created_at)
+            await self._publish_task(connection, record, ChangeType.CREATED)
+        return to_task(record)
+
+    async def get_by_id(self, id: uuid.UUID) -> Optional[Task]:
+        connection = await self._connection()
+        record = await connection.fetchrow(f"SELECT {COLUMNS} FROM tasks WHERE id = $1", id)
+        return to_task(record) if record else None
+
+    async def get_by_tenant_and_id(self, tenant_id: uuid.UUID, task_id: uuid.UUID) -> Optional[Task]:
+        connection = await self._connection()
+        record = await connection.fetchrow(
+            f"SELECT {COLUMNS} FROM tasks WHERE tenant_id = $1 AND id = $2", tenant_id, task_id
+        )
+        return to_task(record) if record else None
+
+    async def get_by_project(self, project_id: uuid.UUID, tenant_id: uuid.UUID, include_archived: bool = False) -> List[Task]:
+        return await self._list("project_id = $1 AND tenant_id = $2", include_archived, project_id, tenant_id)
+
+    async def get_by_assignee(self, user_id: uuid.UUID, tenant_id: uuid.UUID, include_archived: bool = False) -> List[Task]:
+        return await self._list("assigned_to = $1 AND tenant_id = $2", include_archived, user_id, tenant_id)
+
+    async def get_by_status(self, tenant_id: uuid.UUID, status: TaskStatus, include_archived: bool = False) -> List[Task]:
+        return await self._list("tenant_id = $1 AND status = $2", include_archived, tenant_id, status.name)
+
+    async def get_updated_since(self, tenant_id: uuid.UUID, since: Optional[datetime]) -> List[Task]:
+        connection = await self._connection()
+        if since is None:
+            records = await connection.fetch(
+                f"SELECT {COLUMNS} FROM tasks WHERE tenant_id = $1 ORDER BY updated_at, id", tenant_id
+            )
+        else:
+            records = await connection.fetch(
+                f"SELECT {COLUMNS} FROM tasks WHERE tenant_id = $1 AND updated_at > $2 ORDER BY updated_at, id",
+                tenant_id, since
+            )
+        return [to_task(record) for record in records]
+
+    async def update(self, entity: Task) -> Task:
+        async with self._transaction() as connection:
+            previous = await connection.fetchval("SELECT status FROM tasks WHERE id = $1 FOR UPDATE", entity.id)
+            if previous is None:
+                raise ValueError("Task not found")
+            record = await connection.fetchrow(
+                f"UPDATE tasks SET title = $2, description = $3, status = $4, priority = $5, assigned_to = $6, "
+                f"due_date = $7, updated_at = $8 WHERE id = $1 RETURNING {COLUMNS}",
+                entity.id, entity.title, entity.description, entity.status.name, entity.priority.name,
+                entity.assigned_to, entity.due_date, entity.updated_at
+            )
+            if previous != entity.status.name:
+                await self._record_transition(
+                    connection, record, TaskStatus[previous], entity.status, entity.updated_at
+                )
+            await self._publish_task(connection, record, ChangeType.UPDATED)
+        return to_task(record)
+
+    async def delete(self, id: uuid.UUID) -> bool:
+        async with self._transaction() as connection:
+            record = await connection.fetchrow(
+                "DELETE FROM tasks WHERE id = $1 RETURNING id, project_id, tenant_id, status", id
+            )
+            if not record:
+                return False
+            # Leave a tombstone so delta-syncing clients learn about the delete
+            await connection.execute(
+                "INSERT INTO tombstones (id, entity_type, entity_id, tenant_id, deleted_at) "
+                "VALUES ($1, 'TASK', $2, $3, $4)",
+                uuid7(), record["id"], record["tenant_id"], datetime.utcnow()
+            )
+            await self._record_transition(
+                connection, record, TaskStatus[record["status"]], None, datetime.utcnow()
+            )
+            await self._publish_task(connection, record, ChangeType.DELETED)
+        return True
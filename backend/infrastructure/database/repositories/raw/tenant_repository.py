@@ -0,0 +1,53 @@
+# backend/infrastructure/database/repositories/raw/tenant_repository.py
+from typing import Optional
+import uuid
+from asyncpg import Record
+
+from domain.entities.tenant import Tenant
+from domain.repositories.tenant_repository import TenantRepository
+from .base import AsyncpgRepository
+
+COLUMNS = "id, name, domain, created_at, task_archive_days"
+
+def to_tenant(record: Record) -> Tenant:
+    return Tenant(
+        id=record["id"],
+        name=record["name"],
+        domain=record["domain"],
+        created_at=record["created_at"],
+        task_archive_days=record["task_archive_days"]
+    )
+
+class AsyncpgTenantRepository(AsyncpgRepository, TenantRepository):
+    async def create(self, entity: Tenant) -> Tenant:
+        async with self._transaction() as connection:
+            record = await connection.fetchrow(
+                f"INSERT INTO tenants ({COLUMNS}) VALUES ($1, $2, $3, $4, $5) RETURNING {COLUMNS}",
+                entity.id, entity.name, entity.domain, entity.created_at, entity.task_archive_days
+            )
+        return to_tenant(record)
+
+    async def get_by_id(self, id: uuid.UUID) -> Optional[Tenant]:
+        connection = await self._connection()
+        record = await connection.fetchrow(f"SELECT {COLUMNS} FROM tenants WHERE id = $1", id)
+        return to_tenant(record) if record else None
+
+    async def get_by_domain(self, domain: str) -> Optional[Tenant]:
+        connection = await self._connection()
+        record = await connection.fetchrow(f"SELECT {COLUMNS} FROM tenants WHERE domain = $1", domain)
+        return to_tenant(record) if record else None
+
+    async def update(self, entity: Tenant) -> Tenant:
+        async with self._transaction() as connection:
+            record = await connection.fetchrow(
+                f"UPDATE tenants SET name = $2, domain = $3 WHERE id = $1 RETURNING {COLUMNS}",
+                entity.id, entity.name, entity.domain
+            )
+            if not record:
+                raise ValueError("Tenant not found")
+        return to_tenant(record)
+
+    async def delete(self, id: uuid.UUID) -> bool:
+        async with self._transaction() as connection:
+            deleted = await connection.fetchval("DELETE FROM tenants WHERE id = $1 RETURNING id", id)
+        return deleted is not None
@@ -0,0 +1,70 @@
+# backend/infrastructure/database/repositories/raw/user_repository.py
+from typing import List, Optional
+import uuid
+from asyncpg import Record
+
+from domain.entities.user import User
+from domain.repositories.user_repository import UserRepository
+from .base import AsyncpgRepository
+
+COLUMNS = "id, email, tenant_id, hashed_password, first_name, last_name, is_active, created_at"
+
+def to_user(record: Record) -> User:
+    return User(
+        id=record["id"],
+        email=record["email"],
+        tenant_id=record["tenant_id"],
+        hashed_password=record["hashed_password"],
+        first_name=record["first_name"],
+        last_name=record["last_name"],
+        is_active=record["is_active"],
+        created_at=record["created_at"]
+    )
+
+class AsyncpgUserRepository(AsyncpgRepository, UserRepository):
+    async def create(self, entity: User) -> User:
+        async with self._transaction() as connection:
+            record = await connection.fetchrow(
+                f"INSERT INTO users ({COLUMNS}) VALUES ($1, $2, $3, $4, $5, $6, $7, $8) RETURNING {COLUMNS}",
+                entity.id, entity.email, entity.tenant_id, entity.hashed_password,
+                entity.first_name, entity.last_name, entity.is_active, entity.created_at
+            )
+        return to_user(record)
+
+    async def get_by_id(self, id: uuid.UUID) -> Optional[User]:
+        connection = await self._connection()
+        record = await connection.fetchrow(f"SELECT {COLUMNS} FROM users WHERE id = $1", id)
+        return to_user(record) if record else None
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        connection = await self._connection()
+        record = await connection.fetchrow(f"SELECT {COLUMNS} FROM users WHERE email = $1", email)
+        return to_user(record) if record else None
+
+    async def get_by_tenant(self, tenant_id: uuid.UUID) -> List[User]:
+        connection = await self._connection()
+        records = await connection.fetch(f"SELECT {COLUMNS} FROM users WHERE tenant_id = $1", tenant_id)
+        return [to_user(record) for record in records]
+
+    async def get_by_email_and_tenant(self, email: str, tenant_id: uuid.UUID) -> Optional[User]:
+        connection = await self._connection()
+        record = await connection.fetchrow(
+            f"SELECT {COLUMNS} FROM users WHERE email = $1 AND tenant_id = $2", email, tenant_id
+        )
+        return to_user(record) if record else None
+
+    async def update(self, entity: User) -> User:
+        async with self._transaction() as connection:
+            record = await connection.fetchrow(
+                f"UPDATE users SET email = $2, first_name = $3, last_name = $4, is_active = $5 "
+                f"WHERE id = $1 RETURNING {COLUMNS}",
+                entity.id, entity.email, entity.first_name, entity.last_name, entity.is_active
+            )
+            if not record:
+                raise ValueError("User not found")
+        return to_user(record)
+
+    async def delete(self, id: uuid.UUID) -> bool:
+        async with self._transaction() as connection:
+            deleted = await connection.fetchval("DELETE FROM users WHERE id = $1 RETURNING id", id)
+        return deleted is not None
@@ -0,0 +1,98 @@
+# backend/infrastructure/database/repositories/task_archive_repository_impl.py
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+import uuid
+from sqlalchemy import DateTime, delete, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities.change import ChangeEvent, ChangeType, EntityType
+from domain.entities.task import TaskStatus
+from domain.repositories.task_archive_repository import TaskArchiveRepository
+from infrastructure.realtime.notifier import publish_changes
+from ..models import TaskArchiveModel, TaskModel, TenantModel, TombstoneModel
+
+class TaskArchiveRepositoryImpl(TaskArchiveRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_tenant_thresholds(self) -> Dict[uuid.UUID, Optional[int]]:
+        result = await self.session.execute(select(TenantModel.id, TenantModel.task_archive_days))
+        return dict(result.all())
+
+    async def archive_completed(self, tenant_id: uuid.UUID, completed_before: datetime, limit: int) -> int:
+        if self.session.bind.dialect.name != "postgresql":
+            return await self._archive_in_steps(tenant_id, completed_before, limit)
+        # SKIP LOCKED leaves tasks someone is editing right now for the next run
+        batch = (
+            select(TaskModel.id)
+            .where(
+                TaskModel.tenant_id == tenant_id,
+                TaskModel.status == TaskStatus.DONE,
+                TaskModel.updated_at < completed_before
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        columns = list(TaskModel.__table__.columns)
+        # DELETE ... RETURNING feeds the INSERT, so each batch moves in one statement and transaction
+        moved = (
+            delete(TaskModel)
+            .where(TaskModel.tenant_id == tenant_id, TaskModel.id.in_(batch.scalar_subquery()))
+            .returning(*columns)
+            .cte("moved")
+        )
+        result = await self.session.execute(
+            insert(TaskArchiveModel)
+            .from_select(
+                [column.name for column in columns] + ["archived_at"],
+                select(*moved.c, literal(datetime.utcnow(), DateTime))
+            )
+            .returning(TaskArchiveModel.id, TaskArchiveModel.project_id)
+        )
+        moved_tasks = result.all()
+        await self._retire(tenant_id, moved_tasks)
+        await self.session.commit()
+        return len(moved_tasks)
+
+    async def _archive_in_steps(self, tenant_id: uuid.UUID, completed_before: datetime, limit: int) -> int:
+        """Copy then delete the batch: SQLite has neither data-modifying CTEs nor row locks"""
+        result = await self.session.execute(
+            select(TaskModel.id, TaskModel.project_id)
+            .where(
+                TaskModel.tenant_id == tenant_id,
+                TaskModel.status == TaskStatus.DONE,
+                TaskModel.updated_at < completed_before
+            )
+            .limit(limit)
+        )
+        moved_tasks = result.all()
+        if not moved_tasks:
+            return 0
+        ids = [task_id for task_id, _ in moved_tasks]
+        columns = list(TaskModel.__table__.columns)
+        await self.session.execute(
+            insert(TaskArchiveModel).from_select(
+                [column.name for column in columns] + ["archived_at"],
+                select(*columns, literal(datetime.utcnow(), DateTime)).where(TaskModel.id.in_(ids))
+            )
+        )
+        await self.session.execute(delete(TaskModel).where(TaskModel.id.in_(ids)))
+        await self._retire(tenant_id, moved_tasks)
+        await self.session.commit()
+        return len(moved_tasks)
+
+    async def _retire(self, tenant_id: uuid.UUID, moved_tasks: List[Tuple[uuid.UUID, uuid.UUID]]) -> None:
+        """Archived tasks leave `tasks`, so delta-sync and live clients must drop them as if deleted"""
+        if not moved_tasks:
+            return
+        await self.session.execute(insert(TombstoneModel), [
+            {"entity_type": EntityType.TASK, "entity_id": task_id, "tenant_id": tenant_id}
+            for task_id, _ in moved_tasks
+        ])
+        await publish_changes(self.session, [
+            ChangeEvent(
+                tenant_id=tenant_id, entity_type=EntityType.TASK, entity_id=task_id,
+                change_type=ChangeType.DELETED, project_id=project_id
+            )
+            for task_id, project_id in moved_tasks
+        ])
@@ -0,0 +1,52 @@
+# backend/infrastructure/database/repositories/task_report_repository_impl.py
+import uuid
+from sqlalchemy import select, func, case, cast, Float, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities.report import TaskColumns
+from domain.entities.task import TaskStatus
+from domain.repositories.task_report_repository import TaskReportRepository
+from ..models import TaskModel, TaskArchiveModel, TaskStatusTransitionModel
+
+def _epoch(column):
+    # Numbers convert to arrays far faster than datetime objects
+    return cast(func.extract("epoch", column), Float)
+
+class TaskReportRepositoryImpl(TaskReportRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_task_columns(self, tenant_id: uuid.UUID) -> TaskColumns:
+        transitions = TaskStatusTransitionModel
+        milestones = (
+            select(
+                transitions.task_id,
+                func.min(case((transitions.to_status == TaskStatus.IN_PROGRESS, transitions.changed_at))).label("started_at"),
+                func.max(case((transitions.to_status == TaskStatus.DONE, transitions.changed_at))).label("completed_at")
+            )
+            .where(
+                transitions.tenant_id == tenant_id,
+                transitions.to_status.in_([TaskStatus.IN_PROGRESS, TaskStatus.DONE])
+            )
+            .group_by(transitions.task_id)
+            .subquery()
+        )
+        # Plain column tuples, no ORM objects: a tenant can have hundreds of thousands of tasks.
+        # Archived tasks still count towards completions and cycle times in past windows.
+        result = await self.session.execute(union_all(*[
+            select(
+                model.assigned_to,
+                model.status,
+                model.priority,
+                _epoch(model.created_at),
+                _epoch(model.due_date),
+                _epoch(milestones.c.started_at),
+                _epoch(milestones.c.completed_at)
+            )
+            .outerjoin(milestones, milestones.c.task_id == model.id)
+            .where(model.tenant_id == tenant_id)
+            for model in (TaskModel, TaskArchiveModel)
+        ]))
+        rows = result.all()
+        columns = tuple(zip(*rows)) if rows else ((),) * 7
+        return TaskColumns(*columns)
@@ -1,68 +1,121 @@
 # backend/infrastructure/database/repositories/task_repository_impl.py
-from typing import List, Optional
+from datetime import datetime
+from typing import Callable, List, Optional
 import uuid
-from sqlalchemy import select
+from sqlalchemy import DateTime, lambda_stmt, literal, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from domain.entities.change import ChangeEvent, ChangeType, EntityType
 from domain.entities.task import Task, TaskStatus
 from domain.repositories.task_repository import TaskRepository
-from ..models import TaskModel
+from infrastructure.realtime.notifier import publish_change
+from ..models import TaskModel, TaskArchiveModel, TombstoneModel, TaskStatusTransitionModel
 from ..mappers import TaskMapper
 
+TASK_COLUMNS = [column.name for column in TaskModel.__table__.columns]
+
 class TaskRepositoryImpl(TaskRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    async def _publish(self, model: TaskModel, change_type: ChangeType) -> None:
+        await publish_change(self.session, ChangeEvent(
+            tenant_id=model.tenant_id,
+            entity_type=EntityType.TASK,
+            entity_id=model.id,
+            change_type=change_type,
+            project_id=model.project_id
+        ))
+
+    def _record_transition(
+        self,
+        model: TaskModel,
+        from_status: Optional[TaskStatus],
+        to_status: Optional[TaskStatus],
+        changed_at: datetime
+    ) -> None:
+        # Written in the same transaction as the task so flow rollups never miss a change
+        self.session.add(TaskStatusTransitionModel(
+            task_id=model.id,
+            project_id=model.project_id,
+            tenant_id=model.tenant_id,
+            from_status=from_status,
+            to_status=to_status,
+            changed_at=changed_at
+        ))
+
     async def create(self, entity: Task) -> Task:
         model = TaskMapper.to_model(entity)
         self.session.add(model)
+        self._record_transition(model, None, entity.status, entity.created_at)
+        await self._publish(model, ChangeType.CREATED)
         await self.session.commit()
         await self.session.refresh(model)
         return TaskMapper.to_domain(model)
 
-    async def get_by_id(self, id: uuid.UUID) -> Optional[Task]:
-        result = await self.session.execute(
-            select(TaskModel).where(TaskModel.id == id)
-        )
-        model = result.scalar_one_or_none()
+    async def _one(self, statement) -> Optional[Task]:
+        model = (await self.session.execute(statement)).scalar_one_or_none()
         return TaskMapper.to_domain(model) if model else None
 
+    async def _all(self, statement) -> List[Task]:
+        result = await self.session.execute(statement)
+        return [TaskMapper.to_domain(model) for model in result.scalars().all()]
+
+    async def get_by_id(self, id: uuid.UUID) -> Optional[Task]:
+        return await self._one(lambda_stmt(lambda: select(TaskModel).where(TaskModel.id == id)))
+
     async def get_by_tenant_and_id(self, tenant_id: uuid.UUID, task_id: uuid.UUID) -> Optional[Task]:
-        result = await self.session.execute(
-            select(TaskModel).where(
-                TaskModel.tenant_id == tenant_id,
-                TaskModel.id == task_id
+        return await self._one(lambda_stmt(
+            lambda: select(TaskModel).where(TaskModel.tenant_id == tenant_id, TaskModel.id == task_id)
+        ))
+
+    async def _list_with_archive(self, criteria: Callable[[type], list]) -> List[Task]:
+        """Tasks matching criteria(model) in both the hot table and the archive"""
+        # One UNION ALL round trip; each branch filters on its own table's indexes
+        active = select(
+            *[TaskModel.__table__.c[name] for name in TASK_COLUMNS],
+            literal(None, DateTime).label("archived_at")
+        ).where(*criteria(TaskModel))
+        archived = select(
+            *[TaskArchiveModel.__table__.c[name] for name in TASK_COLUMNS],
+            TaskArchiveModel.archived_at
+        ).where(*criteria(TaskArchiveModel))
+        result = await self.session.execute(union_all(active, archived))
+        return [TaskMapper.to_domain(row) for row in result.all()]
+
+    async def get_by_project(self, project_id: uuid.UUID, tenant_id: uuid.UUID, include_archived: bool = False) -> List[Task]:
+        if include_archived:
+            return await self._list_with_archive(
+                lambda model: [model.project_id == project_id, model.tenant_id == tenant_id]
             )
-        )
-        model = result.scalar_one_or_none()
-        return TaskMapper.to_domain(model) if model else None
+        return await self._all(lambda_stmt(
+            lambda: select(TaskModel).where(TaskModel.project_id == project_id, TaskModel.tenant_id == tenant_id)
+        ))
 
-    async def get_by_project(self, project_id: uuid.UUID, tenant_id: uuid.UUID) -> List[Task]:
-        result = await self.session.execute(
-            select(TaskModel).where(
-                TaskModel.project_id == project_id,
-                TaskModel.tenant_id == tenant_id
+    async def get_by_assignee(self, user_id: uuid.UUID, tenant_id: uuid.UUID, include_archived: bool = False) -> List[Task]:
+        if include_archived:
+            return await self._list_with_archive(
+                lambda model: [model.assigned_to == user_id, model.tenant_id == tenant_id]
             )
-        )
-        models = result.scalars().all()
-        return [TaskMapper.to_domain(model) for model in models]
+        return await self._all(lambda_stmt(
+            lambda: select(TaskModel).where(TaskModel.assigned_to == user_id, TaskModel.tenant_id == tenant_id)
+        ))
 
-    async def get_by_assignee(self, user_id: uuid.UUID, tenant_id: uuid.UUID) -> List[Task]:
-        result = await self.session.execute(
-            select(TaskModel).where(
-                TaskModel.assigned_to == user_id,
-                TaskModel.tenant_id == tenant_id
+    async def get_by_status(self, tenant_id: uuid.UUID, status: TaskStatus, include_archived: bool = False) -> List[Task]:
+        if include_archived:
+            return await self._list_with_archive(
+                lambda model: [model.tenant_id == tenant_id, model.status == status]
             )
-        )
-        models = result.scalars().all()
-        return [TaskMapper.to_domain(model) for model in models]
+        return await self._all(lambda_stmt(
+            lambda: select(TaskModel).where(TaskModel.tenant_id == tenant_id, TaskModel.status == status)
+        ))
 
-    async def get_by_status(self, tenant_id: uuid.UUID, status: TaskStatus) -> List[Task]:
+    async def get_updated_since(self, tenant_id: uuid.UUID, since: Optional[datetime]) -> List[Task]:
+        query = select(TaskModel).where(TaskModel.tenant_id == tenant_id)
+        if since is not None:
+            query = query.where(TaskModel.updated_at > since)
         result = await self.session.execute(
-            select(TaskModel).where(
-                TaskModel.tenant_id == tenant_id,
-                TaskModel.status == status
-            )
+            query.order_by(TaskModel.updated_at, TaskModel.id)
         )
         models = result.scalars().all()
         return [TaskMapper.to_domain(model) for model in models]
@@ -76,6 +129,9 @@ class TaskRepositoryImpl(TaskRepository):
         if not model:
             raise ValueError("Task not found")
         
+        if model.status != entity.status:
+            self._record_transition(model, model.status, entity.status, entity.updated_at)
+        
         # Update fields
         model.title = entity.title
         model.description = entity.description
@@ -84,6 +140,7 @@ class TaskRepositoryImpl(TaskRepository):
         model.assigned_to = entity.assigned_to
         model.due_date = entity.due_date
         model.updated_at = entity.updated_at
+        await self._publish(model, ChangeType.UPDATED)
         
         await self.session.commit()
         await self.session.refresh(model)
@@ -99,5 +156,13 @@ class TaskRepositoryImpl(TaskRepository):
             return False
         
         await self.session.delete(model)
+        # Leave a tombstone so delta-syncing clients learn about the delete
+        self.session.add(TombstoneModel(
+            entity_type=EntityType.TASK,
+            entity_id=model.id,
+            tenant_id=model.tenant_id
+        ))
+        self._record_transition(model, model.status, None, datetime.utcnow())
+        await self._publish(model, ChangeType.DELETED)
         await self.session.commit()
         return True
\ No newline at end of file
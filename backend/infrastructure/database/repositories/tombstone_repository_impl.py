@@ -0,0 +1,32 @@
+# backend/infrastructure/database/repositories/tombstone_repository_impl.py
+from datetime import datetime
+from typing import List
+import uuid
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities.change import Tombstone
+from domain.repositories.tombstone_repository import TombstoneRepository
+from ..models import TombstoneModel
+from ..mappers import TombstoneMapper
+
+class TombstoneRepositoryImpl(TombstoneRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_since(self, tenant_id: uuid.UUID, since: datetime) -> List[Tombstone]:
+        result = await self.session.execute(
+            select(TombstoneModel).where(
+                TombstoneModel.tenant_id == tenant_id,
+                TombstoneModel.deleted_at > since
+            ).order_by(TombstoneModel.deleted_at)
+        )
+        models = result.scalars().all()
+        return [TombstoneMapper.to_domain(model) for model in models]
+
+    async def purge_before(self, cutoff: datetime) -> int:
+        result = await self.session.execute(
+            delete(TombstoneModel).where(TombstoneModel.deleted_at < cutoff)
+        )
+        await self.session.commit()
+        return result.rowcount
@@ -1,7 +1,7 @@
 # backend/infrastructure/database/repositories/user_repository_impl.py
 from typing import Optional, List
 import uuid
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.entities.user import User
@@ -22,32 +22,32 @@ class UserRepositoryImpl(UserRepository):
 
     async def get_by_id(self, id: uuid.UUID) -> Optional[User]:
         result = await self.session.execute(
-            select(UserModel).where(UserModel.id == id)
+            lambda_stmt(lambda: select(UserModel).where(UserModel.id == id))
         )
         model = result.scalar_one_or_none()
         return UserMapper.to_domain(model) if model else None
 
     async def get_by_email(self, email: str) -> Optional[User]:
         result = await self.session.execute(
-            select(UserModel).where(UserModel.email == email)
+            lambda_stmt(lambda: select(UserModel).where(UserModel.email == email))
         )
         model = result.scalar_one_or_none()
         return UserMapper.to_domain(model) if model else None
 
     async def get_by_tenant(self, tenant_id: uuid.UUID) -> List[User]:
         result = await self.session.execute(
-            select(UserModel).where(UserModel.tenant_id == tenant_id)
+            lambda_stmt(lambda: select(UserModel).where(UserModel.tenant_id == tenant_id))
         )
         models = result.scalars().all()
         return [UserMapper.to_domain(model) for model in models]
 
     async def get_by_email_and_tenant(self, email: str, tenant_id: uuid.UUID) -> Optional[User]:
-        result = await self.session.execute(
-            select(UserModel).where(
+        result = await self.session.execute(lambda_stmt(
+            lambda: select(UserModel).where(
                 UserModel.email == email,
                 UserModel.tenant_id == tenant_id
             )
-        )
+        ))
         model = result.scalar_one_or_none()
         return UserMapper.to_domain(model) if model else None
 
@@ -0,0 +1,133 @@
+# backend/infrastructure/database/sharding.py
+"""
+Tenant-to-shard directory and placement of new tenants.
+
+The default shard is also the directory: it holds every tenant and user
+(for login and uniqueness checks) plus `tenant_shards`, which lists the
+tenants living elsewhere. A tenant's own shard carries copies of its
+tenant and user rows so its projects and tasks keep their foreign keys.
+"""
+from abc import ABC, abstractmethod
+import hashlib
+import importlib
+import logging
+import os
+from typing import List, NamedTuple, Optional
+import uuid
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities.tenant import Tenant
+from domain.entities.user import User
+from domain.repositories.tenant_placement import TenantPlacement
+from infrastructure.cache import TTLCache
+from .connection import DEFAULT_SHARD, AsyncSessionLocal, current_shard, shard_sessions
+from .mappers import TenantMapper, UserMapper
+from .models import TenantShardModel
+
+logger = logging.getLogger(__name__)
+
+SHARD_ACTIVE = "active"
+SHARD_MOVING = "moving"
+
+class ShardAssignment(NamedTuple):
+    shard: str
+    state: str = SHARD_ACTIVE
+
+DEFAULT_ASSIGNMENT = ShardAssignment(DEFAULT_SHARD)
+
+class ShardDirectory:
+    def __init__(self):
+        # Every worker caches lookups, so a changed assignment takes up to this long to apply
+        self.cache_ttl_seconds = float(os.getenv("SHARD_MAP_CACHE_TTL_SECONDS", "30"))
+        self._cache = TTLCache(ttl_seconds=self.cache_ttl_seconds, max_entries=100_000)
+
+    @property
+    def shard_names(self) -> List[str]:
+        return list(shard_sessions)
+
+    @property
+    def sharded(self) -> bool:
+        return len(shard_sessions) > 1
+
+    def session(self, shard: Optional[str] = None) -> AsyncSession:
+        """A session on the given shard, or on the current request's shard"""
+        return shard_sessions[shard or current_shard.get()]()
+
+    async def assignment(self, tenant_id: uuid.UUID) -> ShardAssignment:
+        if not self.sharded:
+            return DEFAULT_ASSIGNMENT
+        cached = self._cache.get(tenant_id)
+        if cached is not None:
+            return cached
+        async with AsyncSessionLocal() as session:
+            model = await session.get(TenantShardModel, tenant_id)
+        assignment = ShardAssignment(model.shard, model.state) if model else DEFAULT_ASSIGNMENT
+        if assignment.shard not in shard_sessions:
+            raise LookupError(f"Tenant {tenant_id} is on unknown shard {assignment.shard!r}")
+        self._cache.set(tenant_id, assignment)
+        return assignment
+
+    def invalidate(self, tenant_id: uuid.UUID) -> None:
+        self._cache.delete(tenant_id)
+
+    async def shard_for(self, tenant_id: uuid.UUID) -> str:
+        return (await self.assignment(tenant_id)).shard
+
+    async def assign(self, tenant_id: uuid.UUID, shard: str, state: str = SHARD_ACTIVE) -> None:
+        if shard not in shard_sessions:
+            raise ValueError(f"Unknown shard {shard!r}")
+        async with AsyncSessionLocal() as session:
+            await session.merge(TenantShardModel(tenant_id=tenant_id, shard=shard, state=state))
+            await session.commit()
+        self._cache.set(tenant_id, ShardAssignment(shard, state))
+
+class ShardPlacementPolicy(ABC):
+    @abstractmethod
+    async def choose(self, tenant: Tenant, shards: List[str]) -> str:
+        pass
+
+class DefaultShardPolicy(ShardPlacementPolicy):
+    """Keep every new tenant on the default shard; large tenants are moved later"""
+    async def choose(self, tenant: Tenant, shards: List[str]) -> str:
+        return DEFAULT_SHARD
+
+class HashShardPolicy(ShardPlacementPolicy):
+    """Spread new tenants evenly over all shards by a hash of their id"""
+    async def choose(self, tenant: Tenant, shards: List[str]) -> str:
+        ordered = sorted(shards)
+        digest = hashlib.sha1(tenant.id.bytes).digest()
+        return ordered[int.from_bytes(digest[:8], "big") % len(ordered)]
+
+PLACEMENT_POLICIES = {"default": DefaultShardPolicy, "hash": HashShardPolicy}
+
+def load_placement_policy(name: str) -> ShardPlacementPolicy:
+    """A built-in policy by name, or any ShardPlacementPolicy as "package.module:ClassName" """
+    if name in PLACEMENT_POLICIES:
+        return PLACEMENT_POLICIES[name]()
+    module_name, _, class_name = name.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)()
+
+class ShardTenantPlacement(TenantPlacement):
+    def __init__(self, directory: ShardDirectory, policy: ShardPlacementPolicy):
+        self.directory = directory
+        self.policy = policy
+
+    async def place(self, tenant: Tenant, owner: User) -> str:
+        shard = await self.policy.choose(tenant, self.directory.shard_names)
+        if shard == DEFAULT_SHARD:
+            return shard
+        # Copy the anchor rows first so the directory never points at a shard without them
+        async with self.directory.session(shard) as session:
+            session.add(TenantMapper.to_model(tenant))
+            await session.flush()
+            session.add(UserMapper.to_model(owner))
+            await session.commit()
+        await self.directory.assign(tenant.id, shard)
+        logger.info("Placed tenant %s on shard %s", tenant.id, shard)
+        return shard
+
+shard_directory = ShardDirectory()
+tenant_placement = ShardTenantPlacement(
+    shard_directory,
+    load_placement_policy(os.getenv("SHARD_PLACEMENT_POLICY", "default"))
+)
@@ -0,0 +1,148 @@
+# backend/infrastructure/database/slow_queries.py
+"""
+Slow-query log.
+
+Statements slower than SLOW_QUERY_THRESHOLD_MS are kept in a bounded ring
+buffer (SLOW_QUERY_LOG_SIZE) with the route and tenant of the request that
+ran them and the types of their parameters, never the values. The plan is
+captured afterwards by a background task: EXPLAIN (FORMAT JSON) without
+ANALYZE on Postgres, EXPLAIN QUERY PLAN on SQLite, through a connection of
+the engine that ran the statement. At most SLOW_QUERY_MAX_EXPLAINS run at
+once and the rest are recorded without a plan. With SLOW_QUERY_LOG_PATH
+set, each record is also appended to that file as a JSON line once its
+plan is in.
+"""
+import asyncio
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime
+import json
+import logging
+import os
+from typing import Any, Deque, Dict, List, Optional
+import uuid
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+
+# Set while a plan is being captured, so EXPLAIN itself is neither recorded nor counted
+explaining: ContextVar[bool] = ContextVar("slow_query_explaining", default=False)
+
+def parameter_shapes(parameters: Any) -> Any:
+    """Replace bound values with their type names, keeping the structure"""
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            # executemany: one shape and the row count are enough
+            return {"rows": len(parameters), "shape": parameter_shapes(parameters[0])}
+        return [type(value).__name__ for value in parameters]
+    return None if parameters is None else type(parameters).__name__
+
+class SlowQuery:
+    def __init__(
+        self,
+        statement: str,
+        duration_ms: float,
+        parameters: Any,
+        route: Optional[str] = None,
+        tenant_id: Optional[uuid.UUID] = None
+    ):
+        self.statement = statement
+        self.duration_ms = duration_ms
+        self.parameters = parameters
+        self.route = route
+        self.tenant_id = tenant_id
+        self.recorded_at = datetime.utcnow()
+        self.plan: Optional[Any] = None
+        self.plan_error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "recorded_at": self.recorded_at.isoformat(),
+            "duration_ms": round(self.duration_ms, 3),
+            "route": self.route,
+            "tenant_id": str(self.tenant_id) if self.tenant_id else None,
+            "statement": self.statement,
+            "parameters": self.parameters,
+            "plan": self.plan,
+            "plan_error": self.plan_error
+        }
+
+class SlowQueryLog:
+    def __init__(self):
+        self.threshold_seconds = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "500")) / 1000
+        self.max_explains = int(os.getenv("SLOW_QUERY_MAX_EXPLAINS", "2"))
+        self.path = os.getenv("SLOW_QUERY_LOG_PATH") or None
+        self.records: Deque[SlowQuery] = deque(maxlen=int(os.getenv("SLOW_QUERY_LOG_SIZE", "200")))
+        self.recorded = 0
+        self.explains_skipped = 0
+        self._explains: set = set()
+
+    def observe(
+        self,
+        engine: AsyncEngine,
+        statement: str,
+        parameters: Any,
+        seconds: float,
+        route: Optional[str] = None,
+        tenant_id: Optional[uuid.UUID] = None
+    ) -> None:
+        """Called for every statement; keeps the ones over the threshold (0 turns the log off)"""
+        if self.threshold_seconds <= 0 or seconds < self.threshold_seconds:
+            return
+        record = SlowQuery(statement, seconds * 1000, parameter_shapes(parameters), route, tenant_id)
+        self.records.append(record)
+        self.recorded += 1
+        many = isinstance(parameters, list) and parameters and isinstance(parameters[0], (dict, list, tuple))
+        explainable = statement.lstrip().upper().startswith(EXPLAINABLE) and not many
+        if not explainable or len(self._explains) >= self.max_explains:
+            self.explains_skipped += 1
+            self._write(record)
+            return
+        task = asyncio.get_running_loop().create_task(self._explain(engine, record, parameters))
+        self._explains.add(task)
+        task.add_done_callback(self._explains.discard)
+
+    async def _explain(self, engine: AsyncEngine, record: SlowQuery, parameters: Any) -> None:
+        explaining.set(True)
+        try:
+            async with engine.connect() as connection:
+                if engine.dialect.name == "postgresql":
+                    result = await connection.exec_driver_sql(
+                        f"EXPLAIN (ANALYZE off, FORMAT JSON) {record.statement}", parameters
+                    )
+                    plan = result.scalar()
+                    record.plan = json.loads(plan) if isinstance(plan, str) else plan
+                elif engine.dialect.name == "sqlite":
+                    result = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {record.statement}", parameters)
+                    record.plan = [row.detail for row in result]
+        except Exception as e:
+            record.plan_error = str(e)
+        self._write(record)
+
+    def _write(self, record: SlowQuery) -> None:
+        if self.path is None:
+            return
+        try:
+            with open(self.path, "a") as sink:
+                sink.write(json.dumps(record.to_dict()) + "\n")
+        except OSError:
+            logger.warning("Could not append to the slow-query log %s", self.path, exc_info=True)
+
+    def recent(self, limit: int) -> List[Dict[str, Any]]:
+        """Newest first"""
+        return [record.to_dict() for record in list(reversed(self.records))[:limit]]
+
+    def stats(self) -> dict:
+        return {
+            "threshold_ms": self.threshold_seconds * 1000,
+            "recorded": self.recorded,
+            "buffered": len(self.records),
+            "explains_running": len(self._explains),
+            "explains_skipped": self.explains_skipped
+        }
+
+slow_query_log = SlowQueryLog()
@@ -0,0 +1,65 @@
+# backend/infrastructure/database/sqlite.py
+"""
+SQLite profile for single-node installs, used when DATABASE_URL points at
+a SQLite file.
+
+The file is opened through two engines. The writer has one pooled
+connection, so concurrent writes queue in the process instead of failing
+with SQLITE_BUSY. The reader has SQLITE_READERS query-only connections.
+In WAL mode readers run alongside the writer and see every committed
+write, so the reader engine serves read sessions through the
+ReplicaRouter without any replay tracking.
+"""
+from sqlalchemy import event
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .pool import InstrumentedQueuePool
+from .settings import DatabaseSettings
+
+def is_sqlite_file(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:")
+
+def sqlite_pool_options(settings: DatabaseSettings, readonly: bool) -> dict:
+    # aiosqlite defaults to NullPool, which would reopen the file and rerun the pragmas per session
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.sqlite_readers if readonly else 1,
+        "max_overflow": 0,
+        "pool_timeout": settings.pool_timeout
+    }
+
+def sqlite_pragmas(settings: DatabaseSettings, readonly: bool) -> list:
+    pragmas = [
+        # WAL is stored in the file; setting it on every connection is a no-op after the first
+        "PRAGMA journal_mode = WAL",
+        # NORMAL only syncs at checkpoints in WAL mode: a power loss can drop the last
+        # transactions but never corrupts the file
+        f"PRAGMA synchronous = {settings.sqlite_synchronous}",
+        f"PRAGMA mmap_size = {settings.sqlite_mmap_size}",
+        f"PRAGMA cache_size = {settings.sqlite_cache_size}",
+        f"PRAGMA busy_timeout = {settings.sqlite_busy_timeout_ms}",
+        "PRAGMA foreign_keys = ON",
+        "PRAGMA temp_store = MEMORY",
+    ]
+    if readonly:
+        pragmas.append("PRAGMA query_only = ON")
+    return pragmas
+
+def configure_sqlite(engine: AsyncEngine, settings: DatabaseSettings, readonly: bool) -> None:
+    pragmas = sqlite_pragmas(settings, readonly)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _connect(dbapi_connection, connection_record) -> None:
+        # Hand transaction control to the begin hook below instead of the driver's implicit BEGIN
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin(connection) -> None:
+        # Writers take the lock up front. A deferred transaction that upgrades to a write
+        # can fail with SQLITE_BUSY immediately instead of waiting out busy_timeout.
+        connection.exec_driver_sql("BEGIN" if readonly else "BEGIN IMMEDIATE")
@@ -0,0 +1,218 @@
+# backend/infrastructure/database/synthetic_data.py
+"""
+Synthetic tenants for capacity testing, loaded by jobs.seed_synthetic.
+
+Tenant sizes follow a Zipf-like law: the tenant of rank r gets a share of
+the tasks proportional to 1 / r^skew, so a few tenants hold most of the
+data and there is a long tail of small ones. Users and projects scale
+with a tenant's tasks, and within a tenant projects and assignees are
+skewed the same way. Tasks are mostly recent, old ones are mostly done.
+
+Everything is derived from the seed: a tenant's users and projects from
+Random("seed:rank"), each chunk of its tasks from Random("seed:rank:chunk"),
+so chunks can be generated in any order, in separate processes, and still
+come out the same. Task ids are UUIDv7 of the task's created_at, like the
+ids the app creates.
+"""
+from datetime import datetime, timedelta
+from itertools import accumulate
+import math
+import random
+from typing import List, Optional, Sequence, Tuple
+import uuid
+
+from domain.entities.project import ProjectStatus
+from domain.entities.task import TaskPriority, TaskStatus
+from domain.identifiers import uuid7_floor
+
+TENANT_COLUMNS = ("id", "name", "domain", "created_at")
+USER_COLUMNS = ("id", "email", "tenant_id", "hashed_password", "first_name", "last_name", "is_active", "created_at")
+PROJECT_COLUMNS = ("id", "name", "description", "status", "tenant_id", "created_by", "created_at", "updated_at")
+TASK_COLUMNS = (
+    "id", "title", "description", "status", "priority", "project_id", "tenant_id", "created_by", "assigned_to",
+    "due_date", "created_at", "updated_at"
+)
+
+# Enum columns store member names; weights are cumulative, for random.choices
+PROJECT_STATUSES = [status.name for status in ProjectStatus]
+PROJECT_STATUS_WEIGHTS = list(accumulate([15, 55, 10, 15, 5]))
+PRIORITIES = [priority.name for priority in TaskPriority]
+PRIORITY_WEIGHTS = list(accumulate([20, 50, 22, 8]))
+TASK_STATUSES = [status.name for status in TaskStatus]
+RECENT_STATUS_WEIGHTS = list(accumulate([35, 30, 15, 20]))
+OLD_STATUS_WEIGHTS = list(accumulate([8, 7, 5, 80]))
+RECENT = timedelta(days=30)
+DUE_DATE_SHARE = 0.6
+ASSIGNED_SHARE = 0.85
+DESCRIBED_SHARE = 0.3
+
+class SyntheticSettings:
+    """The shape of a synthetic dataset; the same settings always give the same rows"""
+    def __init__(
+        self,
+        seed: int = 1,
+        tenants: int = 1000,
+        tasks: int = 1_000_000,
+        skew: float = 1.1,
+        tasks_per_user: int = 200,
+        tasks_per_project: int = 400,
+        days: int = 365,
+        until: Optional[datetime] = None,
+        chunk_size: int = 20_000
+    ):
+        self.seed = seed
+        self.tenants = tenants
+        self.tasks = tasks
+        self.skew = skew
+        self.tasks_per_user = tasks_per_user
+        self.tasks_per_project = tasks_per_project
+        self.days = days
+        # Midnight, so runs on the same day produce identical dates
+        self.until = until or datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.chunk_size = chunk_size
+
+class TenantPlan:
+    """One tenant's ids and sizes: enough to generate any chunk of its tasks independently"""
+    def __init__(
+        self,
+        rank: int,
+        id: uuid.UUID,
+        domain: str,
+        created_at: datetime,
+        task_count: int,
+        user_ids: List[uuid.UUID],
+        project_ids: List[uuid.UUID]
+    ):
+        self.rank = rank
+        self.id = id
+        self.domain = domain
+        self.created_at = created_at
+        self.task_count = task_count
+        self.user_ids = user_ids
+        self.project_ids = project_ids
+
+    def chunks(self, chunk_size: int) -> List[Tuple[int, int]]:
+        """(chunk, tasks in it) pairs covering the tenant's tasks"""
+        return [
+            (chunk, min(chunk_size, self.task_count - start))
+            for chunk, start in enumerate(range(0, self.task_count, chunk_size))
+        ]
+
+def pack_chunks(plans: Sequence[TenantPlan], chunk_size: int) -> List[List[Tuple[TenantPlan, int, int]]]:
+    """(plan, chunk, count) parts grouped into loads of about chunk_size tasks, largest first.
+    The long tail of small tenants then shares loads instead of taking one each."""
+    loads, partial, partial_size = [], [], 0
+    for plan in plans:
+        for chunk, count in plan.chunks(chunk_size):
+            if count == chunk_size:
+                loads.append([(plan, chunk, count)])
+                continue
+            partial.append((plan, chunk, count))
+            partial_size += count
+            if partial_size >= chunk_size:
+                loads.append(partial)
+                partial, partial_size = [], 0
+    if partial:
+        loads.append(partial)
+    return sorted(loads, key=lambda load: -sum(count for _, _, count in load))
+
+def zipf_weights(count: int, skew: float) -> List[float]:
+    """Cumulative weights of ranks 1..count under 1 / rank^skew"""
+    return list(accumulate(1 / rank ** skew for rank in range(1, count + 1)))
+
+def zipf_shares(total: int, count: int, skew: float) -> List[int]:
+    """total split over count ranks by 1 / rank^skew, rounded so the shares add up to total"""
+    weights = [1 / rank ** skew for rank in range(1, count + 1)]
+    exact = [total * weight / sum(weights) for weight in weights]
+    shares = [math.floor(share) for share in exact]
+    # Largest remainders first
+    by_remainder = sorted(range(count), key=lambda rank: shares[rank] - exact[rank])
+    for rank in by_remainder[:total - sum(shares)]:
+        shares[rank] += 1
+    return shares
+
+def random_id(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+def time_ordered_id(moment: datetime, rng: random.Random) -> uuid.UUID:
+    """A UUIDv7 of moment, with rand_a and rand_b drawn from rng"""
+    return uuid.UUID(int=uuid7_floor(moment).int | rng.getrandbits(12) << 64 | rng.getrandbits(62))
+
+def plan_tenants(settings: SyntheticSettings) -> List[TenantPlan]:
+    plans = []
+    for rank, task_count in enumerate(zipf_shares(settings.tasks, settings.tenants, settings.skew), start=1):
+        rng = random.Random(f"{settings.seed}:{rank}")
+        users = max(1, round(task_count / settings.tasks_per_user))
+        projects = max(1, math.ceil(task_count / settings.tasks_per_project))
+        plans.append(TenantPlan(
+            rank=rank,
+            id=random_id(rng),
+            domain=f"synthetic-{settings.seed}-{rank}",
+            created_at=settings.until - timedelta(days=settings.days * (0.5 + 0.5 * rng.random())),
+            task_count=task_count,
+            user_ids=[random_id(rng) for _ in range(users)],
+            project_ids=[random_id(rng) for _ in range(projects)]
+        ))
+    return plans
+
+def directory_rows(plan: TenantPlan, settings: SyntheticSettings, hashed_password: str) -> Tuple[tuple, list, list]:
+    """The tenant's row and its users' and projects' rows. Everyone shares one password hash: bcrypt is slow."""
+    rng = random.Random(f"{settings.seed}:{plan.rank}:directory")
+    span = (settings.until - plan.created_at).total_seconds()
+    tenant = (plan.id, f"Synthetic {plan.rank}", plan.domain, plan.created_at)
+    users = [
+        (user_id, f"user{number}@{plan.domain}.example.com", plan.id, hashed_password, "User", str(number), True,
+         plan.created_at + timedelta(seconds=span * rng.random()))
+        for number, user_id in enumerate(plan.user_ids)
+    ]
+    projects = []
+    for number, project_id in enumerate(plan.project_ids):
+        created_at = plan.created_at + timedelta(seconds=span * rng.random() ** 2)
+        projects.append((
+            project_id, f"Project {number}", None,
+            rng.choices(PROJECT_STATUSES, cum_weights=PROJECT_STATUS_WEIGHTS)[0], plan.id,
+            rng.choice(plan.user_ids), created_at,
+            created_at + timedelta(seconds=(settings.until - created_at).total_seconds() * rng.random())
+        ))
+    return tenant, users, projects
+
+def task_rows(plan: TenantPlan, chunk: int, count: int, settings: SyntheticSettings) -> List[tuple]:
+    """Rows of one chunk of the tenant's tasks"""
+    rng = random.Random(f"{settings.seed}:{plan.rank}:{chunk}")
+    # Drawn in bulk: random.choices with cumulative weights is far cheaper per row than in the loop
+    projects = rng.choices(plan.project_ids, cum_weights=zipf_weights(len(plan.project_ids), settings.skew), k=count)
+    assignees = rng.choices(plan.user_ids, cum_weights=zipf_weights(len(plan.user_ids), settings.skew), k=count)
+    creators = rng.choices(plan.user_ids, k=count)
+    priorities = rng.choices(PRIORITIES, cum_weights=PRIORITY_WEIGHTS, k=count)
+    span = (settings.until - plan.created_at).total_seconds()
+    first = chunk * settings.chunk_size
+    rows = []
+    for index in range(count):
+        # Squaring skews ages towards zero: a growing tenant creates more tasks lately
+        age = timedelta(seconds=span * rng.random() ** 2)
+        created_at = settings.until - age
+        status_weights = RECENT_STATUS_WEIGHTS if age < RECENT else OLD_STATUS_WEIGHTS
+        rows.append((
+            time_ordered_id(created_at, rng),
+            f"Task {first + index}",
+            "Synthetic task description" if rng.random() < DESCRIBED_SHARE else None,
+            rng.choices(TASK_STATUSES, cum_weights=status_weights)[0],
+            priorities[index],
+            projects[index],
+            plan.id,
+            creators[index],
+            assignees[index] if rng.random() < ASSIGNED_SHARE else None,
+            created_at + timedelta(days=rng.randint(1, 45)) if rng.random() < DUE_DATE_SHARE else None,
+            created_at,
+            created_at + age * rng.random()
+        ))
+    return rows
+
+def summarize(plans: Sequence[TenantPlan]) -> str:
+    sizes = sorted((plan.task_count for plan in plans), reverse=True)
+    users = sum(len(plan.user_ids) for plan in plans)
+    projects = sum(len(plan.project_ids) for plan in plans)
+    return (
+        f"{len(plans):,} tenants, {users:,} users, {projects:,} projects, {sum(sizes):,} tasks "
+        f"(largest tenant {sizes[0]:,}, median {sizes[len(sizes) // 2]:,}, smallest {sizes[-1]:,})"
+    )
@@ -0,0 +1,241 @@
+# backend/infrastructure/database/tenant_mover.py
+"""
+Online move of one tenant between shards.
+
+1. Copy passes: upsert the tenant's rows into the target, then keep
+   re-copying only rows changed since the previous pass while the tenant
+   stays writable on the source.
+2. Freeze: mark the tenant "moving" (writes get 503 + Retry-After) and wait
+   for every worker's shard map cache to see it.
+3. Final pass under the freeze, then point the directory at the target.
+4. Copy activity entries the batched writer flushed to the source late and,
+   optionally, delete the tenant's rows from the source.
+"""
+import asyncio
+from datetime import datetime, timedelta
+import logging
+import os
+from typing import Optional
+import uuid
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from application.use_cases.flow_use_cases import FLOW_ROLLUP_CHECKPOINT, FlowUseCases
+from domain.entities.change import EntityType
+from .connection import DEFAULT_SHARD, shard_sessions
+from .models import (
+    ActivityModel, ProjectFlowDailyModel, ProjectModel, TaskArchiveModel, TaskModel,
+    TaskStatusTransitionModel, TenantModel, TombstoneModel, UserModel
+)
+from .repositories.flow_repository_impl import FlowRepositoryImpl
+from .sharding import SHARD_ACTIVE, SHARD_MOVING, ShardDirectory
+
+logger = logging.getLogger(__name__)
+
+# Foreign key order, with the column that tells whether a row changed since the last pass
+COPY_TABLES = [
+    (TenantModel, TenantModel.id, None),
+    (UserModel, UserModel.tenant_id, None),
+    (ProjectModel, ProjectModel.tenant_id, ProjectModel.updated_at),
+    (TaskModel, TaskModel.tenant_id, TaskModel.updated_at),
+    (TaskArchiveModel, TaskArchiveModel.tenant_id, TaskArchiveModel.archived_at),
+    (TombstoneModel, TombstoneModel.tenant_id, TombstoneModel.deleted_at),
+    (ActivityModel, ActivityModel.tenant_id, ActivityModel.created_at),
+]
+# Rows that are only ever inserted; upserts skip instead of overwriting
+IMMUTABLE_TABLES = {TaskArchiveModel, TombstoneModel, ActivityModel}
+
+class TenantMover:
+    def __init__(self, directory: ShardDirectory):
+        self.directory = directory
+        self.batch_size = int(os.getenv("SHARD_MOVE_BATCH_SIZE", "1000"))
+        self.max_passes = int(os.getenv("SHARD_MOVE_MAX_PASSES", "5"))
+        # Rows changed in the last pass below this count are left to the final, frozen pass
+        self.freeze_threshold = int(os.getenv("SHARD_MOVE_FREEZE_THRESHOLD", "500"))
+        # Margin for transactions that stamped their rows before committing
+        self.settle_seconds = float(os.getenv("SHARD_MOVE_SETTLE_SECONDS", "5"))
+
+    async def move(self, tenant_id: uuid.UUID, target: str, purge_source: bool = False) -> None:
+        if target not in shard_sessions:
+            raise ValueError(f"Unknown shard {target!r}")
+        self.directory.invalidate(tenant_id)
+        assignment = await self.directory.assignment(tenant_id)
+        source = assignment.shard
+        if source == target:
+            raise ValueError(f"Tenant {tenant_id} is already on shard {target!r}")
+        logger.info("Moving tenant %s from %s to %s", tenant_id, source, target)
+
+        await self._clear_history(tenant_id, target)
+        since: Optional[datetime] = None
+        transitions_since: Optional[datetime] = None
+        for number in range(1, self.max_passes + 1):
+            started = datetime.utcnow()
+            copied = await self._copy_pass(tenant_id, source, target, since)
+            transitions_until = started - timedelta(seconds=self.settle_seconds)
+            await self._copy_transitions(tenant_id, source, target, transitions_since, transitions_until)
+            transitions_since = transitions_until
+            since = transitions_until
+            logger.info("Pass %d copied %d changed rows", number, copied)
+            if number > 1 and copied < self.freeze_threshold:
+                break
+
+        frozen_at = datetime.utcnow()
+        await self.directory.assign(tenant_id, source, SHARD_MOVING)
+        try:
+            await self._wait_for_caches()
+            await self._copy_pass(tenant_id, source, target, since)
+            await self._copy_transitions(tenant_id, source, target, transitions_since, None)
+            await self._copy_rollups(tenant_id, source, target)
+            await self.directory.assign(tenant_id, target, SHARD_ACTIVE)
+        except Exception:
+            logger.exception("Move of tenant %s failed; leaving it on %s", tenant_id, source)
+            await self.directory.assign(tenant_id, source, SHARD_ACTIVE)
+            raise
+        logger.info("Tenant %s now served from %s", tenant_id, target)
+
+        # Writers that still had the old assignment cached flushed their activity to the source
+        await self._wait_for_caches()
+        async with shard_sessions[source]() as source_session, shard_sessions[target]() as target_session:
+            await self._copy_table(
+                source_session, target_session, ActivityModel,
+                ActivityModel.tenant_id == tenant_id,
+                ActivityModel.created_at >= frozen_at - timedelta(seconds=self.settle_seconds)
+            )
+
+        if purge_source:
+            await self._purge(tenant_id, source)
+
+    async def _wait_for_caches(self) -> None:
+        await asyncio.sleep(self.directory.cache_ttl_seconds + self.settle_seconds)
+
+    async def _copy_pass(
+        self,
+        tenant_id: uuid.UUID,
+        source: str,
+        target: str,
+        since: Optional[datetime]
+    ) -> int:
+        """Copy every row changed since `since` (all rows when None) and apply deletes"""
+        copied = 0
+        async with shard_sessions[source]() as source_session, shard_sessions[target]() as target_session:
+            for model, tenant_column, changed_column in COPY_TABLES:
+                conditions = [tenant_column == tenant_id]
+                if since is not None and changed_column is not None:
+                    conditions.append(changed_column >= since)
+                copied += await self._copy_table(source_session, target_session, model, *conditions)
+            if since is not None:
+                await self._apply_deletes(tenant_id, source_session, target_session, since)
+        return copied
+
+    async def _copy_table(self, source_session, target_session, model, *conditions) -> int:
+        table = model.__table__
+        keys = [column.name for column in table.primary_key]
+        # Conflicts are matched by constraint name: a hash-partitioned tasks table keys on (id, tenant_id)
+        primary_key = f"{table.name}_pkey"
+        copied = 0
+        result = await source_session.stream(select(table).where(*conditions))
+        async for rows in result.mappings().partitions(self.batch_size):
+            statement = pg_insert(table).values([dict(row) for row in rows])
+            if model in IMMUTABLE_TABLES:
+                statement = statement.on_conflict_do_nothing(constraint=primary_key)
+            else:
+                statement = statement.on_conflict_do_update(
+                    constraint=primary_key,
+                    set_={
+                        column.name: statement.excluded[column.name]
+                        for column in table.columns if column.name not in keys
+                    }
+                )
+            await target_session.execute(statement)
+            await target_session.commit()
+            copied += len(rows)
+        return copied
+
+    async def _apply_deletes(self, tenant_id: uuid.UUID, source_session, target_session, since: datetime) -> None:
+        result = await source_session.execute(
+            select(TombstoneModel.entity_type, TombstoneModel.entity_id).where(
+                TombstoneModel.tenant_id == tenant_id,
+                TombstoneModel.deleted_at >= since
+            )
+        )
+        deleted = {EntityType.PROJECT: [], EntityType.TASK: []}
+        for entity_type, entity_id in result.all():
+            deleted[entity_type].append(entity_id)
+        # Archiving removes a task from the hot table without a tombstone
+        result = await source_session.execute(
+            select(TaskArchiveModel.id).where(
+                TaskArchiveModel.tenant_id == tenant_id,
+                TaskArchiveModel.archived_at >= since
+            )
+        )
+        deleted[EntityType.TASK] += result.scalars().all()
+        if deleted[EntityType.TASK]:
+            await target_session.execute(delete(TaskModel).where(TaskModel.id.in_(deleted[EntityType.TASK])))
+        if deleted[EntityType.PROJECT]:
+            project_ids = deleted[EntityType.PROJECT]
+            for model in (TaskModel, TaskArchiveModel):
+                await target_session.execute(delete(model).where(model.project_id.in_(project_ids)))
+            await target_session.execute(delete(ProjectModel).where(ProjectModel.id.in_(project_ids)))
+        await target_session.commit()
+
+    async def _clear_history(self, tenant_id: uuid.UUID, target: str) -> None:
+        """Drop transitions and rollups left on the target by an earlier, aborted move"""
+        async with shard_sessions[target]() as session:
+            for model in (TaskStatusTransitionModel, ProjectFlowDailyModel):
+                await session.execute(delete(model).where(model.tenant_id == tenant_id))
+            await session.commit()
+
+    async def _copy_transitions(
+        self,
+        tenant_id: uuid.UUID,
+        source: str,
+        target: str,
+        since: Optional[datetime],
+        until: Optional[datetime]
+    ) -> None:
+        """Copy transitions in [since, until); the target's sequence assigns new ids"""
+        table = TaskStatusTransitionModel.__table__
+        columns = [column for column in table.columns if column.name != "id"]
+        conditions = [table.c.tenant_id == tenant_id]
+        if since is not None:
+            conditions.append(table.c.changed_at >= since)
+        if until is not None:
+            conditions.append(table.c.changed_at < until)
+        async with shard_sessions[source]() as source_session, shard_sessions[target]() as target_session:
+            result = await source_session.stream(select(*columns).where(*conditions))
+            async for rows in result.mappings().partitions(self.batch_size):
+                await target_session.execute(pg_insert(table).values([dict(row) for row in rows]))
+                await target_session.commit()
+
+    async def _copy_rollups(self, tenant_id: uuid.UUID, source: str, target: str) -> None:
+        """Copy the daily rollups, then fold in what the source's rollup job had not processed yet"""
+        async with shard_sessions[source]() as source_session, shard_sessions[target]() as target_session:
+            await self._copy_table(
+                source_session, target_session, ProjectFlowDailyModel,
+                ProjectFlowDailyModel.tenant_id == tenant_id
+            )
+            processed_until = await FlowRepositoryImpl(source_session).get_checkpoint(FLOW_ROLLUP_CHECKPOINT)
+
+            flow_repository = FlowRepositoryImpl(target_session)
+            until = datetime.utcnow()
+            changed = await flow_repository.get_changed_projects(processed_until, until)
+            flow_use_cases = FlowUseCases(flow_repository)
+            for project_id, (project_tenant_id, first_change) in changed.items():
+                if project_tenant_id == tenant_id:
+                    await flow_use_cases.rebuild_project(tenant_id, project_id, first_change.date(), until)
+
+    async def _purge(self, tenant_id: uuid.UUID, source: str) -> None:
+        """Delete the tenant from its old shard, children first"""
+        models = [
+            ActivityModel, TombstoneModel, TaskStatusTransitionModel, ProjectFlowDailyModel,
+            TaskArchiveModel, TaskModel, ProjectModel
+        ]
+        if source != DEFAULT_SHARD:
+            # The default shard keeps tenants and users as the directory
+            models += [UserModel, TenantModel]
+        async with shard_sessions[source]() as session:
+            for model in models:
+                tenant_column = model.id if model is TenantModel else model.tenant_id
+                await session.execute(delete(model).where(tenant_column == tenant_id))
+            await session.commit()
+        logger.info("Purged tenant %s from shard %s", tenant_id, source)
@@ -0,0 +1,117 @@
+# backend/infrastructure/loop_monitor.py
+"""
+Event-loop lag monitor and blocking-call detector.
+
+A task on the loop sleeps LOOP_MONITOR_INTERVAL_MS at a time and records
+how late each wake-up is in askbob_event_loop_lag_seconds: the time
+other callbacks kept the loop busy. By the time that task runs again,
+whatever blocked the loop has already returned. So a watchdog thread
+also watches the task's heartbeat. Once the heartbeat is more than
+LOOP_BLOCK_THRESHOLD_MS overdue, the watchdog grabs the loop thread's
+stack while the blocking call is still on it. It then logs that stack
+with the request in flight, taken from RequestMetricsMiddleware's
+registry of request tasks. The last LOOP_BLOCK_LOG_SIZE reports are
+kept in `blocks`.
+
+Set LOOP_MONITOR_INTERVAL_MS=0 to turn it off. tests/conftest.py uses
+the same monitor to fail tests that block their loop, with
+LOOP_BLOCKING_FAILS=1.
+"""
+import asyncio
+from collections import deque
+from contextlib import suppress
+from datetime import datetime
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Deque, Dict, Optional
+
+from infrastructure.metrics import event_loop_blocks, event_loop_lag
+
+logger = logging.getLogger(__name__)
+
+# The ASGI scope of each request, by the task serving it; maintained by RequestMetricsMiddleware
+requests_in_flight: Dict[asyncio.Task, Dict[str, Any]] = {}
+
+def blocking_stack(frame) -> str:
+    """The loop thread's stack, from the first frame after asyncio's own"""
+    frames = traceback.extract_stack(frame)
+    asyncio_dir = os.path.dirname(asyncio.__file__)
+    start = max((index + 1 for index, summary in enumerate(frames) if summary.filename.startswith(asyncio_dir)), default=0)
+    return "".join(traceback.format_list(frames[start:]))
+
+class LoopMonitor:
+    def __init__(self):
+        self.interval_seconds = float(os.getenv("LOOP_MONITOR_INTERVAL_MS", "50")) / 1000
+        self.threshold_seconds = float(os.getenv("LOOP_BLOCK_THRESHOLD_MS", "100")) / 1000
+        self.blocks: Deque[Dict[str, Any]] = deque(maxlen=int(os.getenv("LOOP_BLOCK_LOG_SIZE", "50")))
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id = 0
+        self._heartbeat = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    async def start(self) -> None:
+        """Watch the running loop until stop()"""
+        if self._task is not None or self.interval_seconds <= 0:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._beat(), name="loop-monitor")
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopped.set()
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        await asyncio.to_thread(self._watchdog.join)
+        self._task, self._watchdog = None, None
+
+    async def _beat(self) -> None:
+        while True:
+            self._heartbeat = time.monotonic()
+            await asyncio.sleep(self.interval_seconds)
+            event_loop_lag.observe(max(0.0, time.monotonic() - self._heartbeat - self.interval_seconds))
+
+    def _watch(self) -> None:
+        """Runs in the watchdog thread; reports each overdue heartbeat once"""
+        reported = None
+        while not self._stopped.wait(min(self.interval_seconds, self.threshold_seconds / 2)):
+            heartbeat = self._heartbeat
+            blocked = time.monotonic() - heartbeat - self.interval_seconds
+            if heartbeat != reported and blocked > self.threshold_seconds:
+                reported = heartbeat
+                self._report(blocked)
+
+    def _report(self, blocked_seconds: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        task = asyncio.current_task(self._loop)
+        scope = requests_in_flight.get(task) if task is not None else None
+        route = scope.get("route") if scope is not None else None
+        block = {
+            "detected_at": datetime.utcnow().isoformat(),
+            "blocked_ms": round(blocked_seconds * 1000, 1),
+            "task": task.get_name() if task is not None else None,
+            "method": scope["method"] if scope is not None else None,
+            # The path when routing hasn't matched yet
+            "route": route.path if route is not None else scope["path"] if scope is not None else None,
+            "stack": blocking_stack(frame) if frame is not None else ""
+        }
+        self.blocks.append(block)
+        event_loop_blocks.labels(block["route"] or "none").inc()
+        logger.warning(
+            "Event loop blocked for %.0fms and counting, in %s %s (task %s):\n%s",
+            block["blocked_ms"], block["method"] or "no request", block["route"] or "", block["task"], block["stack"]
+        )
+
+loop_monitor = LoopMonitor()
@@ -0,0 +1,14 @@
+# backend/infrastructure/memory/__init__.py
+from .repositories import (
+    InMemoryProjectRepository, InMemoryTaskRepository, InMemoryTenantRepository, InMemoryUserRepository
+)
+from .store import IndexedTable, InMemoryStore
+
+__all__ = [
+    "IndexedTable",
+    "InMemoryStore",
+    "InMemoryProjectRepository",
+    "InMemoryTaskRepository",
+    "InMemoryTenantRepository",
+    "InMemoryUserRepository"
+]
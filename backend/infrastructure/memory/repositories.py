@@ -0,0 +1,220 @@
+# backend/infrastructure/memory/repositories.py
+"""
+Repositories over an InMemoryStore, for tests and for profiling the API
+layer without a database. Writes leave the same tombstones, status
+transitions and change events as the database repositories; events go
+straight to this process's subscribers, as on databases without NOTIFY.
+"""
+from datetime import datetime
+from typing import List, Optional
+import uuid
+
+from domain.entities.change import ChangeEvent, ChangeType, EntityType, Tombstone
+from domain.entities.flow import StatusTransition
+from domain.entities.project import Project, ProjectStatus
+from domain.entities.task import Task, TaskStatus
+from domain.entities.tenant import Tenant
+from domain.entities.user import User
+from domain.repositories import ProjectRepository, TaskRepository, TenantRepository, UserRepository
+from infrastructure.realtime.broker import change_broker
+from .store import InMemoryStore
+
+class InMemoryTenantRepository(TenantRepository):
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    async def create(self, entity: Tenant) -> Tenant:
+        return self.store.tenants.put(entity)
+
+    async def get_by_id(self, id: uuid.UUID) -> Optional[Tenant]:
+        return self.store.tenants.get(id)
+
+    async def get_by_domain(self, domain: str) -> Optional[Tenant]:
+        return next(iter(self.store.tenants.find("domain", domain)), None)
+
+    async def update(self, entity: Tenant) -> Tenant:
+        tenant = self.store.tenants.get(entity.id)
+        if not tenant:
+            raise ValueError("Tenant not found")
+        tenant.name = entity.name
+        tenant.domain = entity.domain
+        return self.store.tenants.put(tenant)
+
+    async def delete(self, id: uuid.UUID) -> bool:
+        return self.store.tenants.remove(id) is not None
+
+class InMemoryUserRepository(UserRepository):
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    async def create(self, entity: User) -> User:
+        return self.store.users.put(entity)
+
+    async def get_by_id(self, id: uuid.UUID) -> Optional[User]:
+        return self.store.users.get(id)
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        return next(iter(self.store.users.find("email", email)), None)
+
+    async def get_by_tenant(self, tenant_id: uuid.UUID) -> List[User]:
+        return self.store.users.find("tenant", tenant_id)
+
+    async def get_by_email_and_tenant(self, email: str, tenant_id: uuid.UUID) -> Optional[User]:
+        return next(iter(self.store.users.find("email_and_tenant", (email, tenant_id))), None)
+
+    async def update(self, entity: User) -> User:
+        user = self.store.users.get(entity.id)
+        if not user:
+            raise ValueError("User not found")
+        user.email = entity.email
+        user.first_name = entity.first_name
+        user.last_name = entity.last_name
+        user.is_active = entity.is_active
+        return self.store.users.put(user)
+
+    async def delete(self, id: uuid.UUID) -> bool:
+        return self.store.users.remove(id) is not None
+
+class InMemoryProjectRepository(ProjectRepository):
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    def _publish(self, project: Project, change_type: ChangeType) -> None:
+        change_broker.dispatch(ChangeEvent(
+            tenant_id=project.tenant_id,
+            entity_type=EntityType.PROJECT,
+            entity_id=project.id,
+            change_type=change_type
+        ))
+
+    async def create(self, entity: Project) -> Project:
+        project = self.store.projects.put(entity)
+        self._publish(project, ChangeType.CREATED)
+        return project
+
+    async def get_by_id(self, id: uuid.UUID) -> Optional[Project]:
+        return self.store.projects.get(id)
+
+    async def get_by_tenant_and_id(self, tenant_id: uuid.UUID, project_id: uuid.UUID) -> Optional[Project]:
+        project = self.store.projects.get(project_id)
+        return project if project and project.tenant_id == tenant_id else None
+
+    async def get_by_tenant(self, tenant_id: uuid.UUID) -> List[Project]:
+        return self.store.projects.find("tenant", tenant_id)
+
+    async def get_by_status(self, tenant_id: uuid.UUID, status: ProjectStatus) -> List[Project]:
+        return self.store.projects.find("status", (tenant_id, status))
+
+    async def get_updated_since(self, tenant_id: uuid.UUID, since: Optional[datetime]) -> List[Project]:
+        projects = self.store.projects.find("tenant", tenant_id)
+        if since is not None:
+            projects = [project for project in projects if project.updated_at > since]
+        return sorted(projects, key=lambda project: (project.updated_at, project.id))
+
+    async def update(self, entity: Project) -> Project:
+        project = self.store.projects.get(entity.id)
+        if not project:
+            raise ValueError("Project not found")
+        project.name = entity.name
+        project.description = entity.description
+        project.status = entity.status
+        project.updated_at = entity.updated_at
+        project = self.store.projects.put(project)
+        self._publish(project, ChangeType.UPDATED)
+        return project
+
+    async def delete(self, id: uuid.UUID) -> bool:
+        project = self.store.projects.remove(id)
+        if not project:
+            return False
+        for task in self.store.archived_tasks.find("project", (project.tenant_id, project.id)):
+            self.store.archived_tasks.remove(task.id)
+        # Leave a tombstone so delta-syncing clients learn about the delete
+        self.store.tombstones.append(Tombstone(EntityType.PROJECT, project.id, project.tenant_id))
+        self._publish(project, ChangeType.DELETED)
+        return True
+
+class InMemoryTaskRepository(TaskRepository):
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+
+    def _publish(self, task: Task, change_type: ChangeType) -> None:
+        change_broker.dispatch(ChangeEvent(
+            tenant_id=task.tenant_id,
+            entity_type=EntityType.TASK,
+            entity_id=task.id,
+            change_type=change_type,
+            project_id=task.project_id
+        ))
+
+    def _record_transition(
+        self,
+        task: Task,
+        from_status: Optional[TaskStatus],
+        to_status: Optional[TaskStatus],
+        changed_at: datetime
+    ) -> None:
+        self.store.transitions.append(StatusTransition(
+            task.id, task.project_id, task.tenant_id, from_status, to_status, changed_at
+        ))
+
+    def _list(self, index: str, key, include_archived: bool) -> List[Task]:
+        tasks = self.store.tasks.find(index, key)
+        if include_archived:
+            tasks += self.store.archived_tasks.find(index, key)
+        return tasks
+
+    async def create(self, entity: Task) -> Task:
+        task = self.store.tasks.put(entity)
+        self._record_transition(task, None, task.status, task.created_at)
+        self._publish(task, ChangeType.CREATED)
+        return task
+
+    async def get_by_id(self, id: uuid.UUID) -> Optional[Task]:
+        return self.store.tasks.get(id)
+
+    async def get_by_tenant_and_id(self, tenant_id: uuid.UUID, task_id: uuid.UUID) -> Optional[Task]:
+        task = self.store.tasks.get(task_id)
+        return task if task and task.tenant_id == tenant_id else None
+
+    async def get_by_project(self, project_id: uuid.UUID, tenant_id: uuid.UUID, include_archived: bool = False) -> List[Task]:
+        return self._list("project", (tenant_id, project_id), include_archived)
+
+    async def get_by_assignee(self, user_id: uuid.UUID, tenant_id: uuid.UUID, include_archived: bool = False) -> List[Task]:
+        return self._list("assignee", (tenant_id, user_id), include_archived)
+
+    async def get_by_status(self, tenant_id: uuid.UUID, status: TaskStatus, include_archived: bool = False) -> List[Task]:
+        return self._list("status", (tenant_id, status), include_archived)
+
+    async def get_updated_since(self, tenant_id: uuid.UUID, since: Optional[datetime]) -> List[Task]:
+        tasks = self.store.tasks.find("tenant", tenant_id)
+        if since is not None:
+            tasks = [task for task in tasks if task.updated_at > since]
+        return sorted(tasks, key=lambda task: (task.updated_at, task.id))
+
+    async def update(self, entity: Task) -> Task:
+        task = self.store.tasks.get(entity.id)
+        if not task:
+            raise ValueError("Task not found")
+        if task.status != entity.status:
+            self._record_transition(task, task.status, entity.status, entity.updated_at)
+        task.title = entity.title
+        task.description = entity.description
+        task.status = entity.status
+        task.priority = entity.priority
+        task.assigned_to = entity.assigned_to
+        task.due_date = entity.due_date
+        task.updated_at = entity.updated_at
+        task = self.store.tasks.put(task)
+        self._publish(task, ChangeType.UPDATED)
+        return task
+
+    async def delete(self, id: uuid.UUID) -> bool:
+        task = self.store.tasks.remove(id)
+        if not task:
+            return False
+        # Leave a tombstone so delta-syncing clients learn about the delete
+        self.store.tombstones.append(Tombstone(EntityType.TASK, task.id, task.tenant_id))
+        self._record_transition(task, task.status, None, datetime.utcnow())
+        self._publish(task, ChangeType.DELETED)
+        return True
@@ -0,0 +1,84 @@
+# backend/infrastructure/memory/store.py
+"""
+Process-local storage for the in-memory repositories.
+
+Every table keeps its rows by id plus one hash index per lookup the
+repositories make, so reads never scan. Rows are copied on the way in
+and out: callers mutate entities before calling update(), and a shared
+object would change stored state and leave the indexes stale.
+"""
+import copy
+from typing import Callable, Dict, Generic, Hashable, List, Optional, TypeVar
+import uuid
+
+from domain.entities.change import Tombstone
+from domain.entities.flow import StatusTransition
+
+T = TypeVar("T")
+
+class IndexedTable(Generic[T]):
+    def __init__(self, **indexes: Callable[[T], Hashable]):
+        self.rows: Dict[uuid.UUID, T] = {}
+        self.key_functions = indexes
+        # Ids per key in a dict rather than a set, so listings keep insertion order like a heap scan
+        self.indexes: Dict[str, Dict[Hashable, Dict[uuid.UUID, None]]] = {name: {} for name in indexes}
+
+    def get(self, id: uuid.UUID) -> Optional[T]:
+        row = self.rows.get(id)
+        return copy.copy(row) if row is not None else None
+
+    def find(self, index: str, key: Hashable) -> List[T]:
+        return [copy.copy(self.rows[id]) for id in self.indexes[index].get(key, ())]
+
+    def put(self, row: T) -> T:
+        """Insert or replace the row with row.id"""
+        self._unindex(row.id)
+        stored = copy.copy(row)
+        self.rows[row.id] = stored
+        for name, key_function in self.key_functions.items():
+            self.indexes[name].setdefault(key_function(stored), {})[row.id] = None
+        return copy.copy(stored)
+
+    def remove(self, id: uuid.UUID) -> Optional[T]:
+        row = self._unindex(id)
+        if row is not None:
+            del self.rows[id]
+        return row
+
+    def _unindex(self, id: uuid.UUID) -> Optional[T]:
+        row = self.rows.get(id)
+        if row is None:
+            return None
+        for name, key_function in self.key_functions.items():
+            key = key_function(row)
+            ids = self.indexes[name][key]
+            del ids[id]
+            if not ids:
+                del self.indexes[name][key]
+        return row
+
+def task_table() -> IndexedTable:
+    return IndexedTable(
+        tenant=lambda task: task.tenant_id,
+        project=lambda task: (task.tenant_id, task.project_id),
+        assignee=lambda task: (task.tenant_id, task.assigned_to),
+        status=lambda task: (task.tenant_id, task.status)
+    )
+
+class InMemoryStore:
+    """Tenants, users, projects and tasks, with the tombstones and transitions their writes leave"""
+    def __init__(self):
+        self.tenants = IndexedTable(domain=lambda tenant: tenant.domain)
+        self.users = IndexedTable(
+            email=lambda user: user.email,
+            tenant=lambda user: user.tenant_id,
+            email_and_tenant=lambda user: (user.email, user.tenant_id)
+        )
+        self.projects = IndexedTable(
+            tenant=lambda project: project.tenant_id,
+            status=lambda project: (project.tenant_id, project.status)
+        )
+        self.tasks = task_table()
+        self.archived_tasks = task_table()
+        self.tombstones: List[Tombstone] = []
+        self.transitions: List[StatusTransition] = []
@@ -0,0 +1,66 @@
+# backend/infrastructure/metrics.py
+"""
+Prometheus metrics served at /metrics.
+
+Every worker process keeps its own registry, so with several uvicorn
+workers each scrape only sees the worker that answered it.
+"""
+from typing import Any, Callable, Dict, Iterator, Optional
+from prometheus_client import Counter, Gauge, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+REQUEST_LABELS = ("method", "route", "status")
+
+http_request_duration = Histogram(
+    "askbob_http_request_duration_seconds", "Time to serve a request", REQUEST_LABELS
+)
+http_requests_in_flight = Gauge("askbob_http_requests_in_flight", "Requests being served right now")
+db_statements_per_request = Histogram(
+    "askbob_db_statements_per_request", "SQL statements a request ran", REQUEST_LABELS,
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+)
+db_time_per_request = Histogram(
+    "askbob_db_time_per_request_seconds", "Time a request spent executing SQL", REQUEST_LABELS
+)
+db_pool_wait_per_request = Histogram(
+    "askbob_db_pool_wait_per_request_seconds", "Time a request waited for pooled connections", REQUEST_LABELS,
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+)
+auth_failures = Counter("askbob_auth_failures_total", "Rejected bearer tokens", ("reason",))
+query_budget_exceeded = Counter(
+    "askbob_query_budget_exceeded_total", "Requests that ran more statements than their route's query budget",
+    ("method", "route")
+)
+event_loop_lag = Histogram(
+    "askbob_event_loop_lag_seconds", "How late the loop monitor's timer fired",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+)
+event_loop_blocks = Counter(
+    "askbob_event_loop_blocks_total", "Times the event loop was blocked past LOOP_BLOCK_THRESHOLD_MS", ("route",)
+)
+request_profiles = Counter("askbob_request_profiles_total", "Requests profiled, by what asked for it", ("trigger",))
+
+class StatsCollector(Collector):
+    """
+    Export the numeric values of a stats dict, such as pool_stats(), as gauges.
+    With a label, stats returns one such dict per label value, e.g. per replica.
+    """
+    def __init__(self, prefix: str, stats: Callable[[], Dict[str, Any]], label: Optional[str] = None):
+        self.prefix = prefix
+        self.stats = stats
+        self.label = label
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        groups = self.stats() if self.label else {None: self.stats()}
+        families: Dict[str, GaugeMetricFamily] = {}
+        for label_value, stats in groups.items():
+            for name, value in stats.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    if name not in families:
+                        families[name] = GaugeMetricFamily(
+                            f"{self.prefix}_{name}", f"{self.prefix} {name.replace('_', ' ')}",
+                            labels=[self.label] if self.label else []
+                        )
+                    families[name].add_metric([label_value] if self.label else [], value)
+        yield from families.values()
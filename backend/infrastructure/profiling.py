@@ -0,0 +1,214 @@
+# backend/infrastructure/profiling.py
+"""
+Profiles of single requests, taken on demand (see api/profiling_middleware.py).
+
+While a profiled request is in flight, a StackSampler thread wakes every
+PROFILING_INTERVAL_MS and records where that request is. If the
+request's task is the one running, that is the event loop thread's
+stack. Otherwise it is the chain of coroutines the request is suspended
+in, ending in "(waiting)", so time spent awaiting the database shows up
+under the call that awaited it. Other requests sharing the loop are left
+out, which a thread-wide profiler like cProfile can't do.
+
+Each sample is weighted by the microseconds since the previous one. The
+sampler has to wait for the GIL, so while the request computes, samples
+come less often than while it awaits; counting them instead of weighting
+them would understate CPU-bound code. The weights are written in the
+collapsed format that flamegraph.pl and speedscope read.
+
+Profiles are saved as JSON files in PROFILING_DIR, keeping the newest
+PROFILING_MAX_PROFILES. All workers share the directory, so the admin
+endpoints see every worker's profiles. At most PROFILING_MAX_CONCURRENT
+requests are profiled at once, each for at most PROFILING_MAX_SECONDS.
+"""
+import asyncio
+from collections import Counter
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from types import CodeType, FrameType
+from typing import Any, Dict, List, Optional
+import uuid
+
+WAITING = "(waiting)"
+BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def frame_label(code: CodeType) -> str:
+    """function (file:line), with paths relative to the backend or site-packages"""
+    filename = code.co_filename
+    packages = filename.rfind("site-packages" + os.sep)
+    if packages != -1:
+        filename = filename[packages + len("site-packages") + 1:]
+    elif filename.startswith(BACKEND_ROOT + os.sep):
+        filename = filename[len(BACKEND_ROOT) + 1:]
+    # ";" separates frames in collapsed stacks
+    return f"{code.co_qualname} ({filename}:{code.co_firstlineno})".replace(";", ",")
+
+def running_stack(frame: Optional[FrameType], root: CodeType) -> List[str]:
+    """Labels from the root frame down to frame"""
+    labels = []
+    while frame is not None:
+        labels.append(frame_label(frame.f_code))
+        if frame.f_code is root:
+            break
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+def awaiting_stack(coroutine: Any, root: CodeType) -> List[str]:
+    """Labels from the root coroutine down to the one a suspended task is waiting in"""
+    labels = []
+    while coroutine is not None:
+        frame = getattr(coroutine, "cr_frame", None) or getattr(coroutine, "gi_frame", None)
+        if frame is None:
+            break
+        if frame.f_code is root:
+            labels = []
+        labels.append(frame_label(frame.f_code))
+        coroutine = getattr(coroutine, "cr_await", None) or getattr(coroutine, "gi_yieldfrom", None)
+    labels.append(WAITING)
+    return labels
+
+class StackSampler:
+    """Samples one asyncio task from a separate thread until stopped, or for max_seconds"""
+    def __init__(self, task: asyncio.Task, root: CodeType, interval_seconds: float, max_seconds: float):
+        self.task = task
+        self.root = root
+        self.interval_seconds = interval_seconds
+        self.max_samples = int(max_seconds / interval_seconds)
+        self.loop_thread_id = threading.get_ident()
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        loop = self.task.get_loop()
+        last = time.perf_counter()
+        while not self._stopped.wait(self.interval_seconds) and self.samples < self.max_samples:
+            if asyncio.current_task(loop) is self.task:
+                stack = running_stack(sys._current_frames().get(self.loop_thread_id), self.root)
+            else:
+                stack = awaiting_stack(self.task.get_coro(), self.root)
+            now = time.perf_counter()
+            self.stacks[";".join(stack)] += round((now - last) * 1e6)
+            self.samples += 1
+            last = now
+
+class ProfileStore:
+    """Profiles as {id}.json files; ids are UUIDv7, so file names sort oldest first"""
+    def __init__(self, directory: str, max_profiles: int):
+        self.directory = directory
+        self.max_profiles = max_profiles
+
+    def path(self, profile_id: uuid.UUID) -> str:
+        return os.path.join(self.directory, f"{profile_id}.json")
+
+    def names(self) -> List[str]:
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(name for name in os.listdir(self.directory) if name.endswith(".json"))
+
+    def save(self, profile: Dict[str, Any]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(profile["id"])
+        # Written whole, then renamed, so readers never see half a profile
+        with open(path + ".tmp", "w") as sink:
+            json.dump(profile, sink)
+        os.replace(path + ".tmp", path)
+        for name in self.names()[:-self.max_profiles]:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                # Another worker pruned it first
+                pass
+
+    def get(self, profile_id: uuid.UUID) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path(profile_id)) as source:
+                return json.load(source)
+        except FileNotFoundError:
+            return None
+
+    def recent(self, limit: int) -> List[Dict[str, Any]]:
+        """The newest profiles, without their stacks"""
+        summaries = []
+        for name in reversed(self.names()[-limit:]):
+            profile = self.get(uuid.UUID(name[:-len(".json")]))
+            if profile is not None:
+                profile.pop("stacks")
+                summaries.append(profile)
+        return summaries
+
+def collapsed(profile: Dict[str, Any]) -> str:
+    """One "frame;frame;frame microseconds" line per stack, for flamegraph.pl or speedscope"""
+    return "".join(f"{stack} {microseconds}\n" for stack, microseconds in sorted(profile["stacks"].items()))
+
+def speedscope(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """The profile in speedscope's file format, weighted in milliseconds"""
+    frames: Dict[str, int] = {}
+    samples, weights = [], []
+    for stack, microseconds in profile["stacks"].items():
+        samples.append([frames.setdefault(label, len(frames)) for label in stack.split(";")])
+        weights.append(microseconds / 1000)
+    name = f"{profile['method']} {profile['path']}"
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "askbob",
+        "shared": {"frames": [{"name": label} for label in frames]},
+        "profiles": [{
+            "type": "sampled", "name": name, "unit": "milliseconds",
+            "startValue": 0, "endValue": sum(weights), "samples": samples, "weights": weights
+        }]
+    }
+
+class RequestProfiler:
+    def __init__(self):
+        self.sample_rate = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+        self.interval_seconds = float(os.getenv("PROFILING_INTERVAL_MS", "5")) / 1000
+        self.max_seconds = float(os.getenv("PROFILING_MAX_SECONDS", "30"))
+        self.max_concurrent = int(os.getenv("PROFILING_MAX_CONCURRENT", "2"))
+        self.store = ProfileStore(
+            os.getenv("PROFILING_DIR") or os.path.join(tempfile.gettempdir(), "askbob-profiles"),
+            int(os.getenv("PROFILING_MAX_PROFILES", "100"))
+        )
+        self.active = 0
+
+    def sampled(self) -> bool:
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def start(self, root: CodeType) -> Optional[StackSampler]:
+        """Start sampling the current task, unless enough requests are being profiled already"""
+        if self.active >= self.max_concurrent:
+            return None
+        self.active += 1
+        sampler = StackSampler(asyncio.current_task(), root, self.interval_seconds, self.max_seconds)
+        sampler.start()
+        return sampler
+
+    async def finish(self, sampler: StackSampler, details: Dict[str, Any]) -> Dict[str, Any]:
+        """Stop sampling and save the profile, off the event loop"""
+        try:
+            await asyncio.to_thread(sampler.stop)
+        finally:
+            self.active -= 1
+        profile = {
+            **details, "interval_ms": self.interval_seconds * 1000, "samples": sampler.samples,
+            "stacks": dict(sampler.stacks)
+        }
+        await asyncio.to_thread(self.store.save, profile)
+        return profile
+
+request_profiler = RequestProfiler()
@@ -0,0 +1,4 @@
+from .broker import ChangeBroker, Subscription, change_broker
+from .notifier import publish_change
+
+__all__ = ["ChangeBroker", "Subscription", "change_broker", "publish_change"]
@@ -0,0 +1,160 @@
+# backend/infrastructure/realtime/broker.py
+"""
+Per-worker fan-out of change events to live subscribers.
+
+Each API worker holds a single LISTEN connection to Postgres and hands every
+notification to the in-process subscribers of the matching tenant, so the
+number of database connections does not grow with the number of clients.
+"""
+import asyncio
+import json
+import logging
+import os
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Set
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from domain.entities.change import ChangeEvent, ChangeType, EntityType
+
+logger = logging.getLogger(__name__)
+
+CHANGE_CHANNEL = "askbob_changes"
+
+def encode_event(event: ChangeEvent) -> str:
+    """Serialize a change event compactly (NOTIFY payloads are capped at 8000 bytes)"""
+    return json.dumps({
+        "tenant_id": str(event.tenant_id),
+        "entity_type": event.entity_type.value,
+        "entity_id": str(event.entity_id),
+        "change_type": event.change_type.value,
+        "project_id": str(event.project_id) if event.project_id else None,
+        "occurred_at": event.occurred_at.isoformat()
+    }, separators=(",", ":"))
+
+def decode_event(payload: str) -> ChangeEvent:
+    data = json.loads(payload)
+    return ChangeEvent(
+        tenant_id=uuid.UUID(data["tenant_id"]),
+        entity_type=EntityType(data["entity_type"]),
+        entity_id=uuid.UUID(data["entity_id"]),
+        change_type=ChangeType(data["change_type"]),
+        project_id=uuid.UUID(data["project_id"]) if data["project_id"] else None,
+        occurred_at=datetime.fromisoformat(data["occurred_at"])
+    )
+
+class Subscription:
+    """A bounded mailbox for one connected client"""
+    def __init__(self, tenant_id: uuid.UUID, max_queue_size: int):
+        self.tenant_id = tenant_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        # Set when the client fell behind or events may have been missed;
+        # the client must resynchronise through /sync and reconnect
+        self.needs_resync = False
+
+    def offer(self, event: ChangeEvent) -> None:
+        if self.needs_resync:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.needs_resync = True
+
+    def request_resync(self) -> None:
+        """Flag the subscription and wake its stream, which may be waiting on an empty queue"""
+        if self.needs_resync:
+            return
+        self.needs_resync = True
+        try:
+            self.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            # A full queue doesn't keep the stream waiting
+            pass
+
+class ChangeBroker:
+    def __init__(self):
+        self.max_queue_size = int(os.getenv("REALTIME_QUEUE_SIZE", "100"))
+        self.heartbeat_seconds = float(os.getenv("REALTIME_HEARTBEAT_SECONDS", "15"))
+        self.reconnect_seconds = float(os.getenv("REALTIME_RECONNECT_SECONDS", "2"))
+        self._subscriptions: Dict[uuid.UUID, Set[Subscription]] = defaultdict(set)
+        self._listener_tasks: List[asyncio.Task] = []
+
+    def subscribe(self, tenant_id: uuid.UUID) -> Subscription:
+        subscription = Subscription(tenant_id, self.max_queue_size)
+        self._subscriptions[tenant_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._subscriptions.get(subscription.tenant_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscriptions[subscription.tenant_id]
+
+    def dispatch(self, event: ChangeEvent) -> None:
+        """Hand an event to every subscriber of its tenant without blocking"""
+        for subscription in self._subscriptions.get(event.tenant_id, ()):
+            subscription.offer(event)
+
+    def _request_resync(self) -> None:
+        for subscribers in self._subscriptions.values():
+            for subscription in subscribers:
+                subscription.request_resync()
+
+    async def start(self, *database_urls: str) -> None:
+        """Start one LISTEN connection per database for this worker (Postgres only)"""
+        if self._listener_tasks:
+            return
+        for database_url in database_urls:
+            url = make_url(database_url)
+            if url.get_backend_name() != "postgresql":
+                continue
+            dsn = url.set(drivername="postgresql").render_as_string(hide_password=False)
+            self._listener_tasks.append(asyncio.create_task(self._listen(dsn)))
+
+    async def stop(self) -> None:
+        for task in self._listener_tasks:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._listener_tasks = []
+
+    async def _listen(self, dsn: str) -> None:
+        first_connect = True
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(CHANGE_CHANNEL, self._on_notification)
+                if not first_connect:
+                    # Notifications sent while we were disconnected are lost
+                    self._request_resync()
+                first_connect = False
+                await closed.wait()
+                logger.warning("Change feed LISTEN connection closed, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Change feed LISTEN connection failed, retrying")
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(self.reconnect_seconds)
+
+    def _on_notification(self, connection, pid, channel, payload) -> None:
+        try:
+            event = decode_event(payload)
+        except (ValueError, KeyError):
+            logger.warning("Ignoring malformed change notification: %s", payload)
+            return
+        self.dispatch(event)
+
+change_broker = ChangeBroker()
@@ -0,0 +1,49 @@
+# backend/infrastructure/realtime/notifier.py
+"""
+Publishing of change events from repository write paths.
+
+On Postgres the event is sent with pg_notify inside the writing transaction,
+so it is delivered to every worker's LISTEN connection exactly when the
+write commits and never if it rolls back. Other dialects have no NOTIFY;
+there the event is held on the session and dispatched to this process's
+subscribers after commit.
+"""
+from typing import List
+from sqlalchemy import Text, bindparam, event, func, select, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from domain.entities.change import ChangeEvent
+from .broker import CHANGE_CHANNEL, change_broker, encode_event
+
+_PENDING_KEY = "pending_change_events"
+
+async def publish_change(session: AsyncSession, change: ChangeEvent) -> None:
+    """Publish a change as part of the session's current transaction"""
+    if session.bind.dialect.name == "postgresql":
+        await session.execute(select(func.pg_notify(CHANGE_CHANNEL, encode_event(change))))
+    else:
+        session.sync_session.info.setdefault(_PENDING_KEY, []).append(change)
+
+async def publish_changes(session: AsyncSession, changes: List[ChangeEvent]) -> None:
+    """Publish a batch of changes like publish_change, with one statement on Postgres"""
+    if not changes:
+        return
+    if session.bind.dialect.name == "postgresql":
+        await session.execute(
+            text("SELECT pg_notify(:channel, payload) FROM unnest(:payloads) AS payload")
+            .bindparams(bindparam("payloads", type_=ARRAY(Text))),
+            {"channel": CHANGE_CHANNEL, "payloads": [encode_event(change) for change in changes]}
+        )
+    else:
+        session.sync_session.info.setdefault(_PENDING_KEY, []).extend(changes)
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_pending_changes(session: Session) -> None:
+    for change in session.info.pop(_PENDING_KEY, []):
+        change_broker.dispatch(change)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1 @@
+"""Maintenance jobs, run from the backend directory with ``python -m jobs.<name>``."""
@@ -0,0 +1,19 @@
+# backend/jobs/archive_tasks.py - Run periodically (e.g. nightly from cron)
+import asyncio
+from infrastructure.database.connection import dispose_engines, shard_sessions
+from infrastructure.database.repositories.task_archive_repository_impl import TaskArchiveRepositoryImpl
+from application.use_cases.archive_use_cases import ArchiveUseCases
+
+async def main():
+    """Move done tasks past each tenant's threshold into tasks_archive on every shard"""
+    try:
+        for shard, session_factory in shard_sessions.items():
+            async with session_factory() as session:
+                archive_use_cases = ArchiveUseCases(TaskArchiveRepositoryImpl(session))
+                archived = await archive_use_cases.archive_completed_tasks()
+                print(f"Archived {archived} completed tasks on shard {shard}")
+    finally:
+        await dispose_engines()
+
+if __name__ == "__main__":
+    asyncio.run(main())
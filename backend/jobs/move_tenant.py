@@ -0,0 +1,22 @@
+# backend/jobs/move_tenant.py - Run by hand: python -m jobs.move_tenant <tenant_id> <shard> [--purge-source]
+import argparse
+import asyncio
+import logging
+import uuid
+from infrastructure.database.sharding import shard_directory
+from infrastructure.database.tenant_mover import TenantMover
+
+async def main():
+    """Move one tenant's rows to another shard while it keeps serving reads and most writes"""
+    parser = argparse.ArgumentParser(description="Move a tenant to another shard")
+    parser.add_argument("tenant_id", type=uuid.UUID)
+    parser.add_argument("shard", help="Target shard name from DATABASE_SHARD_URLS, or 'default'")
+    parser.add_argument("--purge-source", action="store_true", help="Delete the tenant from its old shard afterwards")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    await TenantMover(shard_directory).move(args.tenant_id, args.shard, purge_source=args.purge_source)
+    print(f"Moved tenant {args.tenant_id} to shard {args.shard}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,34 @@
+# backend/jobs/partition_tasks.py - Run by hand after the "prepare hash partitioned tasks" migration
+import argparse
+import asyncio
+import logging
+from infrastructure.database.connection import shard_sessions
+from infrastructure.database.partitioning import STATE_PARTITIONED, STATE_PREPARED, TaskPartitionMigrator
+
+async def main():
+    """Backfill the partitioned tasks table on every shard, then swap it in"""
+    parser = argparse.ArgumentParser(description="Switch tasks to hash partitioning online")
+    parser.add_argument("--no-swap", action="store_true", help="Only backfill; swap in a later run")
+    parser.add_argument("--drop-old", action="store_true", help="Drop tasks_unpartitioned after the swap")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    for shard, session_factory in shard_sessions.items():
+        migrator = TaskPartitionMigrator(session_factory)
+        state = await migrator.state()
+        if state == STATE_PREPARED:
+            batches = await migrator.backfill()
+            print(f"Backfilled tasks_partitioned in {batches} batches on shard {shard}")
+            if not args.no_swap:
+                await migrator.swap()
+                state = STATE_PARTITIONED
+                print(f"Swapped in partitioned tasks on shard {shard}")
+        elif state != STATE_PARTITIONED:
+            print(f"Shard {shard} has no tasks_partitioned; run alembic upgrade head first")
+            continue
+        if state == STATE_PARTITIONED and args.drop_old:
+            await migrator.drop_unpartitioned()
+            print(f"Dropped tasks_unpartitioned on shard {shard}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,25 @@
+# backend/jobs/purge_tombstones.py - Run periodically (e.g. daily from cron)
+import asyncio
+from infrastructure.database.connection import dispose_engines, shard_sessions
+from infrastructure.database.repositories.project_repository_impl import ProjectRepositoryImpl
+from infrastructure.database.repositories.task_repository_impl import TaskRepositoryImpl
+from infrastructure.database.repositories.tombstone_repository_impl import TombstoneRepositoryImpl
+from application.use_cases.sync_use_cases import SyncUseCases
+
+async def main():
+    """Delete sync tombstones older than SYNC_TOMBSTONE_RETENTION_DAYS on every shard"""
+    try:
+        for shard, session_factory in shard_sessions.items():
+            async with session_factory() as session:
+                sync_use_cases = SyncUseCases(
+                    ProjectRepositoryImpl(session),
+                    TaskRepositoryImpl(session),
+                    TombstoneRepositoryImpl(session)
+                )
+                purged = await sync_use_cases.purge_expired_tombstones()
+                print(f"Purged {purged} expired tombstones on shard {shard}")
+    finally:
+        await dispose_engines()
+
+if __name__ == "__main__":
+    asyncio.run(main())
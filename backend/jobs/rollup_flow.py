@@ -0,0 +1,19 @@
+# backend/jobs/rollup_flow.py - Run periodically (e.g. every few minutes from cron)
+import asyncio
+from infrastructure.database.connection import dispose_engines, shard_sessions
+from infrastructure.database.repositories.flow_repository_impl import FlowRepositoryImpl
+from application.use_cases.flow_use_cases import FlowUseCases
+
+async def main():
+    """Fold task status transitions recorded since the last run into the daily rollups of every shard"""
+    try:
+        for shard, session_factory in shard_sessions.items():
+            async with session_factory() as session:
+                flow_use_cases = FlowUseCases(FlowRepositoryImpl(session))
+                projects = await flow_use_cases.refresh_rollups()
+                print(f"Refreshed flow rollups for {projects} projects on shard {shard}")
+    finally:
+        await dispose_engines()
+
+if __name__ == "__main__":
+    asyncio.run(main())
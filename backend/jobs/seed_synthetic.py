@@ -0,0 +1,148 @@
+# backend/jobs/seed_synthetic.py - Run by hand: python -m jobs.seed_synthetic [--tenants N] [--tasks N] [--seed N]
+"""
+Loads a synthetic multi-tenant dataset (infrastructure/database/synthetic_data.py)
+into DATABASE_URL for capacity testing, through asyncpg COPY.
+
+Tenants, users and projects go first, in one transaction. Tasks follow in
+loads of about --chunk-size, each generated and copied by one of --workers
+processes over its own connection, largest loads first. The rows depend
+only on the settings, never on the number of workers. Rerunning with the
+same --seed fails on the tenant domains, so pass another seed to add more
+tenants, or --schema to load into a fresh scratch schema.
+
+Only the default shard is seeded, and no activity, transitions or
+rollups are written. Every user's password is --password.
+
+The rows are consistent by construction, so --skip-fk-checks copies tasks
+with session_replication_role = replica, which skips the foreign key
+triggers (and every other ordinary trigger) and more than doubles COPY
+throughput. It needs a superuser.
+"""
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from infrastructure.auth.jwt_handler import JWTHandler
+from infrastructure.database.models import Base
+from infrastructure.database.settings import DatabaseSettings
+from infrastructure.database.synthetic_data import (
+    PROJECT_COLUMNS, TASK_COLUMNS, TENANT_COLUMNS, USER_COLUMNS, SyntheticSettings, TenantPlan, directory_rows,
+    pack_chunks, plan_tenants, summarize, task_rows
+)
+
+def server_settings(schema: Optional[str]) -> Dict[str, str]:
+    return {"search_path": schema} if schema else {}
+
+async def create_tables(url: str, schema: Optional[str]) -> None:
+    """The model tables, in a freshly recreated schema if one is given"""
+    engine = create_async_engine(url, connect_args={"server_settings": server_settings(schema)})
+    try:
+        async with engine.begin() as connection:
+            if schema:
+                await connection.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+                await connection.execute(text(f"CREATE SCHEMA {schema}"))
+            await connection.run_sync(Base.metadata.create_all)
+    finally:
+        await engine.dispose()
+
+async def copy_directory(dsn: str, schema: Optional[str], plans: List[TenantPlan], settings: SyntheticSettings,
+                         hashed_password: str) -> None:
+    tenants, users, projects = [], [], []
+    for plan in plans:
+        tenant, tenant_users, tenant_projects = directory_rows(plan, settings, hashed_password)
+        tenants.append(tenant)
+        users += tenant_users
+        projects += tenant_projects
+    connection = await asyncpg.connect(dsn, server_settings=server_settings(schema))
+    try:
+        if await connection.fetchval("SELECT 1 FROM tenants WHERE domain = $1", plans[0].domain):
+            raise SystemExit(f"Seed {settings.seed} is already loaded; pass another --seed, or --schema")
+        async with connection.transaction():
+            await connection.copy_records_to_table("tenants", records=tenants, columns=TENANT_COLUMNS)
+            await connection.copy_records_to_table("users", records=users, columns=USER_COLUMNS)
+            await connection.copy_records_to_table("projects", records=projects, columns=PROJECT_COLUMNS)
+    finally:
+        await connection.close()
+
+async def copy_task_load(dsn: str, schema: Optional[str], load: List[Tuple[TenantPlan, int, int]],
+                         settings: SyntheticSettings, skip_fk_checks: bool) -> int:
+    rows = [row for plan, chunk, count in load for row in task_rows(plan, chunk, count, settings)]
+    options = {**server_settings(schema), **({"session_replication_role": "replica"} if skip_fk_checks else {})}
+    connection = await asyncpg.connect(dsn, server_settings=options)
+    try:
+        await connection.copy_records_to_table("tasks", records=rows, columns=TASK_COLUMNS)
+    finally:
+        await connection.close()
+    return len(rows)
+
+def copy_tasks(dsn: str, schema: Optional[str], load: List[Tuple[TenantPlan, int, int]],
+               settings: SyntheticSettings, skip_fk_checks: bool) -> int:
+    """Runs in a worker process, with its own event loop"""
+    return asyncio.run(copy_task_load(dsn, schema, load, settings, skip_fk_checks))
+
+async def analyze(dsn: str, schema: Optional[str]) -> None:
+    connection = await asyncpg.connect(dsn, server_settings=server_settings(schema))
+    try:
+        await connection.execute("ANALYZE tenants, users, projects, tasks")
+    finally:
+        await connection.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--tenants", type=int, default=1000)
+    parser.add_argument("--tasks", type=int, default=1_000_000, help="Tasks over all tenants")
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent of tenant, project and assignee sizes")
+    parser.add_argument("--tasks-per-user", type=int, default=200)
+    parser.add_argument("--tasks-per-project", type=int, default=400)
+    parser.add_argument("--days", type=int, default=365, help="How far back the oldest tenants go")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="Latest creation time; default today's midnight")
+    parser.add_argument("--chunk-size", type=int, default=20_000, help="Tasks per COPY")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--schema", help="Load into this scratch schema, dropped and recreated first")
+    parser.add_argument("--password", default="synthetic-password")
+    parser.add_argument("--skip-fk-checks", action="store_true", help="Skip foreign key triggers on tasks (superuser)")
+    args = parser.parse_args()
+
+    settings = SyntheticSettings(
+        seed=args.seed, tenants=args.tenants, tasks=args.tasks, skew=args.skew, tasks_per_user=args.tasks_per_user,
+        tasks_per_project=args.tasks_per_project, days=args.days, until=args.until, chunk_size=args.chunk_size
+    )
+    url = DatabaseSettings().url
+    dsn = make_url(url).set(drivername="postgresql").render_as_string(hide_password=False)
+    plans = plan_tenants(settings)
+    print(f"Seeding {summarize(plans)}")
+
+    started = time.perf_counter()
+    asyncio.run(create_tables(url, args.schema))
+    asyncio.run(copy_directory(dsn, args.schema, plans, settings, JWTHandler().get_password_hash(args.password)))
+    print(f"Tenants, users and projects copied in {time.perf_counter() - started:.1f}s")
+
+    copied, reported = 0, 0
+    # Forked before any event loop exists in this process; each worker runs its own
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [
+            pool.submit(copy_tasks, dsn, args.schema, load, settings, args.skip_fk_checks)
+            for load in pack_chunks(plans, settings.chunk_size)
+        ]
+        for future in as_completed(futures):
+            copied += future.result()
+            if copied - reported >= settings.tasks // 10:
+                reported = copied
+                elapsed = time.perf_counter() - started
+                print(f"{copied:,} tasks in {elapsed:.1f}s ({copied / elapsed:,.0f}/s)")
+
+    asyncio.run(analyze(dsn, args.schema))
+    largest = plans[0]
+    print(f"Done in {time.perf_counter() - started:.1f}s. Largest tenant: log in as user0@{largest.domain}.example.com")
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,43 @@
 # backend/main.py
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from api.routes import projects, tasks, auth
-from infrastructure.database.connection import engine
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
+from api.consistency_middleware import ConsistencyTokenMiddleware
+from api.metrics_middleware import RequestMetricsMiddleware
+from api.profiling_middleware import ProfilingMiddleware
+from api.tenant_shard_middleware import TenantShardMiddleware
+from api.routes import projects, tasks, auth, sync, events, activity, flow, reports, admin
+from infrastructure.database.connection import (
+    engine, DATABASE_URL, SHARD_URLS, dispose_engines, replica_router, shard_pool_stats
+)
+from infrastructure.database.replicas import CONSISTENCY_HEADER
+from infrastructure.database.sharding import shard_directory
+from infrastructure.realtime.broker import change_broker
+from infrastructure.activity.writer import activity_log_writer
+from infrastructure.loop_monitor import loop_monitor
+from infrastructure.database.pool import pool_stats
+from infrastructure.database.slow_queries import slow_query_log
+from infrastructure.metrics import StatsCollector
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One LISTEN connection per shard and worker feeds all live subscribers
+    await change_broker.start(DATABASE_URL, *SHARD_URLS.values())
+    await activity_log_writer.start()
+    await loop_monitor.start()
+    yield
+    await loop_monitor.stop()
+    # Drain queued activity entries before the worker exits
+    await activity_log_writer.stop()
+    await change_broker.stop()
+    await dispose_engines()
 
 app = FastAPI(
     title="AskBob Project Management API",
     description="Multi-tenant project management system with Clean Architecture",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware for React frontend
@@ -17,12 +47,38 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[CONSISTENCY_HEADER],
 )
 
+# Keeps a client's reads on the primary until replicas have its latest write
+app.add_middleware(ConsistencyTokenMiddleware, router=replica_router)
+
+# Points each request's database sessions at its tenant's shard
+app.add_middleware(TenantShardMiddleware, directory=shard_directory)
+
+# Profiles the middleware above too when asked to; see api/profiling_middleware.py
+app.add_middleware(ProfilingMiddleware)
+
+# Outermost, so the queries of the middleware above count towards the request
+app.add_middleware(RequestMetricsMiddleware)
+
+REGISTRY.register(StatsCollector("askbob_db_pool", lambda: pool_stats(engine)))
+REGISTRY.register(StatsCollector("askbob_db_shard_pool", shard_pool_stats, label="shard"))
+REGISTRY.register(StatsCollector("askbob_db_replica_pool", replica_router.pool_stats, label="replica"))
+REGISTRY.register(StatsCollector("askbob_activity_writer", activity_log_writer.stats))
+REGISTRY.register(StatsCollector("askbob_replicas", replica_router.stats))
+REGISTRY.register(StatsCollector("askbob_slow_queries", slow_query_log.stats))
+
 # Include routers
 app.include_router(auth.router, prefix="/api/v1", tags=["authentication"])
 app.include_router(projects.router, prefix="/api/v1", tags=["projects"])
 app.include_router(tasks.router, prefix="/api/v1", tags=["tasks"])
+app.include_router(sync.router, prefix="/api/v1", tags=["sync"])
+app.include_router(events.router, prefix="/api/v1", tags=["events"])
+app.include_router(activity.router, prefix="/api/v1", tags=["activity"])
+app.include_router(flow.router, prefix="/api/v1", tags=["flow"])
+app.include_router(reports.router, prefix="/api/v1", tags=["reports"])
+app.include_router(admin.router, prefix="/api/v1", tags=["admin"])
 
 @app.get("/")
 async def root():
@@ -30,4 +86,8 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
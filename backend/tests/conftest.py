@@ -0,0 +1,33 @@
+# backend/tests/conftest.py
+"""
+With LOOP_BLOCKING_FAILS=1, each asyncio test runs under a LoopMonitor
+and fails if anything blocked its event loop for more than
+LOOP_BLOCK_THRESHOLD_MS (default 100). The failure shows the offending
+stack and request, as logged in production. Tests that block on purpose
+are marked blocks_loop.
+"""
+import os
+import pytest
+import pytest_asyncio
+
+from infrastructure.loop_monitor import LoopMonitor
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "blocks_loop: blocks the event loop on purpose")
+
+@pytest_asyncio.fixture(autouse=True)
+async def fail_on_blocked_loop(request):
+    # Sync tests have no running loop to watch
+    marker = request.node.get_closest_marker
+    if os.getenv("LOOP_BLOCKING_FAILS") != "1" or marker("asyncio") is None or marker("blocks_loop") is not None:
+        yield
+        return
+    monitor = LoopMonitor()
+    await monitor.start()
+    yield
+    await monitor.stop()
+    if monitor.blocks:
+        pytest.fail("\n".join(
+            f"Blocked the event loop for {block['blocked_ms']}ms+ in {block['method']} {block['route']}:\n{block['stack']}"
+            for block in monitor.blocks
+        ), pytrace=False)
@@ -0,0 +1,82 @@
+# backend/tests/test_activity_log.py
+import pytest
+from unittest.mock import AsyncMock, Mock
+import uuid
+from application.use_cases.task_use_cases import TaskUseCases
+from domain.entities.activity import ActivityEntry
+from domain.entities.change import ChangeType, EntityType
+from domain.entities.task import Task, TaskStatus
+from infrastructure.activity.writer import ActivityLogWriter
+
+class FakeSessionFactory:
+    """Stands in for async_sessionmaker, collecting executed statements"""
+    def __init__(self):
+        self.session = AsyncMock()
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self.session
+
+    async def __aexit__(self, *args):
+        return False
+
+def make_entry() -> ActivityEntry:
+    return ActivityEntry(
+        tenant_id=uuid.uuid4(),
+        project_id=uuid.uuid4(),
+        entity_type=EntityType.TASK,
+        entity_id=uuid.uuid4(),
+        action=ChangeType.CREATED
+    )
+
+class TestActivityLogWriter:
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_and_counts(self, monkeypatch):
+        """Test that recording never blocks and overflow is counted"""
+        monkeypatch.setenv("ACTIVITY_QUEUE_SIZE", "2")
+        writer = ActivityLogWriter(FakeSessionFactory())
+
+        for _ in range(5):
+            writer.record(make_entry())
+
+        assert writer.enqueued == 2
+        assert writer.dropped == 3
+
+    @pytest.mark.asyncio
+    async def test_stop_drains_queue_in_batches(self):
+        """Test that shutdown writes everything queued using batched inserts"""
+        factory = FakeSessionFactory()
+        writer = ActivityLogWriter(factory)
+        writer.batch_size = 2
+
+        for _ in range(5):
+            writer.record(make_entry())
+        await writer.start()
+        await writer.stop()
+
+        assert writer.written == 5
+        assert writer.batches == 3
+        assert factory.session.execute.await_count == 3
+
+class TestTaskActivity:
+    @pytest.mark.asyncio
+    async def test_update_records_changed_fields(self):
+        """Test that a task update emits who changed which fields"""
+        tenant_id = uuid.uuid4()
+        actor_id = uuid.uuid4()
+        task = Task(title="Task", project_id=uuid.uuid4(), tenant_id=tenant_id, created_by=actor_id)
+        task_repository = AsyncMock()
+        task_repository.get_by_tenant_and_id.return_value = task
+        task_repository.update.side_effect = lambda entity: entity
+        activity_log = Mock()
+        use_cases = TaskUseCases(task_repository, AsyncMock(), activity_log)
+
+        await use_cases.update_task(task.id, tenant_id, status=TaskStatus.IN_PROGRESS, actor_id=actor_id)
+
+        entry = activity_log.record.call_args[0][0]
+        assert entry.action == ChangeType.UPDATED
+        assert entry.actor_id == actor_id
+        assert entry.project_id == task.project_id
+        assert entry.changes == {"status": ["todo", "in_progress"]}
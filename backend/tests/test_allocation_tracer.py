@@ -0,0 +1,83 @@
+# backend/tests/test_allocation_tracer.py
+import asyncio
+import pytest
+
+from infrastructure.allocation_tracer import AllocationTracer
+
+def allocate(blocks: int) -> list:
+    return [bytearray(1024) for _ in range(blocks)]
+
+ALLOCATING_LINE = allocate.__code__.co_firstlineno + 1
+
+@pytest.fixture
+def tracer(monkeypatch):
+    monkeypatch.setenv("TRACEMALLOC_MAX_FRAMES", "5")
+    monkeypatch.setenv("TRACEMALLOC_MAX_SNAPSHOTS", "2")
+    return AllocationTracer()
+
+class TestAllocationTracer:
+    @pytest.mark.asyncio
+    async def test_diff_points_at_the_allocating_line(self, tracer):
+        """Test that growth between two snapshots is attributed to the line that allocated it"""
+        await tracer.start(frames=50)
+        try:
+            first = (await asyncio.to_thread(tracer.take_snapshot, limit=5))["id"]
+            held = allocate(2000)
+            second = (await asyncio.to_thread(tracer.take_snapshot, limit=5))["id"]
+        finally:
+            await tracer.stop()
+
+        by_line = await asyncio.to_thread(tracer.diff, first, second, "lineno", limit=3)
+        by_traceback = await asyncio.to_thread(tracer.diff, first, second, "traceback", limit=1)
+        top = by_line["entries"][0]
+        assert (top["file"], top["line"]) == (__file__, ALLOCATING_LINE)
+        assert top["size_diff"] > 2000 * 1024 and top["count_diff"] >= 2000
+        assert by_traceback["entries"][0]["traceback"][-1] == f"{__file__}:{ALLOCATING_LINE}"
+        assert tracer.frames == 5 and not tracer.status()["tracing"]
+        assert len(held) == 2000
+
+    @pytest.mark.asyncio
+    async def test_only_the_newest_snapshots_are_kept(self, tracer):
+        """Test that snapshots past TRACEMALLOC_MAX_SNAPSHOTS are dropped, and that one session runs at a time"""
+        await tracer.start(frames=1)
+        try:
+            ids = [(await asyncio.to_thread(tracer.take_snapshot, limit=1))["id"] for _ in range(3)]
+            with pytest.raises(ValueError):
+                await tracer.start(frames=1)
+        finally:
+            await tracer.stop()
+
+        assert [snapshot["id"] for snapshot in tracer.status()["snapshots"]] == ids[1:]
+        with pytest.raises(LookupError):
+            tracer.diff(ids[0], ids[2], "lineno", limit=1)
+        with pytest.raises(ValueError):
+            tracer.take_snapshot(limit=1)
+
+    @pytest.mark.asyncio
+    async def test_route_peaks(self, tracer):
+        """Test that listed routes record their peak, one request at a time, and other routes don't"""
+        await tracer.start(frames=1)
+        try:
+            measurement = tracer.begin_request({"method": "GET", "path": "/api/v1/projects/7b1c/tasks"})
+            # Only one request is measured at a time
+            assert tracer.begin_request({"method": "GET", "path": "/api/v1/projects"}) is None
+            del allocate(4096)[:]
+            tracer.end_request(measurement)
+            assert tracer.begin_request({"method": "POST", "path": "/api/v1/projects"}) is None
+            assert tracer.begin_request({"method": "GET", "path": "/api/v1/projects/7b1c"}) is None
+            routes = tracer.status()["routes"]
+        finally:
+            await tracer.stop()
+
+        peaks = routes["GET /api/v1/projects/{project_id}/tasks"]
+        assert list(routes) == ["GET /api/v1/projects/{project_id}/tasks"]
+        assert peaks["requests"] == 1 and peaks["max_bytes"] > 4096 * 1024
+
+    @pytest.mark.asyncio
+    async def test_tracing_stops_after_max_seconds(self, tracer):
+        """Test that a forgotten session is stopped by itself"""
+        tracer.max_seconds = 0
+        await tracer.start(frames=1)
+        await asyncio.sleep(1.2)
+
+        assert not tracer.active and "TRACEMALLOC_MAX_SECONDS" in tracer.stop_reason
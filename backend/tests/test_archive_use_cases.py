@@ -0,0 +1,42 @@
+# backend/tests/test_archive_use_cases.py
+import pytest
+from unittest.mock import AsyncMock
+from datetime import datetime, timedelta
+import uuid
+from application.use_cases.archive_use_cases import ArchiveUseCases
+
+NOW = datetime(2024, 6, 30)
+
+class TestArchiveUseCases:
+    @pytest.fixture
+    def archive_repository(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def archive_use_cases(self, archive_repository, monkeypatch):
+        monkeypatch.setenv("TASK_ARCHIVE_AFTER_DAYS", "365")
+        monkeypatch.setenv("TASK_ARCHIVE_BATCH_SIZE", "10")
+        return ArchiveUseCases(archive_repository)
+
+    @pytest.mark.asyncio
+    async def test_thresholds_per_tenant(self, archive_use_cases, archive_repository):
+        """Test that tenants use their own threshold, the default, or opt out with 0"""
+        custom, default, disabled = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        archive_repository.get_tenant_thresholds.return_value = {custom: 30, default: None, disabled: 0}
+        archive_repository.archive_completed.return_value = 0
+
+        await archive_use_cases.archive_completed_tasks(now=NOW)
+
+        calls = {call.args[0]: call.args[1] for call in archive_repository.archive_completed.await_args_list}
+        assert calls == {custom: NOW - timedelta(days=30), default: NOW - timedelta(days=365)}
+
+    @pytest.mark.asyncio
+    async def test_archives_in_batches_until_short(self, archive_use_cases, archive_repository):
+        """Test that a tenant is archived batch by batch until a batch comes back short"""
+        archive_repository.get_tenant_thresholds.return_value = {uuid.uuid4(): None}
+        archive_repository.archive_completed.side_effect = [10, 10, 3]
+
+        archived = await archive_use_cases.archive_completed_tasks(now=NOW)
+
+        assert archived == 23
+        assert archive_repository.archive_completed.await_count == 3
@@ -1,8 +1,6 @@
 # backend/tests/test_auth.py
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
 import os
 import sys
 
@@ -10,34 +8,13 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from main import app
-from infrastructure.database.connection import get_db_session
-from infrastructure.database.models import Base
-
-# Test database URL (use in-memory SQLite for tests)
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
-
-@pytest.fixture
-async def test_db():
-    """Create test database"""
-    engine = create_async_engine(TEST_DATABASE_URL, echo=True)
-    
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    
-    yield async_session
-    
-    await engine.dispose()
+from api.dependencies import in_memory_overrides
+from infrastructure.memory import InMemoryStore
 
 @pytest.fixture
-def client(test_db):
-    """Create test client with test database"""
-    async def override_get_db():
-        async with test_db() as session:
-            yield session
-    
-    app.dependency_overrides[get_db_session] = override_get_db
+def client():
+    """Create test client with in-memory repositories"""
+    app.dependency_overrides.update(in_memory_overrides(InMemoryStore()))
     yield TestClient(app)
     app.dependency_overrides.clear()
 
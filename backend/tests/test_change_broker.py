@@ -0,0 +1,87 @@
+# backend/tests/test_change_broker.py
+import asyncio
+import pytest
+from unittest.mock import Mock
+import uuid
+from api.routes import events
+from domain.entities.change import ChangeEvent, ChangeType, EntityType
+from infrastructure.realtime.broker import ChangeBroker, decode_event, encode_event
+
+def make_event(tenant_id: uuid.UUID) -> ChangeEvent:
+    return ChangeEvent(
+        tenant_id=tenant_id,
+        entity_type=EntityType.TASK,
+        entity_id=uuid.uuid4(),
+        change_type=ChangeType.UPDATED,
+        project_id=uuid.uuid4()
+    )
+
+class TestChangeBroker:
+    @pytest.mark.asyncio
+    async def test_dispatch_is_tenant_scoped(self):
+        """Test that subscribers only receive their own tenant's events"""
+        broker = ChangeBroker()
+        tenant_id = uuid.uuid4()
+        own = broker.subscribe(tenant_id)
+        other = broker.subscribe(uuid.uuid4())
+
+        event = make_event(tenant_id)
+        broker.dispatch(event)
+
+        assert own.queue.get_nowait() is event
+        assert other.queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_is_flagged_for_resync(self):
+        """Test that a full mailbox drops events and asks the client to resync"""
+        broker = ChangeBroker()
+        broker.max_queue_size = 2
+        tenant_id = uuid.uuid4()
+        subscription = broker.subscribe(tenant_id)
+
+        for _ in range(3):
+            broker.dispatch(make_event(tenant_id))
+
+        assert subscription.needs_resync is True
+        assert subscription.queue.qsize() == 2
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_stops_delivery(self):
+        """Test that unsubscribed clients no longer receive events"""
+        broker = ChangeBroker()
+        tenant_id = uuid.uuid4()
+        subscription = broker.subscribe(tenant_id)
+        broker.unsubscribe(subscription)
+
+        broker.dispatch(make_event(tenant_id))
+
+        assert subscription.queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_resync_wakes_a_waiting_stream(self, monkeypatch):
+        """Test that a resync after a LISTEN reconnect reaches an idle stream at once, not at the next heartbeat"""
+        broker = ChangeBroker()
+        broker.heartbeat_seconds = 60
+        monkeypatch.setattr(events, "change_broker", broker)
+        subscription = broker.subscribe(uuid.uuid4())
+        stream = events._event_stream(Mock(), subscription)
+        await stream.__anext__()
+        waiting = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0.01)
+
+        broker._request_resync()
+
+        assert await asyncio.wait_for(waiting, timeout=1) == "event: resync\ndata: {}\n\n"
+        await stream.aclose()
+
+    def test_event_round_trips_through_notify_payload(self):
+        """Test that events survive encoding for pg_notify"""
+        event = make_event(uuid.uuid4())
+
+        decoded = decode_event(encode_event(event))
+
+        assert decoded.tenant_id == event.tenant_id
+        assert decoded.entity_id == event.entity_id
+        assert decoded.change_type == ChangeType.UPDATED
+        assert decoded.project_id == event.project_id
+        assert decoded.occurred_at == event.occurred_at
@@ -0,0 +1,69 @@
+# backend/tests/test_flow_use_cases.py
+import pytest
+from unittest.mock import AsyncMock
+from datetime import date, datetime, timedelta
+import uuid
+from application.use_cases.flow_use_cases import FlowUseCases, forward_fill, replay_transitions
+from domain.entities.flow import DailyStatusCounts, StatusTransition
+from domain.entities.task import TaskStatus
+
+def make_transition(from_status, to_status, changed_at: datetime) -> StatusTransition:
+    return StatusTransition(
+        task_id=uuid.uuid4(),
+        project_id=uuid.uuid4(),
+        tenant_id=uuid.uuid4(),
+        from_status=from_status,
+        to_status=to_status,
+        changed_at=changed_at
+    )
+
+class TestFlowRollups:
+    def test_replay_emits_end_of_day_counts(self):
+        """Test that transitions fold into one snapshot per changed day"""
+        baseline = DailyStatusCounts(day=date(2024, 1, 1), counts={TaskStatus.TODO: 2})
+        transitions = [
+            make_transition(None, TaskStatus.TODO, datetime(2024, 1, 3, 9)),
+            make_transition(TaskStatus.TODO, TaskStatus.IN_PROGRESS, datetime(2024, 1, 3, 17)),
+            make_transition(TaskStatus.IN_PROGRESS, None, datetime(2024, 1, 5, 8))
+        ]
+
+        rollups = replay_transitions(baseline, transitions)
+
+        assert [rollup.day for rollup in rollups] == [date(2024, 1, 3), date(2024, 1, 5)]
+        assert rollups[0].counts[TaskStatus.TODO] == 2
+        assert rollups[0].counts[TaskStatus.IN_PROGRESS] == 1
+        assert rollups[1].counts[TaskStatus.IN_PROGRESS] == 0
+
+    def test_forward_fill_carries_counts_over_quiet_days(self):
+        """Test that the chart has a point for every day in the range"""
+        rollups = [
+            DailyStatusCounts(day=date(2024, 1, 1), counts={TaskStatus.TODO: 1}),
+            DailyStatusCounts(day=date(2024, 1, 4), counts={TaskStatus.DONE: 1})
+        ]
+
+        days = forward_fill(rollups, date(2024, 1, 2), date(2024, 1, 5))
+
+        assert [day.counts[TaskStatus.TODO] for day in days] == [1, 1, 0, 0]
+        assert [day.counts[TaskStatus.DONE] for day in days] == [0, 0, 1, 1]
+
+    @pytest.mark.asyncio
+    async def test_refresh_recomputes_from_earliest_changed_day(self):
+        """Test that only changed projects are rebuilt, starting at their first changed day"""
+        project_id = uuid.uuid4()
+        tenant_id = uuid.uuid4()
+        now = datetime(2024, 1, 10, 12)
+        flow_repository = AsyncMock()
+        flow_repository.get_checkpoint.return_value = datetime(2024, 1, 9)
+        flow_repository.get_changed_projects.return_value = {project_id: (tenant_id, datetime(2024, 1, 8, 23))}
+        flow_repository.get_rollup_before.return_value = None
+        flow_repository.get_transitions.return_value = []
+        use_cases = FlowUseCases(flow_repository)
+
+        processed = await use_cases.refresh_rollups(now)
+
+        until = now - timedelta(seconds=use_cases.settle_seconds)
+        assert processed == 1
+        flow_repository.get_changed_projects.assert_awaited_once_with(datetime(2024, 1, 9), until)
+        flow_repository.get_rollup_before.assert_awaited_once_with(project_id, date(2024, 1, 8))
+        flow_repository.replace_rollups.assert_awaited_once_with(tenant_id, project_id, date(2024, 1, 8), [])
+        flow_repository.set_checkpoint.assert_awaited_once()
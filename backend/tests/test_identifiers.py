@@ -0,0 +1,43 @@
+# backend/tests/test_identifiers.py
+from datetime import datetime
+from domain import identifiers
+from domain.identifiers import uuid7, uuid7_floor, uuid7_time
+
+def freeze_clock(monkeypatch, time_ns: int) -> None:
+    monkeypatch.setattr(identifiers.time, "time_ns", lambda: time_ns)
+
+class TestUuid7:
+    def test_version_and_variant(self):
+        """Test that generated ids are RFC 9562 version 7 UUIDs"""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_monotonic_within_a_millisecond(self, monkeypatch):
+        """Test that ids from the same millisecond still increase"""
+        monkeypatch.setattr(identifiers, "_last_ms", 0)
+        freeze_clock(monkeypatch, 1_700_000_000_000_000_000)
+
+        ids = [uuid7() for _ in range(1000)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+        assert {uuid7_time(value) for value in ids} == {datetime(2023, 11, 14, 22, 13, 20)}
+
+    def test_monotonic_when_clock_steps_back(self, monkeypatch):
+        """Test that a clock moving backwards does not produce smaller ids"""
+        monkeypatch.setattr(identifiers, "_last_ms", 0)
+        freeze_clock(monkeypatch, 1_700_000_000_000_000_000)
+        first = uuid7()
+        freeze_clock(monkeypatch, 1_699_999_999_000_000_000)
+
+        assert uuid7() > first
+
+    def test_floor_bounds_ids_of_later_moments(self):
+        """Test that uuid7_floor can serve as a chronological keyset cursor"""
+        value = uuid7()
+        moment = uuid7_time(value)
+
+        assert uuid7_floor(moment) <= value
+        assert uuid7_floor(datetime(2100, 1, 1)) > value
@@ -0,0 +1,56 @@
+# backend/tests/test_loop_monitor.py
+import asyncio
+import time
+import pytest
+from prometheus_client import REGISTRY
+
+from infrastructure.loop_monitor import LoopMonitor, requests_in_flight
+
+class FakeRoute:
+    path = "/api/v1/things/{thing_id}"
+
+def lag_observations() -> float:
+    return REGISTRY.get_sample_value("askbob_event_loop_lag_seconds_count") or 0.0
+
+@pytest.fixture
+def monitor():
+    monitor = LoopMonitor()
+    monitor.interval_seconds = 0.01
+    monitor.threshold_seconds = 0.1
+    return monitor
+
+def hash_password_slowly() -> None:
+    time.sleep(0.3)
+
+class TestLoopMonitor:
+    @pytest.mark.asyncio
+    @pytest.mark.blocks_loop
+    async def test_blocking_call_is_reported_with_its_request(self, monitor):
+        """Test that a call blocking the loop is caught in the act, with its stack and route"""
+        requests_in_flight[asyncio.current_task()] = {"method": "POST", "path": "/api/v1/things/1", "route": FakeRoute()}
+        await monitor.start()
+        try:
+            await asyncio.sleep(0.05)
+            hash_password_slowly()
+            await asyncio.sleep(0.05)
+        finally:
+            await monitor.stop()
+            requests_in_flight.pop(asyncio.current_task())
+
+        assert len(monitor.blocks) == 1
+        block = monitor.blocks[0]
+        assert (block["method"], block["route"]) == ("POST", "/api/v1/things/{thing_id}")
+        assert block["blocked_ms"] > 100
+        assert "hash_password_slowly" in block["stack"] and "time.sleep" in block["stack"]
+
+    @pytest.mark.asyncio
+    async def test_awaiting_is_not_blocking(self, monitor):
+        """Test that awaits and short callbacks only show up as lag samples"""
+        before = lag_observations()
+        await monitor.start()
+        for _ in range(10):
+            await asyncio.sleep(0.01)
+        await monitor.stop()
+
+        assert list(monitor.blocks) == []
+        assert lag_observations() > before
@@ -0,0 +1,30 @@
+# backend/tests/test_partitioning.py
+from infrastructure.database.models import TaskModel
+from infrastructure.database.partitioning import rename_statements, retire_statements
+
+class TestTaskPartitionSwap:
+    def test_swap_restores_model_names(self):
+        """Test that the swapped-in table ends up with the names TaskModel and its migrations use"""
+        statements = rename_statements("tasks_partitioned", "tasks")
+        renamed_to = {statement.rsplit(" TO ", 1)[1] for statement in statements}
+
+        assert "tasks" in renamed_to
+        assert "tasks_pkey" in renamed_to
+        assert {index.name for index in TaskModel.__table__.indexes} <= renamed_to
+        assert {f"tasks_{key.parent.name}_fkey" for key in TaskModel.__table__.foreign_keys} <= renamed_to
+
+    def test_old_table_is_renamed_before_new_one(self):
+        """Test that the old heap frees every name before the partitioned table takes it"""
+        old = rename_statements("tasks", "tasks_unpartitioned")
+
+        assert old[0] == "ALTER TABLE tasks RENAME TO tasks_unpartitioned"
+        assert all("tasks_partitioned" not in statement for statement in old)
+
+    def test_old_table_loses_its_foreign_keys(self):
+        """Test that the stale heap can't block deleting the projects, users and tenants its rows reference"""
+        statements = retire_statements("tasks_unpartitioned")
+
+        assert {f"tasks_unpartitioned_{key.parent.name}_fkey" for key in TaskModel.__table__.foreign_keys} == {
+            statement.rsplit(" ", 1)[1] for statement in statements
+        }
+        assert all(statement.startswith("ALTER TABLE tasks_unpartitioned DROP CONSTRAINT") for statement in statements)
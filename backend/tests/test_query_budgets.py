@@ -0,0 +1,152 @@
+# backend/tests/test_query_budgets.py
+"""
+Every API route declares how many SQL statements one request may run
+(@query_budget beside the route). This suite drives each route through a
+real database and fails when a request goes over its budget. It uses a
+SQLite file by default. Set TEST_POSTGRES_URL to run it against Postgres,
+where writes also send a notification, in a scratch schema emptied first.
+"""
+import os
+from typing import List
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi.routing import APIRoute
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from api.query_budget import budget_of
+from infrastructure.allocation_tracer import allocation_tracer
+from infrastructure.database.connection import build_engine, get_db_session, get_directory_db_session, get_read_db_session
+from infrastructure.database.instrumentation import QueryStats, instrument_engine
+from infrastructure.database.models import Base
+from infrastructure.database.settings import DatabaseSettings
+from infrastructure.profiling import ProfileStore, request_profiler
+from main import app
+
+TEST_POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+SCHEMA = "query_budgets"
+# Streams never finish, so the ASGI transport can't drive them; their budget covers the setup
+STREAMING_ROUTES = {"/api/v1/events"}
+
+class RecordingApp:
+    """Keeps the QueryStats RequestMetricsMiddleware leaves in each request's scope"""
+    def __init__(self, app):
+        self.app = app
+        self.requests: List[QueryStats] = []
+
+    async def __call__(self, scope, receive, send):
+        await self.app(scope, receive, send)
+        if scope["type"] == "http":
+            self.requests.append(scope["state"]["query_stats"])
+
+async def create_engines(tmp_path):
+    """The writer and reader engines; on SQLite they differ, as in the SQLite profile"""
+    if not TEST_POSTGRES_URL:
+        settings = DatabaseSettings(f"sqlite+aiosqlite:///{tmp_path / 'budgets.db'}")
+        engine = build_engine(settings)
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        return engine, build_engine(settings, readonly=True)
+    engine = create_async_engine(TEST_POSTGRES_URL, connect_args={"server_settings": {"search_path": SCHEMA}})
+    instrument_engine(engine)
+    async with engine.begin() as connection:
+        await connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}"))
+        await connection.run_sync(Base.metadata.create_all)
+        tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+        await connection.execute(text(f"TRUNCATE {tables} CASCADE"))
+    return engine, engine
+
+@pytest_asyncio.fixture
+async def client(tmp_path, monkeypatch):
+    monkeypatch.setenv("ADMIN_API_KEY", "budget-key")
+    monkeypatch.setattr(request_profiler, "store", ProfileStore(str(tmp_path / "profiles"), 10))
+    engine, reader = await create_engines(tmp_path)
+
+    def sessions(bind):
+        async def session():
+            async with AsyncSession(bind, expire_on_commit=False) as session:
+                yield session
+        return session
+
+    app.dependency_overrides[get_db_session] = sessions(engine)
+    app.dependency_overrides[get_directory_db_session] = sessions(engine)
+    app.dependency_overrides[get_read_db_session] = sessions(reader)
+    recorder = RecordingApp(app)
+    transport = httpx.ASGITransport(app=recorder)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        http.recorder = recorder
+        yield http
+    app.dependency_overrides.clear()
+    if allocation_tracer.active:
+        await allocation_tracer.stop()
+    await engine.dispose()
+    await reader.dispose()
+
+async def exercise(client: httpx.AsyncClient) -> None:
+    """Call every route the way the frontend does, including status changes and deletes"""
+    async def call(method: str, path: str, **kwargs) -> httpx.Response:
+        response = await client.request(method, f"/api/v1{path}", **kwargs)
+        assert response.status_code < 400, (method, path, response.text)
+        return response
+
+    credentials = {"email": "owner@acme.example.com", "password": "budget-password"}
+    await call("POST", "/auth/register", json={
+        **credentials, "first_name": "Owner", "last_name": "Acme", "tenant_name": "Acme", "tenant_domain": "acme"
+    })
+    token = (await call("POST", "/auth/login", json=credentials)).json()["access_token"]
+    client.headers["Authorization"] = f"Bearer {token}"
+    await call("GET", "/auth/me")
+
+    project = (await call("POST", "/projects", json={"name": "Launch"})).json()["id"]
+    await call("PUT", f"/projects/{project}", json={"status": "in_progress"})
+    task = (await call("POST", f"/projects/{project}/tasks", json={"title": "Write docs"})).json()["id"]
+    review = (await call("POST", f"/projects/{project}/tasks", json={"title": "Review"})).json()["id"]
+    await call("PUT", f"/tasks/{task}", json={"status": "in_progress"})
+    await call("PUT", f"/tasks/{task}", json={"title": "Write more docs", "status": "done"})
+    await call("GET", "/projects")
+    await call("GET", f"/projects/{project}")
+    await call("GET", f"/projects/{project}/tasks")
+    await call("GET", f"/projects/{project}/tasks", params={"include_archived": "true"})
+    await call("GET", "/sync")
+    await call("GET", f"/projects/{project}/activity")
+    await call("GET", f"/projects/{project}/flow", params={"from": "2026-01-01", "to": "2026-01-31"})
+    await call("GET", "/reports/workload")
+    admin = {"X-Admin-Key": "budget-key"}
+    await call("GET", "/admin/slow-queries", headers=admin)
+    profiled = await call("GET", "/auth/me", headers={**admin, "X-Profile": "1"})
+    await call("GET", "/admin/profiles", headers=admin)
+    await call("GET", f"/admin/profiles/{profiled.headers['X-Profile-Id']}", headers=admin)
+    await call("POST", "/admin/memory/start", headers=admin)
+    first = (await call("POST", "/admin/memory/snapshots", headers=admin)).json()["id"]
+    await call("GET", "/projects")
+    second = (await call("POST", "/admin/memory/snapshots", headers=admin)).json()["id"]
+    await call("GET", "/admin/memory/diff", params={"first": first, "second": second}, headers=admin)
+    await call("GET", "/admin/memory", headers=admin)
+    await call("POST", "/admin/memory/stop", headers=admin)
+    await call("DELETE", f"/tasks/{task}")
+    await call("DELETE", f"/tasks/{review}")
+    await call("DELETE", f"/projects/{project}")
+
+def api_routes() -> List[APIRoute]:
+    return [route for route in app.routes if isinstance(route, APIRoute) and route.path.startswith("/api/")]
+
+class TestQueryBudgets:
+    def test_every_route_declares_a_budget(self):
+        """Test that no API route is missing its query budget"""
+        assert [route.path for route in api_routes() if budget_of(route) is None] == []
+
+    @pytest.mark.asyncio
+    async def test_requests_stay_within_budget(self, client):
+        """Test that no request runs more statements than its route allows, and every route is exercised"""
+        await exercise(client)
+
+        over_budget = [
+            f"{stats.scope['method']} {stats.route}: {stats.statements} statements, budget "
+            f"{budget_of(stats.scope['route'])}"
+            for stats in client.recorder.requests
+            if stats.statements > budget_of(stats.scope["route"])
+        ]
+        exercised = {stats.scope["route"].path for stats in client.recorder.requests}
+        assert over_budget == []
+        assert {route.path for route in api_routes()} - exercised == STREAMING_ROUTES
@@ -0,0 +1,501 @@
+# backend/tests/test_query_plans.py
+"""
+Query-plan regression suite.
+
+Seeds a multi-tenant dataset into a scratch schema and runs every
+repository method with representative parameters. Each method runs in a
+transaction that is rolled back afterwards. The statements it ran are
+EXPLAINed, and the tests check the plans:
+
+- tenant-scoped lookups never Seq Scan a tenant table;
+- the lookups that should be index-only scans still are;
+- every plan matches its snapshot in tests/query_plans/.
+
+Snapshots are plain text, one file per repository, so a model or index
+change shows up as a reviewable diff. Regenerate them with
+UPDATE_QUERY_PLANS=1. Needs Postgres: set TEST_POSTGRES_URL to a
+postgresql+asyncpg URL.
+"""
+import asyncio
+from datetime import date, datetime
+import difflib
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import uuid
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from domain.entities.activity import ActivityEntry
+from domain.entities.change import ChangeType, EntityType
+from domain.entities.flow import DailyStatusCounts
+from domain.entities.project import Project, ProjectStatus
+from domain.entities.task import Task, TaskStatus
+from domain.entities.tenant import Tenant
+from domain.entities.user import User
+from infrastructure.database.models import Base
+from infrastructure.database.repositories.activity_repository_impl import ActivityRepositoryImpl
+from infrastructure.database.repositories.flow_repository_impl import FlowRepositoryImpl
+from infrastructure.database.repositories.project_repository_impl import ProjectRepositoryImpl
+from infrastructure.database.repositories.raw import (
+    AsyncpgProjectRepository, AsyncpgTaskRepository, AsyncpgTenantRepository, AsyncpgUserRepository
+)
+from infrastructure.database.repositories.task_archive_repository_impl import TaskArchiveRepositoryImpl
+from infrastructure.database.repositories.task_report_repository_impl import TaskReportRepositoryImpl
+from infrastructure.database.repositories.task_repository_impl import TaskRepositoryImpl
+from infrastructure.database.repositories.tenant_repository_impl import TenantRepositoryImpl
+from infrastructure.database.repositories.tombstone_repository_impl import TombstoneRepositoryImpl
+from infrastructure.database.repositories.user_repository_impl import UserRepositoryImpl
+from infrastructure.database.slow_queries import EXPLAINABLE
+
+TEST_POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+UPDATE_QUERY_PLANS = os.getenv("UPDATE_QUERY_PLANS") == "1"
+SCHEMA = "query_plans"
+SNAPSHOTS = Path(__file__).parent / "query_plans"
+# asyncpg looks up custom types once per connection, so these come and go with the pool
+ASYNCPG_INTROSPECTION = ("WITH RECURSIVE typeinfo_tree", "SELECT current_setting('jit')", "SELECT set_config('jit'")
+
+# Tenant t gets LARGEST_TENANT_TASKS // t tasks, a long tail behind a few big tenants.
+# Every table stays small enough for ANALYZE to read all of it, so plans are repeatable.
+TENANTS = 40
+LARGEST_TENANT_TASKS = 6000
+# A mid-sized tenant (1,200 tasks, about 5% of the table), used for tenant-scoped lookups
+TENANT = 5
+# Tables that every tenant-scoped lookup must reach through an index
+TENANT_TABLES = {
+    "tasks", "tasks_archive", "projects", "tombstones", "activity_log",
+    "task_status_transitions", "project_flow_daily"
+}
+
+SEED = [
+    f"""CREATE TEMPORARY TABLE sizes AS
+        SELECT t, {LARGEST_TENANT_TASKS} / t AS tasks, 2 + {LARGEST_TENANT_TASKS} / t / 100 AS users,
+               1 + {LARGEST_TENANT_TASKS} / t / 40 AS projects
+        FROM generate_series(1, {TENANTS}) t""",
+    """INSERT INTO tenants (id, name, domain, created_at)
+        SELECT md5('tenant' || t)::uuid, 'Tenant ' || t, 'tenant' || t, timestamp '2025-01-01' FROM sizes""",
+    """INSERT INTO users (id, email, tenant_id, hashed_password, first_name, last_name, is_active, created_at)
+        SELECT md5('user' || t || '-' || u)::uuid, 'user' || u || '@tenant' || t || '.test', md5('tenant' || t)::uuid,
+               'hashed', 'User', u::text, true, timestamp '2025-01-01'
+        FROM sizes, generate_series(1, sizes.users) u""",
+    """INSERT INTO projects (id, name, status, tenant_id, created_by, created_at, updated_at)
+        SELECT md5('project' || t || '-' || p)::uuid, 'Project ' || p,
+               (ARRAY['PLANNING', 'IN_PROGRESS', 'ON_HOLD', 'COMPLETED', 'CANCELLED'])[1 + p % 5]::projectstatus,
+               md5('tenant' || t)::uuid, md5('user' || t || '-1')::uuid,
+               timestamp '2025-01-01' + p * interval '1 day', timestamp '2025-06-01' + (p * 7 % 200) * interval '1 day'
+        FROM sizes, generate_series(1, sizes.projects) p""",
+    """INSERT INTO tasks (id, title, status, priority, project_id, tenant_id, created_by, assigned_to, due_date,
+                          created_at, updated_at)
+        SELECT md5('task' || t || '-' || n)::uuid, 'Task ' || n,
+               (ARRAY['DONE', 'DONE', 'DONE', 'DONE', 'DONE', 'DONE', 'IN_PROGRESS', 'IN_PROGRESS', 'IN_REVIEW', 'TODO'])
+                   [1 + n % 10]::taskstatus,
+               (ARRAY['LOW', 'MEDIUM', 'HIGH', 'URGENT'])[1 + n % 4]::taskpriority,
+               md5('project' || t || '-' || (1 + n % projects))::uuid, md5('tenant' || t)::uuid,
+               md5('user' || t || '-1')::uuid,
+               CASE WHEN n % 10 = 3 THEN NULL ELSE md5('user' || t || '-' || (1 + n % users))::uuid END,
+               CASE WHEN n % 3 = 0 THEN timestamp '2025-03-01' + (n % 300) * interval '1 day' END,
+               timestamp '2025-01-01' + (n % 365) * interval '1 day' + n * interval '1 second',
+               timestamp '2025-01-01' + (n % 365 + n % 30) * interval '1 day' + n * interval '1 second'
+        FROM sizes, generate_series(1, sizes.tasks) n""",
+    """INSERT INTO tasks_archive (id, title, status, priority, project_id, tenant_id, created_by, assigned_to,
+                                  created_at, updated_at, archived_at)
+        SELECT md5('archived' || t || '-' || n)::uuid, 'Archived ' || n, 'DONE', 'MEDIUM',
+               md5('project' || t || '-' || (1 + n % projects))::uuid, md5('tenant' || t)::uuid,
+               md5('user' || t || '-1')::uuid, md5('user' || t || '-' || (1 + n % users))::uuid,
+               timestamp '2024-01-01' + (n % 365) * interval '1 day', timestamp '2024-02-01' + (n % 365) * interval '1 day',
+               timestamp '2024-06-01' + (n % 365) * interval '1 day'
+        FROM sizes, generate_series(1, sizes.tasks / 2) n""",
+    """INSERT INTO task_status_transitions (task_id, project_id, tenant_id, from_status, to_status, changed_at)
+        SELECT id, project_id, tenant_id, NULL::taskstatus, 'TODO'::taskstatus, created_at FROM tasks
+        UNION ALL
+        SELECT id, project_id, tenant_id, 'TODO', 'IN_PROGRESS', created_at + interval '1 day'
+        FROM tasks WHERE status <> 'TODO'
+        UNION ALL
+        SELECT id, project_id, tenant_id, 'IN_PROGRESS', status, updated_at
+        FROM tasks WHERE status IN ('IN_REVIEW', 'DONE')""",
+    """INSERT INTO activity_log (id, tenant_id, project_id, entity_type, entity_id, action, actor_id, changes, created_at)
+        SELECT md5('activity' || id)::uuid, tenant_id, project_id, 'TASK', id, 'CREATED', created_by, '{}', created_at
+        FROM tasks""",
+    """INSERT INTO tombstones (id, entity_type, entity_id, tenant_id, deleted_at)
+        SELECT md5('tombstone' || t || '-' || n)::uuid, 'TASK', md5('deleted' || t || '-' || n)::uuid,
+               md5('tenant' || t)::uuid, timestamp '2025-01-01' + n * interval '7 hours'
+        FROM sizes, generate_series(1, sizes.tasks / 10) n""",
+    """INSERT INTO project_flow_daily (project_id, day, status, tenant_id, task_count)
+        SELECT md5('project' || t || '-' || p)::uuid, date '2025-01-01' + 3 * d,
+               (ARRAY['TODO', 'IN_PROGRESS', 'DONE'])[s]::taskstatus, md5('tenant' || t)::uuid, d * s
+        FROM sizes, generate_series(1, sizes.projects) p, generate_series(0, 99) d, generate_series(1, 3) s""",
+    "INSERT INTO rollup_checkpoints (name, processed_until) VALUES ('project_flow', timestamp '2026-01-31')",
+]
+
+def seeded(kind: str, *key: int) -> uuid.UUID:
+    """The id the seed gave row `key` of `kind`, e.g. seeded("task", 5, 17)"""
+    return uuid.UUID(hashlib.md5(f"{kind}{'-'.join(map(str, key))}".encode()).hexdigest())
+
+class Dataset:
+    """Representative parameters into the seeded data"""
+    tenant = seeded("tenant", TENANT)
+    user = seeded("user", TENANT, 2)
+    email = f"user2@tenant{TENANT}.test"
+    domain = f"tenant{TENANT}"
+    project = seeded("project", TENANT, 2)
+    task = seeded("task", TENANT, 17)
+    # Ids that setups insert for the deletes to remove; creates use seeded("new-...") ids, so snapshots repeat
+    fresh_tenant = seeded("fresh-tenant")
+    fresh_user = seeded("fresh-user")
+    fresh_project = seeded("fresh-project")
+    sync_since = datetime(2026, 1, 20)
+    at = datetime(2026, 2, 1)
+
+    def task_entity(self, **fields) -> Task:
+        return Task(
+            title="Write docs", project_id=self.project, tenant_id=self.tenant, created_by=self.user,
+            status=TaskStatus.DONE, created_at=self.at, updated_at=self.at,
+            id=fields.pop("id", seeded("new-task")), **fields
+        )
+
+    def project_entity(self, **fields) -> Project:
+        return Project(
+            name="Launch", tenant_id=self.tenant, created_by=self.user, status=ProjectStatus.IN_PROGRESS,
+            created_at=self.at, updated_at=self.at, id=fields.pop("id", seeded("new-project")), **fields
+        )
+
+    def user_entity(self, **fields) -> User:
+        return User(
+            email=fields.pop("email", "new@tenant5.test"), tenant_id=self.tenant, hashed_password="hashed",
+            first_name="New", last_name="User", created_at=self.at, id=fields.pop("id", seeded("new-user")), **fields
+        )
+
+    def tenant_entity(self, **fields) -> Tenant:
+        return Tenant(
+            name="New", domain=fields.pop("domain", "new-tenant"), created_at=self.at,
+            id=fields.pop("id", seeded("new-tenant")), **fields
+        )
+
+Call = Callable[[Any, Dataset], Awaitable[Any]]
+
+class PlanCase:
+    def __init__(
+        self,
+        label: str,
+        call: Call,
+        setup: Optional[Call] = None,
+        sweep: bool = False,
+        index_only: Tuple[str, ...] = ()
+    ):
+        self.label = label
+        self.call = call
+        # Runs first, outside the capture, for calls that need a row of their own
+        self.setup = setup
+        # Jobs that walk every tenant may scan whole tables
+        self.sweep = sweep
+        # Tables the case must read with an Index Only Scan
+        self.index_only = index_only
+
+def task_cases() -> List[PlanCase]:
+    """The TaskRepository contract, shared by both backends"""
+    return [
+        PlanCase("create", lambda repo, data: repo.create(data.task_entity())),
+        PlanCase("get_by_id", lambda repo, data: repo.get_by_id(data.task)),
+        PlanCase("get_by_tenant_and_id", lambda repo, data: repo.get_by_tenant_and_id(data.tenant, data.task)),
+        PlanCase("get_by_project", lambda repo, data: repo.get_by_project(data.project, data.tenant)),
+        PlanCase(
+            "get_by_project(include_archived)",
+            lambda repo, data: repo.get_by_project(data.project, data.tenant, include_archived=True)
+        ),
+        PlanCase("get_by_assignee", lambda repo, data: repo.get_by_assignee(data.user, data.tenant)),
+        PlanCase(
+            "get_by_assignee(include_archived)",
+            lambda repo, data: repo.get_by_assignee(data.user, data.tenant, include_archived=True)
+        ),
+        PlanCase("get_by_status", lambda repo, data: repo.get_by_status(data.tenant, TaskStatus.IN_REVIEW)),
+        PlanCase(
+            "get_by_status(include_archived)",
+            lambda repo, data: repo.get_by_status(data.tenant, TaskStatus.IN_REVIEW, include_archived=True)
+        ),
+        PlanCase("get_updated_since", lambda repo, data: repo.get_updated_since(data.tenant, data.sync_since)),
+        PlanCase("get_updated_since(full)", lambda repo, data: repo.get_updated_since(data.tenant, None)),
+        PlanCase("update", lambda repo, data: repo.update(data.task_entity(id=data.task))),
+        PlanCase("delete", lambda repo, data: repo.delete(data.task)),
+    ]
+
+def project_cases() -> List[PlanCase]:
+    return [
+        PlanCase("create", lambda repo, data: repo.create(data.project_entity())),
+        PlanCase("get_by_id", lambda repo, data: repo.get_by_id(data.project)),
+        PlanCase("get_by_tenant_and_id", lambda repo, data: repo.get_by_tenant_and_id(data.tenant, data.project)),
+        PlanCase("get_by_tenant", lambda repo, data: repo.get_by_tenant(data.tenant)),
+        PlanCase("get_by_status", lambda repo, data: repo.get_by_status(data.tenant, ProjectStatus.ON_HOLD)),
+        PlanCase("get_updated_since", lambda repo, data: repo.get_updated_since(data.tenant, data.sync_since)),
+        PlanCase("update", lambda repo, data: repo.update(data.project_entity(id=data.project))),
+        PlanCase(
+            "delete",
+            lambda repo, data: repo.delete(data.fresh_project),
+            setup=lambda repo, data: repo.create(data.project_entity(id=data.fresh_project))
+        ),
+    ]
+
+def user_cases() -> List[PlanCase]:
+    return [
+        PlanCase("create", lambda repo, data: repo.create(data.user_entity())),
+        PlanCase("get_by_id", lambda repo, data: repo.get_by_id(data.user)),
+        PlanCase("get_by_email", lambda repo, data: repo.get_by_email(data.email)),
+        PlanCase("get_by_tenant", lambda repo, data: repo.get_by_tenant(data.tenant)),
+        PlanCase("get_by_email_and_tenant", lambda repo, data: repo.get_by_email_and_tenant(data.email, data.tenant)),
+        PlanCase("update", lambda repo, data: repo.update(data.user_entity(id=data.user, email=data.email))),
+        PlanCase(
+            "delete",
+            lambda repo, data: repo.delete(data.fresh_user),
+            setup=lambda repo, data: repo.create(data.user_entity(id=data.fresh_user))
+        ),
+    ]
+
+def tenant_cases() -> List[PlanCase]:
+    return [
+        PlanCase("create", lambda repo, data: repo.create(data.tenant_entity())),
+        PlanCase("get_by_id", lambda repo, data: repo.get_by_id(data.tenant)),
+        PlanCase("get_by_domain", lambda repo, data: repo.get_by_domain(data.domain)),
+        PlanCase("update", lambda repo, data: repo.update(data.tenant_entity(id=data.tenant, domain=data.domain))),
+        PlanCase(
+            "delete",
+            lambda repo, data: repo.delete(data.fresh_tenant),
+            setup=lambda repo, data: repo.create(data.tenant_entity(id=data.fresh_tenant))
+        ),
+    ]
+
+REPOSITORIES: Dict[type, List[PlanCase]] = {
+    TaskRepositoryImpl: task_cases(),
+    AsyncpgTaskRepository: task_cases(),
+    ProjectRepositoryImpl: project_cases(),
+    AsyncpgProjectRepository: project_cases(),
+    UserRepositoryImpl: user_cases(),
+    AsyncpgUserRepository: user_cases(),
+    TenantRepositoryImpl: tenant_cases(),
+    AsyncpgTenantRepository: tenant_cases(),
+    ActivityRepositoryImpl: [
+        PlanCase("add_many", lambda repo, data: repo.add_many([
+            ActivityEntry(data.tenant, data.project, EntityType.TASK, data.task, ChangeType.UPDATED, created_at=data.at)
+        ])),
+        PlanCase("get_by_project", lambda repo, data: repo.get_by_project(data.tenant, data.project, 50)),
+        PlanCase(
+            "get_by_project(before)",
+            lambda repo, data: repo.get_by_project(data.tenant, data.project, 50, (datetime(2025, 6, 1), data.task))
+        ),
+    ],
+    FlowRepositoryImpl: [
+        PlanCase(
+            "get_rollups",
+            lambda repo, data: repo.get_rollups(data.tenant, data.project, date(2025, 3, 1), date(2025, 3, 31))
+        ),
+        PlanCase("get_checkpoint", lambda repo, data: repo.get_checkpoint("project_flow")),
+        PlanCase(
+            "get_changed_projects",
+            lambda repo, data: repo.get_changed_projects(datetime(2026, 1, 30), data.at), sweep=True
+        ),
+        PlanCase(
+            "get_rollup_before",
+            lambda repo, data: repo.get_rollup_before(data.project, date(2025, 3, 1)),
+            index_only=("project_flow_daily",)
+        ),
+        PlanCase(
+            "get_transitions",
+            lambda repo, data: repo.get_transitions(data.project, datetime(2025, 3, 1), datetime(2025, 3, 31))
+        ),
+        PlanCase("replace_rollups", lambda repo, data: repo.replace_rollups(
+            data.tenant, data.project, date(2025, 3, 1), [DailyStatusCounts(date(2025, 3, 1), {TaskStatus.DONE: 3})]
+        )),
+        PlanCase("set_checkpoint", lambda repo, data: repo.set_checkpoint("project_flow", data.at)),
+    ],
+    TaskArchiveRepositoryImpl: [
+        PlanCase("get_tenant_thresholds", lambda repo, data: repo.get_tenant_thresholds(), sweep=True),
+        PlanCase("archive_completed", lambda repo, data: repo.archive_completed(data.tenant, datetime(2025, 3, 1), 500)),
+    ],
+    TaskReportRepositoryImpl: [
+        PlanCase("get_task_columns", lambda repo, data: repo.get_task_columns(data.tenant)),
+    ],
+    TombstoneRepositoryImpl: [
+        PlanCase("get_since", lambda repo, data: repo.get_since(data.tenant, datetime(2025, 3, 1))),
+        PlanCase("purge_before", lambda repo, data: repo.purge_before(datetime(2025, 1, 8)), sweep=True),
+    ],
+}
+
+class CapturedStatement:
+    def __init__(self, statement: str, parameters: tuple, many: bool):
+        self.statement = statement
+        self.parameters = parameters
+        self.many = many
+        self.plan: Optional[dict] = None
+
+class StatementCapture:
+    """Records what an engine sends while `active`, through the ORM's cursors and asyncpg directly"""
+    def __init__(self, engine: AsyncEngine):
+        self.active = False
+        self.statements: List[CapturedStatement] = []
+        sync_engine = engine.sync_engine
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def _before(connection, cursor, statement, parameters, context, executemany) -> None:
+            self.record(statement, parameters, executemany)
+
+        @event.listens_for(sync_engine, "connect")
+        def _connect(dbapi_connection, connection_record) -> None:
+            # The asyncpg repositories skip the cursor events
+            dbapi_connection.driver_connection.add_query_logger(self._logged)
+
+    def _logged(self, record) -> None:
+        # Connection.executemany logs its list of argument tuples; the ORM's executemany
+        # is also seen by before_cursor_execute, so only single statements are kept here
+        if not isinstance(record.args, list):
+            self.record(record.query, record.args, False)
+
+    def record(self, statement: str, parameters: Any, many: bool) -> None:
+        statement = " ".join(statement.split())
+        if self.active and statement.upper().startswith(EXPLAINABLE) and not statement.startswith(ASYNCPG_INTROSPECTION):
+            self.statements.append(CapturedStatement(statement, tuple(parameters or ()), many))
+
+def render(node: dict, depth: int = 0) -> List[str]:
+    """A plan as indented node lines; costs and row estimates are left out so snapshots stay stable"""
+    line = node["Node Type"]
+    if "Index Name" in node:
+        line += f" using {node['Index Name']}"
+    if "Relation Name" in node:
+        line += f" on {node['Relation Name']}"
+    lines = ["  " * depth + line]
+    for key in ("Index Cond", "Recheck Cond", "Hash Cond", "Join Filter", "Filter", "Sort Key"):
+        if key in node:
+            value = ", ".join(node[key]) if isinstance(node[key], list) else node[key]
+            lines.append("  " * (depth + 2) + f"{key}: {value}")
+    for child in node.get("Plans", []):
+        lines += render(child, depth + 1)
+    return lines
+
+def nodes(node: dict):
+    yield node
+    for child in node.get("Plans", []):
+        yield from nodes(child)
+
+async def seed(engine: AsyncEngine) -> None:
+    async with engine.begin() as connection:
+        await connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        await connection.run_sync(Base.metadata.create_all)
+        for statement in SEED:
+            await connection.execute(text(statement))
+    autocommit = await engine.connect()
+    try:
+        autocommit = await autocommit.execution_options(isolation_level="AUTOCOMMIT")
+        # A sample as large as the tables, and a visibility map for index-only scans
+        await autocommit.execute(text("SET default_statistics_target = 1000"))
+        await autocommit.execute(text("VACUUM ANALYZE"))
+    finally:
+        await autocommit.close()
+
+async def explain_case(engine: AsyncEngine, capture: StatementCapture, repository: type, case: PlanCase):
+    """Run one case inside a transaction that is rolled back, and EXPLAIN what it sent"""
+    data = Dataset()
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        # Commits inside the repositories only release savepoints of this transaction
+        async with AsyncSession(bind=connection, join_transaction_mode="create_savepoint") as session:
+            repo = repository(session)
+            if case.setup is not None:
+                await case.setup(repo, data)
+            capture.statements = []
+            capture.active = True
+            try:
+                await case.call(repo, data)
+                # asyncpg hands records to its query loggers with call_soon
+                await asyncio.sleep(0)
+            finally:
+                capture.active = False
+            statements = capture.statements
+            driver = (await connection.get_raw_connection()).driver_connection
+            for captured in statements:
+                if not captured.many:
+                    plan = await driver.fetchval(
+                        f"EXPLAIN (COSTS OFF, FORMAT JSON) {captured.statement}", *captured.parameters
+                    )
+                    # The dialect registers a JSON codec on its connections, so this usually arrives decoded
+                    captured.plan = (json.loads(plan) if isinstance(plan, str) else plan)[0]["Plan"]
+        await transaction.rollback()
+    return statements
+
+async def capture_plans() -> Dict[type, Dict[str, List[CapturedStatement]]]:
+    engine = create_async_engine(TEST_POSTGRES_URL, connect_args={"server_settings": {
+        "search_path": SCHEMA,
+        # Parallel plans depend on the machine; the scans underneath are what matters here
+        "max_parallel_workers_per_gather": "0"
+    }})
+    try:
+        # Before the first connection, so every pooled connection gets the asyncpg hook
+        capture = StatementCapture(engine)
+        await seed(engine)
+        return {
+            repository: {case.label: await explain_case(engine, capture, repository, case) for case in cases}
+            for repository, cases in REPOSITORIES.items()
+        }
+    finally:
+        await engine.dispose()
+
+def snapshot(plans: Dict[str, List[CapturedStatement]]) -> str:
+    lines = []
+    for label, statements in plans.items():
+        lines.append(f"## {label}")
+        for captured in statements:
+            lines.append(captured.statement)
+            lines += ["  executemany, not explained"] if captured.plan is None else render(captured.plan, 1)
+        lines.append("")
+    return "\n".join(lines)
+
+def cases() -> List[Tuple[type, PlanCase]]:
+    return [(repository, case) for repository, cases in REPOSITORIES.items() for case in cases]
+
+@pytest.fixture(scope="module")
+def plans():
+    if not TEST_POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    return asyncio.run(capture_plans())
+
+class TestQueryPlans:
+    @pytest.mark.parametrize(
+        "repository,case", [pair for pair in cases() if not pair[1].sweep],
+        ids=lambda value: value.__name__ if isinstance(value, type) else value.label
+    )
+    def test_tenant_lookups_use_indexes(self, plans, repository, case):
+        """Test that tenant-scoped statements never Seq Scan a tenant table"""
+        scanned = [
+            (captured.statement, node["Relation Name"])
+            for captured in plans[repository][case.label] if captured.plan is not None
+            for node in nodes(captured.plan)
+            if node["Node Type"] == "Seq Scan" and node["Relation Name"] in TENANT_TABLES
+        ]
+        assert scanned == []
+
+    @pytest.mark.parametrize(
+        "repository,case", [pair for pair in cases() if pair[1].index_only],
+        ids=lambda value: value.__name__ if isinstance(value, type) else value.label
+    )
+    def test_index_only_scans(self, plans, repository, case):
+        """Test that the lookups answered from an index alone still are"""
+        index_only = {
+            node["Relation Name"]
+            for captured in plans[repository][case.label] if captured.plan is not None
+            for node in nodes(captured.plan) if node["Node Type"] == "Index Only Scan"
+        }
+        assert set(case.index_only) <= index_only
+
+    @pytest.mark.parametrize("repository", list(REPOSITORIES), ids=lambda repository: repository.__name__)
+    def test_plans_match_snapshots(self, plans, repository):
+        """Test that each repository's plans match tests/query_plans/; UPDATE_QUERY_PLANS=1 rewrites them"""
+        path = SNAPSHOTS / f"{repository.__name__}.txt"
+        current = snapshot(plans[repository])
+        if UPDATE_QUERY_PLANS or not path.exists():
+            SNAPSHOTS.mkdir(exist_ok=True)
+            path.write_text(current)
+        expected = path.read_text()
+        diff = "\n".join(difflib.unified_diff(
+            expected.splitlines(), current.splitlines(), str(path), "current plans", lineterm=""
+        ))
+        assert current == expected, f"Plans changed; review and rerun with UPDATE_QUERY_PLANS=1:\n{diff}"
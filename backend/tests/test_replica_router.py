@@ -0,0 +1,77 @@
+# backend/tests/test_replica_router.py
+import pytest
+from unittest.mock import AsyncMock, Mock
+from infrastructure.database.pool import InstrumentedQueuePool
+from infrastructure.database.replicas import ReplicaRouter, format_lsn, parse_lsn
+
+def make_router(replayed: str):
+    """A router with one replica whose replay position is `replayed`"""
+    replica_session = AsyncMock()
+    replica_session.execute.return_value = Mock(scalar_one_or_none=Mock(return_value=replayed))
+    primary_session = AsyncMock()
+    router = ReplicaRouter(Mock(), Mock(return_value=primary_session), [Mock()])
+    router.replica_sessions = [Mock(return_value=replica_session)]
+    return router, replica_session, primary_session
+
+class TestReplicaRouter:
+    def test_lsn_round_trip(self):
+        """Test that LSN tokens compare numerically and format back unchanged"""
+        assert parse_lsn("1/0") > parse_lsn("0/FFFFFFFF")
+        assert format_lsn(parse_lsn("16/B374D848")) == "16/B374D848"
+
+    @pytest.mark.asyncio
+    async def test_reads_without_token_use_replica(self):
+        """Test that plain reads go to a replica without checking its position"""
+        router, replica_session, _ = make_router("0/10")
+
+        session = await router.read_session()
+
+        assert session is replica_session
+        replica_session.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_lagging_replica_falls_back_to_primary(self):
+        """Test that a client's reads stay on the primary until the replica has its write"""
+        router, replica_session, primary_session = make_router("0/10")
+
+        session = await router.read_session(parse_lsn("0/20"))
+
+        assert session is primary_session
+        replica_session.connection.assert_awaited_once()
+        replica_session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_caught_up_replica_is_remembered(self):
+        """Test that a replica known to be past the token is used without asking again"""
+        router, replica_session, _ = make_router("0/30")
+
+        assert await router.read_session(parse_lsn("0/20")) is replica_session
+        assert await router.read_session(parse_lsn("0/25")) is replica_session
+        assert replica_session.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unreachable_replica_falls_back_to_primary(self):
+        """Test that reads without a token leave a replica that can't connect, and skip it for a while"""
+        router, replica_session, primary_session = make_router("0/10")
+        replica_session.connection.side_effect = OSError("connection refused")
+
+        first = await router.read_session()
+        second = await router.read_session()
+
+        assert first is primary_session and second is primary_session
+        replica_session.connection.assert_awaited_once()
+        replica_session.close.assert_awaited_once()
+        assert router.stats()["primary_reads"] == 2
+
+    def test_pool_stats_per_replica(self):
+        """Test that each replica engine's pool is reported under its index"""
+        engines = [Mock(), Mock()]
+        for engine in engines:
+            engine.sync_engine.pool = InstrumentedQueuePool(Mock, pool_size=2, max_overflow=0)
+        router = ReplicaRouter(Mock(), Mock(), engines)
+        connection = engines[1].sync_engine.pool.connect()
+
+        stats = router.pool_stats()
+        connection.close()
+
+        assert {index: replica["checked_out"] for index, replica in stats.items()} == {"0": 0, "1": 1}
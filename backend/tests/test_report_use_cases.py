@@ -0,0 +1,63 @@
+# backend/tests/test_report_use_cases.py
+import pytest
+from unittest.mock import AsyncMock
+from datetime import datetime
+import uuid
+from application.use_cases.report_use_cases import ReportUseCases, aggregate_workload, epoch_seconds
+from domain.entities.report import TaskColumns
+from domain.entities.task import TaskPriority, TaskStatus
+from infrastructure.cache import TTLCache
+
+START = datetime(2024, 1, 1)
+END = datetime(2024, 2, 1)
+
+def at(day: int, hour: int = 0) -> float:
+    return epoch_seconds(datetime(2024, 1, day, hour))
+
+class TestWorkloadReport:
+    def test_aggregates_per_assignee(self):
+        """Test open counts, throughput, cycle time and overdue ratio for one assignee"""
+        assignee_id = uuid.uuid4()
+        columns = TaskColumns(
+            assigned_to=(assignee_id, assignee_id, assignee_id, None),
+            status=(TaskStatus.TODO, TaskStatus.DONE, TaskStatus.DONE, TaskStatus.IN_PROGRESS),
+            priority=(TaskPriority.HIGH, TaskPriority.LOW, TaskPriority.LOW, TaskPriority.URGENT),
+            created_at=(at(1), at(1), at(2), at(3)),
+            due_date=(at(5), at(5), None, None),
+            started_at=(None, at(2), None, at(4)),
+            completed_at=(None, at(6), at(3), None)
+        )
+
+        report = aggregate_workload(columns, START, END, now=datetime(2024, 1, 20))
+
+        workload = next(row for row in report if row.assignee_id == assignee_id)
+        assert workload.open_by_priority[TaskPriority.HIGH] == 1
+        assert workload.open_total == 1
+        assert workload.completed == 2
+        # 4 days from start to done, and 1 day from creation for the task never started
+        assert workload.avg_cycle_time_hours == pytest.approx((96 + 24) / 2)
+        # Both tasks due on the 5th were late: one still open, one done on the 6th
+        assert workload.overdue_ratio == 1.0
+        unassigned = next(row for row in report if row.assignee_id is None)
+        assert unassigned.open_by_priority[TaskPriority.URGENT] == 1
+        assert unassigned.avg_cycle_time_hours is None
+
+    def test_empty_tenant(self):
+        """Test that a tenant without tasks gets an empty report"""
+        columns = TaskColumns((), (), (), (), (), (), ())
+
+        assert aggregate_workload(columns, START, END, now=END) == []
+
+    @pytest.mark.asyncio
+    async def test_report_is_cached_per_tenant_and_window(self):
+        """Test that repeated requests within the TTL skip the database"""
+        report_repository = AsyncMock()
+        report_repository.get_task_columns.return_value = TaskColumns((), (), (), (), (), (), ())
+        use_cases = ReportUseCases(report_repository, TTLCache(ttl_seconds=60))
+        tenant_id = uuid.uuid4()
+
+        await use_cases.get_workload(tenant_id, START, END)
+        await use_cases.get_workload(tenant_id, START, END)
+        await use_cases.get_workload(uuid.uuid4(), START, END)
+
+        assert report_repository.get_task_columns.await_count == 2
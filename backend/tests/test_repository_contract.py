@@ -0,0 +1,261 @@
+# backend/tests/test_repository_contract.py
+"""
+Behaviour every repository backend must share, run against each one.
+The database backends need Postgres: set TEST_POSTGRES_URL to a
+postgresql+asyncpg URL. Their tables are created in a scratch schema
+that is emptied before every test. The in-memory backend always runs.
+"""
+from datetime import datetime, timedelta
+import os
+from typing import List
+import uuid
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from api.repositories import REPOSITORY_BACKENDS
+from domain.entities.project import Project, ProjectStatus
+from domain.entities.task import Task, TaskStatus
+from domain.entities.tenant import Tenant
+from domain.entities.user import User
+from infrastructure.database.models import Base
+from infrastructure.memory import (
+    InMemoryProjectRepository, InMemoryStore, InMemoryTaskRepository, InMemoryTenantRepository, InMemoryUserRepository
+)
+
+TEST_POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+SCHEMA = "repository_contract"
+
+class Repositories:
+    def __init__(self, backend, session: AsyncSession):
+        self.session = session
+        self.tenants = backend.tenants(session)
+        self.users = backend.users(session)
+        self.projects = backend.projects(session)
+        self.tasks = backend.tasks(session)
+
+    async def _scalar(self, sql: str, **params):
+        result = await self.session.execute(text(sql), params)
+        value = result.scalar()
+        await self.session.commit()
+        return value
+
+    async def tombstone_types(self, entity_id: uuid.UUID) -> List[str]:
+        return (await self._scalar(
+            "SELECT coalesce(array_agg(entity_type::text), '{}') FROM tombstones WHERE entity_id = :id", id=entity_id
+        ))
+
+    async def transitions(self, task_id: uuid.UUID) -> str:
+        """Status changes as "from>to" pairs in order, with "-" for creation and deletion"""
+        return await self._scalar(
+            "SELECT string_agg(coalesce(from_status::text, '-') || '>' || coalesce(to_status::text, '-'), ' ' "
+            "ORDER BY id) FROM task_status_transitions WHERE task_id = :id",
+            id=task_id
+        )
+
+    async def archive(self, task: Task) -> None:
+        await self._scalar(
+            "INSERT INTO tasks_archive (id, title, status, priority, project_id, tenant_id, created_by, "
+            "created_at, updated_at, archived_at) VALUES (:id, :title, :status, :priority, :project_id, "
+            ":tenant_id, :created_by, :created_at, :updated_at, :archived_at) RETURNING id",
+            id=task.id, title=task.title, status=task.status.name, priority=task.priority.name,
+            project_id=task.project_id, tenant_id=task.tenant_id, created_by=task.created_by,
+            created_at=task.created_at, updated_at=task.updated_at, archived_at=task.archived_at
+        )
+
+class MemoryRepositories(Repositories):
+    def __init__(self, store: InMemoryStore):
+        self.store = store
+        self.tenants = InMemoryTenantRepository(store)
+        self.users = InMemoryUserRepository(store)
+        self.projects = InMemoryProjectRepository(store)
+        self.tasks = InMemoryTaskRepository(store)
+
+    async def tombstone_types(self, entity_id: uuid.UUID) -> List[str]:
+        return [t.entity_type.name for t in self.store.tombstones if t.entity_id == entity_id]
+
+    async def transitions(self, task_id: uuid.UUID) -> str:
+        return " ".join(
+            f"{t.from_status.name if t.from_status else '-'}>{t.to_status.name if t.to_status else '-'}"
+            for t in self.store.transitions if t.task_id == task_id
+        )
+
+    async def archive(self, task: Task) -> None:
+        self.store.archived_tasks.put(task)
+
+@pytest_asyncio.fixture(params=sorted(REPOSITORY_BACKENDS) + ["memory"])
+async def repositories(request):
+    if request.param == "memory":
+        yield MemoryRepositories(InMemoryStore())
+        return
+    if not TEST_POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    engine = create_async_engine(TEST_POSTGRES_URL, connect_args={"server_settings": {"search_path": SCHEMA}})
+    async with engine.begin() as connection:
+        await connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}"))
+        await connection.run_sync(Base.metadata.create_all)
+        tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+        await connection.execute(text(f"TRUNCATE {tables} CASCADE"))
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield Repositories(REPOSITORY_BACKENDS[request.param], session)
+    await engine.dispose()
+
+async def create_tenant(repositories: Repositories, domain: str):
+    tenant = await repositories.tenants.create(Tenant(name=domain.title(), domain=domain))
+    user = await repositories.users.create(User(
+        email=f"owner@{domain}.test",
+        tenant_id=tenant.id,
+        hashed_password="hashed",
+        first_name="Owner",
+        last_name=domain.title()
+    ))
+    return tenant, user
+
+async def create_project(repositories: Repositories, tenant, user, name: str = "Launch") -> Project:
+    return await repositories.projects.create(Project(name=name, tenant_id=tenant.id, created_by=user.id))
+
+async def create_task(repositories: Repositories, project: Project, user, **fields) -> Task:
+    return await repositories.tasks.create(Task(
+        title=fields.pop("title", "Write docs"),
+        project_id=project.id,
+        tenant_id=project.tenant_id,
+        created_by=user.id,
+        **fields
+    ))
+
+class TestTenantsAndUsers:
+    @pytest.mark.asyncio
+    async def test_lookups(self, repositories):
+        """Test lookups of tenants by domain and users by email, within and across tenants"""
+        tenant, user = await create_tenant(repositories, "acme")
+        other, _ = await create_tenant(repositories, "globex")
+
+        assert (await repositories.tenants.get_by_domain("acme")).id == tenant.id
+        assert (await repositories.users.get_by_email("owner@acme.test")).id == user.id
+        assert (await repositories.users.get_by_email_and_tenant("owner@acme.test", tenant.id)).id == user.id
+        assert await repositories.users.get_by_email_and_tenant("owner@acme.test", other.id) is None
+        assert [found.id for found in await repositories.users.get_by_tenant(tenant.id)] == [user.id]
+        assert await repositories.users.get_by_id(uuid.uuid4()) is None
+
+    @pytest.mark.asyncio
+    async def test_update_and_delete(self, repositories):
+        """Test that updates persist and missing rows are reported"""
+        tenant, user = await create_tenant(repositories, "acme")
+        user.first_name = "Renamed"
+        user.is_active = False
+
+        updated = await repositories.users.update(user)
+
+        assert (updated.first_name, updated.is_active) == ("Renamed", False)
+        assert (await repositories.users.get_by_id(user.id)).first_name == "Renamed"
+        assert await repositories.users.delete(user.id)
+        assert not await repositories.users.delete(user.id)
+        with pytest.raises(ValueError):
+            await repositories.tenants.update(Tenant(name="Missing", domain="missing"))
+
+class TestProjects:
+    @pytest.mark.asyncio
+    async def test_tenant_isolation(self, repositories):
+        """Test that a project is only found through its own tenant"""
+        tenant, user = await create_tenant(repositories, "acme")
+        other, _ = await create_tenant(repositories, "globex")
+        project = await create_project(repositories, tenant, user)
+
+        found = await repositories.projects.get_by_tenant_and_id(tenant.id, project.id)
+
+        assert (found.id, found.name, found.status) == (project.id, "Launch", ProjectStatus.PLANNING)
+        assert await repositories.projects.get_by_tenant_and_id(other.id, project.id) is None
+        assert await repositories.projects.get_by_tenant(other.id) == []
+        assert [p.id for p in await repositories.projects.get_by_status(tenant.id, ProjectStatus.PLANNING)] == [project.id]
+
+    @pytest.mark.asyncio
+    async def test_updated_since_is_ordered(self, repositories):
+        """Test that delta listings return only later changes, oldest first"""
+        tenant, user = await create_tenant(repositories, "acme")
+        first = await create_project(repositories, tenant, user, "First")
+        second = await create_project(repositories, tenant, user, "Second")
+        first.update_status(ProjectStatus.IN_PROGRESS)
+        await repositories.projects.update(first)
+
+        everything = await repositories.projects.get_updated_since(tenant.id, None)
+        later = await repositories.projects.get_updated_since(tenant.id, second.updated_at)
+
+        assert [p.id for p in everything] == [second.id, first.id]
+        assert [(p.id, p.status) for p in later] == [(first.id, ProjectStatus.IN_PROGRESS)]
+
+    @pytest.mark.asyncio
+    async def test_delete_leaves_tombstone(self, repositories):
+        """Test that deleting a project removes it and records a tombstone"""
+        tenant, user = await create_tenant(repositories, "acme")
+        project = await create_project(repositories, tenant, user)
+
+        assert await repositories.projects.delete(project.id)
+        assert not await repositories.projects.delete(project.id)
+        assert await repositories.projects.get_by_id(project.id) is None
+        assert await repositories.tombstone_types(project.id) == ["PROJECT"]
+
+class TestTasks:
+    @pytest.mark.asyncio
+    async def test_listings(self, repositories):
+        """Test project, assignee and status listings with tenant isolation"""
+        tenant, user = await create_tenant(repositories, "acme")
+        other, _ = await create_tenant(repositories, "globex")
+        project = await create_project(repositories, tenant, user)
+        assigned = await create_task(repositories, project, user, assigned_to=user.id, status=TaskStatus.IN_PROGRESS)
+        unassigned = await create_task(repositories, project, user, title="Review")
+
+        by_project = await repositories.tasks.get_by_project(project.id, tenant.id)
+
+        assert {task.id for task in by_project} == {assigned.id, unassigned.id}
+        assert await repositories.tasks.get_by_project(project.id, other.id) == []
+        assert [t.id for t in await repositories.tasks.get_by_assignee(user.id, tenant.id)] == [assigned.id]
+        assert [t.id for t in await repositories.tasks.get_by_status(tenant.id, TaskStatus.TODO)] == [unassigned.id]
+        assert await repositories.tasks.get_by_tenant_and_id(other.id, assigned.id) is None
+        found = await repositories.tasks.get_by_tenant_and_id(tenant.id, assigned.id)
+        assert (found.title, found.status, found.assigned_to, found.archived_at) == (
+            "Write docs", TaskStatus.IN_PROGRESS, user.id, None
+        )
+
+    @pytest.mark.asyncio
+    async def test_include_archived(self, repositories):
+        """Test that archived tasks are listed only when asked for"""
+        tenant, user = await create_tenant(repositories, "acme")
+        project = await create_project(repositories, tenant, user)
+        await create_task(repositories, project, user)
+        archived_at = datetime.utcnow() - timedelta(days=1)
+        await repositories.archive(Task(
+            title="Old",
+            project_id=project.id,
+            tenant_id=tenant.id,
+            created_by=user.id,
+            status=TaskStatus.DONE,
+            created_at=archived_at,
+            updated_at=archived_at,
+            archived_at=archived_at
+        ))
+
+        active = await repositories.tasks.get_by_project(project.id, tenant.id)
+        everything = await repositories.tasks.get_by_project(project.id, tenant.id, include_archived=True)
+
+        assert len(active) == 1
+        assert sorted(task.title for task in everything) == ["Old", "Write docs"]
+        assert [task.archived_at for task in everything if task.title == "Old"] == [archived_at]
+
+    @pytest.mark.asyncio
+    async def test_status_changes_record_transitions(self, repositories):
+        """Test that create, status updates and delete each record a transition"""
+        tenant, user = await create_tenant(repositories, "acme")
+        project = await create_project(repositories, tenant, user)
+        task = await create_task(repositories, project, user)
+        task.title = "Renamed"
+        await repositories.tasks.update(task)
+        task.update_status(TaskStatus.DONE)
+        await repositories.tasks.update(task)
+
+        assert await repositories.tasks.delete(task.id)
+        assert not await repositories.tasks.delete(task.id)
+        assert await repositories.transitions(task.id) == "->TODO TODO>DONE DONE>-"
+        assert await repositories.tombstone_types(task.id) == ["TASK"]
+        with pytest.raises(ValueError):
+            await repositories.tasks.update(task)
@@ -0,0 +1,80 @@
+# backend/tests/test_request_metrics.py
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY, CollectorRegistry
+from sqlalchemy import text
+
+from api.dependencies import in_memory_overrides
+from api.metrics_middleware import RequestMetricsMiddleware
+from infrastructure.database.connection import build_engine
+from infrastructure.database.settings import DatabaseSettings
+from infrastructure.memory import InMemoryStore
+from infrastructure.metrics import StatsCollector
+from main import app
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+class TestRequestMetrics:
+    @pytest.mark.asyncio
+    async def test_statements_are_counted_per_route_template(self):
+        """Test that a request's statements and DB time are observed under its route template"""
+        engine = build_engine(DatabaseSettings("sqlite+aiosqlite://"))
+        metrics_app = FastAPI()
+        metrics_app.add_middleware(RequestMetricsMiddleware)
+
+        @metrics_app.get("/widgets/{widget_id}")
+        async def get_widget(widget_id: int):
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+                await connection.execute(text("SELECT :id"), {"id": widget_id})
+            return {"id": widget_id}
+
+        labels = {"method": "GET", "route": "/widgets/{widget_id}", "status": "200"}
+        transport = httpx.ASGITransport(app=metrics_app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.get("/widgets/1")
+            await client.get("/widgets/2")
+            await client.get("/missing")
+        await engine.dispose()
+
+        assert sample("askbob_http_request_duration_seconds_count", **labels) == 2
+        assert sample("askbob_db_statements_per_request_sum", **labels) == 4
+        assert sample("askbob_db_statements_per_request_bucket", **labels, le="1.0") == 0
+        assert sample("askbob_db_time_per_request_seconds_sum", **labels) > 0
+        assert sample("askbob_db_statements_per_request_count", method="GET", route="unmatched", status="404") == 1
+        assert sample("askbob_http_requests_in_flight") == 0
+
+    def test_auth_failures_and_metrics_endpoint(self):
+        """Test that rejected tokens are counted by reason and exported at /metrics"""
+        missing = sample("askbob_auth_failures_total", reason="missing_token")
+        invalid = sample("askbob_auth_failures_total", reason="invalid_token")
+        app.dependency_overrides.update(in_memory_overrides(InMemoryStore()))
+        try:
+            client = TestClient(app)
+            assert client.get("/api/v1/projects").status_code == 401
+            assert client.get("/api/v1/projects", headers={"Authorization": "Bearer nope"}).status_code == 401
+            response = client.get("/metrics")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert sample("askbob_auth_failures_total", reason="missing_token") == missing + 1
+        assert sample("askbob_auth_failures_total", reason="invalid_token") == invalid + 1
+        assert response.status_code == 200
+        assert 'askbob_http_request_duration_seconds_count{method="GET",route="/api/v1/projects",status="401"}' in response.text
+        assert "askbob_db_pool_checkouts" in response.text
+        assert 'askbob_db_shard_pool_checkouts{shard="default"}' in response.text
+        assert "askbob_activity_writer_queue_depth" in response.text
+
+    def test_labelled_stats_share_one_family(self):
+        """Test that per-label stats dicts are exported as one gauge family per stat"""
+        registry = CollectorRegistry()
+        registry.register(StatsCollector(
+            "askbob_test_pool", lambda: {"0": {"checkouts": 3, "healthy": True}, "1": {"checkouts": 5}}, label="replica"
+        ))
+
+        assert registry.get_sample_value("askbob_test_pool_checkouts", {"replica": "0"}) == 3
+        assert registry.get_sample_value("askbob_test_pool_checkouts", {"replica": "1"}) == 5
+        assert registry.get_sample_value("askbob_test_pool_healthy", {"replica": "0"}) is None
@@ -0,0 +1,97 @@
+# backend/tests/test_request_profiling.py
+import asyncio
+import time
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.profiling_middleware import ProfilingMiddleware
+from infrastructure.profiling import WAITING, ProfileStore, RequestProfiler, collapsed, request_profiler, speedscope
+from main import app
+
+def spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+async def slow_endpoint():
+    spin(0.1)
+    await asyncio.sleep(0.1)
+    return {"ok": True}
+
+@pytest.fixture
+def profiler(monkeypatch, tmp_path):
+    monkeypatch.setenv("ADMIN_API_KEY", "s3cret")
+    profiler = RequestProfiler()
+    profiler.interval_seconds = 0.002
+    profiler.store = ProfileStore(str(tmp_path), max_profiles=2)
+    return profiler
+
+def profiled_app(profiler: RequestProfiler) -> ProfilingMiddleware:
+    inner = FastAPI()
+    inner.get("/slow")(slow_endpoint)
+    return ProfilingMiddleware(inner, profiler)
+
+class TestRequestProfiling:
+    @pytest.mark.asyncio
+    @pytest.mark.blocks_loop
+    async def test_admin_header_profiles_the_request(self, profiler):
+        """Test that the request's own CPU time and awaits are sampled and stored under X-Profile-Id"""
+        transport = httpx.ASGITransport(app=profiled_app(profiler))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/slow", headers={"X-Profile": "1", "X-Admin-Key": "s3cret"})
+
+        profile = profiler.store.get(response.headers["X-Profile-Id"])
+        stacks = profile["stacks"]
+        running = sum(weight for stack, weight in stacks.items() if stack.rsplit(";", 1)[-1].startswith("spin "))
+        waiting = sum(weight for stack, weight in stacks.items() if "slow_endpoint" in stack and stack.endswith(WAITING))
+        assert profile["route"] == "/slow" and profile["status"] == 200 and profile["trigger"] == "header"
+        # 100ms each of computing and sleeping, in microseconds
+        assert 60_000 < running < 140_000 and 60_000 < waiting < 140_000
+        assert all(stack.startswith("ProfilingMiddleware.profile") for stack in profile["stacks"])
+        assert profiler.active == 0
+
+    @pytest.mark.asyncio
+    async def test_requests_are_not_profiled_without_the_key(self, profiler):
+        """Test that X-Profile needs a valid admin key, and nothing is stored otherwise"""
+        transport = httpx.ASGITransport(app=profiled_app(profiler))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            wrong_key = await client.get("/slow", headers={"X-Profile": "1", "X-Admin-Key": "guess"})
+            plain = await client.get("/slow")
+
+        assert "X-Profile-Id" not in wrong_key.headers and "X-Profile-Id" not in plain.headers
+        assert profiler.store.recent(10) == []
+
+    def test_store_keeps_the_newest_profiles(self, profiler):
+        """Test that saving past PROFILING_MAX_PROFILES removes the oldest"""
+        ids = ["0192a000-0000-7000-8000-00000000000%d" % number for number in range(3)]
+        for profile_id in ids:
+            profiler.store.save({"id": profile_id, "stacks": {}})
+
+        assert [profile["id"] for profile in profiler.store.recent(10)] == [ids[2], ids[1]]
+
+    def test_exports(self):
+        """Test the collapsed and speedscope renderings of a profile"""
+        profile = {"method": "GET", "path": "/x", "interval_ms": 5.0, "stacks": {"a;b": 3000, "a": 1000}}
+        exported = speedscope(profile)
+
+        assert collapsed(profile) == "a 1000\na;b 3000\n"
+        assert exported["shared"]["frames"] == [{"name": "a"}, {"name": "b"}]
+        assert exported["profiles"][0]["samples"] == [[0, 1], [0]]
+        assert exported["profiles"][0]["weights"] == [3.0, 1.0]
+
+    def test_admin_endpoints(self, profiler, monkeypatch):
+        """Test that stored profiles are listed and served in each format"""
+        monkeypatch.setattr(request_profiler, "store", profiler.store)
+        profile_id = "0192a000-0000-7000-8000-000000000001"
+        profiler.store.save({"id": profile_id, "method": "GET", "path": "/x", "interval_ms": 5.0, "stacks": {"a;b": 2000}})
+        client = TestClient(app)
+        headers = {"X-Admin-Key": "s3cret"}
+
+        assert client.get("/api/v1/admin/profiles", headers=headers).json()["profiles"][0]["id"] == profile_id
+        assert client.get(f"/api/v1/admin/profiles/{profile_id}", headers=headers).text == "a;b 2000\n"
+        speedscope_file = client.get(f"/api/v1/admin/profiles/{profile_id}?format=speedscope", headers=headers).json()
+        assert speedscope_file["profiles"][0]["weights"] == [2.0]
+        missing = client.get("/api/v1/admin/profiles/0192a000-0000-7000-8000-0000000000ff", headers=headers)
+        assert missing.status_code == 404
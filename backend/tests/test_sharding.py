@@ -0,0 +1,81 @@
+# backend/tests/test_sharding.py
+import pytest
+from unittest.mock import AsyncMock
+import uuid
+from domain.entities.tenant import Tenant
+from domain.entities.user import User
+from infrastructure.activity.writer import ActivityLogWriter
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from infrastructure.database import connection
+from infrastructure.database.connection import build_engine, parse_shard_urls, shard_pool_stats
+from infrastructure.database.settings import DatabaseSettings
+from infrastructure.database.sharding import DefaultShardPolicy, HashShardPolicy, ShardTenantPlacement
+from tests.test_activity_log import FakeSessionFactory, make_entry
+
+def make_tenant() -> Tenant:
+    return Tenant(name="Acme", domain=f"{uuid.uuid4().hex[:8]}.example.com")
+
+class TestShardConfig:
+    def test_parse_shard_urls(self):
+        """Test that shard URLs keep any '=' in their query string"""
+        shards = parse_shard_urls("eu=postgresql+asyncpg://db-eu/app?ssl=require, us=postgresql+asyncpg://db-us/app")
+
+        assert shards == {
+            "eu": "postgresql+asyncpg://db-eu/app?ssl=require",
+            "us": "postgresql+asyncpg://db-us/app"
+        }
+
+    def test_pool_stats_per_shard(self, monkeypatch):
+        """Test that every shard's engine pool is reported under its shard name"""
+        monkeypatch.setenv("DB_POOL_SIZE", "3")
+        eu = build_engine(DatabaseSettings("postgresql+asyncpg://db-eu/app"))
+        monkeypatch.setitem(connection.shard_sessions, "eu", async_sessionmaker(bind=eu))
+
+        stats = shard_pool_stats()
+
+        assert set(stats) == {"default", "eu"}
+        assert stats["eu"]["size"] == 3 and stats["eu"]["checked_out"] == 0
+
+class TestPlacement:
+    @pytest.mark.asyncio
+    async def test_hash_policy_is_stable_and_spreads(self):
+        """Test that a tenant always hashes to the same shard, whatever the shard order"""
+        policy = HashShardPolicy()
+        tenants = [make_tenant() for _ in range(200)]
+
+        chosen = [await policy.choose(tenant, ["default", "eu", "us"]) for tenant in tenants]
+        reordered = [await policy.choose(tenant, ["us", "default", "eu"]) for tenant in tenants]
+
+        assert chosen == reordered
+        assert set(chosen) == {"default", "eu", "us"}
+
+    @pytest.mark.asyncio
+    async def test_default_placement_skips_directory_entry(self):
+        """Test that tenants kept on the default shard need no copies or directory row"""
+        directory = AsyncMock()
+        directory.shard_names = ["default", "eu"]
+        placement = ShardTenantPlacement(directory, DefaultShardPolicy())
+        tenant = make_tenant()
+        owner = User(email="owner@example.com", tenant_id=tenant.id, hashed_password="x", first_name="A", last_name="B")
+
+        shard = await placement.place(tenant, owner)
+
+        assert shard == "default"
+        directory.assign.assert_not_awaited()
+
+class TestShardedActivityLog:
+    @pytest.mark.asyncio
+    async def test_batches_are_split_by_shard(self):
+        """Test that each shard receives only its own tenants' entries"""
+        eu_entry, default_entry = make_entry(), make_entry()
+        factories = {"default": FakeSessionFactory(), "eu": FakeSessionFactory()}
+
+        async def shard_for(tenant_id):
+            return "eu" if tenant_id == eu_entry.tenant_id else "default"
+
+        writer = ActivityLogWriter(lambda shard: factories[shard](), shard_for)
+        await writer._flush([eu_entry, default_entry, make_entry()])
+
+        assert writer.written == 3
+        assert factories["eu"].session.execute.await_count == 1
+        assert factories["default"].session.execute.await_count == 1
@@ -0,0 +1,62 @@
+# backend/tests/test_slow_queries.py
+import asyncio
+from collections import deque
+from datetime import datetime
+import json
+import uuid
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from infrastructure.database.connection import build_engine
+from infrastructure.database.settings import DatabaseSettings
+from infrastructure.database.slow_queries import parameter_shapes, slow_query_log
+from main import app
+
+@pytest.fixture
+def slow_log(monkeypatch, tmp_path):
+    """The engine hooks' log, recording every statement into a small buffer and a JSONL file"""
+    monkeypatch.setattr(slow_query_log, "threshold_seconds", 1e-9)
+    monkeypatch.setattr(slow_query_log, "records", deque(maxlen=3))
+    monkeypatch.setattr(slow_query_log, "path", str(tmp_path / "slow.jsonl"))
+    return slow_query_log
+
+class TestSlowQueryLog:
+    def test_parameter_values_are_redacted(self):
+        """Test that only the types and structure of bound parameters are kept"""
+        assert parameter_shapes({"email": "owner@acme.test", "id": uuid.uuid4()}) == {"email": "str", "id": "UUID"}
+        assert parameter_shapes(("secret", 3, None)) == ["str", "int", "NoneType"]
+        assert parameter_shapes([{"at": datetime.utcnow()}, {"at": None}]) == {"rows": 2, "shape": {"at": "datetime"}}
+
+    @pytest.mark.asyncio
+    async def test_slow_statements_are_recorded_with_plans(self, slow_log):
+        """Test that statements over the threshold land in the ring buffer and sink with their plan"""
+        engine = build_engine(DatabaseSettings("sqlite+aiosqlite://"))
+        async with engine.begin() as connection:
+            await connection.execute(text("CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT)"))
+            await connection.execute(text("INSERT INTO notes (body) VALUES (:body)"), {"body": "private"})
+            await connection.execute(text("SELECT body FROM notes WHERE id = :id"), {"id": 1})
+        await asyncio.gather(*slow_log._explains)
+        await engine.dispose()
+
+        records = slow_log.recent(10)
+        lines = [json.loads(line) for line in open(slow_log.path)]
+        assert len(records) == 3
+        newest = records[0]
+        assert newest["statement"] == "SELECT body FROM notes WHERE id = ?"
+        assert newest["parameters"] == ["int"]
+        assert any("notes" in step for step in newest["plan"])
+        assert newest in lines
+        assert "private" not in open(slow_log.path).read()
+
+    def test_admin_endpoint_needs_the_key(self, monkeypatch):
+        """Test that the slow-query endpoint is hidden without ADMIN_API_KEY and checks X-Admin-Key"""
+        client = TestClient(app)
+        monkeypatch.delenv("ADMIN_API_KEY", raising=False)
+        assert client.get("/api/v1/admin/slow-queries").status_code == 404
+
+        monkeypatch.setenv("ADMIN_API_KEY", "s3cret")
+        assert client.get("/api/v1/admin/slow-queries", headers={"X-Admin-Key": "wrong"}).status_code == 403
+        response = client.get("/api/v1/admin/slow-queries?limit=5", headers={"X-Admin-Key": "s3cret"})
+        assert response.status_code == 200
+        assert "threshold_ms" in response.json()
@@ -0,0 +1,73 @@
+# backend/tests/test_sqlite_profile.py
+from datetime import datetime, timedelta
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities.project import Project
+from domain.entities.task import Task, TaskStatus
+from domain.entities.tenant import Tenant
+from domain.entities.user import User
+from infrastructure.database.connection import build_engine
+from infrastructure.database.models import Base, TaskArchiveModel, TaskModel, TombstoneModel
+from infrastructure.database.repositories.project_repository_impl import ProjectRepositoryImpl
+from infrastructure.database.repositories.task_archive_repository_impl import TaskArchiveRepositoryImpl
+from infrastructure.database.repositories.task_repository_impl import TaskRepositoryImpl
+from infrastructure.database.repositories.tenant_repository_impl import TenantRepositoryImpl
+from infrastructure.database.repositories.user_repository_impl import UserRepositoryImpl
+from infrastructure.database.settings import DatabaseSettings
+
+@pytest_asyncio.fixture
+async def engines(tmp_path):
+    settings = DatabaseSettings(f"sqlite+aiosqlite:///{tmp_path / 'askbob.db'}")
+    writer, reader = build_engine(settings), build_engine(settings, readonly=True)
+    async with writer.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    yield writer, reader
+    await writer.dispose()
+    await reader.dispose()
+
+class TestSQLiteProfile:
+    @pytest.mark.asyncio
+    async def test_pragmas_and_pools(self, engines):
+        """Test that connections run in WAL mode with one writer and query-only readers"""
+        writer, reader = engines
+        async with writer.connect() as connection:
+            assert (await connection.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+            assert (await connection.execute(text("PRAGMA foreign_keys"))).scalar() == 1
+            assert (await connection.execute(text("PRAGMA query_only"))).scalar() == 0
+
+        assert writer.pool.size() == 1
+        async with reader.connect() as connection:
+            assert (await connection.execute(text("PRAGMA query_only"))).scalar() == 1
+            with pytest.raises(OperationalError):
+                await connection.execute(text("DELETE FROM tasks"))
+
+    @pytest.mark.asyncio
+    async def test_archive_without_returning_cte(self, engines):
+        """Test that old done tasks move to the archive on SQLite and leave tombstones for sync"""
+        writer, _ = engines
+        async with AsyncSession(writer, expire_on_commit=False) as session:
+            tenant = await TenantRepositoryImpl(session).create(Tenant(name="Acme", domain="acme"))
+            user = await UserRepositoryImpl(session).create(User(
+                email="owner@acme.example.com", tenant_id=tenant.id, hashed_password="hashed",
+                first_name="Owner", last_name="Acme"
+            ))
+            project = await ProjectRepositoryImpl(session).create(
+                Project(name="Launch", tenant_id=tenant.id, created_by=user.id)
+            )
+            for status in (TaskStatus.DONE, TaskStatus.DONE, TaskStatus.TODO):
+                await TaskRepositoryImpl(session).create(Task(
+                    title="Old", project_id=project.id, tenant_id=tenant.id, created_by=user.id, status=status
+                ))
+
+            archived = await TaskArchiveRepositoryImpl(session).archive_completed(
+                tenant.id, datetime.utcnow() + timedelta(seconds=1), 1
+            )
+
+            assert archived == 1
+            assert (await session.execute(select(func.count()).select_from(TaskArchiveModel))).scalar() == 1
+            assert (await session.execute(select(func.count()).select_from(TaskModel))).scalar() == 2
+            assert (await session.execute(select(func.count()).select_from(TombstoneModel))).scalar() == 1
@@ -0,0 +1,56 @@
+# backend/tests/test_statement_cache.py
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from infrastructure.database.repositories.project_repository_impl import ProjectRepositoryImpl
+from infrastructure.database.repositories.task_repository_impl import TaskRepositoryImpl
+from infrastructure.database.repositories.user_repository_impl import UserRepositoryImpl
+
+def recording_session() -> AsyncMock:
+    session = AsyncMock()
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = None
+    result.scalars.return_value.all.return_value = []
+    session.execute.return_value = result
+    return session
+
+def executed(session: AsyncMock):
+    return [call.args[0] for call in session.execute.await_args_list]
+
+class TestHotStatements:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("lookup", [
+        lambda session, value: TaskRepositoryImpl(session).get_by_tenant_and_id(value, value),
+        lambda session, value: TaskRepositoryImpl(session).get_by_project(value, value),
+        lambda session, value: ProjectRepositoryImpl(session).get_by_id(value),
+        lambda session, value: UserRepositoryImpl(session).get_by_email(f"{value}@example.com"),
+    ])
+    async def test_calls_share_one_cache_key(self, lookup):
+        """Test that repeated lookups reuse the compiled statement with new bind values"""
+        session = recording_session()
+        first_id, second_id = uuid.uuid4(), uuid.uuid4()
+
+        await lookup(session, first_id)
+        await lookup(session, second_id)
+
+        first, second = executed(session)
+        first_key, second_key = first._generate_cache_key(), second._generate_cache_key()
+        assert first_key == second_key
+        compiled = first.compile(dialect=postgresql.asyncpg.dialect())
+        assert str(first_id) not in str(compiled)
+        assert [param.effective_value for param in second_key.bindparams] != \
+            [param.effective_value for param in first_key.bindparams]
+
+    @pytest.mark.asyncio
+    async def test_archived_listing_still_unions_the_archive(self):
+        """Test that include_archived keeps the UNION ALL over tasks_archive"""
+        session = recording_session()
+        session.execute.return_value.all.return_value = []
+
+        await TaskRepositoryImpl(session).get_by_project(uuid.uuid4(), uuid.uuid4(), include_archived=True)
+
+        sql = str(executed(session)[0].compile(dialect=postgresql.asyncpg.dialect()))
+        assert "UNION ALL" in sql
+        assert "tasks_archive" in sql
@@ -0,0 +1,166 @@
+# backend/tests/test_sync_use_cases.py
+import asyncio
+import os
+import pytest
+import pytest_asyncio
+import asyncpg
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from unittest.mock import AsyncMock
+from datetime import datetime, timedelta
+import uuid
+from api.dependencies import get_current_tenant, get_sync_use_cases
+from application.use_cases.sync_use_cases import SyncUseCases
+from domain.entities.change import ChangeType, EntityType, Tombstone
+from domain.entities.project import Project
+from domain.entities.task import TaskStatus
+from infrastructure.database.connection import Base
+from infrastructure.database.models import ProjectModel, TaskModel, TenantModel, UserModel
+from infrastructure.database.repositories.project_repository_impl import ProjectRepositoryImpl
+from infrastructure.database.repositories.task_archive_repository_impl import TaskArchiveRepositoryImpl
+from infrastructure.database.repositories.task_repository_impl import TaskRepositoryImpl
+from infrastructure.database.repositories.tombstone_repository_impl import TombstoneRepositoryImpl
+from infrastructure.realtime.broker import CHANGE_CHANNEL, decode_event
+from main import app
+
+TEST_POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+SCHEMA = "sync_archive"
+
+class TestSyncUseCases:
+    @pytest.fixture
+    def project_repository(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def task_repository(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def tombstone_repository(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def sync_use_cases(self, project_repository, task_repository, tombstone_repository):
+        return SyncUseCases(project_repository, task_repository, tombstone_repository)
+
+    @pytest.mark.asyncio
+    async def test_first_sync_returns_full_snapshot(self, sync_use_cases, project_repository, tombstone_repository):
+        """Test that a sync without a cursor resets the client cache"""
+        tenant_id = uuid.uuid4()
+        project = Project(name="Project", tenant_id=tenant_id, created_by=uuid.uuid4())
+        project_repository.get_updated_since.return_value = [project]
+
+        changes = await sync_use_cases.get_changes(tenant_id)
+
+        project_repository.get_updated_since.assert_called_once_with(tenant_id, None)
+        tombstone_repository.get_since.assert_not_called()
+        assert changes.reset is True
+        assert changes.projects == [project]
+        assert changes.cursor <= datetime.utcnow()
+
+    @pytest.mark.asyncio
+    async def test_delta_sync_includes_tombstones(self, sync_use_cases, project_repository, task_repository, tombstone_repository):
+        """Test that a recent cursor returns only changes and deletions"""
+        tenant_id = uuid.uuid4()
+        since = datetime.utcnow() - timedelta(minutes=5)
+        tombstone = Tombstone(entity_type=EntityType.TASK, entity_id=uuid.uuid4(), tenant_id=tenant_id)
+        project_repository.get_updated_since.return_value = []
+        task_repository.get_updated_since.return_value = []
+        tombstone_repository.get_since.return_value = [tombstone]
+
+        changes = await sync_use_cases.get_changes(tenant_id, since)
+
+        task_repository.get_updated_since.assert_called_once_with(tenant_id, since)
+        tombstone_repository.get_since.assert_called_once_with(tenant_id, since)
+        assert changes.reset is False
+        assert changes.tombstones == [tombstone]
+
+    @pytest.mark.asyncio
+    async def test_cursor_older_than_retention_forces_reset(self, sync_use_cases, project_repository, tombstone_repository):
+        """Test that a cursor past the tombstone retention window falls back to a full snapshot"""
+        tenant_id = uuid.uuid4()
+        since = datetime.utcnow() - sync_use_cases.retention - timedelta(days=1)
+        project_repository.get_updated_since.return_value = []
+
+        changes = await sync_use_cases.get_changes(tenant_id, since)
+
+        project_repository.get_updated_since.assert_called_once_with(tenant_id, None)
+        tombstone_repository.get_since.assert_not_called()
+        assert changes.reset is True
+
+    def test_route_accepts_cursors_with_an_offset(self, sync_use_cases, project_repository, task_repository, tombstone_repository):
+        """Test that Z and +00:00 cursors are read as UTC rather than failing against naive timestamps"""
+        for repository in (project_repository, task_repository):
+            repository.get_updated_since.return_value = []
+        tombstone_repository.get_since.return_value = []
+        app.dependency_overrides[get_sync_use_cases] = lambda: sync_use_cases
+        app.dependency_overrides[get_current_tenant] = lambda: uuid.uuid4()
+        try:
+            client = TestClient(app)
+            recent = (datetime.utcnow() - timedelta(minutes=5)).isoformat(timespec="seconds")
+            responses = [
+                client.get("/api/v1/sync", params={"since": recent + suffix}) for suffix in ("Z", "+00:00", "+02:00")
+            ]
+            invalid = client.get("/api/v1/sync", params={"since": "yesterday"})
+        finally:
+            app.dependency_overrides.clear()
+
+        assert [response.status_code for response in responses] == [200, 200, 200]
+        assert [response.json()["reset"] for response in responses] == [False, False, False]
+        assert invalid.status_code == 400
+        since = tombstone_repository.get_since.call_args_list[2].args[1]
+        assert since.tzinfo is None and since == datetime.fromisoformat(recent) - timedelta(hours=2)
+
+@pytest_asyncio.fixture
+async def postgres_session():
+    engine = create_async_engine(TEST_POSTGRES_URL, connect_args={"server_settings": {"search_path": SCHEMA}})
+    async with engine.begin() as connection:
+        await connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        await connection.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    async with engine.begin() as connection:
+        await connection.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+    await engine.dispose()
+
+@pytest.mark.skipif(not TEST_POSTGRES_URL, reason="archiving needs Postgres; set TEST_POSTGRES_URL")
+class TestSyncAfterArchive:
+    @pytest.mark.asyncio
+    async def test_archived_task_is_synced_as_deleted(self, postgres_session):
+        """Test that archiving leaves a tombstone for delta sync and notifies live clients"""
+        tenant, user, project = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        done, open_task = uuid.uuid4(), uuid.uuid4()
+        long_ago = datetime.utcnow() - timedelta(days=400)
+        postgres_session.add(TenantModel(id=tenant, name="Acme", domain="acme.example.com"))
+        await postgres_session.flush()
+        postgres_session.add(UserModel(id=user, email="a@acme.example.com", tenant_id=tenant, hashed_password="x", first_name="A", last_name="B"))
+        await postgres_session.flush()
+        postgres_session.add(ProjectModel(id=project, name="Launch", tenant_id=tenant, created_by=user))
+        await postgres_session.flush()
+        for task_id, status in ((done, TaskStatus.DONE), (open_task, TaskStatus.TODO)):
+            postgres_session.add(TaskModel(
+                id=task_id, title="Task", status=status, project_id=project, tenant_id=tenant, created_by=user,
+                created_at=long_ago, updated_at=long_ago
+            ))
+        await postgres_session.commit()
+        since = datetime.utcnow() - timedelta(minutes=1)
+
+        notifications = asyncio.Queue()
+        listener = await asyncpg.connect(make_url(TEST_POSTGRES_URL).set(drivername="postgresql").render_as_string(hide_password=False))
+        await listener.add_listener(CHANGE_CHANNEL, lambda *args: notifications.put_nowait(decode_event(args[-1])))
+        try:
+            archived = await TaskArchiveRepositoryImpl(postgres_session).archive_completed(tenant, datetime.utcnow() - timedelta(days=365), 100)
+            event = await asyncio.wait_for(notifications.get(), timeout=5)
+        finally:
+            await listener.close()
+        changes = await SyncUseCases(
+            ProjectRepositoryImpl(postgres_session), TaskRepositoryImpl(postgres_session), TombstoneRepositoryImpl(postgres_session)
+        ).get_changes(tenant, since)
+
+        assert archived == 1
+        assert [tombstone.entity_id for tombstone in changes.tombstones] == [done]
+        assert changes.tasks == []
+        assert (event.entity_id, event.change_type, event.project_id) == (done, ChangeType.DELETED, project)
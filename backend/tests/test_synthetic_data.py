@@ -0,0 +1,56 @@
+# backend/tests/test_synthetic_data.py
+from datetime import datetime, timedelta
+
+from domain.identifiers import uuid7_time
+from infrastructure.database.synthetic_data import (
+    TASK_COLUMNS, SyntheticSettings, directory_rows, pack_chunks, plan_tenants, task_rows, zipf_shares
+)
+
+UNTIL = datetime(2026, 6, 1)
+
+def settings(**overrides) -> SyntheticSettings:
+    return SyntheticSettings(**{"seed": 7, "tenants": 50, "tasks": 20_000, "until": UNTIL, "chunk_size": 1000, **overrides})
+
+class TestSyntheticData:
+    def test_tenant_sizes_are_skewed_and_add_up(self):
+        """Test that Zipf shares cover every task, largest first, with a long tail"""
+        shares = zipf_shares(100_000, 1000, 1.1)
+
+        assert sum(shares) == 100_000
+        assert shares == sorted(shares, reverse=True)
+        assert shares[0] > 100 * shares[500]
+
+    def test_same_seed_gives_same_rows(self):
+        """Test that plans and task chunks depend only on the settings"""
+        first, second = plan_tenants(settings()), plan_tenants(settings())
+
+        assert [plan.id for plan in first] == [plan.id for plan in second]
+        assert task_rows(first[0], 3, 1000, settings()) == task_rows(second[0], 3, 1000, settings())
+        assert plan_tenants(settings(seed=8))[0].id != first[0].id
+
+    def test_chunks_are_independent(self):
+        """Test that a chunk is the same whether or not earlier chunks were generated"""
+        plan = plan_tenants(settings())[0]
+        task_rows(plan, 0, 1000, settings())
+
+        assert task_rows(plan, 1, 1000, settings()) == task_rows(plan_tenants(settings())[0], 1, 1000, settings())
+
+    def test_loads_cover_every_task_once(self):
+        """Test that packing chunks into loads keeps each (tenant, chunk) exactly once"""
+        plans = plan_tenants(settings())
+        parts = [(plan.rank, chunk) for load in pack_chunks(plans, 1000) for plan, chunk, _ in load]
+
+        assert len(parts) == len(set(parts))
+        assert sum(count for load in pack_chunks(plans, 1000) for _, _, count in load) == 20_000
+
+    def test_tasks_reference_their_tenant(self):
+        """Test that tasks use their own tenant's projects and users, with UUIDv7 ids of created_at"""
+        plan = plan_tenants(settings())[1]
+        _, users, projects = directory_rows(plan, settings(), "hash")
+        rows = [dict(zip(TASK_COLUMNS, row)) for row in task_rows(plan, 0, 1000, settings())]
+
+        assert {row["project_id"] for row in rows} <= {project[0] for project in projects}
+        assert {row["assigned_to"] for row in rows} - {None} <= {user[0] for user in users}
+        assert all(row["tenant_id"] == plan.id for row in rows)
+        assert all(timedelta(0) <= row["created_at"] - uuid7_time(row["id"]) < timedelta(milliseconds=1) for row in rows)
+        assert all(plan.created_at <= row["created_at"] <= row["updated_at"] <= UNTIL for row in rows)
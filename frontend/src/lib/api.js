@@ -10,6 +10,10 @@ const api = axios.create({
   },
 });
 
+// Position of this client's latest write, so reads from replicas include it
+const CONSISTENCY_HEADER = 'X-Consistency-Token';
+let consistencyToken = null;
+
 // Request interceptor to add auth token
 api.interceptors.request.use(
   (config) => {
@@ -17,6 +21,9 @@ api.interceptors.request.use(
     if (token) {
       config.headers.Authorization = `Bearer ${token}`;
     }
+    if (consistencyToken) {
+      config.headers[CONSISTENCY_HEADER] = consistencyToken;
+    }
     return config;
   },
   (error) => {
@@ -26,7 +33,13 @@ api.interceptors.request.use(
 
 // Response interceptor to handle auth errors
 api.interceptors.response.use(
-  (response) => response,
+  (response) => {
+    const written = response.headers[CONSISTENCY_HEADER.toLowerCase()];
+    if (written) {
+      consistencyToken = written;
+    }
+    return response;
+  },
   (error) => {
     if (error.response?.status === 401) {
       // Token is invalid or expired
@@ -56,10 +69,48 @@ export const projectsApi = {
 
 // Tasks API
 export const tasksApi = {
-  getByProject: (projectId) => api.get(`/projects/${projectId}/tasks`),
+  getByProject: (projectId, includeArchived = false) =>
+    api.get(`/projects/${projectId}/tasks`, { params: includeArchived ? { include_archived: true } : {} }),
   create: (projectId, data) => api.post(`/projects/${projectId}/tasks`, data),
   update: (id, data) => api.put(`/tasks/${id}`, data),
   delete: (id) => api.delete(`/tasks/${id}`),
 };
 
+// Sync API - pass the cursor from the previous response to fetch only changes
+export const syncApi = {
+  getChanges: (since) => api.get('/sync', { params: since ? { since } : {} }),
+};
+
+// Live change feed (Server-Sent Events). EventSource cannot send the
+// Authorization header, so the stream is read with fetch instead.
+// Returns a function that closes the stream.
+export const subscribeToChanges = (onChange, onResync) => {
+  const controller = new AbortController();
+  const token = localStorage.getItem('token');
+
+  fetch(`${API_BASE_URL}/events`, {
+    headers: { Authorization: `Bearer ${token}` },
+    signal: controller.signal,
+  }).then(async (response) => {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+      const messages = buffer.split('\n\n');
+      buffer = messages.pop();
+      for (const message of messages) {
+        const event = message.match(/^event: (.*)$/m)?.[1];
+        const data = message.match(/^data: (.*)$/m)?.[1];
+        if (event === 'change') onChange(JSON.parse(data));
+        if (event === 'resync') onResync?.();
+      }
+    }
+  }).catch(() => {});
+
+  return () => controller.abort();
+};
+
 export default api;
\ No newline at end of file